@@ -34,6 +34,9 @@ class Config:
     # Folder Laporan PDF (di dalam static agar bisa diakses browser)
     REPORTS_DIR = os.path.join(STATIC_DIR, "reports")
 
+    # Aset hasil build (fingerprint + gzip/brotli), dibuat oleh Scripts/build_assets.py
+    ASSET_DIST_DIR = os.path.join(STATIC_DIR, "dist")
+
     # =========================================
     # 3. FILE PATHS
     # =========================================
@@ -43,11 +46,31 @@ class Config:
     
     # Logs
     PREDICTION_LOG = os.path.join(LOGS_DIR, "prediction_logs.csv")
+    # Agregat statistik prediksi per jam/hari (+ offset log yang sudah diproses)
+    STATS_PATH = os.path.join(LOGS_DIR, "prediction_stats.json")
+    # Salinan kolumnar log prediksi untuk /api/logs/search (file .npy per kolom)
+    LOG_STORE_DIR = os.path.join(LOGS_DIR, "columnar")
+    # Segmen log per worker (Backend/models/prediction_log.py), digabung ke PREDICTION_LOG
+    LOG_SEGMENTS_DIR = os.path.join(LOGS_DIR, "segments")
     
     # Model & Metadata
     MODEL_PATH = os.path.join(MODELS_DIR, "decision_tree_bundle.pkl")
     META_PATH = os.path.join(MODELS_DIR, "decision_tree_meta.json")
     
+    # Registry model berversi (vNNNN/bundle.pkl + meta.json, pointer ACTIVE & SHADOW).
+    # Selama belum ada versi aktif, MODEL_PATH & META_PATH di atas yang dipakai.
+    REGISTRY_DIR = os.path.join(MODELS_DIR, "registry")
+
+    # Manifest aset statis (path asli -> path ber-hash)
+    ASSET_MANIFEST = os.path.join(ASSET_DIST_DIR, "manifest.json")
+
+    # Distribusi referensi fitur untuk monitor drift (dibuat saat training)
+    DRIFT_REFERENCE_PATH = os.path.join(MODELS_DIR, "drift_reference.json")
+
+    # Job training latar (/api/admin/train): status progres JSON & output proses job
+    TRAINING_STATUS_PATH = os.path.join(LOGS_DIR, "training_job.json")
+    TRAINING_LOG_PATH = os.path.join(LOGS_DIR, "training_job.log")
+
     # Laporan Teknis (Opsional)
     DATA_REPORT = os.path.join(DATA_DIR, "dataset_report.txt")
 
@@ -79,6 +102,47 @@ class Config:
         'stroke': 'Riwayat Stroke'
     }
 
+    # Skema input per fitur (dikompilasi oleh Backend/models/schema.py):
+    #   number   -> satuan dataset + rentang klinis wajar (dicek SETELAH konversi satuan)
+    #   category -> nama mapping di DiabetesPreprocessor yang menentukan nilai yang dikenali
+    # 'convert': nilai di atas 'above' dianggap satuan alternatif lalu dibagi 'divide'
+    # 'zero_means_auto': 0 berarti dihitung otomatis (BMI dari berat & tinggi)
+    FEATURE_SCHEMA = {
+        'age':            {'type': 'number', 'unit': 'tahun', 'min': 1, 'max': 120},
+        'gender':         {'type': 'category', 'mapping': 'gender_map'},
+        'pulse_rate':     {'type': 'number', 'unit': 'bpm', 'min': 20, 'max': 250},
+        'systolic_bp':    {'type': 'number', 'unit': 'mmHg', 'min': 50, 'max': 300},
+        'diastolic_bp':   {'type': 'number', 'unit': 'mmHg', 'min': 20, 'max': 200},
+        'glucose':        {'type': 'number', 'unit': 'mmol/L', 'min': 1.0, 'max': 40.0,
+                           'convert': {'above': 30, 'divide': 18, 'from_unit': 'mg/dL'}},
+        'height':         {'type': 'number', 'unit': 'm', 'min': 0.5, 'max': 2.5,
+                           'convert': {'above': 3, 'divide': 100, 'from_unit': 'cm'}},
+        'weight':         {'type': 'number', 'unit': 'kg', 'min': 2, 'max': 300},
+        'bmi':            {'type': 'number', 'unit': 'kg/m2', 'min': 10, 'max': 80, 'zero_means_auto': True},
+        'family_diabetes':        {'type': 'category', 'mapping': 'bool_replace'},
+        'hypertensive':           {'type': 'category', 'mapping': 'bool_replace'},
+        'family_hypertension':    {'type': 'category', 'mapping': 'bool_replace'},
+        'cardiovascular_disease': {'type': 'category', 'mapping': 'bool_replace'},
+        'stroke':         {'type': 'category', 'mapping': 'stroke_map'},
+    }
+
+    # Dtype ringkas per kolom file dataset (dibaca oleh Backend/models/dataset.py).
+    # Nilai rusak di kolom numerik/bool (misal 'le' di usia) dijadikan NaN, bukan menggagalkan load.
+    RAW_DATA_DTYPES = {
+        'age': 'float32', 'gender': 'category', 'pulse_rate': 'float32',
+        'systolic_bp': 'float32', 'diastolic_bp': 'float32', 'glucose': 'float32',
+        'height': 'float32', 'weight': 'float32', 'bmi': 'float32',
+        'family_diabetes': 'bool', 'hypertensive': 'bool', 'family_hypertension': 'bool',
+        'cardiovascular_disease': 'bool', 'stroke': 'category', 'diabetic': 'category',
+    }
+    # Hasil SMOTE sudah ter-encode (kolom biner bisa bernilai pecahan hasil interpolasi)
+    BALANCED_DATA_DTYPES = {**{f: 'float32' for f in FEATURES}, 'diabetic': 'int8'}
+
+    # Engine CSV: 'auto' (pyarrow jika terinstall), 'pyarrow', atau 'c'
+    DATASET_ENGINE = os.environ.get("DATASET_ENGINE", "auto")
+    # Ukuran chunk untuk iterasi file yang lebih besar dari RAM
+    DATASET_CHUNK_SIZE = int(os.environ.get("DATASET_CHUNK_SIZE", 100000))
+
     # =========================================
     # 5. SERVER CONFIG
     # =========================================
@@ -86,9 +150,139 @@ class Config:
     SERVER_PORT = 8000
     DEBUG = True
     SECRET_KEY = "kunci_rahasia_bisa_diganti_nanti"
+    # Pantau perubahan file template tanpa restart (pengembangan). Nonaktif: sidik jari
+    # template dihitung sekali per proses; aktif: dicek ulang paling sering tiap N detik
+    TEMPLATES_AUTO_RELOAD = os.environ.get("TEMPLATES_AUTO_RELOAD", "0") == "1"
+    TEMPLATES_CHECK_SECONDS = float(os.environ.get("TEMPLATES_CHECK_SECONDS", 2))
+
+    # =========================================
+    # 6. INFERENCE & PERFORMANCE
+    # =========================================
+    # Estimator yang dilatih Scripts/train_model.py (lihat Backend/models/backends.py):
+    #   'calibrated_tree' (default), 'tree', 'hist_gb', 'logreg'
+    MODEL_BACKEND = os.environ.get("MODEL_BACKEND", "calibrated_tree")
+
+    # Distilasi ensemble terkalibrasi -> satu pohon + tabel probabilitas daun (Backend/models/distill.py)
+    DISTILL_ENABLED = os.environ.get("DISTILL_ENABLED", "1") == "1"  # ikut dijalankan train_model.py
+    DISTILL_MAX_DEPTH = int(os.environ.get("DISTILL_MAX_DEPTH", 12))
+    DISTILL_MIN_SAMPLES_LEAF = int(os.environ.get("DISTILL_MIN_SAMPLES_LEAF", 5))
+    DISTILL_AUGMENT = int(os.environ.get("DISTILL_AUGMENT", 5))  # salinan baris sintetis per baris training
+
+    # Backend eksekusi model:
+    #   'thread'  -> predict_proba dijalankan langsung di thread request (default)
+    #   'process' -> dijalankan di pool proses (model dibagi via fork copy-on-write)
+    INFERENCE_BACKEND = os.environ.get("INFERENCE_BACKEND", "thread")
+    INFERENCE_WORKERS = int(os.environ.get("INFERENCE_WORKERS", 0)) or (os.cpu_count() or 1)
+
+    # Micro-batching: request /api/predict yang datang bersamaan digabung
+    # menjadi satu panggilan predict_proba (berguna untuk worker gthread)
+    MICRO_BATCH_ENABLED = os.environ.get("MICRO_BATCH_ENABLED", "0") == "1"
+    MICRO_BATCH_WINDOW_MS = float(os.environ.get("MICRO_BATCH_WINDOW_MS", 2.0))
+    MICRO_BATCH_MAX_SIZE = int(os.environ.get("MICRO_BATCH_MAX_SIZE", 32))
+    # Jumlah sampel terbaru yang disimpan untuk metrik waktu antri (p50/p99)
+    MICRO_BATCH_METRICS_WINDOW = int(os.environ.get("MICRO_BATCH_METRICS_WINDOW", 1000))
+
+    # Cascade: model tahap-1 murah menilai semua request; hanya probabilitas dalam
+    # (0.5 - BAND, 0.5 + BAND) yang dinilai ulang ensemble penuh. Lihat Scripts/cascade_report.py
+    CASCADE_ENABLED = os.environ.get("CASCADE_ENABLED", "0") == "1"
+    CASCADE_BAND = float(os.environ.get("CASCADE_BAND", 0.15))
+    CASCADE_FIRST_STAGE = os.environ.get("CASCADE_FIRST_STAGE", "auto")  # 'auto' / 'distilled' / 'fold'
+
+    # Admission control per kelas endpoint (Backend/routes/admission.py), batas per worker:
+    # request berjalan bersamaan, antrian tunggu & lama tunggu maks; lewat batas -> 503 + Retry-After.
+    # Prediksi didahulukan: PDF & skrining tidak masuk selama ada prediksi yang menunggu.
+    # Dengan MICRO_BATCH_ENABLED=1 batas predict minimal MICRO_BATCH_MAX_SIZE (batch tidak terpotong).
+    ADMISSION_ENABLED = os.environ.get("ADMISSION_ENABLED", "1") == "1"
+    ADMISSION_PREDICT_CONCURRENCY = int(os.environ.get("ADMISSION_PREDICT_CONCURRENCY", 2))
+    ADMISSION_PREDICT_QUEUE = int(os.environ.get("ADMISSION_PREDICT_QUEUE", 16))
+    ADMISSION_PREDICT_WAIT_MS = float(os.environ.get("ADMISSION_PREDICT_WAIT_MS", 100))
+    ADMISSION_REPORT_CONCURRENCY = int(os.environ.get("ADMISSION_REPORT_CONCURRENCY", 1))
+    ADMISSION_REPORT_QUEUE = int(os.environ.get("ADMISSION_REPORT_QUEUE", 2))
+    ADMISSION_REPORT_WAIT_MS = float(os.environ.get("ADMISSION_REPORT_WAIT_MS", 500))
+    ADMISSION_SCREENING_CONCURRENCY = int(os.environ.get("ADMISSION_SCREENING_CONCURRENCY", 1))
+    # Koneksi SSE fallback /api/logs/stream per worker (masing-masing memegang satu thread gthread;
+    # jika fan-out terpisah diaktifkan, pelanggan dilayani di sana, lihat FEED_SERVER_PORT)
+    ADMISSION_STREAM_CONCURRENCY = int(os.environ.get("ADMISSION_STREAM_CONCURRENCY", 2))
+    ADMISSION_RETRY_AFTER = int(os.environ.get("ADMISSION_RETRY_AFTER", 1))  # header Retry-After (detik)
+
+    # Cache browser untuk aset ber-fingerprint (1 tahun, konten tidak pernah berubah)
+    STATIC_CACHE_MAX_AGE = 31536000
+
+    # Response teks/JSON di atas ukuran ini (bytes) dikompresi gzip
+    GZIP_MIN_SIZE = int(os.environ.get("GZIP_MIN_SIZE", 1024))
+    # Encoder JSON cepat (orjson jika tersedia, NumPy diserialisasi langsung)
+    FAST_JSON = os.environ.get("FAST_JSON", "0") == "1"
+
+    # Monitor drift fitur (/api/drift): histogram bin tetap vs referensi training
+    DRIFT_ENABLED = os.environ.get("DRIFT_ENABLED", "1") == "1"
+    DRIFT_BINS = int(os.environ.get("DRIFT_BINS", 10))
+    # PSI >= WARN -> 'waspada', PSI >= ALERT -> 'drift' (ambang umum 0.1 / 0.25)
+    DRIFT_PSI_WARN = float(os.environ.get("DRIFT_PSI_WARN", 0.1))
+    DRIFT_PSI_ALERT = float(os.environ.get("DRIFT_PSI_ALERT", 0.25))
+    # Statistik belum dihitung sebelum jumlah sampel live mencapai batas ini
+    DRIFT_MIN_SAMPLES = int(os.environ.get("DRIFT_MIN_SAMPLES", 100))
+    # Hitungan dibagi dua setiap kali mencapai jumlah ini (prediksi terbaru lebih berbobot)
+    DRIFT_DECAY_WINDOW = int(os.environ.get("DRIFT_DECAY_WINDOW", 10000))
+
+    # Shadow scoring: kandidat (pointer SHADOW) menilai salinan traffic di thread latar
+    SHADOW_ENABLED = os.environ.get("SHADOW_ENABLED", "1") == "1"
+    SHADOW_QUEUE_SIZE = int(os.environ.get("SHADOW_QUEUE_SIZE", 1000))  # penuh -> sampel dibuang
+    SHADOW_BATCH_SIZE = int(os.environ.get("SHADOW_BATCH_SIZE", 64))
+    SHADOW_MAX_WAIT_MS = float(os.environ.get("SHADOW_MAX_WAIT_MS", 1000))  # jendela pengumpulan batch
+
+    # Pengecekan pointer registry (ACTIVE/SHADOW) untuk hot reload model tanpa restart (detik)
+    MODEL_RELOAD_CHECK_SECONDS = float(os.environ.get("MODEL_RELOAD_CHECK_SECONDS", 2))
+
+    # Readiness probe (/ready): jumlah prediksi sintetis per warmup & batas median latensinya (ms)
+    READY_WARMUP_ROUNDS = int(os.environ.get("READY_WARMUP_ROUNDS", 5))
+    READY_MAX_LATENCY_MS = float(os.environ.get("READY_MAX_LATENCY_MS", 250))
+
+    # Batas sumber daya proses job training (0 = tanpa batas)
+    TRAINING_NICE = int(os.environ.get("TRAINING_NICE", 10))              # prioritas CPU lebih rendah
+    TRAINING_CPU_CORES = int(os.environ.get("TRAINING_CPU_CORES", 1))     # afinitas & thread BLAS
+    TRAINING_MEMORY_MB = int(os.environ.get("TRAINING_MEMORY_MB", 2048))  # RLIMIT_AS
+    TRAINING_CPU_SECONDS = int(os.environ.get("TRAINING_CPU_SECONDS", 3600))  # RLIMIT_CPU
+    # Token endpoint /api/admin/* (header X-Admin-Token); kosong = endpoint admin nonaktif (403)
+    ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+
+    # Statistik prediksi (/api/stats): jeda minimum antar penyimpanan agregat ke disk (detik)
+    STATS_FLUSH_SECONDS = float(os.environ.get("STATS_FLUSH_SECONDS", 5))
+
+    # Segmen log prediksi per worker: rotasi per ukuran, jeda antar gabung ke log kanonik (detik),
+    # dan grace: baris yang lebih muda dari ini ditahan agar log kanonik tetap urut timestamp
+    LOG_SEGMENT_MAX_BYTES = int(os.environ.get("LOG_SEGMENT_MAX_BYTES", 4 * 1024 * 1024))
+    LOG_SEGMENT_MERGE_SECONDS = float(os.environ.get("LOG_SEGMENT_MERGE_SECONDS", 2))
+    LOG_SEGMENT_GRACE_SECONDS = float(os.environ.get("LOG_SEGMENT_GRACE_SECONDS", 1))
+
+    # Feed live riwayat (/api/logs, /api/logs/stream): ukuran ring buffer, jeda tailer segmen worker lain,
+    # umur maksimum satu koneksi SSE endpoint Flask (fallback), heartbeat & jeda reconnect klien
+    FEED_BUFFER_SIZE = int(os.environ.get("FEED_BUFFER_SIZE", 500))
+    FEED_POLL_SECONDS = float(os.environ.get("FEED_POLL_SECONDS", 0.5))
+    FEED_STREAM_SECONDS = float(os.environ.get("FEED_STREAM_SECONDS", 25))
+    FEED_HEARTBEAT_SECONDS = float(os.environ.get("FEED_HEARTBEAT_SECONDS", 15))
+    FEED_RETRY_MS = int(os.environ.get("FEED_RETRY_MS", 2000))
+    # Fan-out SSE terpisah (Backend/routes/feed_server.py, asyncio): port 0 = nonaktif (pakai endpoint Flask).
+    # Opt-in (0 = nonaktif): port harus terbuka untuk browser; FEED_STREAM_URL = URL publik jika di belakang proxy
+    FEED_SERVER_PORT = int(os.environ.get("FEED_SERVER_PORT", 0))
+    FEED_SERVER_HOST = os.environ.get("FEED_SERVER_HOST", "0.0.0.0")
+    FEED_SERVER_MAX_CLIENTS = int(os.environ.get("FEED_SERVER_MAX_CLIENTS", 5000))
+    FEED_STREAM_URL = os.environ.get("FEED_STREAM_URL", "")
+    # Origin halaman riwayat yang boleh membaca fan-out lintas port (misal https://app.example.com);
+    # kosong = tanpa header CORS (data pasien tidak dibuka untuk origin lain)
+    FEED_SERVER_ALLOW_ORIGIN = os.environ.get("FEED_SERVER_ALLOW_ORIGIN", "")
+
+    # Pencarian log (/api/logs/search): kompaksi log CSV -> store kolumnar
+    LOG_STORE_COMPACT_SECONDS = float(os.environ.get("LOG_STORE_COMPACT_SECONDS", 10))
+    LOG_STORE_PART_ROWS = int(os.environ.get("LOG_STORE_PART_ROWS", 1000000))  # ukuran maks part hasil gabung
+    LOG_STORE_BATCH_ROWS = int(os.environ.get("LOG_STORE_BATCH_ROWS", 200000))  # baris log per batch kompaksi (memori)
+    LOG_STORE_MERGE_FANIN = int(os.environ.get("LOG_STORE_MERGE_FANIN", 8))    # part selevel yang digabung
+    LOG_SEARCH_MAX_PAGE_SIZE = int(os.environ.get("LOG_SEARCH_MAX_PAGE_SIZE", 500))
+
+    # Skrining massal (/api/screening): jumlah baris CSV yang diproses per chunk
+    SCREENING_CHUNK_SIZE = int(os.environ.get("SCREENING_CHUNK_SIZE", 5000))
 
     # =========================================
-    # 6. AUTO-INIT UTILITY
+    # 7. AUTO-INIT UTILITY
     # =========================================
     @classmethod
     def init_app(cls):
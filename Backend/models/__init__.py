@@ -6,7 +6,7 @@ File ini menyederhanakan proses import di routes.py.
 
 # Import komponen utama dari file-file di dalam folder models
 from .decision_tree_model import DiabetesModel
-from .preprocess import DiabetesPreprocessor
+from .preprocess import DiabetesPreprocessor, DiabetesFeatureTransformer
 from .utils import validate_input_data, log_prediction
 
 # Mendefinisikan apa yang akan di-import jika menggunakan 'from Backend.models import *'
@@ -14,6 +14,7 @@ from .utils import validate_input_data, log_prediction
 __all__ = [
     'DiabetesModel',
     'DiabetesPreprocessor',
+    'DiabetesFeatureTransformer',
     'validate_input_data',
     'log_prediction'
 ]
\ No newline at end of file
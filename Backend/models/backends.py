@@ -0,0 +1,106 @@
+"""
+Backend/models/backends.py
+Backend model yang bisa dipilih saat training (Scripts/train_model.py --backend / Config.MODEL_BACKEND).
+Semua backend menghasilkan estimator sklearn dengan predict_proba di atas fitur ter-encode
+(urutan Config.FEATURES), sehingga format bundle, inference, registry & shadow tetap sama:
+1. calibrated_tree -> Decision Tree + kalibrasi sigmoid 5 fold (default, model sebelumnya)
+2. tree            -> satu Decision Tree tanpa kalibrasi (paling ringan)
+3. hist_gb         -> HistGradientBoostingClassifier
+4. logreg          -> Logistic Regression (fitur distandarisasi)
+
+Bandingkan biaya & akurasinya dengan Scripts/benchmark_backends.py.
+"""
+
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from Backend.config import Config
+
+
+class UnknownBackendError(ValueError):
+    """Nama backend tidak terdaftar."""
+
+
+class ModelBackend:
+    """Resep estimator: nama, deskripsi algoritma (metadata/UI), dan builder estimator baru."""
+
+    def __init__(self, name: str, algorithm: str, build: Callable):
+        self.name = name
+        self.algorithm = algorithm
+        self._build = build
+
+    def build(self):
+        """Estimator baru (belum di-fit)."""
+        return self._build()
+
+
+def _decision_tree():
+    # Hyperparameter pohon yang sama dengan model sebelumnya
+    return Pipeline([
+        ('scaler', StandardScaler()),
+        ('dt', DecisionTreeClassifier(
+            criterion="entropy", max_depth=6, min_samples_leaf=10,
+            min_samples_split=20, class_weight="balanced", random_state=42
+        ))
+    ])
+
+
+BACKENDS: Dict[str, ModelBackend] = {
+    'calibrated_tree': ModelBackend(
+        'calibrated_tree', 'Calibrated Decision Tree (Entropy)',
+        lambda: CalibratedClassifierCV(estimator=_decision_tree(), method='sigmoid', cv=5)),
+    'tree': ModelBackend(
+        'tree', 'Decision Tree (Entropy, tanpa kalibrasi)', _decision_tree),
+    'hist_gb': ModelBackend(
+        'hist_gb', 'Histogram Gradient Boosting',
+        lambda: HistGradientBoostingClassifier(
+            max_iter=200, learning_rate=0.1, max_leaf_nodes=31,
+            class_weight='balanced', random_state=42)),
+    'logreg': ModelBackend(
+        'logreg', 'Logistic Regression (Standardized)',
+        lambda: Pipeline([
+            ('scaler', StandardScaler()),
+            ('lr', LogisticRegression(max_iter=1000, class_weight='balanced')),
+        ])),
+}
+
+
+def list_backends() -> List[str]:
+    return list(BACKENDS)
+
+
+def get_backend(name: str = None) -> ModelBackend:
+    name = name or Config.MODEL_BACKEND
+    if name not in BACKENDS:
+        raise UnknownBackendError(f"Backend model '{name}' tidak dikenal. Pilihan: {', '.join(BACKENDS)}")
+    return BACKENDS[name]
+
+
+def feature_importances(model) -> Optional[np.ndarray]:
+    """
+    Bobot kepentingan fitur (jumlah = 1, urutan Config.FEATURES) dari model terlatih backend mana pun,
+    atau None jika model tidak menyediakannya (misal HistGradientBoosting).
+    Model terkalibrasi: fold pertama sebagai representasi.
+    """
+    if hasattr(model, 'calibrated_classifiers_'):
+        model = model.calibrated_classifiers_[0].estimator
+    if hasattr(model, 'steps'):
+        model = model.steps[-1][1]
+
+    if hasattr(model, 'feature_importances_'):
+        values = np.asarray(model.feature_importances_, dtype=np.float64)
+    elif hasattr(model, 'coef_'):
+        # Koefisien pada fitur terstandarisasi -> besar pengaruh relatif
+        values = np.abs(np.asarray(model.coef_, dtype=np.float64)).ravel()
+    else:
+        return None
+
+    total = values.sum()
+    return values / total if total > 0 else values
@@ -0,0 +1,59 @@
+"""
+Backend/models/bundle.py
+Memuat bundle model (decision_tree_bundle.pkl) dalam format yang seragam:
+1. 'model'        -> estimator yang menerima fitur ter-encode (urutan Config.FEATURES)
+2. 'preprocessor' -> DiabetesFeatureTransformer yang sudah di-fit (record mentah -> fitur)
+3. 'pipeline'     -> Pipeline(preprocessor, model): satu predict_proba untuk record mentah
+4. 'preprocess_version' -> versi aturan preprocessing saat model dilatih
+
+Bundle lama (tanpa transformer) tetap bisa dipakai: transformer dibuat saat load dan
+diasumsikan versi "1" (aturan clean_and_encode saat bundle lama dilatih).
+"""
+
+import joblib
+from sklearn.pipeline import Pipeline
+
+from Backend.models.preprocess import PREPROCESS_VERSION, DiabetesFeatureTransformer
+from Backend.models.registry import active_paths
+
+# Versi preprocessing yang dipakai bundle sebelum versi dicatat di dalam bundle
+LEGACY_PREPROCESS_VERSION = "1"
+
+
+class PreprocessVersionError(ValueError):
+    """Bundle dilatih dengan aturan preprocessing berbeda dari kode saat ini."""
+
+
+def build_pipeline(preprocessor, model) -> Pipeline:
+    return Pipeline([('preprocess', preprocessor), ('model', model)])
+
+
+def load_model_bundle(path: str = None) -> dict:
+    """
+    Muat & normalisasi bundle (default: versi aktif registry / Config.MODEL_PATH).
+    Raise PreprocessVersionError jika versi tidak cocok.
+    """
+    path = path or active_paths()[0]
+    data = joblib.load(path)
+    bundle = dict(data) if isinstance(data, dict) and 'model' in data else {'model': data}
+
+    version = bundle.get('preprocess_version') or LEGACY_PREPROCESS_VERSION
+    if version != PREPROCESS_VERSION:
+        raise PreprocessVersionError(
+            f"Bundle {path} dibuat dengan preprocessing versi {version}, "
+            f"kode saat ini versi {PREPROCESS_VERSION}. Latih ulang model (Scripts/train_model.py)."
+        )
+
+    preprocessor = bundle.get('preprocessor')
+    if preprocessor is None:
+        preprocessor = DiabetesFeatureTransformer().fit()
+    elif getattr(preprocessor, 'version_', version) != version:
+        raise PreprocessVersionError(
+            f"Versi transformer di bundle ({preprocessor.version_}) tidak sama dengan "
+            f"preprocess_version bundle ({version})."
+        )
+
+    bundle['preprocessor'] = preprocessor
+    bundle['preprocess_version'] = version
+    bundle.setdefault('pipeline', build_pipeline(preprocessor, bundle['model']))
+    return bundle
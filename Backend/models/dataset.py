@@ -0,0 +1,209 @@
+"""
+Backend/models/dataset.py
+Loader dataset terpusat untuk semua script (training, evaluasi, analisis, skoring):
+1. Dtype ringkas dideklarasikan di Config (float32 / category / bool), tanpa inferensi pandas
+2. Engine PyArrow dipakai otomatis untuk load penuh jika terinstall (multithread, lebih hemat)
+3. Iterasi per chunk untuk file yang lebih besar dari RAM (opsional dengan offset byte untuk resume)
+4. Nilai rusak di kolom numerik dijadikan NaN (dilaporkan), bukan menggagalkan seluruh load
+5. Laporan memori: ukuran DataFrame & peak RSS proses
+"""
+
+import io
+import os
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from Backend.config import Config
+
+# Coba import pyarrow, jika belum install tetap jalan dengan engine C bawaan pandas
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# --- 1. SKEMA & ENGINE ---
+def dataset_dtypes(kind: str = 'raw') -> Dict[str, str]:
+    """Dtype kolom untuk 'raw' (diabetes.csv) atau 'balanced' (diabetes_balanced.csv)."""
+    return dict(Config.BALANCED_DATA_DTYPES if kind == 'balanced' else Config.RAW_DATA_DTYPES)
+
+
+def default_path(kind: str = 'raw') -> str:
+    return Config.BALANCED_DATA if kind == 'balanced' else Config.RAW_DATA
+
+
+def resolve_engine(engine: Optional[str] = None) -> str:
+    engine = engine or Config.DATASET_ENGINE
+    if engine == 'auto':
+        return 'pyarrow' if HAS_PYARROW else 'c'
+    if engine == 'pyarrow' and not HAS_PYARROW:
+        print("ℹ️  Modul 'pyarrow' tidak ada, memakai engine C (pip install pyarrow).")
+        return 'c'
+    return engine
+
+
+def _is_numeric(dtype: str) -> bool:
+    return dtype != 'category' and dtype not in (str, 'str', 'object')
+
+
+def _declared(path: str, dtypes: Dict[str, str]) -> Dict[str, str]:
+    """Dtype hanya untuk kolom yang benar-benar ada di header file."""
+    header = pd.read_csv(path, nrows=0).columns
+    return {c: t for c, t in dtypes.items() if c in header}
+
+
+# --- 2. KOERSI NILAI RUSAK ---
+def _coerce(chunk: pd.DataFrame, dtypes: Dict[str, str]) -> int:
+    """Ubah kolom teks ke dtype deklarasi (in-place). Return: jumlah nilai rusak -> NaN."""
+    invalid = 0
+    for col, dtype in dtypes.items():
+        if col not in chunk.columns or not _is_numeric(dtype):
+            continue
+        raw = chunk[col]
+        values = pd.to_numeric(raw, errors='coerce')
+        if dtype == 'bool':
+            values = values.where(values.isin([0, 1]))
+            chunk[col] = values.astype('boolean')
+        elif np.issubdtype(np.dtype(dtype), np.integer):
+            # Integer dengan NaN -> tipe nullable (Int8, Int32, ...)
+            chunk[col] = values.astype(dtype.capitalize())
+        else:
+            chunk[col] = values.astype(dtype)
+        invalid += int((values.isna() & raw.notna()).sum())
+    return invalid
+
+
+def concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Gabung chunk tanpa kehilangan dtype 'category' (kategori disatukan dulu)."""
+    if not chunks:
+        return pd.DataFrame()
+    for col in chunks[0].columns:
+        if isinstance(chunks[0][col].dtype, pd.CategoricalDtype):
+            categories = union_categoricals([c[col] for c in chunks]).categories
+            for chunk in chunks:
+                chunk[col] = chunk[col].cat.set_categories(categories)
+    return pd.concat(chunks, ignore_index=True)
+
+
+# --- 3. LOADER ---
+def iter_dataset(path: str = None, kind: str = 'raw', chunksize: int = None,
+                 dtypes: Dict[str, str] = None, strict: bool = False,
+                 skiprows=None, usecols=None) -> Iterator[pd.DataFrame]:
+    """
+    Iterasi dataset per chunk dengan dtype deklarasi.
+    strict=True  -> kolom numerik diparse langsung (tercepat, error jika ada nilai rusak)
+    strict=False -> kolom numerik dibaca sebagai teks per chunk lalu dikoersi (nilai rusak -> NaN)
+    """
+    path = path or default_path(kind)
+    declared = _declared(path, dtypes or dataset_dtypes(kind))
+    read_dtypes = declared if strict else {c: (str if _is_numeric(t) else t) for c, t in declared.items()}
+
+    reader = pd.read_csv(path, chunksize=chunksize or Config.DATASET_CHUNK_SIZE,
+                         dtype=read_dtypes, skiprows=skiprows, usecols=usecols)
+    invalid = 0
+    for chunk in reader:
+        if not strict:
+            invalid += _coerce(chunk, declared)
+        yield chunk
+    if invalid:
+        print(f"⚠️  {invalid} nilai rusak di {os.path.basename(path)} dijadikan NaN.")
+
+
+def _record_blocks(path: str, chunksize: int, offset: int = 0) -> Iterator[Tuple[bytes, bytes, int]]:
+    """
+    (header, blok byte berisi <= chunksize record CSV utuh, offset byte setelah blok).
+    Batas record mengikuti kutip ganda, jadi newline di dalam field berkutip tidak memotong record.
+    """
+    with open(path, 'rb') as f:
+        header = f.readline()
+        if offset > f.tell():
+            f.seek(offset)
+        else:
+            offset = f.tell()
+        lines, n_records, quoted = [], 0, False
+        for line in f:
+            lines.append(line)
+            offset += len(line)
+            if line.count(b'"') % 2:
+                quoted = not quoted
+            if quoted:
+                continue
+            n_records += 1
+            if n_records >= chunksize:
+                yield header, b''.join(lines), offset
+                lines, n_records = [], 0
+        if lines:
+            yield header, b''.join(lines), offset
+
+
+def iter_dataset_offsets(path: str = None, kind: str = 'raw', chunksize: int = None,
+                         dtypes: Dict[str, str] = None, strict: bool = False,
+                         offset: int = 0) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """
+    Seperti iter_dataset, plus offset byte input setelah setiap chunk (untuk checkpoint).
+    offset: lanjut dari posisi byte ini (hasil chunk sebelumnya) dengan seek, tanpa membaca
+    atau mem-parse ulang baris yang sudah selesai.
+    """
+    path = path or default_path(kind)
+    declared = _declared(path, dtypes or dataset_dtypes(kind))
+    read_dtypes = declared if strict else {c: (str if _is_numeric(t) else t) for c, t in declared.items()}
+
+    invalid = 0
+    for header, block, end in _record_blocks(path, chunksize or Config.DATASET_CHUNK_SIZE, offset):
+        chunk = pd.read_csv(io.BytesIO(header + block), dtype=read_dtypes)
+        if chunk.empty:  # Blok berisi baris kosong saja
+            continue
+        if not strict:
+            invalid += _coerce(chunk, declared)
+        yield chunk, end
+    if invalid:
+        print(f"⚠️  {invalid} nilai rusak di {os.path.basename(path)} dijadikan NaN.")
+
+
+def load_dataset(path: str = None, kind: str = 'raw', engine: str = None,
+                 dtypes: Dict[str, str] = None, strict: bool = False, usecols=None) -> pd.DataFrame:
+    """
+    Load penuh dengan dtype deklarasi (engine PyArrow jika tersedia).
+    Jika file berisi nilai rusak, dibaca ulang per chunk dengan koersi (kecuali strict=True).
+    """
+    path = path or default_path(kind)
+    declared = _declared(path, dtypes or dataset_dtypes(kind))
+    engine = resolve_engine(engine)
+
+    try:
+        return pd.read_csv(path, dtype=declared, engine=engine, usecols=usecols)
+    except (ValueError, TypeError) as e:
+        if strict:
+            raise
+        print(f"⚠️  Parsing cepat gagal ({e}). Membaca ulang per chunk dengan koersi...")
+        return concat_chunks(list(iter_dataset(path, kind, dtypes=declared, usecols=usecols)))
+
+
+# --- 4. LAPORAN MEMORI ---
+def frame_memory_mb(df: pd.DataFrame) -> float:
+    return float(df.memory_usage(deep=True).sum()) / (1024 ** 2)
+
+
+def peak_rss_mb(who: str = 'self') -> float:
+    """Peak RSS proses ini ('self') atau child yang sudah selesai ('children'), dalam MB."""
+    if resource is None:
+        return 0.0
+    target = resource.RUSAGE_CHILDREN if who == 'children' else resource.RUSAGE_SELF
+    peak = resource.getrusage(target).ru_maxrss
+    # Linux: KB, macOS: bytes
+    return peak / (1024 ** 2) if sys.platform == 'darwin' else peak / 1024
+
+
+def memory_report(df: pd.DataFrame, label: str = 'Dataset') -> str:
+    return (f"🧠 {label}: {len(df):,} baris | {frame_memory_mb(df):.2f} MB di memori | "
+            f"peak RSS proses {peak_rss_mb():.1f} MB")
@@ -1,5 +1,4 @@
 import os
-import joblib
 import pandas as pd
 import numpy as np
 import threading  # Tambahan untuk Thread Safety
@@ -7,7 +6,8 @@ from datetime import datetime
 from typing import Dict, Any
 
 from Backend.config import Config
-from Backend.models.preprocess import DiabetesPreprocessor
+from Backend.models.bundle import load_model_bundle
+from Backend.models.registry import active_paths
 
 class DiabetesModel:
     _instance = None
@@ -24,28 +24,23 @@ class DiabetesModel:
 
     def __init__(self):
         self.model_bundle = None
-        self.preprocessor = DiabetesPreprocessor()
+        self.preprocessor = None  # DiabetesFeatureTransformer dari bundle
         self.load_bundle()
 
     def load_bundle(self):
-        """Load model .pkl dari disk"""
-        if not os.path.exists(Config.MODEL_PATH):
-            print(f"⚠️ Warning: Model file not found at {Config.MODEL_PATH}")
+        """Load model .pkl dari disk (versi aktif registry / file lama)"""
+        model_path = active_paths()[0]
+        if not os.path.exists(model_path):
+            print(f"⚠️ Warning: Model file not found at {model_path}")
             self.model_bundle = None
             return
 
         try:
-            # Gunakan mmap_mode='r' untuk efisiensi jika model sangat besar
-            bundle_data = joblib.load(Config.MODEL_PATH)
-            
-            # Normalisasi Format Bundle (Support Dict & Object langsung)
-            if isinstance(bundle_data, dict) and 'model' in bundle_data:
-                self.model_bundle = bundle_data
-            else:
-                # Jika format lama (langsung objek model), bungkus jadi dict
-                self.model_bundle = {'model': bundle_data}
-            
-            print(f"✅ Model loaded successfully from {Config.MODEL_PATH}")
+            # Normalisasi format bundle (dict / objek langsung) + cek versi preprocessing
+            self.model_bundle = load_model_bundle(model_path)
+            self.preprocessor = self.model_bundle['preprocessor']
+
+            print(f"✅ Model loaded successfully from {model_path}")
         except Exception as e:
             print(f"❌ Failed to load model: {e}")
             self.model_bundle = None
@@ -61,20 +56,8 @@ class DiabetesModel:
             }
 
         try:
-            # 1. Konversi ke DataFrame
-            df_raw = pd.DataFrame([input_data])
-
-            # 2. Preprocessing
-            df_clean = self.preprocessor.clean_and_encode(df_raw, is_training=False)
-            
-            if df_clean.empty:
-                return {
-                    "success": False,
-                    "error": "Validasi klinis gagal. Pastikan parameter (Glukosa, BMI, dll) dalam rentang medis yang wajar."
-                }
-
-            # 3. Ambil Fitur sesuai urutan saat training
-            X = self.preprocessor.get_features(df_clean)
+            # 1-3. Preprocessing -> fitur sesuai urutan saat training (transformer bundle)
+            X = self.preprocessor.transform(input_data)
 
             # 4. Prediksi
             model = self.model_bundle['model']
@@ -100,7 +83,7 @@ class DiabetesModel:
                 "risk_level": risk_level,
                 "interpretation": interpretation,
                 # Mengembalikan data bersih untuk verifikasi
-                "input_data": df_clean.to_dict(orient='records')[0], 
+                "input_data": X.to_dict(orient='records')[0],
                 "model_info": {
                     "algorithm": self.model_bundle.get('algorithm', 'Decision Tree'),
                     "accuracy": f"{self.model_bundle.get('accuracy_cv', 0.0) * 100:.2f}%",
@@ -0,0 +1,225 @@
+"""
+Backend/models/distill.py
+Distilasi ensemble terkalibrasi (CalibratedClassifierCV cv=5: 5 pipeline + 5 kalibrator sigmoid)
+menjadi SATU pohon + tabel probabilitas daun:
+1. Guru (model terlatih) memberi probabilitas terkalibrasi untuk data training
+   (+ baris sintetis hasil acak-ulang kolom agar ruang fitur di antara sampel ikut tertutup)
+2. Satu DecisionTreeRegressor dilatih meniru probabilitas itu
+3. Tabel node -> probabilitas dihitung sekali; prediksi = satu jalan akar->daun + lookup
+   (tanpa scaler & kalibrator; pohon tidak terpengaruh skala fitur)
+
+Hasilnya disimpan sebagai versi registry tersendiri (metadata 'distilled_from'), sehingga bisa
+dibandingkan (Scripts/evaluate_model.py), di-shadow, lalu diaktifkan seperti model lain.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.metrics import accuracy_score, brier_score_loss, f1_score, roc_auc_score
+from sklearn.tree import DecisionTreeRegressor
+
+from Backend.config import Config
+from Backend.models import registry
+
+DISTILLED_BACKEND = 'distilled_tree'
+# Backend ensemble yang layak didistilasi (pohon tunggal / regresi logistik sudah murah)
+DISTILL_TEACHERS = ('calibrated_tree', 'hist_gb')
+THRESHOLD = 0.5  # Sama dengan /api/predict
+
+
+class DistilledTree(BaseEstimator, ClassifierMixin):
+    """Pohon tunggal peniru probabilitas guru. predict_proba = lookup node_proba_[daun]."""
+
+    def __init__(self, max_depth: int = 12, min_samples_leaf: int = 5, random_state: int = 42):
+        self.max_depth = max_depth
+        self.min_samples_leaf = min_samples_leaf
+        self.random_state = random_state
+
+    def fit(self, X, teacher_proba):
+        """teacher_proba: P(Diabetic) guru per baris (0-1), bukan label."""
+        self.regressor_ = DecisionTreeRegressor(
+            max_depth=self.max_depth, min_samples_leaf=self.min_samples_leaf,
+            random_state=self.random_state,
+        ).fit(self._matrix(X), np.asarray(teacher_proba, dtype=np.float64))
+        self.classes_ = np.array([0, 1])
+        self.n_features_in_ = len(Config.FEATURES)
+        # Tabel probabilitas untuk SEMUA node (daun dipakai prediksi, node dalam dipakai explain.py)
+        self.node_proba_ = np.clip(self.regressor_.tree_.value[:, 0, 0], 0.0, 1.0)
+        return self
+
+    @staticmethod
+    def _matrix(X) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            if list(X.columns) != Config.FEATURES:
+                X = X[Config.FEATURES]
+            X = X.to_numpy()
+        # Sama seperti sklearn: fitur dibandingkan sebagai float32 (C-contiguous untuk Tree.apply)
+        return np.ascontiguousarray(np.atleast_2d(X), dtype=np.float32)
+
+    @property
+    def tree_(self):
+        return self.regressor_.tree_
+
+    @property
+    def feature_importances_(self):
+        return self.regressor_.feature_importances_
+
+    def apply(self, X) -> np.ndarray:
+        # Langsung ke Tree.apply (Cython) tanpa validasi input sklearn per panggilan
+        return self.regressor_.tree_.apply(self._matrix(X))
+
+    def predict_proba(self, X) -> np.ndarray:
+        p = self.node_proba_[self.apply(X)]
+        return np.column_stack([1.0 - p, p])
+
+    def predict(self, X) -> np.ndarray:
+        return (self.predict_proba(X)[:, 1] > THRESHOLD).astype(int)
+
+
+# --- 1. DISTILASI ---
+def augment(X: pd.DataFrame, copies: int, seed: int = 42) -> pd.DataFrame:
+    """Baris sintetis: setiap kolom diambil dari baris training acak (distribusi marginal tetap)."""
+    if copies <= 0:
+        return X
+    rng = np.random.default_rng(seed)
+    n = len(X) * copies
+    synthetic = pd.DataFrame({col: X[col].to_numpy()[rng.integers(len(X), size=n)] for col in X.columns})
+    return pd.concat([X, synthetic], ignore_index=True)
+
+
+def distill(teacher, X: pd.DataFrame, max_depth: int = None, min_samples_leaf: int = None,
+            augment_copies: int = None) -> DistilledTree:
+    """Latih DistilledTree dari probabilitas guru pada X (+ baris augmentasi)."""
+    X = X[Config.FEATURES]
+    X_fit = augment(X, Config.DISTILL_AUGMENT if augment_copies is None else augment_copies)
+    teacher_proba = teacher.predict_proba(X_fit)[:, 1]
+    return DistilledTree(
+        max_depth=max_depth or Config.DISTILL_MAX_DEPTH,
+        min_samples_leaf=min_samples_leaf or Config.DISTILL_MIN_SAMPLES_LEAF,
+    ).fit(X_fit, teacher_proba)
+
+
+def distilled_bundle(student: DistilledTree, teacher_bundle: Dict[str, Any],
+                     teacher_version: Optional[str]) -> Dict[str, Any]:
+    """Bundle format standar (lihat models/bundle.py) dengan preprocessor yang sama dengan guru."""
+    from Backend.models.bundle import build_pipeline
+    bundle = {k: v for k, v in teacher_bundle.items() if k not in ('model', 'pipeline')}
+    bundle.update({
+        'model': student,
+        'pipeline': build_pipeline(teacher_bundle['preprocessor'], student),
+        'backend': DISTILLED_BACKEND,
+        'algorithm': f"Distilled Decision Tree (dari {teacher_bundle.get('algorithm', 'ensemble')})",
+        'distilled_from': teacher_version or 'legacy',
+    })
+    return bundle
+
+
+# --- 2. PERBANDINGAN GURU vs MURID ---
+def _metrics(y, proba) -> Dict[str, float]:
+    pred = (proba > THRESHOLD).astype(int)
+    out = {'accuracy': accuracy_score(y, pred), 'f1': f1_score(y, pred, zero_division=0),
+           'brier': brier_score_loss(y, proba)}
+    try:
+        out['roc_auc'] = roc_auc_score(y, proba)
+    except ValueError:
+        out['roc_auc'] = None
+    return {k: round(float(v), 4) if v is not None else None for k, v in out.items()}
+
+
+def measure_latency(model, X: pd.DataFrame, repeats: int = 200) -> Dict[str, float]:
+    """p50 predict_proba 1 baris (seperti /api/predict) & per baris untuk batch (seperti /api/screening)."""
+    row = X.iloc[:1]
+    model.predict_proba(row)
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        model.predict_proba(row)
+        samples.append(time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    model.predict_proba(X)
+    batch = time.perf_counter() - t0
+    return {'single_us_p50': round(float(np.median(samples)) * 1e6, 1),
+            'batch_us_per_row': round(batch * 1e6 / len(X), 3)}
+
+
+def compare(teacher, student, X: pd.DataFrame, y=None, latency: bool = True) -> Dict[str, Any]:
+    """Seberapa jauh probabilitas, label & metrik murid menyimpang dari guru pada X."""
+    p_teacher = teacher.predict_proba(X)[:, 1]
+    p_student = student.predict_proba(X)[:, 1]
+    delta = np.abs(p_student - p_teacher) * 100  # poin persen
+
+    report = {
+        'rows': int(len(X)),
+        'label_agreement': round(float(((p_teacher > THRESHOLD) == (p_student > THRESHOLD)).mean()), 4),
+        'delta_pp': {
+            'mean_abs': round(float(delta.mean()), 3),
+            'p99_abs': round(float(np.percentile(delta, 99)), 3),
+            'max_abs': round(float(delta.max()), 3),
+        },
+        'leaves': int(student.regressor_.get_n_leaves()),
+        'depth': int(student.regressor_.get_depth()),
+    }
+    if y is not None:
+        report['metrics'] = {'teacher': _metrics(y, p_teacher), 'student': _metrics(y, p_student)}
+    if latency:
+        t, s = measure_latency(teacher, X), measure_latency(student, X)
+        report['latency'] = {'teacher': t, 'student': s,
+                             'single_speedup': round(t['single_us_p50'] / max(s['single_us_p50'], 1e-9), 1)}
+    return report
+
+
+def summary_lines(report: Dict[str, Any]) -> list:
+    """Ringkasan laporan compare() untuk dicetak script."""
+    delta = report['delta_pp']
+    lines = [
+        f"Pohon distilasi      : {report['leaves']} daun, kedalaman {report['depth']}",
+        f"Kesepakatan label    : {report['label_agreement']:.2%} dari {report['rows']:,} baris",
+        f"|Selisih prob.| (pp) : rata-rata {delta['mean_abs']}, p99 {delta['p99_abs']}, maks {delta['max_abs']}",
+    ]
+    for name, values in (report.get('metrics') or {}).items():
+        label = 'Guru (ensemble)' if name == 'teacher' else 'Murid (distilasi)'
+        lines.append(f"{label:<21}: " + ", ".join(f"{k} {v}" for k, v in values.items()))
+    if report.get('latency'):
+        t, s = report['latency']['teacher'], report['latency']['student']
+        lines.append(f"Latensi 1 baris p50  : {t['single_us_p50']} µs -> {s['single_us_p50']} µs "
+                     f"({report['latency']['single_speedup']}x lebih cepat)")
+        lines.append(f"Batch per baris      : {t['batch_us_per_row']} µs -> {s['batch_us_per_row']} µs")
+    return lines
+
+
+def register_distilled(teacher_bundle: Dict[str, Any], teacher_version: Optional[str], X: pd.DataFrame,
+                       y=None, metadata: Dict[str, Any] = None, extras: Dict[str, Any] = None,
+                       root: str = None):
+    """Distilasi + simpan sebagai versi registry baru. Return: (versi, laporan perbandingan)."""
+    teacher_bundle = dict(teacher_bundle)
+    teacher_bundle.setdefault('algorithm', (metadata or {}).get('algorithm', 'ensemble'))
+    student = distill(teacher_bundle['model'], X)
+    report = compare(teacher_bundle['model'], student, X[Config.FEATURES], y)
+    bundle = distilled_bundle(student, teacher_bundle, teacher_version)
+    # Metrik CV & confusion matrix milik guru tidak berlaku untuk murid
+    meta = {k: v for k, v in (metadata or {}).items()
+            if k not in ('accuracy_cv', 'accuracy_train', 'metrics', 'confusion_matrix')}
+    top = sorted(zip(Config.FEATURES, student.feature_importances_), key=lambda x: x[1], reverse=True)
+    meta.update({
+        'algorithm': bundle['algorithm'],
+        'backend': DISTILLED_BACKEND,
+        'distilled_from': bundle['distilled_from'],
+        'distillation': report,
+        'top_features': {k: round(float(v), 4) for k, v in top[:5]},
+    })
+    if report.get('metrics'):
+        meta['metrics'] = report['metrics']['student']
+        meta['accuracy_train'] = report['metrics']['student']['accuracy']
+    return registry.register(bundle, meta, root, extras=extras), report
+
+
+def find_distilled(version: Optional[str], root: str = None) -> Optional[str]:
+    """Versi distilasi terbaru dari guru 'version' (None = file model lama -> 'legacy')."""
+    teacher = version or 'legacy'
+    for candidate in reversed(registry.list_versions(root)):
+        if registry.read_meta(candidate, root).get('distilled_from') == teacher:
+            return candidate
+    return None
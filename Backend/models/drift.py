@@ -0,0 +1,249 @@
+"""
+Backend/models/drift.py
+Monitor drift fitur untuk prediksi live (apakah pasien yang masuk masih mirip data training):
+1. build_reference(X)  -> dihitung SEKALI saat training: batas bin tetap per fitur (kuantil),
+                          proporsi per bin, mean & std data training
+2. DriftMonitor        -> diperbarui tiap prediksi: histogram bin tetap + momen berjalan
+                          (Welford/Chan), update O(1) & memori konstan berapapun trafiknya
+3. report()            -> PSI & aproksimasi KS (selisih CDF di batas bin) per fitur
+
+Agar prediksi terbaru lebih berbobot, semua hitungan dibagi dua setiap kali total
+sampel mencapai Config.DRIFT_DECAY_WINDOW (peluruhan eksponensial bertahap).
+Catatan: dengan beberapa worker gunicorn, setiap proses punya monitornya sendiri.
+"""
+
+import os
+import json
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from Backend.config import Config
+from Backend.models.preprocess import PREPROCESS_VERSION
+
+# Konstanta KS dua sampel untuk alpha = 0.05
+KS_ALPHA_COEF = 1.358
+# Proporsi minimum per bin agar log(0) tidak terjadi pada PSI
+PSI_EPS = 1e-4
+
+
+# --- 1. REFERENSI (SAAT TRAINING) ---
+def _bin_edges(values: np.ndarray, bins: int) -> np.ndarray:
+    """Batas bin internal. Fitur diskrit (<= bins nilai unik) -> titik tengah antar nilai."""
+    uniques = np.unique(values)
+    if len(uniques) <= bins:
+        return (uniques[:-1] + uniques[1:]) / 2.0
+    quantiles = np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1])
+    return np.unique(quantiles)
+
+
+def build_reference(X: pd.DataFrame, bins: int = None, source: str = '') -> Dict[str, Any]:
+    """Distribusi referensi per fitur dari matriks fitur training (urutan Config.FEATURES)."""
+    bins = bins or Config.DRIFT_BINS
+    features = {}
+    for name in Config.FEATURES:
+        values = pd.to_numeric(X[name], errors='coerce').to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        edges = _bin_edges(values, bins)
+        counts = np.bincount(np.searchsorted(edges, values, side='right'), minlength=len(edges) + 1)
+        features[name] = {
+            'edges': [float(e) for e in edges],  # tidak dibulatkan: nilai tepat di batas tetap konsisten
+            'proportions': [round(float(c), 6) for c in counts / max(len(values), 1)],
+            'mean': round(float(values.mean()), 6) if len(values) else 0.0,
+            'std': round(float(values.std()), 6) if len(values) else 0.0,
+        }
+
+    return {
+        'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'source': source,
+        'n_samples': int(len(X)),
+        'preprocess_version': PREPROCESS_VERSION,
+        'features': features,
+    }
+
+
+def save_reference(reference: Dict[str, Any], path: str = None) -> str:
+    path = path or Config.DRIFT_REFERENCE_PATH
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(reference, f, indent=2)
+    return path
+
+
+def load_reference(path: str = None) -> Optional[Dict[str, Any]]:
+    path = path or Config.DRIFT_REFERENCE_PATH
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# --- 2. MONITOR LIVE ---
+class DriftMonitor:
+    """
+    Histogram bin tetap + momen berjalan per fitur.
+    Semua state berupa array ukuran [n_fitur, n_bin] -> memori konstan.
+    """
+
+    def __init__(self, reference: Dict[str, Any], decay_window: int = None):
+        self.reference = reference
+        self.features = list(Config.FEATURES)
+        self.decay_window = decay_window if decay_window is not None else Config.DRIFT_DECAY_WINDOW
+        specs = [reference['features'][name] for name in self.features]
+
+        # Batas bin dipadatkan ke matriks (sisa diisi +inf) -> indeks bin semua fitur
+        # dihitung sekaligus dengan satu perbandingan vektor
+        width = max(len(s['edges']) for s in specs)
+        self.edges = np.full((len(specs), width), np.inf)
+        self.expected = np.zeros((len(specs), width + 1))
+        self.n_bins = np.array([len(s['edges']) + 1 for s in specs])
+        for i, s in enumerate(specs):
+            self.edges[i, :len(s['edges'])] = s['edges']
+            self.expected[i, :len(s['proportions'])] = s['proportions']
+        self.ref_mean = np.array([s['mean'] for s in specs])
+        self.ref_std = np.array([s['std'] for s in specs])
+        self.ref_n = int(reference.get('n_samples', 0))
+
+        self._rows = np.arange(len(specs))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = np.zeros_like(self.expected)
+            self.n = np.zeros(len(self.features))
+            self.mean = np.zeros(len(self.features))
+            self.m2 = np.zeros(len(self.features))
+            self.total = 0
+
+    def update(self, X):
+        """Tambahkan satu/lebih baris fitur (DataFrame/array, urutan Config.FEATURES)."""
+        if isinstance(X, pd.DataFrame):
+            # Seleksi kolom hanya jika perlu (X[cols] jauh lebih mahal dari to_numpy)
+            if list(X.columns) != self.features:
+                X = X[self.features]
+            X = X.to_numpy(dtype=np.float64)
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(self.features))
+        if X.shape[0] == 1:
+            self._update_one(X[0])
+        else:
+            self._update_batch(X)
+
+    def _update_one(self, x: np.ndarray):
+        """Jalur cepat satu pasien (/api/predict): Welford per fitur."""
+        valid = ~np.isnan(x)
+        # Indeks bin = jumlah batas yang dilewati nilai (setara searchsorted side='right')
+        bins = (x[:, None] >= self.edges).sum(axis=1)
+        with self._lock:
+            self.counts[self._rows[valid], bins[valid]] += 1.0
+            n = self.n + valid
+            delta = np.where(valid, x - self.mean, 0.0)
+            self.mean = self.mean + np.divide(delta, n, out=np.zeros_like(n), where=n > 0)
+            self.m2 = self.m2 + delta * np.where(valid, x - self.mean, 0.0)
+            self.n = n
+            self.total += 1
+            self._maybe_decay()
+
+    def _update_batch(self, X: np.ndarray):
+        valid = ~np.isnan(X)
+        bins = (X[:, :, None] >= self.edges[None, :, :]).sum(axis=2)
+
+        # Momen batch (NaN diabaikan per fitur)
+        n_b = valid.sum(axis=0).astype(np.float64)
+        safe = np.where(valid, X, 0.0)
+        mean_b = safe.sum(axis=0) / np.maximum(n_b, 1)
+        m2_b = (np.where(valid, X - mean_b, 0.0) ** 2).sum(axis=0)
+
+        with self._lock:
+            rows = np.broadcast_to(self._rows, bins.shape)
+            np.add.at(self.counts, (rows[valid], bins[valid]), 1.0)
+
+            # Gabung momen (Chan et al.): O(n_fitur), tanpa menyimpan sampel
+            n_a = self.n
+            n = n_a + n_b
+            delta = mean_b - self.mean
+            ratio = np.divide(n_b, n, out=np.zeros_like(n), where=n > 0)
+            self.mean = self.mean + delta * ratio
+            self.m2 = self.m2 + m2_b + delta ** 2 * n_a * ratio
+            self.n = n
+            self.total += X.shape[0]
+            self._maybe_decay()
+
+    def _maybe_decay(self):
+        if self.decay_window and self.total >= self.decay_window:
+            self.counts *= 0.5
+            self.n *= 0.5
+            self.m2 *= 0.5
+            self.total //= 2
+
+    # --- 3. LAPORAN ---
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            counts, n = self.counts.copy(), self.n.copy()
+            mean, m2 = self.mean.copy(), self.m2.copy()
+
+        features = {}
+        worst_psi = 0.0
+        drifted = []
+        for i, name in enumerate(self.features):
+            k = self.n_bins[i]
+            expected = np.maximum(self.expected[i, :k], PSI_EPS)
+            actual = counts[i, :k] / n[i] if n[i] > 0 else np.zeros(k)
+
+            entry = {
+                'samples': round(float(n[i]), 1),
+                'mean': round(float(mean[i]), 4) if n[i] > 0 else None,
+                'std': round(float(np.sqrt(m2[i] / n[i])), 4) if n[i] > 0 else None,
+                'ref_mean': round(float(self.ref_mean[i]), 4),
+                'ref_std': round(float(self.ref_std[i]), 4),
+                'psi': None, 'ks': None, 'ks_critical': None, 'status': 'data kurang',
+            }
+            if n[i] >= Config.DRIFT_MIN_SAMPLES:
+                actual_s = np.maximum(actual, PSI_EPS)
+                psi = float(np.sum((actual_s - expected) * np.log(actual_s / expected)))
+                # KS aproksimasi: selisih maksimum CDF kumulatif di batas bin
+                ks = float(np.max(np.abs(np.cumsum(actual) - np.cumsum(self.expected[i, :k]))))
+                ks_critical = KS_ALPHA_COEF * np.sqrt((n[i] + self.ref_n) / (n[i] * self.ref_n)) \
+                    if self.ref_n else None
+
+                if psi >= Config.DRIFT_PSI_ALERT:
+                    status = 'drift'
+                    drifted.append(name)
+                elif psi >= Config.DRIFT_PSI_WARN:
+                    status = 'waspada'
+                else:
+                    status = 'stabil'
+                worst_psi = max(worst_psi, psi)
+                entry.update({
+                    'psi': round(psi, 4), 'ks': round(ks, 4),
+                    'ks_critical': round(float(ks_critical), 4) if ks_critical else None,
+                    'status': status,
+                })
+            features[name] = entry
+
+        return {
+            'samples': int(self.total),
+            'max_psi': round(worst_psi, 4),
+            'drifted_features': drifted,
+            'thresholds': {'psi_warn': Config.DRIFT_PSI_WARN, 'psi_alert': Config.DRIFT_PSI_ALERT,
+                           'min_samples': Config.DRIFT_MIN_SAMPLES},
+            'reference': {k: self.reference.get(k) for k in ('created', 'source', 'n_samples')},
+            'features': features,
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Ringkasan kecil untuk /api/metrics."""
+        report = self.report()
+        return {k: report[k] for k in ('samples', 'max_psi', 'drifted_features')}
+
+
+def create_monitor(path: str = None) -> Optional[DriftMonitor]:
+    """Monitor dari file referensi, atau None jika dimatikan / referensi belum dibuat."""
+    if not Config.DRIFT_ENABLED:
+        return None
+    reference = load_reference(path)
+    if reference is None:
+        return None
+    return DriftMonitor(reference)
@@ -0,0 +1,230 @@
+"""
+Backend/models/explain.py
+Penjelasan per-pasien berbasis jalur keputusan (decision path) pohon:
+1. Saat model dimuat, setiap pohon fold diringkas menjadi tabel kontribusi kumulatif per node
+   (perubahan P(Diabetic) di setiap cabang dibebankan ke fitur yang dipakai node induknya)
+2. Penjelasan = apply() (jalan dari akar ke daun, O(kedalaman)) + lookup baris tabel daun
+3. Kontribusi diskalakan ke ruang probabilitas terkalibrasi lalu dirata-rata antar fold,
+   sehingga base_value + jumlah kontribusi == probabilitas yang dikembalikan model
+
+Bekerja untuk batch (matriks fitur n baris) tanpa memanggil ulang model.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from Backend.config import Config
+
+
+class _FoldTable:
+    """Tabel kontribusi satu pohon (satu fold CalibratedClassifierCV)."""
+
+    def __init__(self, estimator, calibrator=None, positive_class=1):
+        # Pipeline(scaler, dt) -> langkah transformasi + pohon; pohon polos juga didukung
+        steps = [s for _, s in estimator.steps] if hasattr(estimator, 'steps') else [estimator]
+        tree_model = steps[-1]
+        if not hasattr(tree_model, 'tree_'):
+            raise TypeError(f"Estimator {type(tree_model).__name__} bukan pohon keputusan.")
+
+        # Rantai StandardScaler dilipat menjadi satu (X - offset) / scale tanpa overhead
+        # validasi sklearn; transformasi lain tetap lewat .transform() milik Pipeline
+        self.offset, self.scale = 0.0, 1.0
+        self.transform = None
+        for step in steps[:-1]:
+            if isinstance(step, StandardScaler):
+                mean = step.mean_ if step.mean_ is not None else 0.0
+                scale = step.scale_ if step.scale_ is not None else 1.0
+                self.offset = self.offset + mean * self.scale
+                self.scale = self.scale * scale
+            else:
+                self.transform = estimator[:-1]
+                break
+
+        tree = tree_model.tree_
+        # Struktur pohon untuk jalan vektor. Daun menunjuk ke dirinya sendiri (threshold +inf)
+        # sehingga tiap level cukup satu perbandingan tanpa masking baris yang sudah selesai.
+        leaf = tree.children_left < 0
+        self.max_depth = tree.max_depth
+        self.feature = np.where(leaf, 0, tree.feature).astype(np.intp)
+        self.threshold = np.where(leaf, np.inf, tree.threshold)
+        self.left = np.where(leaf, np.arange(tree.node_count), tree.children_left).astype(np.intp)
+        self.right = np.where(leaf, np.arange(tree.node_count), tree.children_right).astype(np.intp)
+
+        if hasattr(tree_model, 'node_proba_'):
+            # Pohon distilasi (models/distill.py): tabel probabilitas per node sudah tersedia
+            node_prob = tree_model.node_proba_
+        else:
+            # P(kelas positif) di setiap node (value sklearn = bobot sampel per kelas)
+            values = tree.value[:, 0, :]
+            pos_idx = list(tree_model.classes_).index(positive_class)
+            node_prob = values[:, pos_idx] / values.sum(axis=1)
+
+        # Tabel kumulatif: cum[node] = cum[parent] + (p[node] - p[parent]) pada fitur parent.
+        # Node disusun depth-first (parent selalu sebelum anak) -> cukup satu lintasan.
+        n_features = len(Config.FEATURES)
+        cum = np.zeros((tree.node_count, n_features), dtype=np.float64)
+        for parent in range(tree.node_count):
+            feature = tree.feature[parent]
+            for child in (tree.children_left[parent], tree.children_right[parent]):
+                if child < 0:
+                    continue
+                cum[child] = cum[parent]
+                cum[child, feature] += node_prob[child] - node_prob[parent]
+
+        # Kalibrasi (sigmoid) monoton tapi tidak linear: tabel diskalakan proporsional per node
+        # agar kontribusi tetap menjumlah tepat ke (prob_terkalibrasi - base_terkalibrasi).
+        # Semua dihitung sekali di sini -> saat request cukup lookup baris daun.
+        node_cal = self._calibrate(calibrator, node_prob)
+        delta_raw = node_prob - node_prob[0]
+        delta_cal = node_cal - node_cal[0]
+        safe = np.abs(delta_raw) > 1e-12
+        scale = np.where(safe, delta_cal / np.where(safe, delta_raw, 1.0), 0.0)
+
+        self.node_calibrated = node_cal
+        self.cumulative = cum * scale[:, None]
+        self.root_calibrated = float(node_cal[0])
+
+    @staticmethod
+    def _calibrate(calibrator, p: np.ndarray) -> np.ndarray:
+        if calibrator is None:
+            return p
+        return np.clip(calibrator.predict(p), 0.0, 1.0)
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """Indeks daun tiap baris: jalan vektor dari akar, satu langkah per level (O(kedalaman))."""
+        if self.transform is not None:
+            X = self.transform.transform(pd.DataFrame(X, columns=Config.FEATURES))
+        else:
+            X = (X - self.offset) / self.scale
+        # Sama seperti sklearn: fitur dibandingkan sebagai float32
+        X = np.asarray(X, dtype=np.float32)
+
+        rows = np.arange(X.shape[0])
+        node = np.zeros(X.shape[0], dtype=np.intp)
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return node
+
+    def explain(self, X: np.ndarray):
+        """Return: (probabilitas terkalibrasi [n], kontribusi terkalibrasi [n, n_features])."""
+        leaves = self.apply(X)
+        return self.node_calibrated[leaves], self.cumulative[leaves]
+
+
+class PathExplainer:
+    """
+    Penjelas per-prediksi untuk model pohon (tunggal / Pipeline / CalibratedClassifierCV).
+    Gunakan PathExplainer.from_model(model) -> None jika model tidak didukung.
+    """
+
+    def __init__(self, folds: List[_FoldTable]):
+        self.folds = folds
+        self.features = list(Config.FEATURES)
+        self.base_value = float(np.mean([f.root_calibrated for f in folds]))
+        self._stacked = self._stack(folds)
+
+    @staticmethod
+    def _stack(folds: List[_FoldTable]):
+        """
+        Gabungkan semua pohon fold menjadi satu array node (indeks anak digeser per fold)
+        agar jalan dari akar ke daun untuk semua fold dilakukan dalam SATU loop vektor.
+        Hanya bila semua fold memakai transformasi linear (scaler) -> selain itu None.
+        """
+        if any(f.transform is not None for f in folds):
+            return None
+        n_features = len(Config.FEATURES)
+        starts = np.cumsum([0] + [len(f.feature) for f in folds[:-1]]).astype(np.intp)
+        return {
+            'starts': starts,
+            'offset': np.vstack([np.broadcast_to(f.offset, n_features) for f in folds])[:, None, :],
+            'scale': np.vstack([np.broadcast_to(f.scale, n_features) for f in folds])[:, None, :],
+            'max_depth': max(f.max_depth for f in folds),
+            'feature': np.concatenate([f.feature for f in folds]),
+            'threshold': np.concatenate([f.threshold for f in folds]),
+            'left': np.concatenate([f.left + s for f, s in zip(folds, starts)]),
+            'right': np.concatenate([f.right + s for f, s in zip(folds, starts)]),
+            'calibrated': np.concatenate([f.node_calibrated for f in folds]),
+            'cumulative': np.concatenate([f.cumulative for f in folds]),
+        }
+
+    def _explain_stacked(self, X: np.ndarray):
+        st = self._stacked
+        n_folds, n_rows = len(self.folds), X.shape[0]
+        # [fold, baris, fitur] -> baris gabungan (fold-major), dibandingkan sebagai float32
+        Xs = ((X[None, :, :] - st['offset']) / st['scale']).astype(np.float32)
+        Xs = Xs.reshape(n_folds * n_rows, -1)
+
+        rows = np.arange(n_folds * n_rows)
+        node = np.repeat(st['starts'], n_rows)
+        for _ in range(st['max_depth']):
+            go_left = Xs[rows, st['feature'][node]] <= st['threshold'][node]
+            node = np.where(go_left, st['left'][node], st['right'][node])
+
+        probs = st['calibrated'][node].reshape(n_folds, n_rows).mean(axis=0)
+        contrib = st['cumulative'][node].reshape(n_folds, n_rows, -1).mean(axis=0)
+        return probs, contrib
+
+    @classmethod
+    def from_model(cls, model) -> Optional['PathExplainer']:
+        try:
+            if hasattr(model, 'calibrated_classifiers_'):
+                positive = model.classes_[-1]
+                folds = []
+                for cc in model.calibrated_classifiers_:
+                    # Klasifikasi biner: satu kalibrator untuk kelas positif
+                    calibrator = cc.calibrators[0] if len(cc.calibrators) == 1 else None
+                    folds.append(_FoldTable(cc.estimator, calibrator, positive))
+                return cls(folds)
+            return cls([_FoldTable(model, None, model.classes_[-1])])
+        except (TypeError, AttributeError, ValueError, IndexError):
+            return None
+
+    def explain(self, X):
+        """
+        Penjelasan batch.
+        Return: (probabilitas [n], kontribusi [n, n_features]) di skala 0-1, dengan
+        base_value + kontribusi.sum(axis=1) == probabilitas.
+        """
+        if isinstance(X, pd.DataFrame):
+            X = X[self.features].to_numpy(dtype=np.float64)
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        if self._stacked is not None:
+            return self._explain_stacked(X)
+
+        probs = np.zeros(X.shape[0], dtype=np.float64)
+        contrib = np.zeros((X.shape[0], len(self.features)), dtype=np.float64)
+        for fold in self.folds:
+            p, c = fold.explain(X)
+            probs += p
+            contrib += c
+        n = len(self.folds)
+        return probs / n, contrib / n
+
+    def top_contributions(self, contributions: np.ndarray, k: int = 5) -> list:
+        """Fitur dengan kontribusi absolut terbesar untuk SATU baris (dalam poin persen)."""
+        order = np.argsort(-np.abs(contributions))[:k]
+        return [
+            {
+                'name': self.features[i],
+                'value': round(float(contributions[i]) * 100, 2),
+                'direction': 'naik' if contributions[i] > 0 else 'turun',
+            }
+            for i in order if abs(contributions[i]) >= 5e-5
+        ]
+
+    def summarize(self, probability: float, contributions: np.ndarray, k: int = 5) -> dict:
+        """Ringkasan siap-JSON satu baris hasil explain() (dipakai /api/predict)."""
+        return {
+            'base_percent': round(self.base_value * 100, 2),
+            'probability_percent': round(float(probability) * 100, 2),
+            'contributions': self.top_contributions(contributions, k),
+        }
+
+    def explain_one(self, X, k: int = 5) -> dict:
+        """Ringkasan siap-JSON untuk satu pasien."""
+        probs, contrib = self.explain(X)
+        return self.summarize(probs[0], contrib[0], k)
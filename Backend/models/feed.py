@@ -0,0 +1,172 @@
+"""
+Backend/models/feed.py
+Feed live prediksi untuk halaman riwayat (/api/logs & /api/logs/stream):
+1. Ring buffer di memori berisi N prediksi terbaru (per proses), diisi:
+   - awal: ekor log kanonik + segmen yang belum digabung (sekali, tanpa membaca seluruh log)
+   - log_prediction di proses ini: langsung saat prediksi ditulis
+   - worker lain: thread tailer membaca baris baru segmen mereka per offset (ringan, tanpa parse ulang log)
+2. Setiap entri punya id '<timestamp>@<segmen>:<offset>' yang sama di semua worker ->
+   klien SSE yang reconnect ke worker lain melanjutkan dari Last-Event-ID tanpa baris ganda
+3. Pelanggan menunggu entri baru lewat Condition (tanpa polling disk per pelanggan)
+4. sse_event(): format event SSE yang sama untuk endpoint Flask & server fan-out (routes/feed_server.py)
+"""
+
+import os
+import json
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from Backend.config import Config
+from Backend.models import prediction_log
+from Backend.models.prediction_log import LOG_COLUMNS, SEGMENT_PREFIX
+
+
+def _clean(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Nilai siap-JSON seperti /api/logs lama: angka tetap angka, kosong -> '-'."""
+    out = {}
+    for col in LOG_COLUMNS:
+        value = row.get(col)
+        if value is None or value == '':
+            value = '-'
+        elif isinstance(value, str) and col not in ('timestamp', 'prediction', 'probability'):
+            try:
+                value = int(value)
+            except ValueError:
+                try:
+                    value = float(value)
+                except ValueError:
+                    pass
+        out[col] = value
+    return out
+
+
+def sse_event(event_id: str, row: Dict[str, Any]) -> str:
+    """Satu event 'prediction' Server-Sent Events (id dipakai klien sebagai Last-Event-ID)."""
+    return f"id: {event_id}\nevent: prediction\ndata: {json.dumps(row, default=str)}\n\n"
+
+
+class PredictionFeed:
+    """Ring buffer prediksi terbaru + notifikasi untuk pelanggan SSE."""
+
+    def __init__(self, size: int = None, merger: prediction_log.SegmentMerger = None):
+        self.size = size or Config.FEED_BUFFER_SIZE
+        self._merger = merger or prediction_log.get_merger()
+        self._cond = threading.Condition()
+        self._items = deque()  # (seq, event_id, row)
+        self._ids = set()      # id sumber '<segmen>:<offset>' di buffer (cegah ganda)
+        self._seq = 0
+        self._own_prefix = f"{SEGMENT_PREFIX}{os.getpid()}-"
+        self._poll_lock = threading.Lock()
+
+        rows, self._offsets = self._merger.read_recent(self.size)
+        for source_id, row in rows:
+            self._add(source_id, row)
+
+    def _add(self, source_id: str, row: Dict[str, Any]) -> bool:
+        if source_id in self._ids:
+            return False
+        row = _clean(row)
+        self._seq += 1
+        self._items.append((self._seq, f"{row['timestamp']}@{source_id}", row))
+        self._ids.add(source_id)
+        if len(self._items) > self.size:
+            _, old_id, _ = self._items.popleft()
+            self._ids.discard(old_id.split('@', 1)[1])
+        return True
+
+    def publish(self, source_id: str, row: Dict[str, Any]):
+        """Entri baru (dari log_prediction proses ini atau tailer)."""
+        with self._cond:
+            if self._add(source_id, row):
+                self._cond.notify_all()
+
+    def poll(self) -> int:
+        """Tarik baris baru segmen milik worker lain. Return: jumlah entri baru."""
+        with self._poll_lock:
+            rows, self._offsets = self._merger.read_segment_rows(self._offsets, self._own_prefix)
+        added = 0
+        with self._cond:
+            for source_id, row in rows:
+                added += self._add(source_id, row)
+            if added:
+                self._cond.notify_all()
+        return added
+
+    # --- PEMBACA ---
+    def last_id(self) -> Optional[str]:
+        with self._cond:
+            return self._items[-1][1] if self._items else None
+
+    def recent(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Entri terbaru dulu (urut timestamp, untuk muat awal halaman riwayat)."""
+        with self._cond:
+            rows = [row for _, _, row in self._items]
+        rows.sort(key=lambda r: r['timestamp'], reverse=True)
+        return rows[:limit]
+
+    def cursor(self, last_event_id: str = None) -> int:
+        """
+        Posisi awal pelanggan. Tanpa Last-Event-ID: hanya entri baru.
+        Id dikenal -> lanjut tepat setelahnya; id tidak dikenal (tergeser / dari worker lain
+        sebelum sempat ditarik) -> mulai dari entri dengan timestamp >= timestamp id tersebut.
+        """
+        with self._cond:
+            if not last_event_id:
+                return self._seq
+            for seq, event_id, _ in reversed(self._items):
+                if event_id == last_event_id:
+                    return seq
+            timestamp = last_event_id.split('@', 1)[0]
+            for seq, _, row in self._items:
+                if row['timestamp'] >= timestamp:
+                    return seq - 1
+            return self._seq
+
+    def _since(self, cursor: int) -> List[Tuple[str, Dict[str, Any]]]:
+        if not self._items or self._items[-1][0] <= cursor:
+            return []
+        return [(event_id, row) for seq, event_id, row in self._items if seq > cursor]
+
+    def wait(self, cursor: int, timeout: float) -> Tuple[List[Tuple[str, Dict[str, Any]]], int]:
+        """Entri setelah `cursor` (menunggu sampai ada atau timeout). Return: (entri, cursor baru)."""
+        with self._cond:
+            events = self._since(cursor)
+            if not events:
+                self._cond.wait(timeout)
+                events = self._since(cursor)
+            return events, (self._seq if events else cursor)
+
+
+# --- FEED PER PROSES + TAILER ---
+_feed = {'pid': None, 'feed': None}
+_feed_lock = threading.Lock()
+
+
+def get_feed() -> PredictionFeed:
+    """Feed proses ini (dibuat ulang setelah fork) beserta thread tailer segmen worker lain."""
+    if _feed['pid'] != os.getpid():
+        with _feed_lock:
+            if _feed['pid'] != os.getpid():
+                feed = PredictionFeed()
+                _start_tailer(feed)
+                _feed.update(pid=os.getpid(), feed=feed)
+    return _feed['feed']
+
+
+def _start_tailer(feed: PredictionFeed):
+    interval = Config.FEED_POLL_SECONDS
+    if interval <= 0:
+        return None
+
+    def _run():
+        stop = threading.Event()
+        while not stop.wait(interval):
+            try:
+                feed.poll()
+            except Exception as e:
+                print(f"⚠️ Tailer feed prediksi gagal: {e}")
+
+    thread = threading.Thread(target=_run, name='prediction-feed-tailer', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,406 @@
+"""
+Backend/models/inference.py
+Lapisan eksekusi model (inference backend) untuk API:
+1. DirectInference   -> memanggil model langsung di thread request (perilaku default)
+2. ProcessPoolInference -> menjalankan model di pool proses terpisah (lepas dari GIL)
+3. MicroBatcher      -> menggabungkan request yang datang bersamaan menjadi satu panggilan vektor
+4. CascadeInference  -> model tahap-1 murah untuk semua baris; hanya baris di sekitar ambang 0.5
+                        yang dinaikkan ke ensemble penuh (Config.CASCADE_*)
+5. create_inference  -> memilih backend sesuai Config
+
+Semua backend menerima matriks fitur (urutan Config.FEATURES) dan mengembalikan
+matriks probabilitas [n_rows, 2] seperti predict_proba milik scikit-learn.
+"""
+
+import os
+import time
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from Backend.config import Config
+from Backend.models.registry import active_paths
+
+
+def _as_matrix(X) -> np.ndarray:
+    """
+    DataFrame / list / array -> array 2D float64 dengan urutan Config.FEATURES.
+    Tidak diperkecil ke float32: scaler di depan pohon bekerja di float64, nilai dekat ambang
+    split bisa berpindah cabang jika dibulatkan lebih dulu.
+    """
+    if isinstance(X, pd.DataFrame):
+        X = X[Config.FEATURES].to_numpy(dtype=np.float64)
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+    return X
+
+
+def _percentile(samples, q: float) -> float:
+    samples = list(samples)  # copy dulu: deque bisa berubah dari thread lain
+    if not samples:
+        return 0.0
+    return round(float(np.percentile(samples, q)), 3)
+
+
+# --- 1. INFERENCE LANGSUNG (IN-THREAD) ---
+class DirectInference:
+    """Memanggil model langsung di thread yang sedang melayani request."""
+
+    name = 'thread'
+
+    def __init__(self, model):
+        self.model = model
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = _as_matrix(X)
+        # Model dilatih dengan DataFrame, nama kolom disertakan agar tidak memicu warning sklearn
+        frame = pd.DataFrame(X, columns=Config.FEATURES)
+
+        if hasattr(self.model, 'predict_proba'):
+            return np.asarray(self.model.predict_proba(frame), dtype=float)
+
+        # Fallback model tanpa probabilitas -> one-hot dari kelas prediksi
+        pred = np.asarray(self.model.predict(frame)).astype(int)
+        return np.column_stack([1 - pred, pred]).astype(float)
+
+    def stats(self) -> Dict[str, Any]:
+        return {'backend': self.name}
+
+    def close(self):
+        pass
+
+
+# --- 2. PROCESS-POOL INFERENCE ---
+# Model milik proses worker, diisi initializer dari initargs pool pemiliknya. Dengan start
+# method 'fork' initargs diwarisi lewat fork (tidak di-pickle) -> worker berbagi halaman memori
+# model (copy-on-write); pool lama & baru (hot reload) masing-masing memegang modelnya sendiri.
+# Dengan 'spawn' model dimuat sekali dari model_path.
+_WORKER_MODEL = None
+
+
+def _init_worker(model_path: str, model=None):
+    global _WORKER_MODEL
+    if model is None:
+        from Backend.models.bundle import load_model_bundle
+        model = load_model_bundle(model_path)['model']
+    _WORKER_MODEL = model
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _worker_predict(buf: bytes, n_rows: int) -> bytes:
+    """Dijalankan di proses worker. Input & output dikirim sebagai raw bytes float64."""
+    X = np.frombuffer(buf, dtype=np.float64).reshape(n_rows, len(Config.FEATURES))
+    proba = DirectInference(_WORKER_MODEL).predict_proba(X)
+    return np.ascontiguousarray(proba, dtype=np.float64).tobytes()
+
+
+class ProcessPoolInference:
+    """
+    Menjalankan predict_proba di pool proses agar inference tidak bersaing GIL
+    dengan thread lain di worker Flask (gthread).
+    Pool dibuat lazy per PID sehingga aman dipakai bersama gunicorn --preload; semua proses
+    worker di-fork sekaligus saat pool dibuat (di bawah lock), bukan bertahap saat submit.
+    """
+
+    name = 'process'
+
+    def __init__(self, model, workers: int = None, model_path: str = None):
+        self.model = model
+        self.workers = workers or os.cpu_count() or 1
+        self.model_path = model_path or active_paths()[0]
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None or self._pid != os.getpid():
+            with self._lock:
+                if self._pool is None or self._pid != os.getpid():
+                    methods = multiprocessing.get_all_start_methods()
+                    fork = 'fork' in methods
+                    pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context('fork' if fork else 'spawn'),
+                        initializer=_init_worker,
+                        # fork: model pool ini diwarisi langsung (bukan global yang bisa sudah diganti reload)
+                        initargs=(self.model_path, self.model if fork else None)
+                    )
+                    # Submit pertama memulai semua worker (fork: sekaligus) -> tidak ada fork
+                    # susulan dari thread request nanti; error initializer juga muncul di sini
+                    pool.submit(_worker_ready).result()
+                    self._pool, self._pid = pool, os.getpid()
+        return self._pool
+
+    def submit(self, X) -> Future:
+        X = np.ascontiguousarray(_as_matrix(X))
+        n_rows = X.shape[0]
+        raw = self._get_pool().submit(_worker_predict, X.tobytes(), n_rows)
+
+        # Ubah hasil bytes -> array [n_rows, 2] tanpa memblokir thread pemanggil
+        future = Future()
+
+        def _done(f):
+            try:
+                future.set_result(np.frombuffer(f.result(), dtype=np.float64).reshape(n_rows, 2))
+            except Exception as e:
+                future.set_exception(e)
+
+        raw.add_done_callback(_done)
+        self._calls += 1
+        return future
+
+    def predict_proba(self, X) -> np.ndarray:
+        return self.submit(X).result()
+
+    def stats(self) -> Dict[str, Any]:
+        return {'backend': self.name, 'workers': self.workers, 'calls': self._calls}
+
+    def close(self):
+        if self._pool is not None and self._pid == os.getpid():
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+
+# --- 3. MICRO-BATCHING SCHEDULER ---
+class MicroBatcher:
+    """
+    Menggabungkan request prediksi yang datang bersamaan menjadi satu panggilan model.
+
+    Request pertama membuka 'jendela' selama window_ms; semua request yang tiba
+    dalam jendela tersebut (maksimal max_batch baris) dieksekusi dalam satu
+    panggilan predict_proba, lalu setiap request menerima barisnya masing-masing.
+    """
+
+    def __init__(self, backend, window_ms: float = 2.0, max_batch: int = 32,
+                 metrics_window: int = 1000):
+        self.backend = backend
+        self.name = f"batch+{backend.name}"
+        self.window = max(window_ms, 0.0) / 1000.0
+        self.max_batch = max(int(max_batch), 1)
+
+        self._cond = threading.Condition()
+        self._pending = deque()
+        self._worker = None
+        self._pid = None
+        self._closed = False
+
+        # Metrik (sampel terbaru saja agar memori konstan)
+        self._queue_ms = deque(maxlen=metrics_window)
+        self._batch_sizes = deque(maxlen=metrics_window)
+        self._requests = 0
+        self._batches = 0
+
+    def _ensure_worker(self):
+        # Thread tidak ikut ter-copy saat fork (gunicorn) -> start ulang per proses
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._pending = deque()
+            self._worker = None
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+            self._worker.start()
+
+    def submit(self, X) -> Future:
+        """Mendaftarkan baris fitur ke antrian. Return Future berisi probabilitas baris tsb."""
+        X = _as_matrix(X)
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("MicroBatcher sudah ditutup.")
+            self._ensure_worker()
+            self._pending.append((X, future, time.perf_counter()))
+            self._cond.notify()
+        return future
+
+    def predict_proba(self, X, timeout: float = None) -> np.ndarray:
+        return self.submit(X).result(timeout=timeout)
+
+    def _collect(self):
+        """Menunggu request pertama, lalu mengumpulkan request lain selama jendela batch."""
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            if self._closed and not self._pending:
+                return None
+
+            deadline = time.perf_counter() + self.window
+            rows = sum(item[0].shape[0] for item in self._pending)
+            while rows < self.max_batch and not self._closed:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+                rows = sum(item[0].shape[0] for item in self._pending)
+
+            batch, rows = [], 0
+            while self._pending and (rows < self.max_batch or not batch):
+                item = self._pending.popleft()
+                batch.append(item)
+                rows += item[0].shape[0]
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+
+            started = time.perf_counter()
+            try:
+                proba = self.backend.predict_proba(np.vstack([item[0] for item in batch]))
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for X, future, enqueued in batch:
+                n = X.shape[0]
+                future.set_result(proba[offset:offset + n])
+                offset += n
+                self._queue_ms.append((started - enqueued) * 1000)
+
+            self._requests += len(batch)
+            self._batches += 1
+            self._batch_sizes.append(offset)
+
+    def stats(self) -> Dict[str, Any]:
+        sizes = list(self._batch_sizes)
+        return {
+            'backend': self.name,
+            'window_ms': round(self.window * 1000, 3),
+            'max_batch': self.max_batch,
+            'requests': self._requests,
+            'batches': self._batches,
+            'avg_batch_size': round(sum(sizes) / len(sizes), 2) if sizes else 0.0,
+            'queue_ms_p50': _percentile(self._queue_ms, 50),
+            'queue_ms_p99': _percentile(self._queue_ms, 99),
+        }
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.backend.close()
+
+
+# --- 4. CASCADE (TAHAP-1 MURAH -> ENSEMBLE PENUH HANYA DI SEKITAR AMBANG) ---
+CASCADE_THRESHOLD = 0.5  # Sama dengan /api/predict: Diabetic jika probabilitas > 0.5
+
+
+class CascadeInference:
+    """
+    Semua baris dinilai model tahap-1 (satu fold ensemble / pohon distilasi) di thread pemanggil.
+    Baris dengan |p - 0.5| < band dianggap ragu dan dinilai ulang oleh backend penuh
+    (Direct / pool proses / micro-batch); baris lain langsung memakai hasil tahap-1.
+    """
+
+    def __init__(self, first_stage, full, band: float, first_stage_name: str = 'first',
+                 metrics_window: int = 1000):
+        self.first = DirectInference(first_stage)
+        self.full = full
+        self.band = float(band)
+        self.first_stage_name = first_stage_name
+        self.name = f"cascade+{full.name}"
+
+        self._lock = threading.Lock()
+        self._rows = 0
+        self._escalated = 0
+        self._first_ms = deque(maxlen=metrics_window)
+        self._full_ms = deque(maxlen=metrics_window)
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = _as_matrix(X)
+        started = time.perf_counter()
+        proba = np.array(self.first.predict_proba(X), dtype=float)
+        first_done = time.perf_counter()
+
+        uncertain = np.abs(proba[:, 1] - CASCADE_THRESHOLD) < self.band
+        n_escalated = int(uncertain.sum())
+        if n_escalated:
+            proba[uncertain] = self.full.predict_proba(X[uncertain])
+
+        with self._lock:
+            self._rows += X.shape[0]
+            self._escalated += n_escalated
+            self._first_ms.append((first_done - started) * 1000)
+            if n_escalated:
+                self._full_ms.append((time.perf_counter() - first_done) * 1000)
+        return proba
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows, escalated = self._rows, self._escalated
+        return {
+            'backend': self.name,
+            'first_stage': self.first_stage_name,
+            'band': self.band,
+            'rows': rows,
+            'escalated': escalated,
+            'escalation_rate': round(escalated / rows, 4) if rows else None,
+            'first_ms_p50': _percentile(self._first_ms, 50),
+            'full_ms_p50': _percentile(self._full_ms, 50),
+            'full': self.full.stats(),
+        }
+
+    def close(self):
+        self.full.close()
+
+
+def cascade_first_stage(model, version: str = None, mode: str = None):
+    """
+    Model tahap-1 untuk cascade: (model, nama) atau (None, alasan).
+    mode 'distilled' -> versi distilasi registry milik model aktif (paling murah)
+    mode 'fold'      -> fold pertama CalibratedClassifierCV (pipeline + kalibrator, ~1/5 biaya)
+    mode 'auto'      -> distilled jika ada, selain itu fold
+    """
+    mode = mode or Config.CASCADE_FIRST_STAGE
+    if mode in ('auto', 'distilled'):
+        from Backend.models import registry
+        from Backend.models.bundle import load_model_bundle
+        from Backend.models.distill import find_distilled
+        distilled = find_distilled(version)
+        if distilled:
+            return load_model_bundle(registry.version_paths(distilled)[0])['model'], f"distilled {distilled}"
+        if mode == 'distilled':
+            return None, 'versi distilasi belum ada (Scripts/distill_model.py)'
+    if hasattr(model, 'calibrated_classifiers_') and len(model.calibrated_classifiers_) > 1:
+        return model.calibrated_classifiers_[0], 'fold 0'
+    return None, 'model aktif bukan ensemble'
+
+
+# --- 5. FACTORY ---
+def create_inference(model, model_path: str = None, first_stage=None, first_stage_name: str = 'first'):
+    """
+    Membuat backend inference sesuai konfigurasi:
+    Config.INFERENCE_BACKEND ('thread' / 'process') + Config.MICRO_BATCH_* (opsional).
+    model_path: file bundle model (dimuat ulang oleh worker pool jika start method 'spawn').
+    first_stage: model tahap-1 -> backend di atas dibungkus CascadeInference (Config.CASCADE_BAND).
+    """
+    if Config.INFERENCE_BACKEND == 'process':
+        backend = ProcessPoolInference(model, workers=Config.INFERENCE_WORKERS, model_path=model_path)
+    else:
+        backend = DirectInference(model)
+
+    if Config.MICRO_BATCH_ENABLED:
+        backend = MicroBatcher(
+            backend,
+            window_ms=Config.MICRO_BATCH_WINDOW_MS,
+            max_batch=Config.MICRO_BATCH_MAX_SIZE,
+            metrics_window=Config.MICRO_BATCH_METRICS_WINDOW
+        )
+
+    if first_stage is not None:
+        return CascadeInference(first_stage, backend, Config.CASCADE_BAND, first_stage_name,
+                                metrics_window=Config.MICRO_BATCH_METRICS_WINDOW)
+    return backend
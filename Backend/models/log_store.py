@@ -0,0 +1,409 @@
+"""
+Backend/models/log_store.py
+Salinan kolumnar (file kolom NumPy) dari prediction_logs.csv untuk pencarian riwayat:
+1. Kompaksi: byte log baru sejak offset terakhir dibaca per batch (maks batch_rows baris di memori),
+   hanya sampai ukuran log yang sudah di-commit penggabung segmen (tidak pernah byte gabung yang crash)
+   -> satu 'part' per batch berisi file .npy per kolom (timestamp int64, label int8, angka float32
+   dalam satuan dataset, kategori teks); part kecil digabung bertingkat agar jumlah part tetap sedikit
+2. Zone map per part (min/maks timestamp & angka, label yang ada) -> part yang pasti tidak
+   cocok dilewati tanpa membuka file kolomnya (predicate pushdown)
+3. Kolom dibuka dengan mmap: hanya kolom yang dipakai filter yang dibaca, baris hasil
+   diambil per halaman saja
+4. Thread kompaksi latar (satu proses pemegang lock per direktori store), bersama penggabung
+   segmen log per worker (models/prediction_log.py) yang mengisi prediction_logs.csv;
+   trigger_compaction() membangunkannya segera (misal pencarian pertama) tanpa menahan request
+
+Log CSV tetap sumber kebenaran; store bisa dihapus & dibangun ulang kapan saja.
+"""
+
+import io
+import os
+import json
+import shutil
+import itertools
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from Backend.config import Config
+from Backend.models import prediction_log
+from Backend.models.prediction_log import LOG_COLUMNS, FileLock
+
+NUMERIC_COLUMNS = ['probability'] + [f for f in Config.FEATURES if Config.FEATURE_SCHEMA[f]['type'] == 'number']
+TEXT_COLUMNS = [f for f in Config.FEATURES if Config.FEATURE_SCHEMA[f]['type'] != 'number']
+LABELS = ['Non-Diabetic', 'Diabetic']  # kode 0/1, label lain = -1
+TEXT_WIDTH = 16  # Panjang maksimum nilai kategori yang disimpan
+MANIFEST = 'manifest.json'
+STORE_FORMAT_VERSION = 1
+
+
+def _to_epoch(values) -> np.ndarray:
+    ts = pd.to_datetime(pd.Series(values), format='%Y-%m-%d %H:%M:%S', errors='coerce')
+    return ts.to_numpy(dtype='datetime64[s]').astype(np.int64)
+
+
+def _numeric(name: str, values: pd.Series) -> np.ndarray:
+    """Angka dalam satuan dataset (glukosa mg/dL -> mmol/L, tinggi cm -> m seperti validator)."""
+    if name == 'probability':
+        values = values.str.rstrip('%')
+    arr = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+    convert = Config.FEATURE_SCHEMA.get(name, {}).get('convert')
+    if convert:
+        arr = np.where(arr > convert['above'], arr / convert['divide'], arr)
+    return arr.astype(np.float32)
+
+
+def parse_time_bound(value: Optional[str], upper: bool = False) -> Optional[int]:
+    """
+    'YYYY-MM-DD' / 'YYYY-MM-DD HH[:MM[:SS]]' -> epoch detik (None jika kosong).
+    Batas atas dibulatkan ke akhir satuan terkecil yang ditulis (tanggal -> 23:59:59).
+    """
+    if not value:
+        return None
+    value = value.strip().replace('T', ' ')
+    units = {10: 86400, 13: 3600, 16: 60, 19: 1}
+    if len(value) not in units:
+        raise ValueError(f"Format tanggal tidak dikenali: {value}")
+    padded = value + ' 00:00:00'[len(value) - 10:] if len(value) < 19 else value
+    epoch = int(_to_epoch([padded])[0])
+    if epoch == np.iinfo(np.int64).min:
+        raise ValueError(f"Tanggal tidak valid: {value}")
+    return epoch + units[len(value)] - 1 if upper else epoch
+
+
+def _zone(arr: np.ndarray) -> List[Optional[float]]:
+    finite = arr[~np.isnan(arr)]
+    if finite.size == 0:
+        return [None, None]
+    return [float(finite.min()), float(finite.max())]
+
+
+class LogStore:
+    """
+    Direktori part kolumnar + manifest (offset log yang sudah dikompaksi & zone map).
+    merger: penggabung pengisi log (batas baca = committed_log_size); default penggabung bersama
+    jika log_path default, log_path lain tanpa merger -> ukuran file.
+    """
+
+    def __init__(self, root: str = None, log_path: str = None, part_rows: int = None, batch_rows: int = None,
+                 merger: prediction_log.SegmentMerger = None):
+        self.merger = merger if merger is not None or log_path else prediction_log.get_merger()
+        self.root = root or Config.LOG_STORE_DIR
+        self.log_path = log_path or Config.PREDICTION_LOG
+        self.part_rows = part_rows or Config.LOG_STORE_PART_ROWS
+        self.batch_rows = min(batch_rows or Config.LOG_STORE_BATCH_ROWS, self.part_rows)
+        self._lock = threading.Lock()
+        self._manifest = None
+        self._manifest_mtime = None
+        self._columns = {}  # cache mmap per (part, kolom)
+
+    # --- 1. MANIFEST ---
+    def _manifest_path(self) -> str:
+        return os.path.join(self.root, MANIFEST)
+
+    def manifest(self) -> Dict[str, Any]:
+        """Manifest terbaru (dibaca ulang hanya jika file berubah, misal dikompaksi proses lain)."""
+        path = self._manifest_path()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return {'version': STORE_FORMAT_VERSION, 'log_offset': 0, 'rows': 0, 'parts': []}
+        if mtime != self._manifest_mtime:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != STORE_FORMAT_VERSION:
+                manifest = {'version': STORE_FORMAT_VERSION, 'log_offset': 0, 'rows': 0, 'parts': []}
+            self._manifest, self._manifest_mtime = manifest, mtime
+            self._columns = {}
+        return self._manifest
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        tmp = self._manifest_path() + f".{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp, self._manifest_path())
+
+    # --- 2. KOMPAKSI ---
+    def _read_log_tail(self, offset: int, max_rows: int, end: int = None) -> Tuple[Optional[pd.DataFrame], int]:
+        """Maks `max_rows` baris lengkap log sejak offset (tidak melewati `end`) -> (DataFrame teks, offset baru)."""
+        with open(self.log_path, 'rb') as f:
+            f.seek(offset)
+            lines = list(itertools.islice(f, max_rows))
+        if end is not None:
+            budget = end - offset
+            for i, line in enumerate(lines):
+                budget -= len(line)
+                if budget < 0:
+                    del lines[i:]
+                    break
+        if lines and not lines[-1].endswith(b'\n'):
+            lines.pop()  # Baris terakhir mungkin sedang ditulis
+        if not lines:
+            return None, offset
+        data = b''.join(lines)
+        df = pd.read_csv(io.BytesIO(data), header=None, names=LOG_COLUMNS, dtype=str,
+                         keep_default_na=False, on_bad_lines='skip')
+        df = df[df['timestamp'] != 'timestamp']  # header file di offset 0
+        return df, offset + len(data)
+
+    def _columns_from_frame(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        labels = df['prediction'].map({name: i for i, name in enumerate(LABELS)})
+        columns = {
+            'timestamp': _to_epoch(df['timestamp']),
+            'label': labels.fillna(-1).to_numpy(dtype=np.int8),
+        }
+        for name in NUMERIC_COLUMNS:
+            columns[name] = _numeric(name, df[name])
+        for name in TEXT_COLUMNS:
+            columns[name] = df[name].str.slice(0, TEXT_WIDTH).to_numpy(dtype=f'<U{TEXT_WIDTH}')
+        return columns
+
+    def _write_part(self, name: str, columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        part_dir = os.path.join(self.root, name)
+        os.makedirs(part_dir, exist_ok=True)
+        for col, arr in columns.items():
+            np.save(os.path.join(part_dir, f"{col}.npy"), arr)
+        ts = columns['timestamp']
+        return {
+            'name': name,
+            'rows': int(len(ts)),
+            'ts': [int(ts.min()), int(ts.max())],
+            'labels': sorted(int(v) for v in np.unique(columns['label'])),
+            'zones': {col: _zone(columns[col]) for col in NUMERIC_COLUMNS},
+        }
+
+    def _load_part(self, name: str) -> Dict[str, np.ndarray]:
+        part_dir = os.path.join(self.root, name)
+        return {f[:-4]: np.load(os.path.join(part_dir, f)) for f in os.listdir(part_dir) if f.endswith('.npy')}
+
+    def _merge_tail(self, parts: List[Dict[str, Any]], seq: int) -> Tuple[int, List[str]]:
+        """
+        Gabung part kecil secara bertingkat (seperti LSM): jika `fanin` part terakhir
+        berada di level yang sama, ditulis ulang menjadi satu part level berikutnya.
+        Setiap baris hanya ditulis ulang O(log jumlah_kompaksi) kali.
+        """
+        fanin, obsolete = max(Config.LOG_STORE_MERGE_FANIN, 2), []
+        while len(parts) >= fanin:
+            tail = parts[-fanin:]
+            level = tail[0].get('level', 0)
+            if any(p.get('level', 0) != level for p in tail) or sum(p['rows'] for p in tail) > self.part_rows:
+                break
+            loaded = [self._load_part(p['name']) for p in tail]
+            columns = {c: np.concatenate([part[c] for part in loaded]) for c in loaded[0]}
+            seq += 1
+            merged = self._write_part(f"part-{seq:06d}", columns)
+            merged['level'] = level + 1
+            obsolete.extend(p['name'] for p in tail)
+            parts[-fanin:] = [merged]
+        return seq, obsolete
+
+    def compact(self) -> int:
+        """
+        Pindahkan baris log baru ke store, satu part per batch_rows baris (memori terbatas,
+        manifest diperbarui per batch -> pencarian sudah melihat progres). Return: jumlah baris baru.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock, FileLock(os.path.join(self.root, '.lock')) as locked:
+            if not locked:
+                return 0  # Proses lain sedang kompaksi
+            self._manifest_mtime = None
+            manifest = dict(self.manifest())
+            parts = list(manifest['parts'])
+
+            size = self._log_size()
+            if size < manifest['log_offset']:
+                # Log dihapus/diganti -> store dibangun ulang dari awal
+                for part in parts:
+                    shutil.rmtree(os.path.join(self.root, part['name']), ignore_errors=True)
+                manifest = {'version': STORE_FORMAT_VERSION, 'log_offset': 0, 'rows': 0, 'parts': []}
+                parts = []
+                self._write_manifest(manifest)
+            added = 0
+            while size > manifest['log_offset']:
+                df, new_offset = self._read_log_tail(manifest['log_offset'], self.batch_rows, size)
+                if new_offset == manifest['log_offset']:
+                    break  # Hanya ada baris yang belum lengkap
+                obsolete, seq = [], int(manifest.get('next_part', 0))
+                if df is not None and len(df):
+                    seq += 1
+                    part = self._write_part(f"part-{seq:06d}", self._columns_from_frame(df))
+                    part['level'] = 0
+                    parts.append(part)
+                    seq, obsolete = self._merge_tail(parts, seq)
+                    added += len(df)
+
+                manifest.update({'log_offset': new_offset, 'parts': list(parts), 'next_part': seq,
+                                 'rows': int(sum(p['rows'] for p in parts))})
+                self._write_manifest(manifest)
+                # Part lama dihapus setelah manifest baru terpasang (pembaca mmap tetap aman di Linux)
+                for name in obsolete:
+                    shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+            return added
+
+    def pending_bytes(self) -> int:
+        """Byte log yang belum masuk store (0 = store sudah lengkap)."""
+        return max(self._log_size() - self.manifest()['log_offset'], 0)
+
+    # --- 3. PENCARIAN ---
+    def _column(self, part: str, name: str) -> np.ndarray:
+        key = (part, name)
+        arr = self._columns.get(key)
+        if arr is None:
+            arr = np.load(os.path.join(self.root, part, f"{name}.npy"), mmap_mode='r')
+            self._columns[key] = arr
+        return arr
+
+    @staticmethod
+    def _part_may_match(part: Dict[str, Any], ts_range, label, ranges) -> bool:
+        lo, hi = part['ts']
+        if ts_range[0] is not None and hi < ts_range[0]:
+            return False
+        if ts_range[1] is not None and lo > ts_range[1]:
+            return False
+        if label is not None and label not in part['labels']:
+            return False
+        for col, (low, high) in ranges.items():
+            zmin, zmax = part['zones'].get(col, [None, None])
+            if zmin is None:
+                return False  # Kolom kosong semua: tidak ada nilai yang lolos rentang
+            if (low is not None and zmax < low) or (high is not None and zmin > high):
+                return False
+        return True
+
+    def _part_mask(self, part: str, ts_range, label, ranges) -> np.ndarray:
+        mask = None
+
+        def _and(cond):
+            nonlocal mask
+            mask = cond if mask is None else (mask & cond)
+
+        if ts_range[0] is not None or ts_range[1] is not None:
+            ts = self._column(part, 'timestamp')
+            if ts_range[0] is not None:
+                _and(ts >= ts_range[0])
+            if ts_range[1] is not None:
+                _and(ts <= ts_range[1])
+        if label is not None:
+            _and(self._column(part, 'label') == label)
+        for col, (low, high) in ranges.items():
+            values = self._column(part, col)
+            if low is not None:
+                _and(values >= low)
+            if high is not None:
+                _and(values <= high)
+        return mask
+
+    def search(self, ts_range=(None, None), label: int = None, ranges: Dict[str, Tuple] = None,
+               page: int = 1, page_size: int = 50) -> Dict[str, Any]:
+        """
+        Baris yang cocok, terbaru dulu. ts_range dalam epoch detik (inklusif),
+        ranges: {kolom_angka: (min|None, maks|None)}.
+        """
+        ranges = ranges or {}
+        manifest = self.manifest()
+        start = (page - 1) * page_size
+
+        total, scanned, skipped, rows = 0, 0, 0, []
+        for part in reversed(manifest['parts']):
+            if not self._part_may_match(part, ts_range, label, ranges):
+                skipped += 1
+                continue
+            scanned += 1
+            mask = self._part_mask(part['name'], ts_range, label, ranges)
+            idx = np.arange(part['rows']) if mask is None else np.flatnonzero(mask)
+            # Halaman diambil dari part ini jika rentangnya beririsan
+            lo, hi = max(start - total, 0), min(start + page_size - total, len(idx))
+            if lo < hi:
+                rows.extend(self._materialize(part['name'], idx[::-1][lo:hi]))
+            total += len(idx)
+
+        return {
+            'total': total, 'page': page, 'page_size': page_size,
+            'pages': (total + page_size - 1) // page_size,
+            'rows': rows,
+            'parts_scanned': scanned, 'parts_skipped': skipped,
+            'store_rows': manifest['rows'],
+            'pending_bytes': self.pending_bytes(),
+        }
+
+    def _materialize(self, part: str, idx: np.ndarray) -> List[Dict[str, Any]]:
+        """Ambil hanya baris halaman ini dari tiap kolom (mmap -> hanya halaman disk terkait)."""
+        ts = np.datetime_as_string(self._column(part, 'timestamp')[idx].astype('datetime64[s]'))
+        labels = self._column(part, 'label')[idx]
+        data = {col: self._column(part, col)[idx] for col in NUMERIC_COLUMNS + TEXT_COLUMNS}
+        out = []
+        for i in range(len(idx)):
+            row = {'timestamp': str(ts[i]).replace('T', ' '),
+                   'prediction': LABELS[labels[i]] if labels[i] >= 0 else '-'}
+            for col in NUMERIC_COLUMNS:
+                value = float(data[col][i])
+                row[col] = None if np.isnan(value) else round(value, 2)
+            for col in TEXT_COLUMNS:
+                row[col] = str(data[col][i])
+            out.append(row)
+        return out
+
+    def _log_size(self) -> int:
+        if self.merger is not None:
+            return self.merger.committed_log_size()
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+
+# --- 4. KOMPAKSI LATAR ---
+_default_store = None
+_compactor = {'thread': None, 'pid': None, 'wake': None}
+_compactor_lock = threading.Lock()
+
+
+def get_store() -> LogStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = LogStore()
+    return _default_store
+
+
+def _compact_quietly():
+    try:
+        get_store().compact()
+    except Exception as e:
+        print(f"⚠️ Kompaksi log gagal: {e}")
+
+
+def start_compactor(interval: float = None) -> Optional[threading.Thread]:
+    """Thread daemon yang mengompaksi log secara berkala (sekali per proses) + penggabung segmen log."""
+    prediction_log.start_merger()
+    interval = Config.LOG_STORE_COMPACT_SECONDS if interval is None else interval
+    if interval <= 0:
+        return None
+    with _compactor_lock:
+        if (_compactor['pid'] == os.getpid() and _compactor['thread'] is not None
+                and _compactor['thread'].is_alive()):
+            return _compactor['thread']
+
+        wake = threading.Event()
+
+        def _run():
+            while True:
+                wake.wait(interval)
+                wake.clear()
+                _compact_quietly()
+
+        thread = threading.Thread(target=_run, name='log-compactor', daemon=True)
+        thread.start()
+        _compactor.update({'thread': thread, 'pid': os.getpid(), 'wake': wake})
+        return thread
+
+
+def trigger_compaction():
+    """Minta kompaksi segera di latar (request tidak menunggu; pemanggil berulang digabung)."""
+    thread = start_compactor()
+    if thread is not None:
+        _compactor['wake'].set()
+    else:
+        # Kompaksi berkala dinonaktifkan: jalankan sekali di thread latar
+        threading.Thread(target=_compact_quietly, name='log-compactor-once', daemon=True).start()
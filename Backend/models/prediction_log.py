@@ -0,0 +1,471 @@
+"""
+Backend/models/prediction_log.py
+Log prediksi aman multi-proses (beberapa worker gunicorn) tanpa lock antar proses saat menulis:
+1. Setiap proses menulis ke segmen miliknya sendiri (logs/segments/seg-<pid>-<mulai>-<urutan>.csv),
+   satu baris utuh per os.write() ber-O_APPEND; segmen dirotasi per ukuran
+2. Penggabung (merger) memindahkan baris segmen yang sudah lewat watermark (sekarang - grace)
+   ke log kanonik prediction_logs.csv, terurut timestamp. Satu proses per putaran (flock
+   non-blocking); niat tulis dicatat lebih dulu agar crash di tengah tidak menggandakan baris.
+   State gabung menyimpan ukuran log yang sudah di-commit: pembaca tidak pernah membaca
+   melewatinya, jadi byte gabung yang crash (lalu dipotong _recover) tidak pernah terlihat
+3. Pembaca (read_log) menggabungkan log kanonik + baris segmen yang belum dipindah secara
+   on demand -> tampilan audit lengkap walaupun penggabung belum berjalan
+4. Baris terbaru & baris segmen baru per offset (read_recent / read_segment_rows) untuk
+   feed live (models/feed.py); id baris = '<segmen>:<offset>' unik lintas worker
+
+Log kanonik adalah sumber models/log_store.py (tail by offset sampai committed_log_size); models/stats.py
+men-tail log kanonik dan menambahkan baris segmen yang belum digabung (read_unmerged).
+"""
+
+import io
+import os
+import csv
+import json
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from Backend.config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: lock antar proses dilewati
+    fcntl = None
+
+# Urutan kolom prediction_logs.csv (segmen memakai urutan yang sama, tanpa header)
+LOG_COLUMNS = ['timestamp', 'prediction', 'probability'] + Config.FEATURES
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+SEGMENT_PREFIX = 'seg-'
+STATE_FILE = 'merge_state.json'
+LOCK_FILE = '.lock'
+TAIL_BYTES_PER_ROW = 512  # Perkiraan atas ukuran satu baris log (untuk membaca ekor log kanonik)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _parse_rows(lines: List[Tuple[str, bytes]]) -> List[Tuple[str, Dict[str, str]]]:
+    """[(id, baris CSV mentah)] -> [(id, {kolom: nilai})]; header & baris rusak dilewati."""
+    out = []
+    for row_id, line in lines:
+        values = next(csv.reader([line.decode('utf-8', errors='replace')]), [])
+        if len(values) != len(LOG_COLUMNS) or values[0] == 'timestamp':
+            continue
+        out.append((row_id, dict(zip(LOG_COLUMNS, values))))
+    return out
+
+
+def _parse_segment_name(name: str) -> Optional[Tuple[int, int, int]]:
+    """'seg-<pid>-<mulai>-<urutan>.csv' -> (pid, mulai, urutan) atau None."""
+    if not (name.startswith(SEGMENT_PREFIX) and name.endswith('.csv')):
+        return None
+    try:
+        pid, started, seq = name[len(SEGMENT_PREFIX):-4].split('-')
+        return int(pid), int(started), int(seq)
+    except ValueError:
+        return None
+
+
+class FileLock:
+    """
+    flock antar proses: eksklusif non-blocking untuk satu penulis (penggabung segmen, kompaksi
+    models/log_store.py), shared (menunggu) untuk pembaca. Tanpa fcntl (Windows) selalu berhasil.
+    """
+
+    def __init__(self, path: str, shared: bool = False):
+        self.path = path
+        self.shared = shared
+        self._fd = None
+
+    def __enter__(self) -> bool:
+        if fcntl is None:
+            return True
+        self._fd = open(self.path, 'a')
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            self._fd.close()
+            self._fd = None
+            return False
+
+    def __exit__(self, *exc):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._fd.close()
+            self._fd = None
+
+
+# --- 1. PENULIS SEGMEN (SATU PER PROSES) ---
+class SegmentWriter:
+    """Penulis segmen milik satu proses; thread dalam proses yang sama berbagi lock lokal."""
+
+    def __init__(self, directory: str = None, max_bytes: int = None):
+        self.directory = directory or Config.LOG_SEGMENTS_DIR
+        self.max_bytes = max_bytes or Config.LOG_SEGMENT_MAX_BYTES
+        self.pid = os.getpid()
+        self.started = int(time.time())
+        self.seq = 0
+        self._fd = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{self.pid}-{self.started}-{self.seq:04d}.csv")
+
+    def _rotate(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self.seq += 1
+        os.makedirs(self.directory, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._size = os.fstat(self._fd).st_size
+
+    def write_row(self, row: Dict[str, object]) -> str:
+        """Tulis satu baris. Return: id baris '<segmen>:<offset>'."""
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=LOG_COLUMNS).writerow(row)
+        data = buffer.getvalue().encode('utf-8')
+        with self._lock:
+            if self._fd is None or self._size >= self.max_bytes:
+                self._rotate()
+            # Satu write() ber-O_APPEND: baris tidak pernah tercampur dengan penulis lain
+            os.write(self._fd, data)
+            row_id = f"{os.path.basename(self.path)}:{self._size}"
+            self._size += len(data)
+        return row_id
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+_writer = {'pid': None, 'writer': None}
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> SegmentWriter:
+    """Penulis segmen proses ini (dibuat ulang setelah fork -> tiap worker punya file sendiri)."""
+    if _writer['pid'] != os.getpid():
+        with _writer_lock:
+            if _writer['pid'] != os.getpid():
+                _writer.update(pid=os.getpid(), writer=SegmentWriter())
+    return _writer['writer']
+
+
+def append(row: Dict[str, object]) -> str:
+    """Tulis satu baris log prediksi (kolom LOG_COLUMNS) ke segmen proses ini. Return: id baris."""
+    return get_writer().write_row(row)
+
+
+# --- 2. PENGGABUNG SEGMEN -> LOG KANONIK ---
+class SegmentMerger:
+    """Status gabung (offset per segmen) + operasi gabung, baca & bersih-bersih segmen."""
+
+    def __init__(self, directory: str = None, log_path: str = None, grace_seconds: float = None):
+        self.directory = directory or Config.LOG_SEGMENTS_DIR
+        self.log_path = log_path or Config.PREDICTION_LOG
+        self.grace = Config.LOG_SEGMENT_GRACE_SECONDS if grace_seconds is None else grace_seconds
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _segments(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return sorted((n for n in names if _parse_segment_name(n)), key=_parse_segment_name)
+
+    def _load_state(self) -> Dict[str, object]:
+        try:
+            with open(self._path(STATE_FILE), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        return {'offsets': state.get('offsets', {}), 'pending': state.get('pending'),
+                'log_size': state.get('log_size')}
+
+    def _write_state(self, state: Dict[str, object]):
+        tmp = self._path(f"{STATE_FILE}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp, self._path(STATE_FILE))
+
+    def _log_size(self) -> int:
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+    def committed_log_size(self, state: Dict[str, object] = None) -> int:
+        """
+        Ukuran log kanonik yang sudah di-commit penggabung (batas baca semua pembaca).
+        Tanpa state gabung (log tidak diisi penggabung) -> ukuran file.
+        """
+        state = state or self._load_state()
+        size = self._log_size()
+        committed = state.get('log_size')
+        if committed is None and state.get('pending'):
+            committed = state['pending']['log_size']
+        return size if committed is None else min(size, committed)
+
+    @staticmethod
+    def _read_lines(path: str, offset: int) -> List[bytes]:
+        """Baris lengkap segmen sejak offset (baris terakhir mungkin sedang ditulis)."""
+        try:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return []
+        end = data.rfind(b'\n') + 1
+        return [line + b'\n' for line in data[:end].split(b'\n')[:-1]]
+
+    def _segment_lines(self, name: str, offset: int) -> Tuple[List[Tuple[str, bytes]], int]:
+        """[(id, baris)] segmen sejak offset + offset akhir baris lengkap."""
+        lines = []
+        for line in self._read_lines(self._path(name), offset):
+            lines.append((f"{name}:{offset}", line))
+            offset += len(line)
+        return lines, offset
+
+    def _recover(self, state: Dict[str, object]) -> bool:
+        """Gabung sebelumnya crash setelah mulai menulis: potong log ke ukuran sebelum gabung."""
+        pending = state.get('pending')
+        if not pending:
+            return False
+        if self._log_size() > pending['log_size']:
+            with open(self.log_path, 'r+b') as f:
+                f.truncate(pending['log_size'])
+        return True
+
+    def _sealed(self, name: str, names: List[str]) -> bool:
+        """Segmen tidak akan ditulis lagi: pemiliknya sudah rotasi ke segmen berikutnya atau mati."""
+        pid, started, seq = _parse_segment_name(name)
+        if pid == os.getpid() and _writer['pid'] == pid:
+            writer = _writer['writer']
+            return writer is not None and (writer.started, writer.seq) > (started, seq)
+        newer = any(_parse_segment_name(n)[:2] == (pid, started) and _parse_segment_name(n)[2] > seq
+                    for n in names)
+        return newer or not _pid_alive(pid)
+
+    def merge(self) -> int:
+        """
+        Pindahkan baris segmen dengan timestamp < (sekarang - grace) ke log kanonik, terurut.
+        Return: jumlah baris yang dipindah (0 jika proses lain sedang menggabung).
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with FileLock(self._path(LOCK_FILE)) as locked:
+            if not locked:
+                return 0
+            state = self._load_state()
+            recovered = self._recover(state)
+            offsets = dict(state['offsets'])
+            watermark = time.strftime(TIMESTAMP_FORMAT, time.localtime(time.time() - self.grace))
+
+            names = self._segments()
+            rows = []
+            for name in names:
+                offset = offsets.get(name, 0)
+                for line in self._read_lines(self._path(name), offset):
+                    # Baris segmen urut waktu tulis; berhenti di baris pertama yang belum lewat watermark
+                    if line[:19].decode('utf-8', errors='replace') >= watermark:
+                        break
+                    rows.append((line[:19], name, offset, line))
+                    offset += len(line)
+                offsets[name] = offset
+
+            if rows:
+                rows.sort(key=lambda r: (r[0], r[1], r[2]))
+                log_size = self._log_size()
+                # Niat tulis dicatat dulu: crash sebelum state akhir -> dipotong ulang (_recover)
+                self._write_state({'offsets': state['offsets'], 'pending': {'log_size': log_size},
+                                   'log_size': log_size})
+                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                with open(self.log_path, 'ab') as f:
+                    if log_size == 0:
+                        f.write((','.join(LOG_COLUMNS) + '\r\n').encode('utf-8'))
+                    f.write(b''.join(r[3] for r in rows))
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            # Commit dulu (offset baru, pending dihapus) sebelum segmen apa pun dihapus:
+            # crash setelah titik ini tidak lagi memotong baris yang sumbernya sudah hilang
+            log_size = self._log_size()
+            if rows or recovered or offsets != state['offsets'] or state['log_size'] != log_size:
+                self._write_state({'offsets': offsets, 'pending': None, 'log_size': log_size})
+
+            # Segmen tertutup yang sudah habis dipindah dihapus (offset usang tidak berbahaya jika crash di sini)
+            committed = dict(offsets)
+            for name in names:
+                try:
+                    size = os.path.getsize(self._path(name))
+                except OSError:
+                    offsets.pop(name, None)
+                    continue
+                if offsets.get(name, 0) >= size and self._sealed(name, names):
+                    os.remove(self._path(name))
+                    offsets.pop(name, None)
+            if offsets != committed:
+                self._write_state({'offsets': offsets, 'pending': None, 'log_size': log_size})
+            return len(rows)
+
+    def pending_bytes(self) -> int:
+        offsets = self._load_state()['offsets']
+        total = 0
+        for name in self._segments():
+            try:
+                total += max(os.path.getsize(self._path(name)) - offsets.get(name, 0), 0)
+            except OSError:
+                pass
+        return total
+
+    def read_recent(self, limit: int) -> Tuple[List[Tuple[str, Dict[str, str]]], Dict[str, int]]:
+        """
+        `limit` baris terbaru (id, baris) dari ekor log kanonik + baris segmen yang belum digabung,
+        tanpa membaca seluruh log. Juga offset akhir tiap segmen (titik awal read_segment_rows).
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with FileLock(self._path(LOCK_FILE), shared=True):
+            state = self._load_state()
+            size = self.committed_log_size(state)
+            start = max(size - limit * TAIL_BYTES_PER_ROW, 0)
+            lines = []
+            if size:
+                with open(self.log_path, 'rb') as f:
+                    f.seek(start)
+                    data = f.read(size - start)
+                if start:
+                    # Baris pertama kemungkinan terpotong
+                    cut = data.find(b'\n') + 1
+                    data, start = data[cut:], start + cut
+                offset = start
+                for line in data.split(b'\n')[:-1]:
+                    lines.append((f"log:{offset}", line))
+                    offset += len(line) + 1
+
+            offsets, pending = {}, []
+            state_offsets = state['offsets']
+            for name in self._segments():
+                segment_lines, offsets[name] = self._segment_lines(name, state_offsets.get(name, 0))
+                pending.extend(segment_lines)
+
+        rows = _parse_rows(lines) + _parse_rows(pending)
+        rows.sort(key=lambda r: r[1]['timestamp'])  # stabil: urutan tulis dipertahankan per detik
+        return rows[-limit:], offsets
+
+    def read_segment_rows(self, offsets: Dict[str, int], skip_prefix: str = None):
+        """
+        Baris segmen baru sejak `offsets` ({segmen: offset}; segmen baru dari awal).
+        skip_prefix: segmen yang dilewati (milik proses sendiri). Return: ([(id, baris)], offsets baru).
+        """
+        rows, new_offsets = [], {}
+        for name in self._segments():
+            if skip_prefix and name.startswith(skip_prefix):
+                continue
+            lines, new_offsets[name] = self._segment_lines(name, offsets.get(name, 0))
+            rows.extend(_parse_rows(lines))
+        return rows, new_offsets
+
+    def read_unmerged(self, offsets: Dict[str, int]):
+        """
+        Snapshot konsisten untuk pembaca inkremental (models/stats.py), di bawah lock shared seperti
+        read_log: ukuran log kanonik yang di-commit, offset gabung per segmen, dan baris segmen baru sejak `offsets`
+        (tidak pernah sebelum offset gabung). Return: (ukuran log, offset gabung, [(id, baris)], offsets baru).
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with FileLock(self._path(LOCK_FILE), shared=True):
+            state = self._load_state()
+            log_size, merged = self.committed_log_size(state), state['offsets']
+            start = {name: max(offsets.get(name, 0), merged.get(name, 0)) for name in set(offsets) | set(merged)}
+            rows, new_offsets = self.read_segment_rows(start)
+        return log_size, merged, rows, new_offsets
+
+    def read_log(self) -> pd.DataFrame:
+        """
+        Tampilan audit lengkap: log kanonik + baris segmen yang belum digabung, terurut timestamp.
+        Dibaca di bawah lock shared -> tidak pernah melihat baris ganda / hilang saat gabung berjalan.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with FileLock(self._path(LOCK_FILE), shared=True):
+            state = self._load_state()
+            try:
+                with open(self.log_path, 'rb') as f:
+                    canonical = f.read(self.committed_log_size(state))
+            except OSError:
+                canonical = b''
+            offsets = state['offsets']
+            pending = b''.join(b''.join(self._read_lines(self._path(n), offsets.get(n, 0)))
+                               for n in self._segments())
+
+        if not canonical:
+            canonical = (','.join(LOG_COLUMNS) + '\r\n').encode('utf-8')
+        elif not canonical.endswith(b'\n'):
+            canonical += b'\n'
+        # Satu kali parse (tipe kolom sama seperti membaca prediction_logs.csv langsung)
+        df = pd.read_csv(io.BytesIO(canonical + pending), on_bad_lines='skip')
+        if pending:
+            # Log kanonik sudah urut; hanya baris segmen yang perlu disisipkan
+            df = df.sort_values('timestamp', kind='stable', ignore_index=True)
+        return df
+
+
+_default_merger = None
+
+
+def get_merger() -> SegmentMerger:
+    global _default_merger
+    if _default_merger is None:
+        _default_merger = SegmentMerger()
+    return _default_merger
+
+
+def merge_segments() -> int:
+    """Satu putaran gabung (dipanggil thread penggabung latar)."""
+    try:
+        return get_merger().merge()
+    except OSError as e:
+        print(f"⚠️ Gabung segmen log gagal: {e}")
+        return 0
+
+
+def read_log() -> pd.DataFrame:
+    return get_merger().read_log()
+
+
+# --- 3. PENGGABUNG LATAR ---
+_merger_thread = {'thread': None, 'pid': None}
+
+
+def start_merger(interval: float = None) -> Optional[threading.Thread]:
+    """Thread daemon yang menggabung segmen secara berkala (sekali per proses)."""
+    interval = Config.LOG_SEGMENT_MERGE_SECONDS if interval is None else interval
+    if interval <= 0:
+        return None
+    if (_merger_thread['pid'] == os.getpid() and _merger_thread['thread'] is not None
+            and _merger_thread['thread'].is_alive()):
+        return _merger_thread['thread']
+
+    stop = threading.Event()
+
+    def _run():
+        while not stop.wait(interval):
+            merge_segments()
+
+    thread = threading.Thread(target=_run, name='log-segment-merger', daemon=True)
+    thread.start()
+    _merger_thread.update({'thread': thread, 'pid': os.getpid()})
+    return thread
@@ -1,5 +1,16 @@
 import pandas as pd
 import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+
+from Backend.config import Config
+
+# Versi aturan cleaning/encoding. NAIKKAN jika logika di bawah berubah:
+# bundle model menyimpan versi ini dan akan ditolak saat load jika berbeda (wajib latih ulang).
+PREPROCESS_VERSION = "1"
+
+NUMERIC_COLUMNS = ['age', 'pulse_rate', 'systolic_bp', 'diastolic_bp', 'glucose', 'height', 'weight', 'bmi']
+BOOL_COLUMNS = ['family_diabetes', 'hypertensive', 'family_hypertension', 'cardiovascular_disease']
+
 
 class DiabetesPreprocessor:
     def __init__(self):
@@ -25,12 +36,8 @@ class DiabetesPreprocessor:
             'no': 0, 'tidak': 0, 'false': 0, '0': 0, 'n': 0, 'nan': 0, 'none': 0
         }
         
-        # 2. Urutan Fitur WAJIB (14 Fitur)
-        self.feature_order = [
-            'age', 'gender', 'pulse_rate', 'systolic_bp', 'diastolic_bp', 
-            'glucose', 'height', 'weight', 'bmi', 'family_diabetes', 
-            'hypertensive', 'family_hypertension', 'cardiovascular_disease', 'stroke'
-        ]
+        # 2. Urutan Fitur WAJIB (14 Fitur) -> satu sumber: Config.FEATURES
+        self.feature_order = list(Config.FEATURES)
 
     def clean_and_encode(self, df, is_training=False):
         """
@@ -56,8 +63,7 @@ class DiabetesPreprocessor:
                 df[col] = np.nan
 
         # --- B. CLEANING NUMERIK ---
-        numeric_cols = ['age', 'pulse_rate', 'systolic_bp', 'diastolic_bp', 'glucose', 'height', 'weight', 'bmi']
-        for col in numeric_cols:
+        for col in NUMERIC_COLUMNS:
             if col in df.columns:
                 # Paksa ke numerik, ganti error dengan NaN
                 df[col] = pd.to_numeric(df[col], errors='coerce')
@@ -99,8 +105,7 @@ class DiabetesPreprocessor:
             df['stroke'] = df['stroke'].astype(str).str.lower().str.strip().map(self.stroke_map)
 
         # Kolom Biner Lainnya (Yes/No)
-        bool_cols = ['family_diabetes', 'hypertensive', 'family_hypertension', 'cardiovascular_disease']
-        for col in bool_cols:
+        for col in BOOL_COLUMNS:
             if col in df.columns:
                 # Konversi manual dictionary replace lebih aman daripada map untuk parsial match
                 df[col] = df[col].astype(str).str.lower().str.strip()
@@ -130,4 +135,119 @@ class DiabetesPreprocessor:
 
     def get_target(self, df):
         """Mengambil kolom target (y) jika ada."""
-        return df['diabetic'] if 'diabetic' in df.columns else None
\ No newline at end of file
+        return df['diabetic'] if 'diabetic' in df.columns else None
+
+
+class DiabetesFeatureTransformer(BaseEstimator, TransformerMixin):
+    """
+    Versi scikit-learn dari DiabetesPreprocessor (clean_and_encode + get_features dalam satu langkah).
+    - fit()       -> menyimpan mapping kategori & versi aturan (state ikut ter-pickle di bundle)
+    - transform() -> record mentah (dict / list of dict / DataFrame) -> DataFrame float32
+                     berurutan Config.FEATURES, siap masuk predict_proba
+    Hasil identik dengan clean_and_encode, tetapi:
+    - satu record (dict) diproses dengan loop Python biasa tanpa membangun DataFrame mentah
+    - batch diproses per kolom: nilai kategori unik di-encode sekali (factorize), numerik vektor NumPy
+    """
+
+    def fit(self, X=None, y=None):
+        pp = DiabetesPreprocessor()
+        self.gender_map_ = dict(pp.gender_map)
+        self.stroke_map_ = dict(pp.stroke_map)
+        self.bool_replace_ = dict(pp.bool_replace)
+        self.feature_order_ = list(pp.feature_order)
+        self.version_ = PREPROCESS_VERSION
+        self.n_features_out_ = len(self.feature_order_)
+        return self
+
+    def get_feature_names_out(self, input_features=None):
+        return np.asarray(self.feature_order_, dtype=object)
+
+    def transform(self, X):
+        if not hasattr(self, 'version_'):
+            self.fit()
+        if isinstance(X, dict):
+            values = np.array([self._encode_record(X)], dtype=np.float32)
+            return pd.DataFrame(values, columns=self.feature_order_)
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(list(X))
+        return self._encode_frame(X)
+
+    # --- A. SATU RECORD (jalur API) ---
+    @staticmethod
+    def _to_float(value) -> float:
+        if value is None:
+            return np.nan
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def _encode_record(self, record: dict) -> list:
+        num = {col: self._to_float(record.get(col)) for col in NUMERIC_COLUMNS}
+
+        # Konversi satuan (sama dengan clean_and_encode)
+        if num['glucose'] > 30:
+            num['glucose'] = round(num['glucose'] / 18, 2)
+        if num['height'] > 3:
+            num['height'] = round(num['height'] / 100, 2)
+        h, w, bmi = num['height'], num['weight'], num['bmi']
+        if (bmi != bmi or bmi == 0) and h == h and w == w and h > 0:
+            num['bmi'] = round(w / (h ** 2), 2)
+
+        encoded = dict(num)
+        encoded['gender'] = self.gender_map_.get(str(record.get('gender')).lower().strip(), np.nan)
+        encoded['stroke'] = self.stroke_map_.get(str(record.get('stroke')).lower().strip(), np.nan)
+        for col in BOOL_COLUMNS:
+            key = str(record.get(col)).lower().strip()
+            encoded[col] = self.bool_replace_[key] if key in self.bool_replace_ else self._to_float(key)
+
+        # NaN -> 0 (sama dengan fillna(0) di clean_and_encode)
+        return [0.0 if v != v else v for v in (encoded[c] for c in self.feature_order_)]
+
+    # --- B. BATCH (jalur skoring massal) ---
+    @staticmethod
+    def _encode_uniques(column: pd.Series, encode) -> np.ndarray:
+        """Encode nilai unik sekali lalu sebarkan ke semua baris."""
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        keys = pd.Series(pd.Index(uniques).astype(str)).str.lower().str.strip()
+        return np.asarray(encode(keys), dtype=np.float64)[codes]
+
+    @staticmethod
+    def _round2(values: np.ndarray) -> np.ndarray:
+        """
+        round(x, 2) Python per nilai unik (bukan np.round: pembulatan setengah berbeda
+        untuk nilai seperti 140.5 / 100), agar hasil batch identik dengan jalur satu record.
+        """
+        uniques, inverse = np.unique(values, return_inverse=True)
+        rounded = np.fromiter((round(v, 2) for v in uniques.tolist()), dtype=np.float64, count=len(uniques))
+        return rounded[inverse.reshape(-1)]
+
+    def _encode_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        n = len(df)
+        out = {}
+        for col in NUMERIC_COLUMNS:
+            out[col] = (pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+                        if col in df.columns else np.full(n, np.nan))
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            g, h = out['glucose'], out['height']
+            out['glucose'] = np.where(g > 30, self._round2(g / 18), g)
+            out['height'] = h = np.where(h > 3, self._round2(h / 100), h)
+            w, bmi = out['weight'], out['bmi']
+            auto = (np.isnan(bmi) | (bmi == 0)) & ~np.isnan(h) & ~np.isnan(w) & (h > 0)
+            out['bmi'] = np.where(auto, self._round2(w / (h ** 2)), bmi)
+
+        missing = pd.Series(np.nan, index=df.index)
+        categorical = {
+            'gender': lambda keys: keys.map(self.gender_map_),
+            'stroke': lambda keys: keys.map(self.stroke_map_),
+        }
+        for col in BOOL_COLUMNS:
+            categorical[col] = lambda keys: pd.to_numeric(keys.replace(self.bool_replace_), errors='coerce')
+        for col, encode in categorical.items():
+            out[col] = self._encode_uniques(df[col] if col in df.columns else missing, encode)
+
+        matrix = np.column_stack([out[c] for c in self.feature_order_])
+        matrix[np.isnan(matrix)] = 0.0
+        return pd.DataFrame(matrix.astype(np.float32), columns=self.feature_order_, index=df.index)
+
@@ -0,0 +1,200 @@
+"""
+Backend/models/registry.py
+Registry model berversi (Backend/models/registry/):
+1. Setiap hasil training disimpan sebagai versi baru yang tidak pernah ditimpa:
+       registry/v0001/bundle.pkl + meta.json (+ drift_reference.json)  (file dibuat read-only)
+2. File pointer 'ACTIVE' -> versi yang dipakai API & script
+3. File pointer 'SHADOW' -> kandidat yang ikut menilai salinan traffic live (lihat models/shadow.py)
+
+Jika belum ada versi aktif, semua pemanggil tetap memakai file lama
+(Config.MODEL_PATH & Config.META_PATH) sehingga deployment lama tidak berubah.
+"""
+
+import os
+import re
+import json
+import shutil
+import stat
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+
+from Backend.config import Config
+
+BUNDLE_FILE = 'bundle.pkl'
+META_FILE = 'meta.json'
+ACTIVE_POINTER = 'ACTIVE'
+SHADOW_POINTER = 'SHADOW'
+VERSION_PATTERN = re.compile(r'^v(\d{4,})$')
+
+
+class RegistryError(ValueError):
+    """Versi tidak ditemukan / pointer tidak valid."""
+
+
+def _root(root: str = None) -> str:
+    return root or Config.REGISTRY_DIR
+
+
+# --- 1. VERSI ---
+def list_versions(root: str = None) -> List[str]:
+    root = _root(root)
+    if not os.path.isdir(root):
+        return []
+    versions = [d for d in os.listdir(root) if VERSION_PATTERN.match(d)]
+    return sorted(versions, key=lambda v: int(v[1:]))
+
+
+def version_paths(version: str, root: str = None) -> Tuple[str, str]:
+    """(path bundle, path metadata) untuk satu versi. Raise RegistryError jika tidak ada."""
+    folder = os.path.join(_root(root), version)
+    if not VERSION_PATTERN.match(version or '') or not os.path.isdir(folder):
+        raise RegistryError(f"Versi model '{version}' tidak ada di registry.")
+    return os.path.join(folder, BUNDLE_FILE), os.path.join(folder, META_FILE)
+
+
+def read_meta(version: str, root: str = None) -> Dict[str, Any]:
+    _, meta_path = version_paths(version, root)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _freeze(folder: str):
+    """Buat file versi read-only (penanda immutable; hapus manual jika benar-benar perlu)."""
+    for name in os.listdir(folder):
+        path = os.path.join(folder, name)
+        os.chmod(path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+
+
+def _publish(tmp_dir: str, root: str) -> str:
+    """Rename folder sementara ke nomor versi berikutnya (rename atomik, gagal jika sudah ada)."""
+    while True:
+        versions = list_versions(root)
+        number = int(versions[-1][1:]) + 1 if versions else 1
+        version = f"v{number:04d}"
+        try:
+            os.rename(tmp_dir, os.path.join(root, version))
+            return version
+        except OSError:
+            if not os.path.isdir(os.path.join(root, version)):
+                raise
+            # Nomor dipakai proses lain di saat bersamaan -> coba nomor berikutnya
+
+
+def register(bundle: Dict[str, Any], metadata: Dict[str, Any], root: str = None,
+             extras: Dict[str, Any] = None) -> str:
+    """
+    Simpan bundle + metadata sebagai versi baru. Return: nama versi (misal 'v0003').
+    extras: {nama_file.json: objek} yang ikut disimpan (misal referensi drift).
+    """
+    root = _root(root)
+    os.makedirs(root, exist_ok=True)
+    tmp_dir = os.path.join(root, f".tmp-{os.getpid()}-{datetime.now().strftime('%H%M%S%f')}")
+    os.makedirs(tmp_dir)
+    try:
+        joblib.dump(bundle, os.path.join(tmp_dir, BUNDLE_FILE))
+        meta = dict(metadata, registered_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        with open(os.path.join(tmp_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=4)
+        for name, content in (extras or {}).items():
+            with open(os.path.join(tmp_dir, name), 'w', encoding='utf-8') as f:
+                json.dump(content, f, indent=2)
+        _freeze(tmp_dir)
+        version = _publish(tmp_dir, root)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return version
+
+
+def register_files(model_path: str, meta_path: str = None, root: str = None) -> str:
+    """Daftarkan bundle yang sudah ada di disk (misal file lama Config.MODEL_PATH)."""
+    metadata = {}
+    if meta_path and os.path.exists(meta_path):
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+    metadata.setdefault('imported_from', os.path.basename(model_path))
+    return register(joblib.load(model_path), metadata, root)
+
+
+# --- 2. POINTER ACTIVE / SHADOW ---
+def _read_pointer(name: str, root: str = None) -> Optional[str]:
+    try:
+        with open(os.path.join(_root(root), name), 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_pointer(name: str, version: Optional[str], root: str = None):
+    root = _root(root)
+    path = os.path.join(root, name)
+    if version is None:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    version_paths(version, root)  # validasi
+    os.makedirs(root, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(version + '\n')
+    os.replace(tmp, path)
+
+
+def get_active(root: str = None) -> Optional[str]:
+    return _read_pointer(ACTIVE_POINTER, root)
+
+
+def set_active(version: str, root: str = None):
+    _write_pointer(ACTIVE_POINTER, version, root)
+    # Kandidat yang baru diaktifkan tidak perlu lagi jalan sebagai shadow
+    if get_shadow(root) == version:
+        _write_pointer(SHADOW_POINTER, None, root)
+
+
+def get_shadow(root: str = None) -> Optional[str]:
+    return _read_pointer(SHADOW_POINTER, root)
+
+
+def set_shadow(version: Optional[str], root: str = None):
+    _write_pointer(SHADOW_POINTER, version, root)
+
+
+def active_paths(root: str = None) -> Tuple[str, str]:
+    """(bundle, metadata) versi aktif, atau file lama Config.MODEL_PATH/META_PATH jika belum ada."""
+    version = get_active(root)
+    if version:
+        return version_paths(version, root)
+    return Config.MODEL_PATH, Config.META_PATH
+
+
+def active_file(name: str, fallback: str, root: str = None) -> str:
+    """File pendamping versi aktif (misal drift_reference.json), atau fallback jika tidak ada."""
+    version = get_active(root)
+    if version:
+        path = os.path.join(_root(root), version, name)
+        if os.path.exists(path):
+            return path
+    return fallback
+
+
+def describe(root: str = None) -> Dict[str, Any]:
+    """Ringkasan registry untuk API/CLI."""
+    active, shadow = get_active(root), get_shadow(root)
+    versions = []
+    for version in list_versions(root):
+        meta = read_meta(version, root)
+        versions.append({
+            'version': version,
+            'registered_at': meta.get('registered_at'),
+            'training_date': meta.get('training_date'),
+            'accuracy_cv': meta.get('accuracy_cv'),
+            'preprocess_version': meta.get('preprocess_version'),
+            'active': version == active,
+            'shadow': version == shadow,
+        })
+    return {'active': active, 'shadow': shadow, 'versions': versions}
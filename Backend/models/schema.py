@@ -0,0 +1,213 @@
+"""
+Backend/models/schema.py
+Validator skema input yang dikompilasi sekali dari Config.FEATURE_SCHEMA:
+1. validate(data)        -> satu pasien (dict API), loop Python minimal tanpa pandas
+2. validate_frame(df)    -> batch per kolom: nilai unik di-factorize lalu dicek sekali,
+                            hasil dipetakan balik ke semua baris dengan NumPy
+3. Kesalahan terstruktur per field (kode + pesan), dengan konversi satuan yang sama
+   seperti DiabetesPreprocessor (glukosa mg/dL -> mmol/L, tinggi cm -> m)
+
+Kode error: OK=0, EMPTY=1 (kosong), NOT_NUMBER=2, OUT_OF_RANGE=3, UNKNOWN=4 (kategori).
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from Backend.config import Config
+from Backend.models.preprocess import DiabetesPreprocessor
+
+OK, EMPTY, NOT_NUMBER, OUT_OF_RANGE, UNKNOWN = 0, 1, 2, 3, 4
+
+
+class _NumericRule:
+    __slots__ = ('name', 'unit', 'low', 'high', 'above', 'divide', 'from_unit', 'zero_means_auto', 'range_text')
+
+    def __init__(self, name: str, spec: dict):
+        self.name = name
+        self.unit = spec.get('unit', '')
+        self.low = float(spec.get('min', -np.inf))
+        self.high = float(spec.get('max', np.inf))
+        convert = spec.get('convert') or {}
+        self.above = float(convert.get('above', np.inf))
+        self.divide = float(convert.get('divide', 1.0))
+        self.from_unit = convert.get('from_unit')
+        self.zero_means_auto = bool(spec.get('zero_means_auto', False))
+
+        text = f"{spec.get('min')}-{spec.get('max')} {self.unit}".strip()
+        if self.from_unit:
+            text += f" / {spec.get('min') * self.divide:g}-{spec.get('max') * self.divide:g} {self.from_unit}"
+        self.range_text = text
+
+    def check(self, value: float) -> int:
+        if value != value:  # NaN
+            return NOT_NUMBER
+        if value > self.above:
+            value = value / self.divide
+        if value == 0 and self.zero_means_auto:
+            return OK
+        return OK if self.low <= value <= self.high else OUT_OF_RANGE
+
+    def check_array(self, values: np.ndarray) -> np.ndarray:
+        """values: float64 (NaN = bukan angka). Return: kode per elemen."""
+        converted = np.where(values > self.above, values / self.divide, values)
+        codes = np.where((converted >= self.low) & (converted <= self.high), OK, OUT_OF_RANGE)
+        if self.zero_means_auto:
+            codes[converted == 0] = OK
+        codes[np.isnan(values)] = NOT_NUMBER
+        return codes.astype(np.int8)
+
+
+class _CategoryRule:
+    __slots__ = ('name', 'allowed', 'numeric_ok')
+
+    def __init__(self, name: str, mapping: dict, numeric_ok: bool):
+        self.name = name
+        self.allowed = frozenset(str(k).strip().lower() for k in mapping)
+        # Kolom biner dikonversi pd.to_numeric oleh preprocessor -> '1.0' juga terbaca benar
+        self.numeric_ok = numeric_ok
+
+    def check(self, value: Any) -> int:
+        if str(value).strip().lower() in self.allowed:
+            return OK
+        if self.numeric_ok:
+            try:
+                return OK if float(value) in (0.0, 1.0) else UNKNOWN
+            except (TypeError, ValueError):
+                pass
+        return UNKNOWN
+
+
+class CompiledSchema:
+    """Skema Config.FEATURE_SCHEMA dalam bentuk siap pakai (dibuat sekali, dipakai berulang)."""
+
+    def __init__(self, schema: Optional[dict] = None, preprocessor: Optional[DiabetesPreprocessor] = None):
+        schema = schema or Config.FEATURE_SCHEMA
+        pp = preprocessor or DiabetesPreprocessor()
+        self.features = list(Config.FEATURES)
+        self.rules = {}
+        for name in self.features:
+            spec = schema[name]
+            if spec['type'] == 'number':
+                self.rules[name] = _NumericRule(name, spec)
+            else:
+                mapping = spec['mapping']
+                self.rules[name] = _CategoryRule(name, getattr(pp, mapping), numeric_ok=(mapping == 'bool_replace'))
+
+    # --- Pesan ---
+    def message(self, name: str, code: int) -> str:
+        if code == EMPTY:
+            return f"{name} kosong"
+        if code == NOT_NUMBER:
+            return f"{name} bukan angka"
+        if code == OUT_OF_RANGE:
+            return f"{name} di luar rentang ({self.rules[name].range_text})"
+        return f"{name} tidak dikenali"
+
+    # --- 1. SATU PASIEN ---
+    def validate(self, data: Dict[str, Any]) -> Dict[str, int]:
+        """Return: {field: kode_error} hanya untuk field yang bermasalah ({} = valid)."""
+        errors = {}
+        for name in self.features:
+            value = data.get(name)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                errors[name] = EMPTY
+                continue
+
+            rule = self.rules[name]
+            if isinstance(rule, _NumericRule):
+                if isinstance(value, bool):
+                    code = NOT_NUMBER
+                else:
+                    try:
+                        code = rule.check(float(value))
+                    except (TypeError, ValueError):
+                        code = NOT_NUMBER
+            else:
+                code = rule.check(value)
+            if code:
+                errors[name] = code
+        return errors
+
+    # --- 2. BATCH (PER KOLOM) ---
+    def validate_frame(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Return: {field: array kode int8 per baris} hanya untuk kolom yang punya error.
+        Nilai unik per kolom dicek sekali (factorize), lalu dipetakan ke semua baris.
+        """
+        n = len(df)
+        errors = {}
+        for name in self.features:
+            if name not in df.columns:
+                errors[name] = np.full(n, EMPTY, dtype=np.int8)
+                continue
+
+            column = df[name]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Kolom 'category' sudah ter-factorize: pakai kode & kategori yang ada
+                codes, uniques = column.cat.codes.to_numpy(), column.cat.categories.astype(object)
+            else:
+                codes, uniques = pd.factorize(column, use_na_sentinel=True)
+            unique_codes = self._check_uniques(self.rules[name], pd.Index(uniques))
+            # Sentinel -1 (NaN) -> indeks terakhir = EMPTY
+            row_codes = np.append(unique_codes, EMPTY).astype(np.int8)[codes]
+            if row_codes.any():
+                errors[name] = row_codes
+        return errors
+
+    @staticmethod
+    def _check_uniques(rule, uniques: pd.Index) -> np.ndarray:
+        if len(uniques) == 0:
+            return np.zeros(0, dtype=np.int8)
+
+        is_text = uniques.dtype == object
+        blank = np.zeros(len(uniques), dtype=bool)
+        if is_text:
+            blank = np.array([isinstance(u, str) and not u.strip() for u in uniques], dtype=bool)
+
+        if isinstance(rule, _NumericRule):
+            if uniques.dtype == bool:
+                codes = np.full(len(uniques), NOT_NUMBER, dtype=np.int8)
+            else:
+                values = pd.to_numeric(uniques, errors='coerce').to_numpy(dtype=np.float64)
+                codes = rule.check_array(values)
+        else:
+            codes = np.array([rule.check(u) for u in uniques], dtype=np.int8)
+
+        codes[blank] = EMPTY
+        return codes
+
+    def row_messages(self, errors: Dict[str, np.ndarray], n_rows: int) -> np.ndarray:
+        """Gabungkan kode per field menjadi pesan per baris ('' jika valid)."""
+        messages = np.full(n_rows, '', dtype=object)
+        invalid = np.zeros(n_rows, dtype=bool)
+        for codes in errors.values():
+            invalid |= codes != OK
+        rows = np.flatnonzero(invalid)
+        if rows.size == 0:
+            return messages
+
+        # String hanya dibangun untuk baris yang bermasalah
+        texts = np.full(rows.size, '', dtype=object)
+        for name in self.features:
+            codes = errors.get(name)
+            if codes is None:
+                continue
+            codes = codes[rows]
+            for code in np.unique(codes[codes != OK]):
+                mask = codes == code
+                texts[mask] = texts[mask] + self.message(name, int(code)) + '; '
+        messages[rows] = [t[:-2] for t in texts]
+        return messages
+
+
+# Instance bersama (dikompilasi sekali saat pertama dipakai)
+_default_schema = None
+
+
+def get_schema() -> CompiledSchema:
+    global _default_schema
+    if _default_schema is None:
+        _default_schema = CompiledSchema()
+    return _default_schema
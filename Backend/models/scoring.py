@@ -0,0 +1,92 @@
+"""
+Backend/models/scoring.py
+Skoring massal (bulk) untuk banyak pasien sekaligus:
+1. Validasi per-baris (kolom kosong, angka tidak valid / di luar rentang klinis, kategori tidak dikenal)
+2. Preprocessing + prediksi per chunk (vektor, satu panggilan model per chunk)
+3. Iterator chunk dari file/stream CSV agar memori tetap terbatas
+
+Dipakai oleh endpoint /api/screening dan script offline Scripts/score_file.py.
+"""
+
+from typing import Callable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from Backend.config import Config
+from Backend.models.preprocess import DiabetesFeatureTransformer
+from Backend.models.schema import CompiledSchema, get_schema
+
+# Kolom output hasil skoring (urutan tetap untuk CSV)
+RESULT_COLUMNS = ['row', 'label', 'probability_percent', 'risk_level', 'error']
+
+NUMERIC_FEATURES = ['age', 'pulse_rate', 'systolic_bp', 'diastolic_bp', 'glucose', 'height', 'weight', 'bmi']
+BOOL_FEATURES = ['family_diabetes', 'hypertensive', 'family_hypertension', 'cardiovascular_disease']
+
+
+def get_risk_level(probability: float) -> str:
+    """Kategori risiko dari probabilitas (0-1), sama dengan respons /api/predict."""
+    return 'Tinggi' if probability >= 0.7 else ('Sedang' if probability >= 0.4 else 'Rendah')
+
+
+def missing_columns(columns) -> list:
+    """Kolom fitur wajib yang tidak ada di header CSV."""
+    return [f for f in Config.FEATURES if f not in columns]
+
+
+def validate_frame(df: pd.DataFrame, schema: CompiledSchema = None) -> pd.Series:
+    """
+    Validasi vektor per baris (per kolom dengan NumPy, lihat models/schema.py).
+    Return: Series string pesan error ('' jika baris valid), index sama dengan df.
+    """
+    schema = schema or get_schema()
+    errors = schema.validate_frame(df)
+    return pd.Series(schema.row_messages(errors, len(df)), index=df.index, dtype=object)
+
+
+def score_frame(df: pd.DataFrame, predict_proba: Callable, start_row: int = 1,
+                preprocessor: DiabetesFeatureTransformer = None) -> pd.DataFrame:
+    """
+    Skoring satu chunk DataFrame mentah.
+    predict_proba: fungsi matriks fitur -> probabilitas [n, 2] (misal backend inference).
+    start_row: nomor baris sumber (1 = baris data pertama setelah header).
+    """
+    pp = preprocessor or DiabetesFeatureTransformer().fit()
+    n = len(df)
+
+    result = pd.DataFrame({
+        'row': np.arange(start_row, start_row + n),
+        'label': '',
+        'probability_percent': np.nan,
+        'risk_level': '',
+        'error': validate_frame(df).to_numpy(),
+    })
+
+    valid = (result['error'] == '').to_numpy()
+    if valid.any():
+        proba = np.asarray(predict_proba(pp.transform(df.loc[valid])))[:, 1]
+
+        result.loc[valid, 'label'] = np.where(proba > 0.5, 'Diabetic', 'Non-Diabetic')
+        result.loc[valid, 'probability_percent'] = np.round(proba * 100, 2)
+        result.loc[valid, 'risk_level'] = [get_risk_level(p) for p in proba]
+
+    return result[RESULT_COLUMNS]
+
+
+def iter_csv_chunks(source, chunksize: int = None) -> Iterator[pd.DataFrame]:
+    """
+    Membaca CSV (path atau file-like/stream) per chunk.
+    Semua kolom dibaca sebagai string agar nilai mentah bisa divalidasi apa adanya.
+    """
+    return pd.read_csv(source, chunksize=chunksize or Config.SCREENING_CHUNK_SIZE,
+                       dtype=str, skipinitialspace=True)
+
+
+def iter_scored_chunks(chunks: Iterator[pd.DataFrame], predict_proba: Callable,
+                       preprocessor: DiabetesFeatureTransformer = None) -> Iterator[pd.DataFrame]:
+    """Skoring berurutan per chunk; nomor baris sumber diteruskan antar chunk."""
+    pp = preprocessor or DiabetesFeatureTransformer().fit()
+    next_row = 1
+    for chunk in chunks:
+        yield score_frame(chunk, predict_proba, start_row=next_row, preprocessor=pp)
+        next_row += len(chunk)
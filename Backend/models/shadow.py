@@ -0,0 +1,186 @@
+"""
+Backend/models/shadow.py
+Shadow scoring: model kandidat (pointer SHADOW di registry) ikut menilai salinan traffic live
+di thread latar, hasilnya TIDAK pernah dikirim ke pasien:
+1. submit() hanya memasukkan salinan record ke antrian terbatas (non-blocking, O(1));
+   jika antrian penuh, sampel dibuang & dihitung (request tidak pernah menunggu)
+2. Thread latar memproses per batch (penuh / jendela waktu habis):
+   transformer kandidat -> satu predict_proba kandidat untuk seluruh batch
+3. Laporan agregat vs model aktif: tingkat kesepakatan label, matriks 2x2,
+   selisih probabilitas (rata-rata, absolut, RMSE, maksimum, histogram)
+
+Catatan: statistik per proses (tiap worker gunicorn punya shadow scorer sendiri).
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from Backend.config import Config
+from Backend.models.inference import DirectInference
+
+# Batas histogram |selisih probabilitas| dalam poin persen
+DELTA_BINS_PP = [1, 2, 5, 10, 20]
+THRESHOLD = 0.5  # Sama dengan /api/predict: Diabetic jika probabilitas > 0.5
+
+
+class ShadowScorer:
+    """Menilai salinan traffic dengan model kandidat tanpa menambah latensi request."""
+
+    def __init__(self, model, preprocessor, version: str, active_version: Optional[str] = None,
+                 queue_size: int = None, batch_size: int = None, max_wait_ms: float = None):
+        self.inference = DirectInference(model)
+        self.preprocessor = preprocessor
+        self.version = version
+        self.active_version = active_version
+        self.queue_size = queue_size or Config.SHADOW_QUEUE_SIZE
+        self.batch_size = batch_size or Config.SHADOW_BATCH_SIZE
+        self.max_wait = (Config.SHADOW_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000.0
+
+        self._cond = threading.Condition()
+        self._pending = deque()
+        self._worker = None
+        self._pid = None
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._stats_lock:
+            self.samples = 0
+            self.agree = 0
+            self.confusion = np.zeros((2, 2), dtype=np.int64)  # [aktif, kandidat]
+            self.delta_sum = 0.0
+            self.abs_sum = 0.0
+            self.sq_sum = 0.0
+            self.max_abs = 0.0
+            self.delta_hist = np.zeros(len(DELTA_BINS_PP) + 1, dtype=np.int64)
+            self.dropped = 0
+            self.errors = 0
+            self.last_error = None
+            self.batch_ms = 0.0
+
+    # --- 1. ANTRIAN (DIPANGGIL DARI THREAD REQUEST) ---
+    def submit(self, record: Dict[str, Any], active_probability: float) -> bool:
+        """Salin record ke antrian. Return False jika dibuang karena antrian penuh."""
+        with self._cond:
+            if self._closed:
+                return False
+            self._ensure_worker()
+            if len(self._pending) >= self.queue_size:
+                self.dropped += 1
+                return False
+            self._pending.append((dict(record), float(active_probability)))
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify()
+        return True
+
+    def _ensure_worker(self):
+        # Thread tidak ikut ter-copy saat fork (gunicorn) -> start ulang per proses
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._pending = deque()
+            self._worker = None
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='shadow-scorer', daemon=True)
+            self._worker.start()
+
+    # --- 2. THREAD LATAR ---
+    def _collect(self):
+        """
+        Tunggu sampai batch penuh atau jendela habis: satu predict_proba untuk banyak sampel
+        -> waktu CPU (dan GIL) yang direbut dari thread request jauh lebih kecil.
+        """
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            deadline = time.monotonic() + self.max_wait
+            while len(self._pending) < self.batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            if self._closed:
+                return None
+            batch = []
+            while self._pending and len(batch) < self.batch_size:
+                batch.append(self._pending.popleft())
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            started = time.perf_counter()
+            try:
+                X = self.preprocessor.transform([record for record, _ in batch])
+                candidate = self.inference.predict_proba(X)[:, 1]
+            except Exception as e:
+                with self._stats_lock:
+                    self.errors += len(batch)
+                    self.last_error = str(e)
+                continue
+            self._record(np.array([p for _, p in batch]), candidate, time.perf_counter() - started)
+
+    def _record(self, active: np.ndarray, candidate: np.ndarray, elapsed: float):
+        delta = (candidate - active) * 100  # poin persen
+        abs_delta = np.abs(delta)
+        a_cls, c_cls = (active > THRESHOLD).astype(int), (candidate > THRESHOLD).astype(int)
+        with self._stats_lock:
+            self.samples += len(delta)
+            self.agree += int((a_cls == c_cls).sum())
+            np.add.at(self.confusion, (a_cls, c_cls), 1)
+            self.delta_sum += float(delta.sum())
+            self.abs_sum += float(abs_delta.sum())
+            self.sq_sum += float((delta ** 2).sum())
+            self.max_abs = max(self.max_abs, float(abs_delta.max()))
+            self.delta_hist += np.bincount(np.searchsorted(DELTA_BINS_PP, abs_delta, side='right'),
+                                           minlength=len(DELTA_BINS_PP) + 1)
+            self.batch_ms = round(elapsed * 1000, 3)
+
+    # --- 3. LAPORAN ---
+    def report(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            n = self.samples
+            labels = [f"<{DELTA_BINS_PP[0]}"] + [
+                f"{lo}-{hi}" for lo, hi in zip(DELTA_BINS_PP[:-1], DELTA_BINS_PP[1:])
+            ] + [f">={DELTA_BINS_PP[-1]}"]
+            return {
+                'candidate_version': self.version,
+                'active_version': self.active_version,
+                'samples': n,
+                'agreement_rate': round(self.agree / n, 4) if n else None,
+                'confusion': {
+                    'both_non_diabetic': int(self.confusion[0, 0]),
+                    'active_non_candidate_diabetic': int(self.confusion[0, 1]),
+                    'active_diabetic_candidate_non': int(self.confusion[1, 0]),
+                    'both_diabetic': int(self.confusion[1, 1]),
+                },
+                'delta_pp': {
+                    'mean': round(self.delta_sum / n, 3) if n else None,
+                    'mean_abs': round(self.abs_sum / n, 3) if n else None,
+                    'rmse': round(float(np.sqrt(self.sq_sum / n)), 3) if n else None,
+                    'max_abs': round(self.max_abs, 3),
+                    'histogram_abs': dict(zip(labels, (int(c) for c in self.delta_hist))),
+                },
+                'pending': len(self._pending),
+                'dropped': self.dropped,
+                'errors': self.errors,
+                'last_error': self.last_error,
+                'last_batch_ms': self.batch_ms,
+            }
+
+    def summary(self) -> Dict[str, Any]:
+        """Ringkasan kecil untuk /api/metrics."""
+        report = self.report()
+        return {k: report[k] for k in ('candidate_version', 'samples', 'agreement_rate', 'dropped')}
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
@@ -0,0 +1,285 @@
+"""
+Backend/models/stats.py
+Statistik prediksi yang diperbarui bertahap (tanpa membaca ulang seluruh prediction_logs.csv):
+1. Agregat per bucket waktu (jam & hari): jumlah, total probabilitas, per label, per tingkat risiko
+2. Diperbarui saat dibaca: hanya byte baru log kanonik sejak offset terakhir yang dibaca & diparse
+   (log kanonik diisi penggabung segmen latar, lihat models/prediction_log.py)
+3. Baris segmen yang belum digabung ikut dihitung sebagai overlay sementara (dibaca per offset
+   segmen; dibuang begitu offset gabung melewatinya) -> request tidak pernah menunggu penggabung.
+   Prediksi worker ini masuk overlay saat ditulis (record); worker lain terbaca dari segmennya
+4. Disimpan ke JSON (bersama offset log, tanpa overlay) -> bertahan setelah restart, lalu menyusul sisa log
+5. Query rentang tanggal: O(jumlah bucket di rentang) via kunci terurut + bisect
+
+Log adalah sumber kebenaran: jika file log menyusut (dihapus/diganti), agregat dibangun ulang.
+"""
+
+import os
+import io
+import csv
+import json
+import time
+import atexit
+import bisect
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from Backend.config import Config
+from Backend.models import prediction_log
+from Backend.models.scoring import get_risk_level
+
+# Panjang prefix timestamp log ('YYYY-MM-DD HH:MM:SS') untuk tiap ukuran bucket
+BUCKET_KEY_LEN = {'hour': 13, 'day': 10}
+# Format batas rentang yang diterima /api/stats (dikenali dari panjang string)
+BOUND_FORMATS = {10: '%Y-%m-%d', 13: '%Y-%m-%d %H', 16: '%Y-%m-%d %H:%M', 19: '%Y-%m-%d %H:%M:%S'}
+STATS_FORMAT_VERSION = 1
+
+
+def _new_bucket() -> Dict[str, Any]:
+    return {'count': 0, 'probability_sum': 0.0, 'labels': {}, 'risks': {}}
+
+
+def _count(bucket: Dict[str, Any], label: str, probability: float, risk: str):
+    bucket['count'] += 1
+    bucket['probability_sum'] += probability
+    bucket['labels'][label] = bucket['labels'].get(label, 0) + 1
+    bucket['risks'][risk] = bucket['risks'].get(risk, 0) + 1
+
+
+def _merge(target: Dict[str, Any], bucket: Dict[str, Any]):
+    target['count'] += bucket['count']
+    target['probability_sum'] += bucket['probability_sum']
+    for field in ('labels', 'risks'):
+        for key, n in bucket[field].items():
+            target[field][key] = target[field].get(key, 0) + n
+    return target
+
+
+def _public(bucket: Dict[str, Any]) -> Dict[str, Any]:
+    count = bucket['count']
+    return {
+        'count': count,
+        'avg_probability': round(bucket['probability_sum'] / count, 2) if count else None,
+        'by_label': dict(bucket['labels']),
+        'by_risk': dict(bucket['risks']),
+    }
+
+
+class PredictionStats:
+    """
+    Agregat log prediksi per bucket jam & hari, dengan offset byte log yang sudah diproses.
+    merger: sumber baris segmen yang belum digabung (default: penggabung bersama jika log_path default;
+    log_path lain tanpa merger -> hanya file log yang di-tail).
+    """
+
+    def __init__(self, log_path: str = None, state_path: str = None, flush_seconds: float = None,
+                 merger: prediction_log.SegmentMerger = None):
+        self.merger = merger if merger is not None or log_path else prediction_log.get_merger()
+        self.log_path = log_path or Config.PREDICTION_LOG
+        self.state_path = state_path or Config.STATS_PATH
+        self.flush_seconds = Config.STATS_FLUSH_SECONDS if flush_seconds is None else flush_seconds
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+        self._dirty = False
+        self._reset()
+        self._load_state()
+
+    def _reset(self):
+        self.offset = 0
+        self.buckets = {name: {} for name in BUCKET_KEY_LEN}
+        self.keys = {name: [] for name in BUCKET_KEY_LEN}  # kunci terurut untuk bisect
+        self.pending = {}  # Overlay baris segmen belum digabung: {id baris: (timestamp, label, probabilitas)}
+        self._segment_offsets = {}
+        self._merged = {}  # Offset gabung per segmen pada refresh terakhir
+
+    # --- 1. PERSISTENSI ---
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if state.get('version') != STATS_FORMAT_VERSION:
+            return
+        self.offset = int(state.get('log_offset', 0))
+        for name in BUCKET_KEY_LEN:
+            self.buckets[name] = state.get(name, {})
+            self.keys[name] = sorted(self.buckets[name])
+
+    def save(self):
+        """Tulis state secara atomik (tmp + rename) agar tidak pernah setengah jadi."""
+        with self._lock:
+            state = {'version': STATS_FORMAT_VERSION, 'log_offset': self.offset, **self.buckets}
+            self._dirty = False
+            self._last_flush = time.monotonic()
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+    def _maybe_flush(self):
+        if self._dirty and time.monotonic() - self._last_flush >= self.flush_seconds:
+            try:
+                self.save()
+            except OSError as e:
+                print(f"⚠️ Gagal menyimpan statistik prediksi: {e}")
+
+    # --- 2. UPDATE DARI LOG ---
+    def _add(self, timestamp: str, label: str, probability: float):
+        risk = get_risk_level(probability / 100.0)
+        for name, key_len in BUCKET_KEY_LEN.items():
+            key = timestamp[:key_len]
+            bucket = self.buckets[name].get(key)
+            if bucket is None:
+                bucket = self.buckets[name][key] = _new_bucket()
+                bisect.insort(self.keys[name], key)
+            _count(bucket, label, probability, risk)
+
+    @staticmethod
+    def _parse_pending(row: Dict[str, str]):
+        try:
+            return row['timestamp'], row['prediction'], float(str(row['probability']).rstrip('%'))
+        except (KeyError, ValueError):
+            return None
+
+    def _refresh_pending(self, merged: Dict[str, int], rows, offsets: Dict[str, int]) -> int:
+        """Buang baris overlay yang sudah masuk log kanonik (atau segmennya sudah dihapus), tambah baris baru."""
+        def still_pending(row_id: str) -> bool:
+            name, offset = row_id.rsplit(':', 1)
+            return name in offsets and int(offset) >= merged.get(name, 0)
+
+        before = len(self.pending)
+        self.pending = {row_id: v for row_id, v in self.pending.items() if still_pending(row_id)}
+        changed = before - len(self.pending)
+        for row_id, row in rows:
+            parsed = self._parse_pending(row)
+            if parsed is not None and row_id not in self.pending:
+                self.pending[row_id] = parsed
+                changed += 1
+        self._segment_offsets, self._merged = offsets, merged
+        return changed
+
+    def record(self, row_id: str, row: Dict[str, object]):
+        """Baris yang baru ditulis proses ini (id '<segmen>:<offset>') langsung masuk overlay."""
+        if self.merger is None:
+            return
+        parsed = self._parse_pending(row)
+        name, offset = row_id.rsplit(':', 1)
+        with self._lock:
+            # Sudah digabung (pencatatan terlambat) -> sudah/akan terhitung dari log kanonik
+            if parsed is not None and int(offset) >= self._merged.get(name, 0):
+                self.pending[row_id] = parsed
+
+    def refresh(self) -> int:
+        """Proses baris log baru sejak offset terakhir. Return: jumlah baris yang ditambahkan."""
+        added = 0
+        with self._lock:
+            if self.merger is not None:
+                # Ukuran log & baris segmen dari snapshot yang sama -> tidak ada baris ganda/hilang saat gabung
+                size, merged, rows, offsets = self.merger.read_unmerged(self._segment_offsets)
+            else:
+                try:
+                    size = os.path.getsize(self.log_path)
+                except OSError:
+                    size = 0
+            if size < self.offset:
+                # Log dihapus/diganti -> agregat lama tidak lagi valid
+                self._reset()
+            if size > self.offset:
+                with open(self.log_path, 'rb') as f:
+                    f.seek(self.offset)
+                    data = f.read(size - self.offset)
+                # Hanya baris lengkap (baris terakhir mungkin sedang ditulis proses lain)
+                end = data.rfind(b'\n') + 1
+                for row in csv.reader(io.StringIO(data[:end].decode('utf-8', errors='replace'))):
+                    if len(row) < 3 or row[0] == 'timestamp':
+                        continue
+                    try:
+                        probability = float(row[2].rstrip('%'))
+                    except ValueError:
+                        continue
+                    self._add(row[0], row[1], probability)
+                    added += 1
+                self.offset += end
+            if added:
+                self._dirty = True
+            if self.merger is not None:
+                added += self._refresh_pending(merged, rows, offsets)
+        self._maybe_flush()
+        return added
+
+    def rebuild(self) -> int:
+        """Bangun ulang seluruh agregat dari log + segmen yang belum digabung (on demand)."""
+        with self._lock:
+            self._reset()
+            self._dirty = True
+        added = self.refresh()
+        self.save()
+        return added
+
+    # --- 3. QUERY ---
+    @staticmethod
+    def _bound(value: Optional[str], bucket: str, upper: bool) -> Optional[str]:
+        """'YYYY-MM-DD' atau 'YYYY-MM-DD HH[:MM[:SS]]' -> kunci bucket (raise ValueError jika salah)."""
+        if not value:
+            return None
+        value = value.strip().replace('T', ' ')
+        if len(value) not in BOUND_FORMATS:
+            raise ValueError(f"Format tanggal tidak dikenali: {value}")
+        datetime.strptime(value, BOUND_FORMATS[len(value)])
+        if bucket == 'hour' and len(value) == 10:
+            value += ' 23' if upper else ' 00'
+        return value[:BUCKET_KEY_LEN[bucket]]
+
+    def version(self) -> tuple:
+        """Penanda isi agregat (untuk ETag): offset log kanonik + id baris overlay."""
+        with self._lock:
+            return (self.offset,) + tuple(sorted(self.pending))
+
+    def _overlay(self, bucket: str, low: Optional[str], high: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """Agregat baris overlay per kunci bucket dalam rentang (overlay kecil: baris beberapa detik terakhir)."""
+        key_len, out = BUCKET_KEY_LEN[bucket], {}
+        for timestamp, label, probability in self.pending.values():
+            key = timestamp[:key_len]
+            if (low and key < low) or (high and key > high):
+                continue
+            _count(out.setdefault(key, _new_bucket()), label, probability, get_risk_level(probability / 100.0))
+        return out
+
+    def query(self, start: str = None, end: str = None, bucket: str = 'day') -> Dict[str, Any]:
+        """Agregat per bucket dalam rentang [start, end] (inklusif) + total rentang."""
+        if bucket not in BUCKET_KEY_LEN:
+            raise ValueError("bucket harus 'hour' atau 'day'")
+        low = self._bound(start, bucket, upper=False)
+        high = self._bound(end, bucket, upper=True)
+
+        with self._lock:
+            keys = self.keys[bucket]
+            i = bisect.bisect_left(keys, low) if low else 0
+            j = bisect.bisect_right(keys, high) if high else len(keys)
+            overlay = self._overlay(bucket, low, high)
+            series, total = [], _new_bucket()
+            for key in sorted(set(keys[i:j]).union(overlay)) if overlay else keys[i:j]:
+                data = self.buckets[bucket].get(key)
+                if key in overlay:
+                    data = _merge(_merge(_new_bucket(), data), overlay[key]) if data else overlay[key]
+                _merge(total, data)
+                series.append({'bucket': key, **_public(data)})
+        return {'bucket': bucket, 'from': low, 'to': high, 'total': _public(total), 'series': series}
+
+
+# Instance bersama per proses (dibuat saat pertama dipakai)
+_default_stats = None
+_default_lock = threading.Lock()
+
+
+def get_stats() -> PredictionStats:
+    global _default_stats
+    if _default_stats is None:
+        with _default_lock:
+            if _default_stats is None:
+                _default_stats = PredictionStats()
+                # Sisa update yang belum di-flush disimpan saat proses berhenti
+                atexit.register(lambda: _default_stats._dirty and _default_stats.save())
+    return _default_stats
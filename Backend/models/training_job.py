@@ -0,0 +1,286 @@
+"""
+Backend/models/training_job.py
+Job training latar yang dipicu admin (/api/admin/train), tanpa masuk ke container:
+1. start_job() menjalankan train_model() (Scripts/train_model.py) di PROSES terpisah
+   (session baru -> tetap jalan walau worker gunicorn yang memicunya di-recycle)
+2. Proses job membatasi dirinya sendiri: nice, afinitas & jumlah thread CPU, limit memori
+   (RLIMIT_AS) dan waktu CPU (RLIMIT_CPU) -> latensi serving tidak ikut terganggu
+3. Progres (tahap, fold, skor per fold, waktu) ditulis atomik ke file status JSON
+   yang dibaca endpoint status oleh worker mana pun
+4. Hasil training = versi baru di registry; jika --activate, pointer ACTIVE dipindah dan
+   worker API memuat ulang model sendiri (lihat reload_if_changed di routes/api_routes.py)
+
+Hanya satu job dalam satu waktu (file lock, berlaku lintas worker).
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import subprocess
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+    import resource
+except ImportError:  # Windows: limit & lock antar proses tidak tersedia
+    fcntl = None
+    resource = None
+
+from Backend.config import Config
+
+ACTIVE_STATES = ('queued', 'running')
+AUTOGROUP_PATH = '/proc/self/autogroup'
+
+
+class JobBusyError(RuntimeError):
+    """Masih ada job training yang berjalan."""
+
+
+# --- 1. FILE STATUS ---
+def _lock_path(status_path: str) -> str:
+    return status_path + '.lock'
+
+
+def read_status(status_path: str = None) -> Optional[Dict[str, Any]]:
+    try:
+        with open(status_path or Config.TRAINING_STATUS_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_status(status: Dict[str, Any], status_path: str):
+    os.makedirs(os.path.dirname(status_path), exist_ok=True)
+    tmp = f"{status_path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(status, f, indent=2)
+    os.replace(tmp, status_path)
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _lock_held(status_path: str) -> bool:
+    """True jika proses job sedang memegang lock (dicek tanpa menunggu)."""
+    if fcntl is None:
+        return False
+    with open(_lock_path(status_path), 'a') as fd:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return True
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    return False
+
+
+def job_status(status_path: str = None) -> Optional[Dict[str, Any]]:
+    """Status job terakhir + waktu berjalan. Job 'running' yang prosesnya hilang -> 'failed'."""
+    status_path = status_path or Config.TRAINING_STATUS_PATH
+    status = read_status(status_path)
+    if status is None:
+        return None
+    if status['state'] in ACTIVE_STATES:
+        if not _pid_alive(status.get('pid')):
+            status.update(state='failed', error=status.get('error') or
+                          'Proses training berhenti tanpa status akhir (kena limit CPU/memori?)')
+        else:
+            status['elapsed_seconds'] = round(time.time() - status['started_at'], 1)
+            status['stage_elapsed_seconds'] = round(time.time() - status['stage_started_at'], 1)
+    return status
+
+
+def _new_status(job_id: str, state: str, pid: int, options: Dict[str, Any]) -> Dict[str, Any]:
+    now = time.time()
+    return {
+        'job_id': job_id, 'state': state, 'pid': pid, 'options': options,
+        'limits': current_limits(), 'stage': state, 'stages': [],
+        'fold': None, 'n_folds': None, 'fold_scores': [],
+        'started_at': now, 'stage_started_at': now,
+        'started': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'finished': None, 'elapsed_seconds': 0.0, 'version': None, 'error': None,
+    }
+
+
+# --- 2. PROSES JOB (DIJALANKAN DI PROSES TERPISAH) ---
+class ProgressWriter:
+    """Callback progress(stage, **info) untuk train_model() -> file status JSON."""
+
+    def __init__(self, job_id: str, status_path: str, options: Dict[str, Any]):
+        self.status_path = status_path
+        self.status = _new_status(job_id, 'running', os.getpid(), options)
+        _write_status(self.status, status_path)
+
+    def __call__(self, stage: str, **info):
+        now = time.time()
+        status = self.status
+        if stage == 'error':
+            status['error'] = info.get('error')
+        else:
+            if stage != status['stage']:
+                # Durasi tahap sebelumnya disimpan (riwayat tahap untuk UI/debug)
+                status['stages'].append({'stage': status['stage'],
+                                         'seconds': round(now - status['stage_started_at'], 2)})
+                status['stage'] = stage
+                status['stage_started_at'] = now
+            for key in ('fold', 'n_folds', 'fold_scores'):
+                if key in info:
+                    status[key] = info[key]
+        status['elapsed_seconds'] = round(now - status['started_at'], 1)
+        _write_status(status, self.status_path)
+
+    def finish(self, version):
+        now = time.time()
+        status = self.status
+        status['stages'].append({'stage': status['stage'],
+                                 'seconds': round(now - status['stage_started_at'], 2)})
+        status.update(state='succeeded' if version else 'failed', version=version or None,
+                      stage='done', finished=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                      elapsed_seconds=round(now - status['started_at'], 1))
+        if not version and not status['error']:
+            status['error'] = 'Training gagal (lihat log job).'
+        _write_status(status, self.status_path)
+
+
+def current_limits() -> Dict[str, Any]:
+    return {
+        'nice': Config.TRAINING_NICE,
+        'cpu_cores': Config.TRAINING_CPU_CORES or None,
+        'memory_mb': Config.TRAINING_MEMORY_MB or None,
+        'cpu_seconds': Config.TRAINING_CPU_SECONDS or None,
+    }
+
+
+def apply_limits():
+    """Batasi proses saat ini (dipanggil di awal proses job, sebelum data dimuat)."""
+    if Config.TRAINING_NICE:
+        try:
+            os.nice(Config.TRAINING_NICE)
+            # Linux autogroup: proses di session baru punya grup scheduler sendiri dan nice
+            # di atas hanya berlaku DI DALAM grup -> nice grup juga diturunkan
+            if os.path.exists(AUTOGROUP_PATH):
+                with open(AUTOGROUP_PATH, 'w') as f:
+                    f.write(str(Config.TRAINING_NICE))
+        except OSError as e:
+            print(f"⚠️ Gagal menurunkan prioritas: {e}")
+    if Config.TRAINING_CPU_CORES and hasattr(os, 'sched_setaffinity'):
+        cores = sorted(os.sched_getaffinity(0))
+        # Core terakhir dipakai training, core awal dibiarkan untuk worker API
+        os.sched_setaffinity(0, cores[-Config.TRAINING_CPU_CORES:])
+    if resource is not None:
+        if Config.TRAINING_MEMORY_MB:
+            limit = Config.TRAINING_MEMORY_MB * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        if Config.TRAINING_CPU_SECONDS:
+            resource.setrlimit(resource.RLIMIT_CPU, (Config.TRAINING_CPU_SECONDS, Config.TRAINING_CPU_SECONDS))
+
+
+def run_job(job_id: str, activate: bool = False, shadow: bool = False, backend: str = None,
+            status_path: str = None, train: Callable = None) -> Optional[str]:
+    """Isi proses job: kunci, jalankan train_model() dengan callback progres. Return: versi baru."""
+    status_path = status_path or Config.TRAINING_STATUS_PATH
+    lock = open(_lock_path(status_path), 'a')
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            print("⚠️ Job training lain sedang berjalan, job ini dibatalkan.")
+            lock.close()
+            return None
+    try:
+        if train is None:
+            from Scripts.train_model import train_model as train
+        writer = ProgressWriter(job_id, status_path, {'activate': activate, 'shadow': shadow, 'backend': backend})
+        try:
+            version = train(activate=activate, shadow=shadow, progress=writer, backend=backend)
+        except BaseException as e:  # MemoryError (RLIMIT_AS), KeyboardInterrupt, dll.
+            writer('error', error=f"{type(e).__name__}: {e}")
+            version = None
+        writer.finish(version)
+        return version or None
+    finally:
+        lock.close()
+
+
+# --- 3. MEMULAI JOB (DARI WORKER API) ---
+def _reap(proc: subprocess.Popen, job_id: str, status_path: str):
+    """Tunggu proses job (hindari zombie); catat kegagalan jika proses mati tanpa status akhir."""
+    code = proc.wait()
+    status = read_status(status_path)
+    if status and status.get('job_id') == job_id and status['state'] in ACTIVE_STATES:
+        status.update(state='failed', error=f"Proses training keluar dengan kode {code}",
+                      finished=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        _write_status(status, status_path)
+
+
+def start_job(activate: bool = False, shadow: bool = False, backend: str = None,
+              status_path: str = None) -> Dict[str, Any]:
+    """Jalankan job training di proses terpisah. Raise JobBusyError jika masih ada job aktif."""
+    status_path = status_path or Config.TRAINING_STATUS_PATH
+    current = job_status(status_path)
+    if current and current['state'] in ACTIVE_STATES:
+        raise JobBusyError(f"Job training {current['job_id']} masih berjalan.")
+    if _lock_held(status_path):
+        raise JobBusyError("Job training lain masih berjalan.")
+
+    job_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+    options = {'activate': activate, 'shadow': shadow, 'backend': backend}
+    command = [sys.executable, '-m', 'Backend.models.training_job', '--job-id', job_id,
+               '--status', status_path]
+    if activate:
+        command.append('--activate')
+    if shadow:
+        command.append('--shadow')
+    if backend:
+        command += ['--backend', backend]
+
+    env = dict(os.environ, PYTHONPATH=Config.ROOT_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    if Config.TRAINING_CPU_CORES:
+        # Harus di-set sebelum NumPy/BLAS di-import di proses job
+        for name in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+            env[name] = str(Config.TRAINING_CPU_CORES)
+
+    # Status 'queued' ditulis SEBELUM spawn (pid = worker pemicu) -> worker lain langsung
+    # melihat job aktif; proses job menimpanya dengan pid & progres sendiri
+    status = _new_status(job_id, 'queued', os.getpid(), options)
+    _write_status(status, status_path)
+
+    os.makedirs(os.path.dirname(Config.TRAINING_LOG_PATH), exist_ok=True)
+    try:
+        with open(Config.TRAINING_LOG_PATH, 'ab') as log:
+            proc = subprocess.Popen(command, cwd=Config.ROOT_DIR, env=env, stdout=log,
+                                    stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                                    start_new_session=True)
+    except OSError as e:
+        status.update(state='failed', error=f"Gagal menjalankan proses training: {e}")
+        _write_status(status, status_path)
+        raise
+
+    threading.Thread(target=_reap, args=(proc, job_id, status_path), daemon=True).start()
+    return status
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Proses job training latar (dipanggil oleh start_job)")
+    parser.add_argument('--job-id', required=True)
+    parser.add_argument('--status', default=Config.TRAINING_STATUS_PATH)
+    parser.add_argument('--activate', action='store_true')
+    parser.add_argument('--shadow', action='store_true')
+    parser.add_argument('--backend', default=None)
+    args = parser.parse_args()
+
+    apply_limits()
+    print(f"🧵 Job training {args.job_id} (pid {os.getpid()}), limit: {current_limits()}")
+    sys.exit(0 if run_job(args.job_id, args.activate, args.shadow, args.backend, args.status) else 1)
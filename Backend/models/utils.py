@@ -2,17 +2,20 @@
 Backend/models/utils.py
 Berisi fungsi bantuan untuk:
 1. Validasi Input API
-2. Logging ke CSV (Audit Trail)
+2. Logging ke CSV (Audit Trail) lewat segmen per worker (lihat models/prediction_log.py)
 3. Generate Laporan PDF (Resep/Hasil)
 """
 
 import os
-import csv
 import datetime
 from typing import Dict, Any, List
 
 # Import Config untuk Path dan Definisi Fitur
 from Backend.config import Config
+from Backend.models.schema import EMPTY, get_schema
+from Backend.models import prediction_log
+from Backend.models.feed import get_feed
+from Backend.models.stats import get_stats
 
 # Coba import FPDF, jika belum install beri peringatan tapi jangan crash
 try:
@@ -26,44 +29,40 @@ except ImportError:
 # --- 1. FUNGSI VALIDASI ---
 def validate_input_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Memastikan data input memiliki semua fitur yang dibutuhkan model.
-    Menggunakan Config.FEATURES sebagai acuan.
+    Memastikan data input lengkap dan masuk akal secara klinis.
+    Aturan per fitur (tipe, satuan, rentang) diambil dari Config.FEATURE_SCHEMA
+    lewat validator terkompilasi di Backend/models/schema.py.
+    Return: is_valid, errors (ringkasan teks), field_errors ({field: pesan}).
     """
-    missing = []
-    empty = []
-    
-    for feature in Config.FEATURES:
-        if feature not in data:
-            missing.append(feature)
-        else:
-            val = data[feature]
-            if val is None or (isinstance(val, str) and str(val).strip() == ""):
-                empty.append(feature)
+    schema = get_schema()
+    codes = schema.validate(data)
+
+    missing = [f for f, c in codes.items() if c == EMPTY and f not in data]
+    empty = [f for f, c in codes.items() if c == EMPTY and f in data]
 
     errors = []
     if missing:
         errors.append(f"Data hilang: {', '.join(missing)}")
     if empty:
         errors.append(f"Data kosong: {', '.join(empty)}")
+    errors.extend(schema.message(f, c) for f, c in codes.items() if c != EMPTY)
 
     return {
         "is_valid": len(errors) == 0,
-        "errors": errors
+        "errors": errors,
+        "field_errors": {f: (f"{f} hilang" if f in missing else schema.message(f, c)) for f, c in codes.items()}
     }
 
 # --- 2. FUNGSI LOGGING CSV ---
 def log_prediction(input_data: Dict[str, Any], prediction: str, probability: float) -> None:
     """
     Menyimpan riwayat prediksi ke CSV untuk audit.
+    Baris ditulis ke segmen milik worker ini (tanpa lock antar proses), lalu digabung ke
+    Config.PREDICTION_LOG oleh penggabung latar / saat dibaca (prediction_log.read_log).
+    Baris juga langsung masuk feed live (models/feed.py) untuk /api/logs & /api/logs/stream
+    dan agregat /api/stats worker ini (models/stats.py); worker lain menyusul dari segmen.
     """
     try:
-        # Pastikan folder logs ada (menggunakan Config)
-        os.makedirs(Config.LOGS_DIR, exist_ok=True)
-        log_path = Config.PREDICTION_LOG
-        
-        # Cek apakah file sudah ada (untuk menentukan perlu tulis header atau tidak)
-        file_exists = os.path.exists(log_path)
-
         # Siapkan data baris
         row_data = {
             'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -74,17 +73,11 @@ def log_prediction(input_data: Dict[str, Any], prediction: str, probability: flo
         for feature in Config.FEATURES:
             row_data[feature] = input_data.get(feature, "")
 
-        # Tentukan urutan kolom (Header)
-        fieldnames = ['timestamp', 'prediction', 'probability'] + Config.FEATURES
+        feed = get_feed()  # Sebelum append: feed baru tidak ikut memuat baris ini dari disk
+        row_id = prediction_log.append(row_data)
+        feed.publish(row_id, row_data)
+        get_stats().record(row_id, row_data)
 
-        with open(log_path, mode='a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            
-            if not file_exists:
-                writer.writeheader() # Tulis header jika file baru
-            
-            writer.writerow(row_data)
-            
     except Exception as e:
         print(f"⚠️ Gagal menulis log prediksi: {e}")
 
@@ -0,0 +1,203 @@
+"""
+Backend/routes/admission.py
+Admission control & load shedding per kelas endpoint:
+1. Setiap kelas (predict / report / screening / stream) punya batas request berjalan bersamaan
+   dan antrian tunggu terbatas (jumlah & lama tunggu maksimum)
+2. Antrian penuh / tunggu habis -> 503 + Retry-After segera (bukan menunggu sampai klien timeout)
+3. Prioritas: kelas berprioritas rendah (PDF, skrining) tidak masuk selama masih ada
+   prediksi yang menunggu slot
+4. Jumlah diterima/ditolak & waktu tunggu (p50/p99) per kelas untuk /api/metrics
+
+Micro-batching (MICRO_BATCH_ENABLED=1): batch hanya sebesar jumlah prediksi yang berjalan
+bersamaan, jadi batas kelas predict dinaikkan minimal ke MICRO_BATCH_MAX_SIZE
+(lihat predict_concurrency()); model tetap dieksekusi satu batch per waktu oleh batcher.
+
+Batas berlaku per worker. Thread gthread yang ditolak langsung bebas, jadi GUNICORN_THREADS
+sebaiknya >= kapasitas admission (lihat capacity()) agar antrian terjadi di sini, bukan di gunicorn.
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+from flask import Flask, g, jsonify, request
+
+from Backend.config import Config
+
+# Endpoint Flask -> kelas admission (endpoint lain tidak dibatasi)
+ENDPOINT_CLASSES = {
+    'api.predict': 'predict',
+    'api.download_report': 'report',
+    'api.screening': 'screening',
+    'api.stream_logs': 'stream',
+}
+
+
+class _Gate:
+    """Status satu kelas endpoint (dijaga oleh lock milik AdmissionController)."""
+
+    def __init__(self, name: str, limit: int, max_queue: int, max_wait_ms: float, priority: int,
+                 metrics_window: int):
+        self.name = name
+        self.limit = max(1, limit)
+        self.max_queue = max(0, max_queue)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.priority = priority
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = {'queue_full': 0, 'timeout': 0}
+        self.wait_ms = deque(maxlen=metrics_window)
+
+
+def _percentile(samples, q: float) -> float:
+    samples = list(samples)
+    if not samples:
+        return 0.0
+    return round(float(np.percentile(samples, q)), 3)
+
+
+class AdmissionController:
+    """Semaphore berprioritas untuk beberapa kelas endpoint (satu Condition bersama)."""
+
+    def __init__(self, metrics_window: int = 1000):
+        self._cond = threading.Condition()
+        self._gates: Dict[str, _Gate] = {}
+        self._metrics_window = metrics_window
+
+    def add_class(self, name: str, limit: int, max_queue: int = 0, max_wait_ms: float = 0.0,
+                  priority: int = 0):
+        """Kelas baru; priority lebih besar = didahulukan."""
+        self._gates[name] = _Gate(name, limit, max_queue, max_wait_ms, priority, self._metrics_window)
+        return self
+
+    def _can_enter(self, gate: _Gate) -> bool:
+        if gate.active >= gate.limit:
+            return False
+        # Kelas lebih penting yang sedang menunggu selalu didahulukan
+        return not any(other.waiting for other in self._gates.values() if other.priority > gate.priority)
+
+    def acquire(self, name: str) -> Optional[str]:
+        """Masuk ke kelas `name`. Return: None jika diterima, selain itu alasan penolakan."""
+        gate = self._gates[name]
+        start = time.perf_counter()
+        with self._cond:
+            if not self._can_enter(gate):
+                if gate.waiting >= gate.max_queue or gate.max_wait <= 0:
+                    gate.rejected['queue_full'] += 1
+                    return 'queue_full'
+                gate.waiting += 1
+                deadline = start + gate.max_wait
+                try:
+                    while not self._can_enter(gate):
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0:
+                            gate.rejected['timeout'] += 1
+                            return 'timeout'
+                        self._cond.wait(remaining)
+                finally:
+                    gate.waiting -= 1
+                    # Kelas prioritas rendah mungkin tertahan oleh antrian ini
+                    self._cond.notify_all()
+            gate.active += 1
+            gate.admitted += 1
+            gate.wait_ms.append((time.perf_counter() - start) * 1000)
+        return None
+
+    def release(self, name: str):
+        with self._cond:
+            self._gates[name].active -= 1
+            self._cond.notify_all()
+
+    def capacity(self) -> int:
+        """Jumlah request yang bisa berada di dalam worker (berjalan + menunggu) tanpa ditolak."""
+        return sum(g.limit + g.max_queue for g in self._gates.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            gates = [(g, g.active, g.waiting, g.admitted, dict(g.rejected), list(g.wait_ms))
+                     for g in self._gates.values()]
+        out = {}
+        for gate, active, waiting, admitted, rejected, waits in gates:
+            total = admitted + sum(rejected.values())
+            out[gate.name] = {
+                'limit': gate.limit,
+                'max_queue': gate.max_queue,
+                'max_wait_ms': gate.max_wait * 1000,
+                'priority': gate.priority,
+                'active': active,
+                'waiting': waiting,
+                'admitted': admitted,
+                'rejected': rejected,
+                'rejection_rate': round(sum(rejected.values()) / total, 4) if total else None,
+                'wait_ms_p50': _percentile(waits, 50),
+                'wait_ms_p99': _percentile(waits, 99),
+            }
+        return out
+
+
+# --- CONTROLLER DEFAULT (PER PROSES, DARI CONFIG) ---
+_default_controller = None
+_default_lock = threading.Lock()
+
+
+def predict_concurrency() -> int:
+    """Batas prediksi bersamaan: tidak boleh lebih kecil dari ukuran batch jika micro-batching aktif."""
+    if Config.MICRO_BATCH_ENABLED:
+        return max(Config.ADMISSION_PREDICT_CONCURRENCY, Config.MICRO_BATCH_MAX_SIZE)
+    return Config.ADMISSION_PREDICT_CONCURRENCY
+
+
+def build_controller() -> AdmissionController:
+    return (AdmissionController(Config.MICRO_BATCH_METRICS_WINDOW)
+            .add_class('predict', predict_concurrency(), Config.ADMISSION_PREDICT_QUEUE,
+                       Config.ADMISSION_PREDICT_WAIT_MS, priority=1)
+            .add_class('report', Config.ADMISSION_REPORT_CONCURRENCY, Config.ADMISSION_REPORT_QUEUE,
+                       Config.ADMISSION_REPORT_WAIT_MS)
+            .add_class('screening', Config.ADMISSION_SCREENING_CONCURRENCY)
+            .add_class('stream', Config.ADMISSION_STREAM_CONCURRENCY))
+
+
+def get_controller() -> AdmissionController:
+    global _default_controller
+    if _default_controller is None:
+        with _default_lock:
+            if _default_controller is None:
+                _default_controller = build_controller()
+    return _default_controller
+
+
+def init_admission(app: Flask):
+    """Mendaftarkan admission control (before_request) & pelepasan slot (teardown_request)."""
+    if not Config.ADMISSION_ENABLED:
+        return app
+
+    @app.before_request
+    def _admit():
+        name = ENDPOINT_CLASSES.get(request.endpoint)
+        if name is None:
+            return None
+        reason = get_controller().acquire(name)
+        if reason is None:
+            g._admission = name
+            return None
+        response = jsonify({
+            'success': False,
+            'error': 'Server sedang sibuk, silakan coba lagi sebentar.',
+            'reason': reason,
+            'retry_after': Config.ADMISSION_RETRY_AFTER,
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = str(Config.ADMISSION_RETRY_AFTER)
+        return response
+
+    # teardown_request: tetap dipanggil saat view error, dan setelah stream (stream_with_context) selesai
+    @app.teardown_request
+    def _release(exc=None):
+        name = g.pop('_admission', None)
+        if name is not None:
+            get_controller().release(name)
+
+    return app
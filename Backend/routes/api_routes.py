@@ -3,21 +3,47 @@ Backend/routes/api_routes.py
 Menangani Logic Utama API:
 1. Load Model Machine Learning
 2. Endpoint Prediksi (/predict) -> Otomatis jadi /api/predict
-3. Endpoint Generate PDF (/download-report)
-4. Endpoint Logs & Info
+3. Endpoint Generate PDF (/download-report) & Skrining Massal CSV (/screening)
+4. Endpoint Logs (termasuk feed live SSE /logs/stream), Info & Metrik
+5. Monitor Drift Fitur (/drift) & Statistik Prediksi (/stats)
+6. Registry Model & Laporan Shadow Scoring (/registry, /shadow)
+7. Admin: Job Training Latar, Hot Reload Model & Rebuild Statistik (/admin/train, /admin/reload, /stats/rebuild)
 """
 
+import io
 import os
+import csv
+import hmac
 import json
-import joblib
+import time
+import itertools
+import threading
+from functools import wraps
 import pandas as pd
 import numpy as np
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 
 from Backend.config import Config
-from Backend.models.preprocess import DiabetesPreprocessor
+from Backend.models import registry
+from Backend.models.bundle import load_model_bundle
+from Backend.models.inference import cascade_first_stage, create_inference
+from Backend.models.explain import PathExplainer
+from Backend.models.drift import create_monitor
+from Backend.models.shadow import ShadowScorer
+from Backend.models.stats import get_stats
+from Backend.models import log_store
+from Backend.models import prediction_log
+from Backend.models.feed import get_feed, sse_event
+from Backend.models import training_job
+from Backend.models import backends
+from Backend.models.scoring import (
+    RESULT_COLUMNS, get_risk_level, iter_csv_chunks, iter_scored_chunks, missing_columns
+)
 # Menggunakan utility agar kode lebih rapi
 from Backend.models.utils import create_pdf, log_prediction, validate_input_data
+from Backend.routes.timing import timed
+from Backend.routes.admission import get_controller as get_admission
+from Backend.routes.http_cache import etag_matches, make_etag, not_modified
 
 # --- 🔥 PERBAIKAN PENTING DI SINI 🔥 ---
 # url_prefix='/api' wajib ada agar alamatnya menjadi:
@@ -27,25 +53,83 @@ api_bp = Blueprint('api', __name__, url_prefix='/api')
 # --- 1. GLOBAL MODEL LOADING ---
 model = None
 model_meta = {}
+model_version = None  # Sidik jari file model + metadata (dipakai untuk ETag /model-info)
+inference = None  # Backend eksekusi model (langsung / micro-batch), lihat models/inference.py
+explainer = None  # Tabel kontribusi decision path per pasien, lihat models/explain.py
+preprocessor = None  # DiabetesFeatureTransformer dari bundle (record mentah -> fitur)
+drift_monitor = None  # Histogram fitur live vs referensi training, lihat models/drift.py
+active_version = None  # Versi registry yang dipakai (None = file model lama)
+shadow = None  # Kandidat yang menilai salinan traffic di thread latar, lihat models/shadow.py
+_loaded_pointers = None  # (ACTIVE, SHADOW) registry saat resource terakhir dimuat
+_reload_lock = threading.Lock()
+_next_reload_check = 0.0
+
+# Status kesiapan worker ini untuk /ready (diisi load_model_resources & warmup_model)
+_readiness = {'load_ms': None, 'loaded_at': None, 'error': None, 'warmup_pid': None,
+              'warmup_version': None, 'warmup_ms': [], 'warmed_at': None, 'warmup_error': None}
+_warmup_lock = threading.Lock()
+
+# Cache body JSON endpoint baca: dibangun ulang hanya jika sumbernya berubah
+_model_info_cache = {'version': None, 'body': None}
+_logs_cache = {'last_id': None, 'body': None}
+
+# Browser/klien wajib revalidasi dengan If-None-Match (dijawab 304 jika tidak berubah)
+API_CACHE_CONTROL = 'no-cache'
+
+def _load_shadow():
+    """Siapkan shadow scorer jika registry punya pointer SHADOW (kandidat != versi aktif)."""
+    global shadow
+    if shadow is not None:
+        shadow.close()
+        shadow = None
+
+    candidate = registry.get_shadow()
+    if not Config.SHADOW_ENABLED or not candidate or candidate == active_version:
+        return
+    try:
+        bundle = load_model_bundle(registry.version_paths(candidate)[0])
+        shadow = ShadowScorer(bundle['model'], bundle['preprocessor'], candidate, active_version)
+        print(f"✅ Shadow model {candidate} aktif (membandingkan dengan {active_version or 'model lama'}).")
+    except Exception as e:
+        print(f"⚠️ Shadow model {candidate} gagal dimuat: {e}")
+
 
 def load_model_resources():
-    """Memuat model .pkl dan metadata .json saat aplikasi dijalankan."""
-    global model, model_meta
-    
-    model_path = Config.MODEL_PATH
-    meta_path = Config.META_PATH
+    """Memuat model .pkl dan metadata .json (versi aktif registry / file lama) saat aplikasi dijalankan."""
+    global model, model_meta, model_version, inference, explainer, preprocessor, drift_monitor, active_version
+    global _loaded_pointers
+
+    started = time.perf_counter()
+    _readiness['error'] = None
+    try:
+        _loaded_pointers = (registry.get_active(), registry.get_shadow())
+        active_version = _loaded_pointers[0]
+        model_path, meta_path = registry.active_paths()
+    except registry.RegistryError as e:
+        print(f"❌ Pointer registry tidak valid: {e}")
+        _readiness['error'] = f"Pointer registry tidak valid: {e}"
+        return
 
     try:
         # A. Load Model Joblib
         if os.path.exists(model_path):
-            loaded_data = joblib.load(model_path)
-            
-            # Cek format dictionary atau model langsung
-            if isinstance(loaded_data, dict) and 'model' in loaded_data:
-                model = loaded_data['model']
-            else:
-                model = loaded_data
-            
+            # Bundle dinormalisasi (format lama/baru) & versi preprocessing dicek
+            bundle = load_model_bundle(model_path)
+            model = bundle['model']
+            preprocessor = bundle['preprocessor']
+
+            if inference is not None:
+                inference.close()
+            # Cascade (opsional): tahap-1 murah, ensemble penuh hanya untuk prediksi dekat ambang
+            first_stage, stage_name = None, None
+            if Config.CASCADE_ENABLED:
+                first_stage, stage_name = cascade_first_stage(model, active_version)
+                if first_stage is None:
+                    print(f"⚠️ Cascade tidak dipakai: {stage_name}")
+            inference = create_inference(model, model_path, first_stage, stage_name)
+            explainer = PathExplainer.from_model(model)
+            drift_monitor = create_monitor(registry.active_file('drift_reference.json', Config.DRIFT_REFERENCE_PATH))
+
             print(f"✅ Model berhasil dimuat dari: {model_path}")
         else:
             print(f"❌ File model tidak ditemukan di: {model_path}")
@@ -54,15 +138,162 @@ def load_model_resources():
         if os.path.exists(meta_path):
             with open(meta_path, 'r', encoding='utf-8') as f:
                 model_meta = json.load(f)
+            if active_version:
+                model_meta['version'] = active_version
             print("✅ Metadata berhasil dimuat.")
-            
+
+        model_version = make_etag(active_version, *(
+            os.stat(p).st_mtime_ns if os.path.exists(p) else 0 for p in (model_path, meta_path)
+        ))
+
+        _load_shadow()
+        _readiness['load_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        _readiness['loaded_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+
     except Exception as e:
         print(f"❌ Error fatal saat memuat resource: {e}")
+        _readiness['error'] = f"Gagal memuat resource: {e}"
 
 # Jalankan saat import
 load_model_resources()
 
 
+def reload_if_changed():
+    """
+    Hot reload: muat ulang model jika pointer ACTIVE/SHADOW registry berubah
+    (misal setelah job training --activate atau Scripts/model_registry.py).
+    Dicek paling sering tiap Config.MODEL_RELOAD_CHECK_SECONDS per worker; satu thread yang memuat.
+    """
+    global _next_reload_check
+    now = time.monotonic()
+    if now < _next_reload_check or not _reload_lock.acquire(blocking=False):
+        return False
+    try:
+        _next_reload_check = now + Config.MODEL_RELOAD_CHECK_SECONDS
+        if (registry.get_active(), registry.get_shadow()) == _loaded_pointers:
+            return False
+        print("🔄 Pointer registry berubah, memuat ulang model...")
+        load_model_resources()
+        _warmup_quietly()
+        return True
+    finally:
+        _reload_lock.release()
+
+
+@api_bp.before_request
+def _check_model_reload():
+    reload_if_changed()
+
+
+# Pasien sintetis untuk pemanasan (tidak ditulis ke log prediksi)
+WARMUP_SAMPLE = {
+    'age': 45, 'gender': 'Male', 'pulse_rate': 72, 'systolic_bp': 130, 'diastolic_bp': 85,
+    'glucose': 150, 'height': 170, 'weight': 70, 'bmi': 0, 'family_diabetes': 'Yes',
+    'hypertensive': 'No', 'family_hypertension': 'No', 'cardiovascular_disease': 'No', 'stroke': 'No'
+}
+# Variasi profil agar cabang pohon & kategori encoder yang berbeda ikut terlewati
+WARMUP_SAMPLES = [
+    WARMUP_SAMPLE,
+    {**WARMUP_SAMPLE, 'age': 28, 'gender': 'Female', 'glucose': 90, 'height': 158, 'weight': 52,
+     'family_diabetes': 'No'},
+    {**WARMUP_SAMPLE, 'age': 67, 'systolic_bp': 160, 'diastolic_bp': 100, 'glucose': 240, 'weight': 95,
+     'hypertensive': 'Yes', 'family_hypertension': 'Yes', 'cardiovascular_disease': 'Yes'},
+]
+
+def warmup_model(rounds: int = None):
+    """
+    Menjalankan prediksi sintetis lewat pipeline lengkap (validasi -> preprocessing -> model
+    -> penjelasan) agar biaya inisialisasi lazy (import sklearn internals, thread/pool backend)
+    dibayar sebelum request pasien pertama. Return: list latensi per putaran (ms).
+    """
+    if model is None:
+        load_model_resources()
+        if model is None:
+            return []
+
+    latencies = []
+    for i in range(rounds or Config.READY_WARMUP_ROUNDS):
+        sample = WARMUP_SAMPLES[i % len(WARMUP_SAMPLES)]
+        start = time.perf_counter()
+        validate_input_data(sample)
+        X = preprocessor.transform(sample)
+        inference.predict_proba(X)
+        if explainer is not None:
+            explainer.explain_one(X)
+        latencies.append(round((time.perf_counter() - start) * 1000, 3))
+
+    _readiness.update(warmup_pid=os.getpid(), warmup_version=model_version, warmup_ms=latencies,
+                      warmed_at=time.strftime('%Y-%m-%dT%H:%M:%S'), warmup_error=None)
+    return latencies
+
+
+def _warmup_quietly():
+    """Warmup setelah (re)load; kegagalan dicatat untuk /ready, tidak menggagalkan request."""
+    try:
+        warmup_model()
+    except Exception as e:
+        _readiness['warmup_error'] = f"Warmup gagal: {e}"
+        print(f"⚠️ Warmup gagal: {e}")
+
+
+def readiness():
+    """
+    Status kesiapan worker ini untuk /ready: (siap?, detail).
+    Siap = model, metadata & preprocessor termuat, warmup sudah berjalan DI PROSES INI untuk
+    model yang sedang dimuat (fork/reload mengulang warmup), dan median latensi warmup
+    <= Config.READY_MAX_LATENCY_MS. Warmup yang belum ada dijalankan sekali di sini.
+    """
+    reload_if_changed()
+
+    reasons = []
+    if _readiness['error']:
+        reasons.append(_readiness['error'])
+    if model is None or inference is None:
+        reasons.append('Model belum dimuat.')
+    if preprocessor is None:
+        reasons.append('Preprocessor belum dimuat.')
+    if not model_meta:
+        reasons.append('Metadata model belum dimuat.')
+
+    def warm():
+        return _readiness['warmup_pid'] == os.getpid() and _readiness['warmup_version'] == model_version
+
+    if not reasons and not warm():
+        with _warmup_lock:
+            if not warm():
+                _warmup_quietly()
+        if _readiness['warmup_error']:
+            reasons.append(_readiness['warmup_error'])
+
+    latencies = _readiness['warmup_ms'] if warm() else []
+    p50 = float(np.median(latencies)) if latencies else None
+    if not reasons:
+        if p50 is None:
+            reasons.append('Warmup belum berjalan.')
+        elif p50 > Config.READY_MAX_LATENCY_MS:
+            reasons.append(f"Latensi warmup {p50:.1f} ms > batas {Config.READY_MAX_LATENCY_MS} ms.")
+
+    detail = {
+        'status': 'ready' if not reasons else 'not_ready',
+        'pid': os.getpid(),
+        'model_version': active_version or model_meta.get('version') or 'legacy',
+        'algorithm': model_meta.get('algorithm'),
+        'inference_backend': getattr(inference, 'name', None),
+        'load_ms': _readiness['load_ms'],
+        'loaded_at': _readiness['loaded_at'],
+        'warmup': {
+            'rounds': len(latencies),
+            'latencies_ms': latencies,
+            'p50_ms': round(p50, 3) if p50 is not None else None,
+            'max_ms': max(latencies) if latencies else None,
+            'limit_ms': Config.READY_MAX_LATENCY_MS,
+            'at': _readiness['warmed_at'] if latencies else None,
+        },
+        'reasons': reasons,
+    }
+    return not reasons, detail
+
+
 # --- 2. API ENDPOINTS ---
 
 @api_bp.route('/predict', methods=['POST'])
@@ -78,75 +309,80 @@ def predict():
             return jsonify({'success': False, 'error': 'Model ML belum siap.'}), 503
 
     try:
-        # 1. Ambil Data JSON
-        data = request.get_json(silent=True)
-        if not data:
-            return jsonify({'success': False, 'error': 'Format JSON tidak valid'}), 400
+        # 1. Ambil Data JSON & 2. Validasi Input
+        with timed('validation'):
+            data = request.get_json(silent=True)
+            if not data:
+                return jsonify({'success': False, 'error': 'Format JSON tidak valid'}), 400
 
-        # 2. Validasi Input
-        validation = validate_input_data(data)
-        if not validation['is_valid']:
-            return jsonify({'success': False, 'error': validation['errors']}), 400
+            validation = validate_input_data(data)
+            if not validation['is_valid']:
+                return jsonify({'success': False, 'error': validation['errors']}), 400
 
         # 3. Preprocessing Data
-        preprocessor = DiabetesPreprocessor()
-        df = pd.DataFrame([data])
-        
-        # Bersihkan & Encode
-        df_clean = preprocessor.clean_and_encode(df, is_training=False)
-        
-        if df_clean.empty:
-            return jsonify({'success': False, 'error': 'Data input tidak valid.'}), 400
-
-        X = preprocessor.get_features(df_clean)
+        with timed('preprocessing'):
+            # Bersihkan & Encode (transformer dari bundle, jalur cepat satu record)
+            X = preprocessor.transform(data)
 
         # 4. Prediksi
-        prediction_class = int(model.predict(X)[0])
-        
-        if hasattr(model, 'predict_proba'):
-            probability = float(model.predict_proba(X)[0][1])
-        else:
-            probability = 1.0 if prediction_class == 1 else 0.0
+        with timed('model'):
+            # Satu panggilan predict_proba (bisa digabung dengan request lain oleh micro-batcher)
+            probability = float(inference.predict_proba(X)[0][1])
+
+            # 5. Extract Feature Importance
+            top_features = []
+            try:
+                # Bobot fitur dari backend model apa pun (None jika tidak tersedia, misal hist_gb)
+                importances = backends.feature_importances(model)
 
+                if importances is not None and len(importances) > 0:
+                    feature_names = Config.FEATURES
+                    feat_imp = sorted(zip(feature_names, importances), key=lambda x: x[1], reverse=True)
+                    top_features = [
+                        {'name': name, 'value': round(val * 100, 2)}
+                        for name, val in feat_imp[:5] if val > 0
+                    ]
+            except Exception as e:
+                current_app.logger.warning(f"Gagal ekstrak feature importance: {e}")
+
+        # 5b. Penjelasan khusus pasien ini (kontribusi tiap fitur di jalur keputusan)
+        explanation = None
+        with timed('explanation'):
+            if explainer is not None:
+                try:
+                    probs, contrib = explainer.explain(X)
+                    explanation = explainer.summarize(probs[0], contrib[0])
+                    # Penjelasan selalu tentang model penuh: dengan cascade, probabilitas tahap-1
+                    # diganti probabilitas model penuh agar hasil & penjelasan konsisten
+                    probability = float(probs[0])
+                except Exception as e:
+                    current_app.logger.warning(f"Gagal membuat penjelasan prediksi: {e}")
+
+        prediction_class = 1 if probability > 0.5 else 0
         result_label = "Diabetic" if prediction_class == 1 else "Non-Diabetic"
         prob_percent = round(probability * 100, 2)
 
-        # 5. Extract Feature Importance
-        top_features = []
-        try:
-            # Logika ambil feature importance
-            base_model = model
-            if hasattr(model, 'calibrated_classifiers_'):
-                base_model = model.calibrated_classifiers_[0].estimator
-            
-            if hasattr(base_model, 'named_steps'):
-                tree_model = base_model.named_steps['dt']
-                importances = tree_model.feature_importances_
-            elif hasattr(base_model, 'feature_importances_'):
-                importances = base_model.feature_importances_
-            else:
-                importances = []
-
-            if len(importances) > 0:
-                feature_names = Config.FEATURES
-                feat_imp = sorted(zip(feature_names, importances), key=lambda x: x[1], reverse=True)
-                top_features = [
-                    {'name': name, 'value': round(val * 100, 2)} 
-                    for name, val in feat_imp[:5] if val > 0
-                ]
-        except Exception as e:
-            current_app.logger.warning(f"Gagal ekstrak feature importance: {e}")
+        # 5c. Update monitor drift (O(1), hanya input pasien yang lolos validasi)
+        if drift_monitor is not None:
+            with timed('drift'):
+                drift_monitor.update(X)
 
         # 6. Simpan Log
-        log_prediction(data, result_label, prob_percent)
+        with timed('logging'):
+            log_prediction(data, result_label, prob_percent)
+
+        # 6b. Salinan request untuk model kandidat (antrian non-blocking, dinilai di thread latar)
+        if shadow is not None:
+            shadow.submit(data, probability)
 
         # 7. Return Response
         return jsonify({
             'success': True,
             'label': result_label,
             'probability_percent': prob_percent,
-            'risk_level': 'Tinggi' if probability >= 0.7 else ('Sedang' if probability >= 0.4 else 'Rendah'),
+            'risk_level': get_risk_level(probability),
             'feature_importance': top_features,
+            'explanation': explanation,
             'input_data': data
         })
 
@@ -155,23 +391,95 @@ def predict():
         return jsonify({'success': False, 'error': f"Internal Server Error: {str(e)}"}), 500
 
 
+def _csv_error_row(message: str) -> str:
+    """Satu baris CSV selebar RESULT_COLUMNS, pesan di kolom 'error' (kutip/koma di-escape csv.writer)."""
+    row = [''] * len(RESULT_COLUMNS)
+    row[RESULT_COLUMNS.index('error')] = message
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator='\n').writerow(row)
+    return buf.getvalue()
+
+
+@api_bp.route('/screening', methods=['POST'])
+def screening():
+    """
+    Endpoint Skrining Massal: /api/screening
+    Menerima CSV (kolom sama dengan Backend/data/diabetes.csv) sebagai:
+    - body mentah (Content-Type: text/csv) -> dibaca & diproses sambil upload berjalan
+    - multipart form field 'file'
+    Hasil di-stream per chunk sebagai CSV (default) atau NDJSON (?format=ndjson).
+    Setiap baris hasil membawa nomor baris sumber dan pesan validasi (jika ada).
+    Catatan: hasil skrining massal tidak ditulis ke log audit prediksi.
+    """
+    if model is None:
+        load_model_resources()
+        if model is None:
+            return jsonify({'success': False, 'error': 'Model ML belum siap.'}), 503
+
+    # 1. Tentukan sumber data (stream mentah atau file upload)
+    upload = request.files.get('file')
+    source = upload.stream if upload is not None else request.stream
+
+    fmt = request.args.get('format', '').lower()
+    if not fmt:
+        fmt = 'ndjson' if 'ndjson' in request.headers.get('Accept', '') else 'csv'
+    if fmt not in ('csv', 'ndjson'):
+        return jsonify({'success': False, 'error': "Format harus 'csv' atau 'ndjson'."}), 400
+
+    # 2. Baca chunk pertama untuk validasi header sebelum response dimulai
+    try:
+        reader = iter_csv_chunks(source, Config.SCREENING_CHUNK_SIZE)
+        first = next(reader)
+    except (StopIteration, pd.errors.EmptyDataError):
+        return jsonify({'success': False, 'error': 'File CSV kosong.'}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': f"CSV tidak dapat dibaca: {e}"}), 400
+
+    missing = missing_columns(first.columns)
+    if missing:
+        return jsonify({'success': False, 'error': f"Kolom hilang: {', '.join(missing)}"}), 400
+
+    # 3. Stream hasil per chunk (memori terbatas: hanya satu chunk di memori)
+    def generate():
+        if fmt == 'csv':
+            yield ','.join(RESULT_COLUMNS) + '\n'
+        try:
+            chunks = itertools.chain([first], reader)
+            for scored in iter_scored_chunks(chunks, inference.predict_proba, preprocessor):
+                if fmt == 'csv':
+                    yield scored.to_csv(index=False, header=False)
+                else:
+                    yield scored.to_json(orient='records', lines=True)
+        except Exception as e:
+            current_app.logger.error(f"Screening Error: {e}")
+            if fmt == 'csv':
+                yield _csv_error_row(f"Proses dihentikan: {e}")
+            else:
+                yield json.dumps({'error': f"Proses dihentikan: {e}"}) + '\n'
+
+    mimetype = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+
 @api_bp.route('/download-report', methods=['POST'])
 def download_report():
     """Endpoint generate PDF: /api/download-report"""
     try:
-        req_data = request.get_json()
-        input_data = req_data.get('input_data')
-        result_label = req_data.get('label')
-        
-        prob_raw = req_data.get('probability', 0)
-        if isinstance(prob_raw, str):
-            prob_raw = prob_raw.replace('%', '')
-        probability = float(prob_raw)
+        with timed('validation'):
+            req_data = request.get_json()
+            input_data = req_data.get('input_data')
+            result_label = req_data.get('label')
+
+            prob_raw = req_data.get('probability', 0)
+            if isinstance(prob_raw, str):
+                prob_raw = prob_raw.replace('%', '')
+            probability = float(prob_raw)
 
-        if not input_data:
-            return jsonify({'success': False, 'error': 'Data input hilang.'}), 400
+            if not input_data:
+                return jsonify({'success': False, 'error': 'Data input hilang.'}), 400
 
-        filename = create_pdf(input_data, result_label, probability)
+        with timed('pdf'):
+            filename = create_pdf(input_data, result_label, probability)
         
         if filename:
             # Return URL statis
@@ -187,21 +495,302 @@ def download_report():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _json_response(body: str, etag: str):
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = API_CACHE_CONTROL
+    return response
+
+
 @api_bp.route('/logs', methods=['GET'])
 def get_logs():
-    """Endpoint Logs: /api/logs"""
+    """
+    Endpoint Logs: /api/logs
+    100 prediksi terbaru dari ring buffer feed (models/feed.py), tanpa membaca log CSV.
+    ETag = id entri terbaru -> polling tanpa data baru dijawab 304,
+    dan body hanya dibangun ulang jika ada entri baru. last_id dipakai halaman riwayat sebagai
+    titik awal feed live (?last_id=) agar tidak ada prediksi yang terlewat di antaranya;
+    stream_url / stream_port menunjuk server fan-out SSE (routes/feed_server.py) jika aktif.
+    """
     try:
-        log_path = Config.PREDICTION_LOG
-        if os.path.exists(log_path):
-            df = pd.read_csv(log_path)
-            logs = df.tail(100).iloc[::-1].fillna('-').to_dict(orient='records')
-            return jsonify({"success": True, "logs": logs})
-        return jsonify({"success": True, "logs": []})
+        feed = get_feed()
+        feed.poll()  # Tarik baris worker lain yang belum sempat diambil tailer
+        last_id = feed.last_id()
+        etag = make_etag('logs', last_id)
+        if etag_matches(etag):
+            return not_modified(etag, API_CACHE_CONTROL)
+
+        if _logs_cache['last_id'] != last_id or _logs_cache['body'] is None:
+            _logs_cache['body'] = current_app.json.dumps({
+                "success": True, "logs": feed.recent(100), "last_id": last_id,
+                # Lokasi feed live: fan-out terpisah (jika aktif) atau endpoint Flask /api/logs/stream
+                "stream_url": Config.FEED_STREAM_URL or None,
+                "stream_port": Config.FEED_SERVER_PORT or None,
+            })
+            _logs_cache['last_id'] = last_id
+
+        return _json_response(_logs_cache['body'], etag)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@api_bp.route('/logs/stream', methods=['GET'])
+def stream_logs():
+    """
+    Endpoint Feed Live (fallback): /api/logs/stream (Server-Sent Events)
+    Setiap prediksi baru dikirim sebagai event 'prediction' (data = baris log JSON, id = id entri feed).
+    - Last-Event-ID (reconnect otomatis EventSource) -> entri yang terlewat dikirim ulang dari buffer
+    - Komentar ': ping' tiap FEED_HEARTBEAT_SECONDS agar proxy tidak memutus koneksi diam
+
+    Di gthread setiap koneksi di sini MEMEGANG satu thread worker selama terbuka. Karena itu di produksi
+    pelanggan dilayani server fan-out asyncio (routes/feed_server.py, lihat gunicorn.conf.py); endpoint ini
+    hanya untuk server dev / fan-out nonaktif, dibatasi admission 'stream' & FEED_STREAM_SECONDS.
+    """
+    feed = get_feed()
+    cursor = feed.cursor(request.headers.get('Last-Event-ID') or request.args.get('last_id'))
+
+    def generate():
+        position = cursor
+        deadline = time.monotonic() + Config.FEED_STREAM_SECONDS
+        next_ping = time.monotonic() + Config.FEED_HEARTBEAT_SECONDS
+        yield f"retry: {Config.FEED_RETRY_MS}\n\n"
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            events, position = feed.wait(position, min(deadline, next_ping) - now)
+            for event_id, row in events:
+                yield sse_event(event_id, row)
+            if not events and time.monotonic() >= next_ping:
+                next_ping = time.monotonic() + Config.FEED_HEARTBEAT_SECONDS
+                yield ": ping\n\n"
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Nonaktifkan buffering proxy (nginx)
+    return response
+
+
+def _search_filters(args):
+    """Query string /api/logs/search -> argumen LogStore.search (raise ValueError jika salah)."""
+    ts_range = (log_store.parse_time_bound(args.get('from')),
+                log_store.parse_time_bound(args.get('to'), upper=True))
+
+    label = args.get('label')
+    if label:
+        names = {name.lower(): code for code, name in enumerate(log_store.LABELS)}
+        if label.lower() not in names:
+            raise ValueError(f"label harus salah satu dari: {', '.join(log_store.LABELS)}")
+        label = names[label.lower()]
+    else:
+        label = None
+
+    ranges = {}
+    for col in log_store.NUMERIC_COLUMNS:
+        low, high = args.get(f'{col}_min'), args.get(f'{col}_max')
+        if low or high:
+            try:
+                ranges[col] = (float(low) if low else None, float(high) if high else None)
+            except ValueError:
+                raise ValueError(f"{col}_min / {col}_max harus angka")
+
+    page = max(args.get('page', 1, type=int) or 1, 1)
+    page_size = args.get('page_size', 50, type=int) or 50
+    page_size = min(max(page_size, 1), Config.LOG_SEARCH_MAX_PAGE_SIZE)
+    return {'ts_range': ts_range, 'label': label, 'ranges': ranges, 'page': page, 'page_size': page_size}
+
+
+@api_bp.route('/logs/search', methods=['GET'])
+def search_logs():
+    """
+    Endpoint Pencarian Riwayat: /api/logs/search
+    Filter: from, to (tanggal/jam), label (Diabetic/Non-Diabetic), <fitur>_min / <fitur>_max
+    untuk probability & fitur angka (satuan dataset: glukosa mmol/L, tinggi m), page, page_size.
+    Contoh: ?label=Diabetic&age_min=60&glucose_min=11&from=2026-09-01&to=2026-09-30
+    Dijalankan di salinan kolumnar log (bukan CSV), terbaru dulu. Baris baru dikompaksi di latar;
+    selama store belum ada sama sekali dijawab 202 {'status': 'building'} + Retry-After.
+    """
+    try:
+        filters = _search_filters(request.args)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    store = log_store.get_store()
+    log_store.start_compactor()
+    pending = store.pending_bytes()
+    if pending:
+        log_store.trigger_compaction()  # Di latar: request tidak pernah mengompaksi sendiri
+        if not store.manifest()['parts']:
+            # Store belum ada sama sekali (pencarian pertama di log besar): minta klien mencoba lagi
+            response = jsonify({'success': False, 'status': 'building', 'pending_bytes': pending,
+                                'error': 'Indeks pencarian sedang dibangun, coba lagi sebentar.'})
+            response.headers['Retry-After'] = str(max(1, int(Config.LOG_STORE_COMPACT_SECONDS // 2)))
+            return response, 202
+
+    etag = make_etag('logs-search', store.manifest()['log_offset'], request.query_string)
+    if etag_matches(etag):
+        return not_modified(etag, API_CACHE_CONTROL)
+
+    try:
+        result = store.search(**filters)
+    except Exception as e:
+        current_app.logger.error(f"Log Search Error: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+    return _json_response(current_app.json.dumps({'success': True, **result}), etag)
+
+
+@api_bp.route('/stats', methods=['GET'])
+def get_prediction_stats():
+    """
+    Endpoint Statistik: /api/stats?from=YYYY-MM-DD&to=YYYY-MM-DD&bucket=day|hour
+    Jumlah prediksi per bucket waktu, per label & tingkat risiko, serta rata-rata probabilitas.
+    Dijawab dari agregat per bucket (bukan membaca ulang log), ETag = offset log terproses + baris segmen.
+    """
+    stats = get_stats()
+    prediction_log.start_merger()  # Penggabung segmen berjalan di latar, request tidak pernah menunggu
+    stats.refresh()  # Susul byte baru log kanonik + baris segmen yang belum digabung
+
+    start, end = request.args.get('from'), request.args.get('to')
+    bucket = request.args.get('bucket', 'day')
+    etag = make_etag('stats', *stats.version(), start, end, bucket)
+    if etag_matches(etag):
+        return not_modified(etag, API_CACHE_CONTROL)
+
+    try:
+        result = stats.query(start, end, bucket)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    return _json_response(current_app.json.dumps({'success': True, **result}), etag)
+
+
 @api_bp.route('/model-info', methods=['GET'])
 def get_model_info():
-    """Endpoint Info: /api/model-info"""
-    return jsonify(model_meta)
\ No newline at end of file
+    """Endpoint Info: /api/model-info (ETag = versi model)"""
+    etag = make_etag('model-info', model_version)
+    if etag_matches(etag):
+        return not_modified(etag, API_CACHE_CONTROL)
+
+    if _model_info_cache['version'] != model_version or _model_info_cache['body'] is None:
+        _model_info_cache['body'] = current_app.json.dumps(model_meta)
+        _model_info_cache['version'] = model_version
+
+    return _json_response(_model_info_cache['body'], etag)
+
+
+@api_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Endpoint Metrik Runtime: /api/metrics"""
+    return jsonify({
+        'inference': inference.stats() if inference is not None else None,
+        'drift': drift_monitor.summary() if drift_monitor is not None else None,
+        'shadow': shadow.summary() if shadow is not None else None,
+        'admission': get_admission().stats() if Config.ADMISSION_ENABLED else None
+    })
+
+
+@api_bp.route('/registry', methods=['GET'])
+def get_registry():
+    """Endpoint Registry: /api/registry (daftar versi model, pointer ACTIVE & SHADOW)"""
+    return jsonify({'success': True, 'loaded_version': active_version, **registry.describe()})
+
+
+@api_bp.route('/shadow', methods=['GET'])
+def get_shadow_report():
+    """
+    Endpoint Shadow: /api/shadow
+    Kesepakatan label & selisih probabilitas model kandidat vs model aktif pada traffic live.
+    """
+    if shadow is None:
+        return jsonify({'success': False, 'error': 'Tidak ada model shadow. Set dengan: '
+                        'python Scripts/model_registry.py shadow <versi>'}), 404
+    return jsonify({'success': True, **shadow.report()})
+
+
+@api_bp.route('/drift', methods=['GET'])
+def get_drift():
+    """
+    Endpoint Drift: /api/drift
+    PSI & KS per fitur: distribusi input pasien live vs data training.
+    Tanpa referensi (atau monitor dimatikan) -> 404 + langkah untuk mengaktifkannya.
+    """
+    if drift_monitor is None:
+        reason = ('Monitor drift dimatikan (DRIFT_ENABLED=0).' if not Config.DRIFT_ENABLED else
+                  'Referensi drift belum dibuat. Jalankan: python Scripts/build_drift_reference.py '
+                  '(memakai dataset training, atau dataset mentah jika belum ada), lalu '
+                  'POST /api/admin/reload.')
+        return jsonify({'success': False, 'error': reason}), 404
+    return jsonify({'success': True, **drift_monitor.report()})
+
+
+# --- 3. ADMIN: JOB TRAINING, RELOAD & REBUILD STATISTIK ---
+
+def _require_admin(view):
+    """
+    Endpoint admin wajib header X-Admin-Token == Config.ADMIN_TOKEN.
+    ADMIN_TOKEN kosong -> endpoint admin nonaktif (selalu 403), bukan terbuka untuk semua.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not Config.ADMIN_TOKEN:
+            return jsonify({'success': False, 'error': 'Endpoint admin nonaktif (ADMIN_TOKEN belum di-set).'}), 403
+        token = request.headers.get('X-Admin-Token', '')
+        if not hmac.compare_digest(token.encode('utf-8'), Config.ADMIN_TOKEN.encode('utf-8')):
+            return jsonify({'success': False, 'error': 'Token admin tidak valid.'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@api_bp.route('/admin/train', methods=['POST'])
+@_require_admin
+def start_training():
+    """
+    Endpoint Training: /api/admin/train  body: {"activate": bool, "shadow": bool, "backend": str}
+    Menjalankan train_model() di proses terpisah (nice + limit CPU/memori). Pantau via GET.
+    """
+    options = request.get_json(silent=True) or {}
+    activate, shadow_run = bool(options.get('activate')), bool(options.get('shadow'))
+    if activate and shadow_run:
+        return jsonify({'success': False, 'error': "Pilih salah satu: 'activate' atau 'shadow'."}), 400
+    try:
+        backend = backends.get_backend(options.get('backend')).name
+    except backends.UnknownBackendError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    try:
+        status = training_job.start_job(activate=activate, shadow=shadow_run, backend=backend)
+    except training_job.JobBusyError as e:
+        return jsonify({'success': False, 'error': str(e), 'job': training_job.job_status()}), 409
+    except OSError as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify({'success': True, 'job': status}), 202
+
+
+@api_bp.route('/admin/train', methods=['GET'])
+@_require_admin
+def get_training_status():
+    """Endpoint Status Training: /api/admin/train (tahap, fold, waktu berjalan, versi hasil)"""
+    status = training_job.job_status()
+    if status is None:
+        return jsonify({'success': False, 'error': 'Belum pernah ada job training.'}), 404
+    return jsonify({'success': True, 'job': status, 'loaded_version': active_version})
+
+
+@api_bp.route('/admin/reload', methods=['POST'])
+@_require_admin
+def reload_model():
+    """Endpoint Reload: /api/admin/reload (muat ulang model worker ini dari pointer registry sekarang)"""
+    with _reload_lock:
+        load_model_resources()
+    _warmup_quietly()
+    return jsonify({'success': model is not None, 'loaded_version': active_version,
+                    'shadow_version': shadow.version if shadow is not None else None})
+
+
+@api_bp.route('/stats/rebuild', methods=['POST'])
+@_require_admin
+def rebuild_prediction_stats():
+    """Bangun ulang agregat /api/stats dari seluruh log prediksi: /api/stats/rebuild (membaca seluruh log)"""
+    try:
+        rows = get_stats().rebuild()
+    except OSError as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify({'success': True, 'rows': rows})
@@ -0,0 +1,82 @@
+"""
+Backend/routes/assets.py
+Penyajian aset statis hasil build (Scripts/build_assets.py):
+1. Helper template asset_url('css/styles.css') -> /static/dist/css/styles.<hash>.css
+2. Handler static: kirim varian .br / .gz sesuai Accept-Encoding
+3. Header cache 'immutable' untuk file ber-fingerprint (URL berubah jika konten berubah)
+
+Jika build belum dijalankan (manifest tidak ada), semua kembali ke perilaku Flask standar.
+"""
+
+import os
+import json
+import mimetypes
+
+from flask import Flask, current_app, send_from_directory, url_for
+
+from Backend.config import Config
+from Backend.routes.http_cache import accepted_encodings
+
+# Urutan preferensi encoding (terbaik dulu)
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+_manifest = {}
+_manifest_mtime = None
+
+
+def load_manifest() -> dict:
+    """Memuat manifest; dibaca ulang otomatis jika file berubah (build ulang saat server jalan)."""
+    global _manifest, _manifest_mtime
+    try:
+        mtime = os.path.getmtime(Config.ASSET_MANIFEST)
+    except OSError:
+        _manifest, _manifest_mtime = {}, None
+        return _manifest
+
+    if mtime != _manifest_mtime:
+        try:
+            with open(Config.ASSET_MANIFEST, 'r', encoding='utf-8') as f:
+                _manifest = json.load(f)
+            _manifest_mtime = mtime
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def asset_url(path: str) -> str:
+    """URL aset: versi ber-fingerprint jika ada di manifest, selain itu URL static biasa."""
+    hashed = load_manifest().get(path)
+    if hashed:
+        return url_for('static', filename=f"dist/{hashed}")
+    return url_for('static', filename=path)
+
+
+def serve_static(filename: str):
+    """Pengganti view 'static' bawaan Flask."""
+    static_dir = current_app.static_folder
+
+    if not filename.startswith('dist/'):
+        return current_app.send_static_file(filename)
+
+    # Aset ber-fingerprint -> pilih varian terkompresi terbaik yang tersedia
+    accepted = accepted_encodings()
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    response = None
+    for encoding, suffix in ENCODINGS:
+        if encoding in accepted and os.path.isfile(os.path.join(static_dir, filename + suffix)):
+            response = send_from_directory(static_dir, filename + suffix, mimetype=mimetype)
+            response.headers['Content-Encoding'] = encoding
+            break
+    if response is None:
+        response = send_from_directory(static_dir, filename, mimetype=mimetype)
+
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = f"public, max-age={Config.STATIC_CACHE_MAX_AGE}, immutable"
+    return response
+
+
+def init_assets(app: Flask):
+    """Mendaftarkan helper template & mengganti handler static bawaan."""
+    app.jinja_env.globals['asset_url'] = asset_url
+    app.view_functions['static'] = serve_static
+    return app
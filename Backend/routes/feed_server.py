@@ -0,0 +1,210 @@
+"""
+Backend/routes/feed_server.py
+Server fan-out SSE untuk feed live (/api/logs/stream) di LUAR pool thread gunicorn:
+1. Satu proses, satu event loop asyncio: pelanggan yang diam hanya memegang socket,
+   bukan thread worker gthread (ribuan pelanggan tidak mengurangi kapasitas prediksi)
+2. Feed (models/feed.py) diisi dengan membaca baris baru semua segmen worker per offset di
+   thread executor; event baru disalin (sudah ter-encode) ke buffer milik event loop, lalu satu
+   notifikasi membangunkan semua pelanggan sekaligus (pelanggan tidak pernah menyentuh lock feed)
+3. Format event, id (Last-Event-ID) & heartbeat sama dengan endpoint Flask /api/logs/stream
+   (fallback untuk server dev / jika fan-out dinonaktifkan)
+4. Klien lambat (buffer kirim tidak terkuras) diputus agar memori tetap terbatas
+5. Tanpa CORS wildcard (baris berisi data pasien): hanya origin FEED_SERVER_ALLOW_ORIGIN yang diizinkan
+
+Dijalankan gunicorn.conf.py (when_ready) sebagai proses terpisah. Manual:
+    python -m Backend.routes.feed_server --port 7861
+"""
+
+import sys
+import json
+import asyncio
+import argparse
+import subprocess
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from Backend.config import Config
+from Backend.models.feed import PredictionFeed, sse_event
+
+STREAM_PATH = '/api/logs/stream'
+HEALTH_PATH = '/health'
+REQUEST_TIMEOUT = 10  # detik untuk membaca header request
+SEND_TIMEOUT = 10     # detik maksimum buffer kirim satu klien boleh tertahan
+
+
+def _cors_headers(origin: Optional[str]) -> str:
+    """Header CORS hanya untuk origin yang dikonfigurasi (halaman riwayat di port utama)."""
+    allowed = Config.FEED_SERVER_ALLOW_ORIGIN
+    if not allowed or origin != allowed:
+        return ''
+    return (f'Access-Control-Allow-Origin: {allowed}\r\nVary: Origin\r\n'
+            'Access-Control-Allow-Headers: Last-Event-ID, Cache-Control\r\n')
+
+
+def _http_head(status: str, headers: str = '', origin: str = None) -> bytes:
+    return f"HTTP/1.1 {status}\r\n{_cors_headers(origin)}{headers}Connection: close\r\n\r\n".encode('latin-1')
+
+
+class FeedServer:
+    """Fan-out SSE: satu poller segmen + banyak pelanggan di satu event loop."""
+
+    def __init__(self, feed: PredictionFeed = None, max_clients: int = None,
+                 poll_seconds: float = None, heartbeat_seconds: float = None):
+        self.feed = feed or PredictionFeed()
+        self.max_clients = max_clients or Config.FEED_SERVER_MAX_CLIENTS
+        self.poll_seconds = poll_seconds or Config.FEED_POLL_SECONDS or 0.5
+        self.heartbeat_seconds = heartbeat_seconds or Config.FEED_HEARTBEAT_SECONDS
+        self.clients = 0
+        self.served = 0
+        self._changed: Optional[asyncio.Event] = None
+        self._poller: Optional[asyncio.Task] = None
+        # Salinan event feed milik event loop: (seq feed, bytes event SSE); hanya diubah di loop
+        self._events = deque(maxlen=self.feed.size)
+        self._seq = 0
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        self._changed = asyncio.Event()
+        self._poller = asyncio.ensure_future(self._poll_loop())
+        return await asyncio.start_server(self._handle, host, port, backlog=1024)
+
+    def stats(self) -> Dict[str, object]:
+        return {'clients': self.clients, 'served': self.served, 'max_clients': self.max_clients,
+                'last_id': self.feed.last_id()}
+
+    # --- A. POLLER SEGMEN ---
+    def _pull(self, cursor: int) -> Tuple[List[Tuple[int, bytes]], int]:
+        """Di thread executor: baca segmen, lalu ambil event setelah `cursor` (sudah ter-encode)."""
+        self.feed.poll()
+        events, cursor = self.feed.wait(cursor, 0)
+        first = cursor - len(events) + 1  # seq event feed berurutan sampai cursor baru
+        return [(first + i, sse_event(event_id, row).encode('utf-8'))
+                for i, (event_id, row) in enumerate(events)], cursor
+
+    async def _poll_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                events, self._seq = await loop.run_in_executor(None, self._pull, self._seq)
+            except Exception as e:
+                print(f"⚠️ Fan-out feed gagal membaca segmen: {e}")
+                events = []
+            if events:
+                self._events.extend(events)
+                # Bangunkan semua pelanggan yang sedang menunggu, lalu siapkan sinyal berikutnya
+                self._changed.set()
+                self._changed = asyncio.Event()
+            await asyncio.sleep(self.poll_seconds)
+
+    def _since(self, cursor: int) -> Tuple[bytes, int]:
+        """Event setelah `cursor` dari buffer event loop (tanpa lock). Return: (payload, cursor baru)."""
+        if not self._events or self._events[-1][0] <= cursor:
+            return b'', cursor
+        chunks = []
+        for seq, payload in reversed(self._events):
+            if seq <= cursor:
+                break
+            chunks.append(payload)
+        return b''.join(reversed(chunks)), self._events[-1][0]
+
+    # --- B. KONEKSI ---
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str]]:
+        head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), REQUEST_TIMEOUT)
+        lines = head.decode('latin-1').split('\r\n')
+        method, target, _ = lines[0].split(' ', 2)
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                key, value = line.split(':', 1)
+                headers[key.strip().lower()] = value.strip()
+        return method, target, headers
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, data: bytes):
+        writer.write(data)
+        await asyncio.wait_for(writer.drain(), SEND_TIMEOUT)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                method, target, headers = await self._read_request(reader)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+                return
+            url = urlsplit(target)
+            origin = headers.get('origin')
+
+            if method == 'OPTIONS':
+                await self._send(writer, _http_head('204 No Content', origin=origin))
+            elif method == 'GET' and url.path == HEALTH_PATH:
+                body = json.dumps(self.stats())
+                await self._send(writer, _http_head('200 OK', 'Content-Type: application/json\r\n'
+                                                    f'Content-Length: {len(body)}\r\n') + body.encode('utf-8'))
+            elif method != 'GET' or url.path != STREAM_PATH:
+                await self._send(writer, _http_head('404 Not Found', 'Content-Length: 0\r\n'))
+            elif self.clients >= self.max_clients:
+                await self._send(writer, _http_head('503 Service Unavailable', 'Content-Length: 0\r\n'
+                                                    f'Retry-After: {Config.ADMISSION_RETRY_AFTER}\r\n', origin))
+            else:
+                last_id = headers.get('last-event-id') or parse_qs(url.query).get('last_id', [None])[0]
+                # feed.cursor memakai lock feed: sekali per koneksi, di executor (bukan di event loop)
+                cursor = await asyncio.get_running_loop().run_in_executor(None, self.feed.cursor, last_id)
+                await self._stream(reader, writer, cursor, origin)
+        except (ConnectionError, asyncio.TimeoutError):
+            pass  # Klien putus / terlalu lambat
+        finally:
+            writer.close()
+
+    async def _stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, cursor: int,
+                      origin: str = None):
+        self.clients += 1
+        self.served += 1
+        # Klien SSE tidak mengirim apa pun lagi: data/EOF berarti koneksi ditutup -> slot langsung bebas
+        gone = asyncio.ensure_future(reader.read(1))
+        try:
+            await self._send(writer, _http_head(
+                '200 OK', 'Content-Type: text/event-stream; charset=utf-8\r\n'
+                          'Cache-Control: no-cache\r\nX-Accel-Buffering: no\r\n', origin
+            ) + f"retry: {Config.FEED_RETRY_MS}\n\n".encode('utf-8'))
+            while not gone.done():
+                changed = self._changed
+                payload, cursor = self._since(cursor)
+                if payload:
+                    await self._send(writer, payload)
+                    continue
+                waiter = asyncio.ensure_future(changed.wait())
+                done, _ = await asyncio.wait({waiter, gone}, timeout=self.heartbeat_seconds,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                waiter.cancel()
+                if not done:
+                    await self._send(writer, b": ping\n\n")
+        finally:
+            gone.cancel()
+            self.clients -= 1
+
+
+def spawn(port: int, host: str = None) -> subprocess.Popen:
+    """Jalankan fan-out sebagai proses terpisah (dipanggil gunicorn.conf.py saat master siap)."""
+    command = [sys.executable, '-m', 'Backend.routes.feed_server', '--port', str(port),
+               '--host', host or Config.FEED_SERVER_HOST]
+    return subprocess.Popen(command, cwd=Config.ROOT_DIR)
+
+
+async def serve(host: str, port: int):
+    server = FeedServer()
+    listener = await server.start(host, port)
+    print(f"📡 Fan-out feed live: http://{host}:{port}{STREAM_PATH} "
+          f"(maks {server.max_clients} pelanggan, buffer {server.feed.size})")
+    async with listener:
+        await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server fan-out SSE untuk feed live prediksi")
+    parser.add_argument('--host', default=Config.FEED_SERVER_HOST)
+    parser.add_argument('--port', type=int, default=Config.FEED_SERVER_PORT or 7861)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,116 @@
+"""
+Backend/routes/http_cache.py
+Utilitas cache HTTP bersama untuk Web & API routes:
+1. ETag dari konten / versi
+2. Conditional GET (If-None-Match -> 304 Not Modified)
+3. Kompresi gzip response di atas ambang ukuran (hasil kompresi di-memo per hash body)
+"""
+
+import gzip
+import hashlib
+from collections import OrderedDict
+
+from flask import Flask, Response, request
+
+from Backend.config import Config
+
+# Tipe konten yang layak dikompresi
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/html', 'text/plain', 'text/csv'}
+
+# Memo hasil gzip untuk response ber-ETag (polling berulang tidak perlu kompresi ulang).
+# Kunci = hash body: ETag versi (bukan dari konten) bisa sama untuk body berbeda
+_GZIP_MEMO_SIZE = 64
+_gzip_memo = OrderedDict()
+
+
+def make_etag(*parts) -> str:
+    """ETag kuat (strong) dari gabungan bagian apa pun (bytes / str / angka)."""
+    digest = hashlib.sha1()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = str(part).encode('utf-8')
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.hexdigest()[:20]
+
+
+def etag_matches(etag: str) -> bool:
+    """
+    True jika ETag yang dimiliki browser (If-None-Match) sama dengan versi sekarang.
+    Perbandingan weak, karena varian gzip dikirim dengan ETag weak (W/"...").
+    """
+    return request.if_none_match.contains_weak(etag)
+
+
+def not_modified(etag: str, cache_control: str = None) -> Response:
+    response = Response(status=304)
+    response.set_etag(etag)
+    if cache_control:
+        response.headers['Cache-Control'] = cache_control
+    return response
+
+
+def accepted_encodings() -> set:
+    """Encoding yang diterima client (entri dengan q=0 dianggap ditolak)."""
+    accepted = set()
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        token, *params = [p.strip() for p in part.split(';')]
+        quality = 1.0
+        for param in params:
+            if param.startswith('q='):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if token and quality > 0:
+            accepted.add(token.lower())
+    return accepted
+
+
+def _gzip_body(data: bytes, etag: str = None) -> bytes:
+    if etag is None:
+        return gzip.compress(data, compresslevel=6)
+
+    # sha1 jauh lebih murah dari gzip; body berbeda dengan ETag & panjang sama tidak bertabrakan
+    key = hashlib.sha1(data).digest()
+    body = _gzip_memo.get(key)
+    if body is None:
+        body = gzip.compress(data, compresslevel=6)
+        _gzip_memo[key] = body
+        if len(_gzip_memo) > _GZIP_MEMO_SIZE:
+            _gzip_memo.popitem(last=False)
+    else:
+        _gzip_memo.move_to_end(key)
+    return body
+
+
+def init_compression(app: Flask):
+    """
+    Mendaftarkan kompresi gzip otomatis untuk response teks/JSON >= Config.GZIP_MIN_SIZE.
+    Daftarkan SEBELUM hook lain yang mengubah body (after_request dijalankan terbalik).
+    """
+
+    @app.after_request
+    def _compress(response):
+        response.vary.add('Accept-Encoding')
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES
+                or 'gzip' not in accepted_encodings()):
+            return response
+
+        data = response.get_data()
+        if len(data) < Config.GZIP_MIN_SIZE:
+            return response
+
+        etag, weak = response.get_etag()
+        response.set_data(_gzip_body(data, etag))
+        response.headers['Content-Encoding'] = 'gzip'
+        if etag:
+            # Representasi berbeda (terkompresi) -> ETag weak
+            response.set_etag(etag, weak=True)
+        return response
+
+    return app
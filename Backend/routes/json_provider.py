@@ -0,0 +1,56 @@
+"""
+Backend/routes/json_provider.py
+Encoder JSON cepat (opt-in via Config.FAST_JSON) untuk jsonify():
+- Jika 'orjson' terinstall: serialisasi native termasuk skalar & array NumPy
+- Jika tidak: tetap json bawaan, tapi skalar/array NumPy dikonversi otomatis (tidak error)
+"""
+
+import numpy as np
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from Backend.config import Config
+
+# Coba import orjson, jika belum install tetap jalan dengan json bawaan
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _numpy_default(obj):
+    """Fallback json bawaan untuk tipe NumPy."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return DefaultJSONProvider.default(obj)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider Flask yang memahami NumPy secara langsung."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        if HAS_ORJSON:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=_numpy_default, option=option).decode('utf-8')
+
+        kwargs.setdefault('default', _numpy_default)
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if HAS_ORJSON and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+
+def init_json(app: Flask):
+    """Aktifkan FastJSONProvider jika Config.FAST_JSON menyala."""
+    if Config.FAST_JSON:
+        app.json = FastJSONProvider(app)
+    return app
@@ -0,0 +1,80 @@
+"""
+Backend/routes/timing.py
+Instrumentasi waktu per-request untuk debugging performa dari browser:
+1. Header 'Server-Timing' di setiap response (validation, preprocessing, model, explanation, drift, logging, pdf)
+2. Blok 'timings' di response JSON jika mode debug diminta (?debug=1 atau header X-Debug-Timing: 1)
+"""
+
+import json
+import time
+from contextlib import contextmanager
+
+from flask import Flask, g, request, has_request_context
+
+# Urutan tahap yang dilaporkan (tahap yang tidak terjadi tidak ditulis)
+STAGES = ('validation', 'preprocessing', 'model', 'explanation', 'drift', 'logging', 'pdf')
+
+DEBUG_HEADER = 'X-Debug-Timing'
+
+
+def timing_requested() -> bool:
+    """True jika client meminta blok 'timings' di body JSON."""
+    flag = request.args.get('debug') or request.headers.get(DEBUG_HEADER) or ''
+    return flag.lower() in ('1', 'true', 'yes')
+
+
+@contextmanager
+def timed(stage: str):
+    """
+    Mengukur durasi satu tahap request (dalam ms).
+    Aman dipanggil di luar request context (misal dari script), cukup tidak tercatat.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if has_request_context() and hasattr(g, '_timings'):
+            elapsed = (time.perf_counter() - start) * 1000
+            g._timings[stage] = g._timings.get(stage, 0.0) + elapsed
+
+
+def get_timings() -> dict:
+    """Snapshot durasi per tahap + total sejak request dimulai (ms, 3 desimal)."""
+    timings = {k: round(v, 3) for k, v in getattr(g, '_timings', {}).items()}
+    start = getattr(g, '_timing_start', None)
+    if start is not None:
+        timings['total'] = round((time.perf_counter() - start) * 1000, 3)
+    return timings
+
+
+def _format_header(timings: dict) -> str:
+    ordered = [s for s in STAGES if s in timings]
+    ordered += [s for s in timings if s not in ordered]
+    return ', '.join(f"{name};dur={timings[name]:.3f}" for name in ordered)
+
+
+def init_timing(app: Flask):
+    """Mendaftarkan hook before/after request ke aplikasi Flask."""
+
+    @app.before_request
+    def _start_timer():
+        g._timing_start = time.perf_counter()
+        g._timings = {}
+
+    @app.after_request
+    def _emit_server_timing(response):
+        if not hasattr(g, '_timing_start'):
+            return response
+
+        timings = get_timings()
+        response.headers['Server-Timing'] = _format_header(timings)
+
+        # Blok 'timings' hanya untuk response JSON berbentuk object & jika diminta
+        if timing_requested() and response.is_json and not response.direct_passthrough:
+            payload = response.get_json(silent=True)
+            if isinstance(payload, dict):
+                payload['timings'] = timings
+                response.set_data(json.dumps(payload))
+        return response
+
+    return app
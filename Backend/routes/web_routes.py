@@ -4,12 +4,89 @@ Menangani Routing Halaman Web (HTML Render).
 File ini bertugas mengembalikan file HTML dari folder templates kepada pengguna.
 """
 
-from flask import Blueprint, render_template
+import os
+import time
+
+from flask import Blueprint, Response, current_app, render_template
 from jinja2 import TemplateNotFound
 
+from Backend.config import Config
+from Backend.routes.http_cache import etag_matches, make_etag, not_modified
+
 # Definisi Blueprint 'web'
 web_bp = Blueprint('web', __name__)
 
+# --- CACHE HALAMAN TER-RENDER ---
+# Output halaman hanya berubah jika file template (atau manifest aset) berubah,
+# jadi hasil render disimpan di memori: {(template, active_page): (html_bytes, etag)}
+_page_cache = {}
+_templates_version = None
+# Sidik jari folder template: dihitung sekali di produksi; saat auto-reload/debug
+# dihitung ulang paling sering sekali per TEMPLATES_CHECK_SECONDS (bukan per request)
+_templates_tree = {'version': None, 'checked': 0.0}
+
+# Browser wajib revalidasi (If-None-Match) -> dijawab 304 tanpa body jika tidak berubah
+PAGE_CACHE_CONTROL = 'no-cache'
+
+
+def _templates_reload_enabled() -> bool:
+    """Template dipantau perubahan jika TEMPLATES_AUTO_RELOAD (Config/app.config) atau mode debug aktif."""
+    return bool(Config.TEMPLATES_AUTO_RELOAD or current_app.debug
+                or current_app.config.get('TEMPLATES_AUTO_RELOAD'))
+
+
+def _scan_templates():
+    """Sidik jari mtime semua file template (walk + stat seluruh folder)."""
+    stamps = []
+    for root, _, files in os.walk(Config.TEMPLATES_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            stamps.append((path, os.stat(path).st_mtime_ns))
+    return tuple(sorted(stamps))
+
+
+def _current_templates_version():
+    """Sidik jari template (lihat _templates_tree) + mtime manifest aset (satu stat, build aset saat server jalan)."""
+    now = time.monotonic()
+    if _templates_tree['version'] is None or (
+            _templates_reload_enabled() and now - _templates_tree['checked'] >= Config.TEMPLATES_CHECK_SECONDS):
+        _templates_tree.update(version=_scan_templates(), checked=now)
+    try:
+        manifest = os.stat(Config.ASSET_MANIFEST).st_mtime_ns
+    except OSError:
+        manifest = None
+    return _templates_tree['version'], manifest
+
+
+def render_cached(template: str, active_page: str):
+    """render_template + cache memori + ETag/304. Invalidasi via mtime template (auto-reload/debug) & manifest aset."""
+    global _templates_version
+
+    version = _current_templates_version()
+    if version != _templates_version:
+        # Template berubah: buang hasil render lama & cache kompilasi Jinja
+        _page_cache.clear()
+        if current_app.jinja_env.cache is not None:
+            current_app.jinja_env.cache.clear()
+        _templates_version = version
+
+    key = (template, active_page)
+    cached = _page_cache.get(key)
+    if cached is None:
+        html = render_template(template, active_page=active_page).encode('utf-8')
+        cached = (html, make_etag(html))
+        _page_cache[key] = cached
+
+    html, etag = cached
+    if etag_matches(etag):
+        return not_modified(etag, PAGE_CACHE_CONTROL)
+
+    response = Response(html, mimetype='text/html')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = PAGE_CACHE_CONTROL
+    return response
+
+
 # --- RUTE 1: LANDING PAGE (HOME) ---
 @web_bp.route('/')
 def index():
@@ -19,7 +96,7 @@ def index():
     """
     try:
         # active_page='home' digunakan untuk menandai menu navigasi yang aktif
-        return render_template('pages/index.html', active_page='home')
+        return render_cached('pages/index.html', active_page='home')
     except TemplateNotFound:
         return "❌ Error: File 'Backend/templates/pages/index.html' tidak ditemukan.", 404
 
@@ -31,7 +108,7 @@ def about():
     URL: http://localhost:8000/about
     """
     try:
-        return render_template('pages/about.html', active_page='about')
+        return render_cached('pages/about.html', active_page='about')
     except TemplateNotFound:
         return "❌ Error: File 'Backend/templates/pages/about.html' tidak ditemukan.", 404
 
@@ -43,7 +120,7 @@ def predict():
     URL: http://localhost:8000/predict
     """
     try:
-        return render_template('pages/form.html', active_page='predict')
+        return render_cached('pages/form.html', active_page='predict')
     except TemplateNotFound:
         return "❌ Error: File 'Backend/templates/pages/form.html' tidak ditemukan.", 404
 
@@ -56,6 +133,6 @@ def history():
     """
     try:
         # Pastikan Anda sudah membuat file logs.html di folder pages
-        return render_template('pages/logs.html', active_page='history')
+        return render_cached('pages/logs.html', active_page='history')
     except TemplateNotFound:
         return "❌ Error: File 'Backend/templates/pages/logs.html' tidak ditemukan.", 404
\ No newline at end of file
@@ -5,6 +5,10 @@ class DiabetesApiClient {
         // Tidak lagi memaksa localhost:8000
         this.baseUrl = baseUrl || window.location.origin;
         this.isConnected = false;
+
+        // Mode debug timing: aktifkan via localStorage.setItem('debugTiming', '1')
+        // Server akan menambahkan blok 'timings' di setiap response JSON
+        this.debugTiming = window.localStorage && localStorage.getItem('debugTiming') === '1';
         
         console.log('🌐 Diabetes API Client initialized');
         console.log('   Target URL:', this.baseUrl);
@@ -28,6 +32,10 @@ class DiabetesApiClient {
 
         const finalOptions = { ...defaultOptions, ...options };
 
+        if (this.debugTiming) {
+            finalOptions.headers = { ...finalOptions.headers, 'X-Debug-Timing': '1' };
+        }
+
         if (finalOptions.body && typeof finalOptions.body === 'object') {
             finalOptions.body = JSON.stringify(finalOptions.body);
         }
@@ -35,6 +43,7 @@ class DiabetesApiClient {
         try {
             console.log(`📡 Sending [${finalOptions.method}] to ${url}`);
             const response = await fetch(url, finalOptions);
+            this.logServerTiming(finalOptions.method, cleanEndpoint, response);
             const contentType = response.headers.get("content-type");
             
             // Handle jika server error dan tidak mengembalikan JSON (misal 500 HTML error)
@@ -64,6 +73,38 @@ class DiabetesApiClient {
         }
     }
 
+    /**
+     * Parsing header Server-Timing dari backend.
+     * Format: "validation;dur=0.120, model;dur=1.300, total;dur=5.200"
+     */
+    parseServerTiming(header) {
+        const timings = {};
+        if (!header) return timings;
+
+        header.split(',').forEach(entry => {
+            const [name, ...params] = entry.trim().split(';');
+            const dur = params.find(p => p.trim().startsWith('dur='));
+            if (name && dur) {
+                timings[name] = parseFloat(dur.trim().slice(4));
+            }
+        });
+        return timings;
+    }
+
+    /**
+     * Menampilkan rincian waktu backend per tahap di console browser
+     */
+    logServerTiming(method, endpoint, response) {
+        const timings = this.parseServerTiming(response.headers.get('Server-Timing'));
+        if (Object.keys(timings).length === 0) return;
+
+        const total = timings.total !== undefined ? `${timings.total.toFixed(1)} ms` : '-';
+        console.log(`⏱️ Backend [${method}] ${endpoint}: ${total}`);
+        if (this.debugTiming && console.table) {
+            console.table(timings);
+        }
+    }
+
     /**
      * CEK KONEKSI (Health Check)
      * UPDATE: Menggunakan endpoint /health yang sudah dibuat di run_app.py
@@ -94,6 +135,14 @@ class DiabetesApiClient {
         return this.request('/api/logs');
     }
 
+    /**
+     * CARI LOGS (filter: from, to, label, <fitur>_min/_max, page, page_size)
+     */
+    async searchLogs(filters = {}) {
+        const params = new URLSearchParams(filters);
+        return this.request(`/api/logs/search?${params}`);
+    }
+
     /**
      * GET MODEL INFO
      */
@@ -184,11 +184,28 @@ document.addEventListener('DOMContentLoaded', () => {
             });
         }
 
-        // Grafik Faktor Penyebab (Feature Importance)
+        // Grafik Faktor Penyebab
         const featList = document.getElementById('featList');
         featList.innerHTML = '';
         
-        if (res.feature_importance && res.feature_importance.length > 0) {
+        const explained = res.explanation && res.explanation.contributions;
+        if (explained && explained.length > 0) {
+            // Kontribusi khusus pasien ini (poin persen terhadap risiko dasar)
+            explained.forEach(f => {
+                const up = f.value > 0;
+                const barColor = up ? '#ef4444' : '#10b981';
+                featList.innerHTML += `
+                    <li>
+                        <span>${f.name}</span>
+                        <div style="display:flex; align-items:center; gap:10px;">
+                            <div style="width:100px; height:6px; background:#334155; border-radius:3px; overflow:hidden;">
+                                <div style="width:${Math.min(Math.abs(f.value), 100)}%; height:100%; background:${barColor};"></div>
+                            </div>
+                            <strong>${up ? '+' : ''}${f.value}%</strong>
+                        </div>
+                    </li>`;
+            });
+        } else if (res.feature_importance && res.feature_importance.length > 0) {
             res.feature_importance.forEach(f => {
                 featList.innerHTML += `
                     <li>
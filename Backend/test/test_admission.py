@@ -0,0 +1,155 @@
+"""
+Backend/test/test_admission.py
+Unit Test untuk admission control (batas konkurensi per kelas endpoint).
+Fokus: kelebihan request ditolak cepat (503 + Retry-After), antrian terbatas, prediksi didahulukan dari PDF,
+dan batas prediksi tidak memotong batch micro-batcher.
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import numpy as np
+from flask import Blueprint, Flask
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.routes import admission
+from Backend.models.inference import MicroBatcher
+from Backend.routes.admission import AdmissionController
+
+
+def test_limits_queue_and_priority():
+    print("\n🚦 TEST: Batas konkurensi, antrian & prioritas")
+    ctl = (AdmissionController()
+           .add_class('predict', limit=1, max_queue=1, max_wait_ms=2000, priority=1)
+           .add_class('report', limit=1))
+
+    assert ctl.acquire('predict') is None
+    # Slot penuh, antrian 1: request kedua menunggu, request ketiga langsung ditolak
+    waiter = {}
+    t = threading.Thread(target=lambda: waiter.setdefault('result', ctl.acquire('predict')))
+    t.start()
+    while ctl.stats()['predict']['waiting'] == 0:
+        time.sleep(0.001)
+    assert ctl.acquire('predict') == 'queue_full'
+
+    # Slot PDF kosong, tapi ada prediksi yang menunggu -> PDF ditolak
+    assert ctl.acquire('report') == 'queue_full'
+
+    ctl.release('predict')
+    t.join(timeout=5)
+    assert waiter['result'] is None
+    assert ctl.acquire('report') is None  # Tidak ada yang menunggu lagi
+
+    stats = ctl.stats()
+    assert stats['predict']['admitted'] == 2 and stats['predict']['rejected']['queue_full'] == 1
+    assert stats['report']['rejected']['queue_full'] == 1 and stats['report']['active'] == 1
+    assert stats['predict']['wait_ms_p99'] > 0
+    print("   ✅ Antrian terbatas & prediksi didahulukan")
+
+
+def test_wait_timeout():
+    ctl = AdmissionController().add_class('predict', limit=1, max_queue=4, max_wait_ms=30)
+    assert ctl.acquire('predict') is None
+    start = time.perf_counter()
+    assert ctl.acquire('predict') == 'timeout'
+    assert time.perf_counter() - start < 1.0
+    assert ctl.stats()['predict']['waiting'] == 0
+
+
+def test_flask_overflow_returns_503():
+    print("\n🚦 TEST: Overflow dijawab 503 + Retry-After, slot dilepas setelah request")
+    app = Flask(__name__)
+    bp = Blueprint('api', __name__, url_prefix='/api')
+    entered, release = threading.Event(), threading.Event()
+
+    @bp.route('/download-report', methods=['POST'])
+    def download_report():
+        entered.set()
+        release.wait(5)
+        return {'success': True}
+
+    app.register_blueprint(bp)
+    admission.init_admission(app)
+    admission._default_controller = AdmissionController().add_class('report', limit=1)
+    client = app.test_client()
+    try:
+        first = threading.Thread(target=lambda: client.post('/api/download-report'))
+        first.start()
+        entered.wait(5)
+
+        response = app.test_client().post('/api/download-report')
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == str(Config.ADMISSION_RETRY_AFTER)
+        assert response.get_json()['success'] is False
+
+        release.set()
+        first.join(timeout=5)
+        assert app.test_client().post('/api/download-report').status_code == 200
+        assert admission.get_controller().stats()['report']['active'] == 0
+    finally:
+        release.set()
+        admission._default_controller = None
+    print("   ✅ 503 cepat saat penuh, slot kembali setelah selesai")
+
+
+class _SlowBackend:
+    name = 'slow'
+
+    def predict_proba(self, X):
+        time.sleep(0.01)
+        return np.column_stack([X[:, 0], 1 - X[:, 0]])
+
+    def close(self):
+        pass
+
+
+def test_micro_batch_not_capped_by_admission():
+    print("\n🚦 TEST: Admission + micro-batching - batch tidak dipotong batas predict")
+    saved = (Config.MICRO_BATCH_ENABLED, Config.ADMISSION_PREDICT_CONCURRENCY, Config.MICRO_BATCH_MAX_SIZE)
+    Config.ADMISSION_PREDICT_CONCURRENCY, Config.MICRO_BATCH_MAX_SIZE = 2, 16
+    try:
+        Config.MICRO_BATCH_ENABLED = False
+        assert admission.build_controller().stats()['predict']['limit'] == 2
+        Config.MICRO_BATCH_ENABLED = True
+        ctl = admission.build_controller()
+        assert ctl.stats()['predict']['limit'] == 16
+
+        # 16 request bersamaan lewat admission -> micro-batcher -> batch besar, tanpa penolakan
+        batcher = MicroBatcher(_SlowBackend(), window_ms=20, max_batch=16)
+        barrier, results = threading.Barrier(16), [None] * 16
+
+        def request(i):
+            barrier.wait()
+            if ctl.acquire('predict') is None:
+                try:
+                    results[i] = batcher.predict_proba(np.full((1, len(Config.FEATURES)), i / 100.0), timeout=5)
+                finally:
+                    ctl.release('predict')
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+        batcher.close()
+        assert all(r is not None and abs(r[0, 0] - i / 100.0) < 1e-6 for i, r in enumerate(results))
+        stats = batcher.stats()
+        assert stats['avg_batch_size'] > 2, stats
+        assert ctl.stats()['predict']['rejected'] == {'queue_full': 0, 'timeout': 0}
+    finally:
+        Config.MICRO_BATCH_ENABLED, Config.ADMISSION_PREDICT_CONCURRENCY, Config.MICRO_BATCH_MAX_SIZE = saved
+    print(f"   ✅ Batas predict = ukuran batch, rata-rata batch {stats['avg_batch_size']}")
+
+
+if __name__ == "__main__":
+    test_limits_queue_and_priority()
+    test_wait_timeout()
+    test_flask_overflow_returns_503()
+    test_micro_batch_not_capped_by_admission()
@@ -1,7 +1,8 @@
 """
 Backend/test/test_api.py
 Script untuk menguji fungsi internal Backend (Validation, Model, Logging)
-tanpa perlu menjalankan server Flask.
+tanpa perlu menjalankan server Flask, plus instrumentasi waktu /api/predict
+(header Server-Timing & blok 'timings' mode debug) lewat Flask test client.
 """
 
 import sys
@@ -19,6 +20,7 @@ try:
     from Backend.config import Config
     from Backend.models.decision_tree_model import DiabetesModel
     from Backend.models.utils import validate_input_data, log_prediction
+    from Backend.models import prediction_log
     print("✅ Module imports successful")
 except ImportError as e:
     print(f"❌ Import Error: {e}")
@@ -112,8 +114,9 @@ def run_api_tests():
             
             log_prediction(sample_data, prediction_result)
             
-            if os.path.exists(Config.PREDICTION_LOG):
-                print(f"   ✅ Log saved successfully: {Config.PREDICTION_LOG}")
+            # Baris ditulis ke segmen worker; read_log() menggabungkan dengan log kanonik
+            if len(prediction_log.read_log()) > 0:
+                print(f"   ✅ Log saved successfully: {Config.LOG_SEGMENTS_DIR}")
             else:
                 print("   ❌ Log file was not created unexpectedly.")
         except Exception as e:
@@ -125,5 +128,76 @@ def run_api_tests():
     print("✅ ALL INTERNAL TESTS COMPLETED")
     print("=" * 70)
 
+# --------------------------------------------------
+# Instrumentasi waktu /api/predict (Backend/routes/timing.py)
+# --------------------------------------------------
+TIMING_SAMPLE = {
+    "age": 45, "gender": "Male", "pulse_rate": 72, "systolic_bp": 130, "diastolic_bp": 85,
+    "glucose": 150, "height": 170, "weight": 70, "bmi": 0, "family_diabetes": "Yes",
+    "hypertensive": "No", "family_hypertension": "No", "cardiovascular_disease": "No", "stroke": "No"
+}
+
+
+def _timing_client():
+    from flask import Flask
+    from Backend.models.registry import active_paths
+    from Backend.routes import api_routes
+    from Backend.routes.timing import init_timing
+
+    if not os.path.exists(active_paths()[0]):
+        print("   ⚠️ Model belum ada, test dilewati (jalankan Scripts/train_model.py)")
+        return None
+    app = Flask(__name__)
+    app.register_blueprint(api_routes.api_bp)
+    init_timing(app)
+    return app.test_client()
+
+
+def _server_timing(response) -> dict:
+    """'validation;dur=0.123, model;dur=1.500' -> {'validation': 0.123, 'model': 1.5}"""
+    stages = {}
+    for part in response.headers['Server-Timing'].split(','):
+        name, dur = part.strip().split(';dur=')
+        stages[name] = float(dur)
+    return stages
+
+
+def test_predict_server_timing():
+    print("\n⏱️ TEST: Header Server-Timing /api/predict")
+    client = _timing_client()
+    if client is None:
+        return
+    response = client.post('/api/predict', json=TIMING_SAMPLE)
+    assert response.status_code == 200 and response.get_json()['success']
+    stages = _server_timing(response)
+    for stage in ('validation', 'preprocessing', 'model', 'logging', 'total'):
+        assert stage in stages and stages[stage] >= 0, stages
+    # Urutan header mengikuti urutan tahap pipeline, total terakhir
+    names = list(stages)
+    assert names.index('validation') < names.index('preprocessing') < names.index('model') < names.index('logging')
+    assert names[-1] == 'total' and stages['total'] >= stages['model']
+    print(f"   ✅ Server-Timing: {response.headers['Server-Timing']}")
+
+
+def test_debug_timings_block():
+    print("\n⏱️ TEST: Blok 'timings' hanya pada mode debug")
+    client = _timing_client()
+    if client is None:
+        return
+    plain = client.post('/api/predict', json=TIMING_SAMPLE).get_json()
+    assert plain['success'] and 'timings' not in plain
+    assert 'timings' not in client.post('/api/predict?debug=0', json=TIMING_SAMPLE).get_json()
+
+    for response in (client.post('/api/predict?debug=1', json=TIMING_SAMPLE),
+                     client.post('/api/predict', json=TIMING_SAMPLE, headers={'X-Debug-Timing': '1'})):
+        data = response.get_json()
+        assert data['success'] and data['label'] == plain['label']
+        assert {'validation', 'preprocessing', 'model', 'logging', 'total'} <= set(data['timings'])
+        assert set(data['timings']) == set(_server_timing(response))
+    print("   ✅ 'timings' muncul dengan ?debug=1 / X-Debug-Timing: 1 saja")
+
+
 if __name__ == "__main__":
-    run_api_tests()
\ No newline at end of file
+    run_api_tests()
+    test_predict_server_timing()
+    test_debug_timings_block()
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Backend/test/test_assets.py
+Unit Test untuk penyajian aset statis hasil build (Backend/routes/assets.py) di folder static sementara.
+Fokus: lookup manifest, negosiasi varian .br/.gz (termasuk q=0), Cache-Control immutable,
+dan fallback ke URL/handler static biasa jika manifest belum dibuat.
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+from flask import Flask
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.routes import assets
+
+HASHED = 'css/app.0123abcd.css'
+BODIES = {'': b'body{color:red}', '.gz': b'GZIP-VARIANT', '.br': b'BROTLI-VARIANT'}
+
+
+def _static_dir(tmp: str, manifest: bool = True):
+    """static/ sementara: css/app.css asli + dist/ ber-hash dengan varian .gz & .br."""
+    os.makedirs(os.path.join(tmp, 'css'))
+    os.makedirs(os.path.join(tmp, 'dist', 'css'))
+    with open(os.path.join(tmp, 'css', 'app.css'), 'wb') as f:
+        f.write(BODIES[''])
+    for suffix, body in BODIES.items():
+        with open(os.path.join(tmp, 'dist', HASHED + suffix), 'wb') as f:
+            f.write(body)
+    if manifest:
+        with open(os.path.join(tmp, 'dist', 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump({'css/app.css': HASHED}, f)
+
+
+def _app(tmp: str):
+    app = Flask(__name__, static_folder=tmp, static_url_path='/static')
+    assets.init_assets(app)
+    return app
+
+
+class _TempManifest:
+    """Arahkan Config.ASSET_MANIFEST ke folder sementara & kosongkan cache manifest modul."""
+
+    def __init__(self, tmp: str):
+        self.path = os.path.join(tmp, 'dist', 'manifest.json')
+
+    def __enter__(self):
+        self.saved = Config.ASSET_MANIFEST
+        Config.ASSET_MANIFEST = self.path
+        assets._manifest, assets._manifest_mtime = {}, None
+        return self
+
+    def __exit__(self, *exc):
+        Config.ASSET_MANIFEST = self.saved
+        assets._manifest, assets._manifest_mtime = {}, None
+
+
+def test_manifest_lookup():
+    print("\n📦 TEST: asset_url dari manifest")
+    with tempfile.TemporaryDirectory() as tmp, _TempManifest(tmp):
+        _static_dir(tmp)
+        with _app(tmp).test_request_context():
+            assert assets.asset_url('css/app.css') == f'/static/dist/{HASHED}'
+            # Aset yang tidak ada di manifest -> URL static biasa
+            assert assets.asset_url('js/other.js') == '/static/js/other.js'
+    print("   ✅ Nama ber-hash dari manifest, sisanya URL biasa")
+
+
+def test_encoding_negotiation_and_cache():
+    print("\n📦 TEST: Negosiasi br/gzip & cache immutable")
+    with tempfile.TemporaryDirectory() as tmp, _TempManifest(tmp):
+        _static_dir(tmp)
+        client = _app(tmp).test_client()
+        url = f'/static/dist/{HASHED}'
+        cases = [
+            ('gzip, deflate, br', 'br', BODIES['.br']),
+            ('gzip', 'gzip', BODIES['.gz']),
+            ('br;q=0, gzip;q=0.8', 'gzip', BODIES['.gz']),  # br ditolak eksplisit
+            ('br;q=0, gzip;q=0', None, BODIES['']),
+            ('', None, BODIES['']),
+        ]
+        for accept, encoding, body in cases:
+            response = client.get(url, headers={'Accept-Encoding': accept})
+            assert response.status_code == 200, accept
+            assert response.headers.get('Content-Encoding') == encoding, accept
+            assert response.get_data() == body, accept
+            assert response.mimetype == 'text/css'
+            assert response.headers['Vary'] == 'Accept-Encoding'
+            assert response.headers['Cache-Control'] == \
+                f"public, max-age={Config.STATIC_CACHE_MAX_AGE}, immutable"
+            response.close()
+
+        # File di luar dist/ tidak ber-fingerprint -> tanpa immutable
+        plain = client.get('/static/css/app.css', headers={'Accept-Encoding': 'br, gzip'})
+        assert plain.status_code == 200 and 'immutable' not in plain.headers.get('Cache-Control', '')
+        assert 'Content-Encoding' not in plain.headers
+        plain.close()
+    print("   ✅ br > gzip > identitas, q=0 dihormati, dist/ immutable")
+
+
+def test_fallback_without_manifest():
+    print("\n📦 TEST: Tanpa manifest -> perilaku Flask standar")
+    with tempfile.TemporaryDirectory() as tmp, _TempManifest(tmp):
+        _static_dir(tmp, manifest=False)
+        app = _app(tmp)
+        with app.test_request_context():
+            assert assets.asset_url('css/app.css') == '/static/css/app.css'
+        response = app.test_client().get('/static/css/app.css')
+        assert response.status_code == 200 and response.get_data() == BODIES['']
+        response.close()
+
+        # Build dijalankan saat server hidup -> manifest baru terbaca tanpa restart
+        with open(os.path.join(tmp, 'dist', 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump({'css/app.css': HASHED}, f)
+        with app.test_request_context():
+            assert assets.asset_url('css/app.css') == f'/static/dist/{HASHED}'
+    print("   ✅ URL static biasa, manifest baru dipakai otomatis")
+
+
+if __name__ == "__main__":
+    test_manifest_lookup()
+    test_encoding_negotiation_and_cache()
+    test_fallback_without_manifest()
@@ -0,0 +1,61 @@
+"""
+Backend/test/test_backends.py
+Unit Test untuk backend model yang bisa dipilih saat training.
+Fokus: semua backend menghasilkan predict_proba di atas fitur Config.FEATURES & bobot fitur yang konsisten.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import backends
+
+
+def _data(n=400):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(n, len(Config.FEATURES))), columns=Config.FEATURES)
+    y = (X['glucose'] + 0.3 * X['bmi'] > 0).astype(int)
+    return X, y
+
+
+def test_all_backends_fit_and_predict():
+    print("\n🧩 TEST: Semua backend model")
+    X, y = _data()
+    for name in backends.list_backends():
+        model = backends.get_backend(name).build().fit(X, y)
+        proba = model.predict_proba(X.iloc[:5])
+        assert proba.shape == (5, 2)
+        assert np.allclose(proba.sum(axis=1), 1.0)
+
+        importances = backends.feature_importances(model)
+        if name == 'hist_gb':
+            assert importances is None
+        else:
+            assert len(importances) == len(Config.FEATURES)
+            assert abs(importances.sum() - 1.0) < 1e-9
+            # Fitur pembentuk target harus paling berpengaruh
+            assert Config.FEATURES[int(np.argmax(importances))] == 'glucose'
+        print(f"   ✅ {name}")
+
+
+def test_unknown_backend():
+    try:
+        backends.get_backend('svm')
+        raised = False
+    except backends.UnknownBackendError:
+        raised = True
+    assert raised
+    assert backends.get_backend(None).name == Config.MODEL_BACKEND
+
+
+if __name__ == "__main__":
+    test_all_backends_fit_and_predict()
+    test_unknown_backend()
@@ -0,0 +1,67 @@
+"""
+Backend/test/test_dataset.py
+Unit Test untuk loader dataset (Backend/models/dataset.py).
+Fokus: dtype ringkas sesuai deklarasi, nilai rusak -> NaN, dan hasil encode identik dengan pd.read_csv polos.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.models import dataset
+from Backend.models.preprocess import DiabetesPreprocessor
+
+CSV = (
+    "age,gender,pulse_rate,systolic_bp,diastolic_bp,glucose,height,weight,bmi,"
+    "family_diabetes,hypertensive,family_hypertension,cardiovascular_disease,stroke,diabetic\n"
+    "45,Male,72,130,85,6.2,1.70,70,24.2,1,0,0,0,0,No\n"
+    "le,Female,80,120,80,5.1,1.60,55,21.5,0,1,0,0,0,No\n"
+    "60,Female,88,150,95,9.8,1.55,68,28.3,1,1,0,1,1,Yes\n"
+)
+
+
+def _write(tmp):
+    path = os.path.join(tmp, 'mini.csv')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(CSV)
+    return path
+
+
+def test_declared_dtypes_and_coercion():
+    print("\n📦 TEST: Dtype deklarasi & nilai rusak")
+    with tempfile.TemporaryDirectory() as tmp:
+        df = dataset.load_dataset(_write(tmp), kind='raw')
+    assert len(df) == 3
+    assert df['age'].dtype == np.float32
+    assert isinstance(df['gender'].dtype, pd.CategoricalDtype)
+    assert np.isnan(df['age'].iloc[1])
+    print("   ✅ float32/category dipakai, 'le' menjadi NaN")
+
+
+def test_chunks_match_plain_read():
+    print("\n📦 TEST: Chunk digabung = pd.read_csv polos setelah encode")
+    pp = DiabetesPreprocessor()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp)
+        expected = pp.clean_and_encode(pd.read_csv(path), is_training=True)
+        chunks = list(dataset.iter_dataset(path, kind='raw', chunksize=1))
+        merged = dataset.concat_chunks(chunks)
+    assert isinstance(merged['gender'].dtype, pd.CategoricalDtype)
+    got = pp.clean_and_encode(merged, is_training=True)
+    pd.testing.assert_frame_equal(got.reset_index(drop=True), expected.reset_index(drop=True),
+                                  check_dtype=False)
+    print("   ✅ Hasil encode identik")
+
+
+if __name__ == "__main__":
+    test_declared_dtypes_and_coercion()
+    test_chunks_match_plain_read()
@@ -0,0 +1,74 @@
+"""
+Backend/test/test_distill.py
+Unit Test untuk distilasi ensemble terkalibrasi menjadi satu pohon.
+Fokus: murid meniru probabilitas guru, penjelasan tetap aditif, dan versi distilasi bisa ditemukan di registry.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import backends, distill, registry
+from Backend.models.bundle import load_model_bundle
+from Backend.models.explain import PathExplainer
+from Backend.models.preprocess import PREPROCESS_VERSION, DiabetesFeatureTransformer
+
+
+def _teacher():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(1500, len(Config.FEATURES))), columns=Config.FEATURES)
+    y = ((X['glucose'] + 0.5 * X['bmi'] + 0.3 * rng.normal(size=len(X))) > 0.5).astype(int)
+    model = backends.get_backend('calibrated_tree').build().fit(X, y)
+    return model, X, y
+
+
+def test_student_mimics_teacher():
+    print("\n🧪 TEST: Distilasi ensemble -> satu pohon")
+    teacher, X, y = _teacher()
+    student = distill.distill(teacher, X.iloc[:1000])
+
+    report = distill.compare(teacher, student, X.iloc[1000:], y.iloc[1000:], latency=False)
+    assert report['label_agreement'] >= 0.95
+    assert report['delta_pp']['mean_abs'] < 3.0
+    assert abs(report['metrics']['student']['roc_auc'] - report['metrics']['teacher']['roc_auc']) < 0.05
+
+    # Penjelasan decision path: base + kontribusi == probabilitas murid
+    explainer = PathExplainer.from_model(student)
+    probs, contrib = explainer.explain(X.iloc[:20])
+    assert np.allclose(probs, student.predict_proba(X.iloc[:20])[:, 1])
+    assert np.allclose(explainer.base_value + contrib.sum(axis=1), probs)
+    print(f"   ✅ Sepakat {report['label_agreement']:.2%}, selisih rata-rata {report['delta_pp']['mean_abs']} pp")
+
+
+def test_registered_distilled_version():
+    print("\n🧪 TEST: Versi distilasi di registry")
+    teacher, X, y = _teacher()
+    bundle = {'model': teacher, 'preprocessor': DiabetesFeatureTransformer().fit(),
+              'preprocess_version': PREPROCESS_VERSION, 'algorithm': 'Calibrated Decision Tree (Entropy)'}
+    with tempfile.TemporaryDirectory() as root:
+        v1 = registry.register(bundle, {'accuracy_cv': 0.9}, root)
+        v2, report = distill.register_distilled(bundle, v1, X, y, {'accuracy_cv': 0.9}, root=root)
+
+        assert distill.find_distilled(v1, root) == v2
+        meta = registry.read_meta(v2, root)
+        assert meta['distilled_from'] == v1 and 'accuracy_cv' not in meta
+        loaded = load_model_bundle(registry.version_paths(v2, root)[0])
+        assert loaded['backend'] == distill.DISTILLED_BACKEND
+        assert report['label_agreement'] >= 0.95
+        assert np.allclose(loaded['model'].predict_proba(X.iloc[:5]),
+                           distill.distill(teacher, X).predict_proba(X.iloc[:5]))
+        print(f"   ✅ {v2} distilled_from {v1}")
+
+
+if __name__ == "__main__":
+    test_student_mimics_teacher()
+    test_registered_distilled_version()
@@ -0,0 +1,129 @@
+"""
+Backend/test/test_drift.py
+Unit Test untuk monitor drift fitur (DriftMonitor).
+Fokus: PSI rendah untuk distribusi yang sama, tinggi jika bergeser, momen berjalan akurat,
+referensi bisa dibangun dari dataset mentah, dan /api/drift tanpa referensi -> 404 + panduan.
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models.drift import DriftMonitor, build_reference
+
+BINARY = {'gender', 'family_diabetes', 'hypertensive', 'family_hypertension',
+          'cardiovascular_disease', 'stroke'}
+
+
+def _patients(n, seed, glucose_shift=0.0):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for name in Config.FEATURES:
+        if name in BINARY:
+            data[name] = rng.integers(0, 2, size=n).astype(np.float32)
+        else:
+            data[name] = rng.normal(50, 10, size=n).astype(np.float32)
+    data['glucose'] = data['glucose'] + glucose_shift
+    return pd.DataFrame(data)[Config.FEATURES]
+
+
+def test_psi_stable_vs_shifted():
+    print("\n📐 TEST: PSI distribusi sama vs bergeser")
+    reference = build_reference(_patients(5000, seed=0))
+
+    same = DriftMonitor(reference, decay_window=0)
+    same.update(_patients(2000, seed=1))
+    report = same.report()
+    assert report['drifted_features'] == []
+    assert report['features']['glucose']['psi'] < Config.DRIFT_PSI_WARN
+
+    shifted = DriftMonitor(reference, decay_window=0)
+    shifted.update(_patients(2000, seed=1, glucose_shift=15))
+    report = shifted.report()
+    glucose = report['features']['glucose']
+    assert report['drifted_features'] == ['glucose']
+    assert glucose['ks'] > glucose['ks_critical']
+    print(f"   ✅ PSI glukosa: stabil vs bergeser {glucose['psi']}")
+
+
+def test_incremental_matches_batch():
+    print("\n📐 TEST: Update per baris == update batch")
+    X = _patients(300, seed=2)
+    reference = build_reference(_patients(1000, seed=3))
+
+    batch = DriftMonitor(reference, decay_window=0)
+    batch.update(X)
+    single = DriftMonitor(reference, decay_window=0)
+    for i in range(len(X)):
+        single.update(X.iloc[[i]])
+
+    np.testing.assert_array_equal(batch.counts, single.counts)
+    np.testing.assert_allclose(single.mean, X.to_numpy(np.float64).mean(axis=0), rtol=1e-9)
+    np.testing.assert_allclose(np.sqrt(single.m2 / single.n), X.to_numpy(np.float64).std(axis=0), rtol=1e-9)
+    print("   ✅ Histogram & momen identik")
+
+
+def test_reference_from_raw_when_balanced_missing():
+    print("\n[3] Referensi drift dari dataset mentah jika dataset balanced belum ada")
+    from Scripts import build_drift_reference
+
+    if not os.path.exists(Config.RAW_DATA):
+        print("   ⚠️ Dataset mentah tidak ada, test dilewati")
+        return
+    saved = Config.BALANCED_DATA
+    with tempfile.TemporaryDirectory() as tmp:
+        Config.BALANCED_DATA = os.path.join(tmp, 'tidak-ada.csv')
+        output = os.path.join(tmp, 'drift_reference.json')
+        try:
+            assert build_drift_reference.main(argparse.Namespace(source='auto', bins=None, output=output))
+        finally:
+            Config.BALANCED_DATA = saved
+        with open(output, 'r', encoding='utf-8') as f:
+            reference = json.load(f)
+    assert reference['source'] == os.path.basename(Config.RAW_DATA)
+    assert set(reference['features']) == set(Config.FEATURES)
+    # Referensi langsung bisa dipakai monitor
+    DriftMonitor(reference).update(_patients(10, seed=5))
+    print(f"   ✅ Referensi dari {reference['source']}")
+
+
+def test_drift_endpoint_without_reference():
+    print("\n[4] /api/drift tanpa referensi -> 404 dengan panduan")
+    from flask import Flask
+    from Backend.routes import api_routes
+
+    app = Flask(__name__)
+    app.register_blueprint(api_routes.api_bp)
+    client = app.test_client()
+    saved = api_routes.drift_monitor
+    try:
+        api_routes.drift_monitor = None
+        response = client.get('/api/drift')
+        assert response.status_code == 404
+        assert 'Scripts/build_drift_reference.py' in response.get_json()['error']
+
+        api_routes.drift_monitor = DriftMonitor(build_reference(_patients(500, seed=6)))
+        response = client.get('/api/drift')
+        assert response.status_code == 200 and response.get_json()['success']
+    finally:
+        api_routes.drift_monitor = saved
+    print("   ✅ 404 + langkah membuat referensi, 200 setelah referensi ada")
+
+
+if __name__ == "__main__":
+    test_psi_stable_vs_shifted()
+    test_incremental_matches_batch()
+    test_reference_from_raw_when_balanced_missing()
+    test_drift_endpoint_without_reference()
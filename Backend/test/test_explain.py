@@ -0,0 +1,144 @@
+"""
+Backend/test/test_explain.py
+Unit Test untuk penjelasan per-pasien (PathExplainer).
+Fokus: base_value + kontribusi == probabilitas model, untuk batch maupun satu pasien,
+dan /api/predict dengan cascade mengembalikan probabilitas model yang dijelaskan.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models.explain import PathExplainer
+
+
+def _synthetic_data(n=600, seed=0):
+    """Data acak dengan label yang bergantung pada 2 fitur (glucose & bmi)."""
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, len(Config.FEATURES))) * 10 + 50, columns=Config.FEATURES)
+    y = ((X['glucose'] + X['bmi'] + rng.normal(scale=5, size=n)) > 100).astype(int)
+    return X, y
+
+
+def _calibrated_tree(X, y):
+    pipeline = Pipeline([
+        ('scaler', StandardScaler()),
+        ('dt', DecisionTreeClassifier(max_depth=5, min_samples_leaf=5, random_state=42)),
+    ])
+    return CalibratedClassifierCV(pipeline, method='sigmoid', cv=3).fit(X, y)
+
+
+def test_explanation_sums_to_model_probability():
+    print("\n[1] Kontribusi + base_value == probabilitas model (batch)")
+    X, y = _synthetic_data()
+    model = _calibrated_tree(X, y)
+    explainer = PathExplainer.from_model(model)
+    assert explainer is not None
+
+    probs, contrib = explainer.explain(X)
+    expected = model.predict_proba(X)[:, 1]
+
+    assert contrib.shape == (len(X), len(Config.FEATURES))
+    assert np.allclose(probs, expected, atol=1e-9)
+    assert np.allclose(explainer.base_value + contrib.sum(axis=1), probs, atol=1e-9)
+    print(f"   ✅ {len(X)} baris, selisih maks {np.abs(probs - expected).max():.2e}")
+
+
+def test_explanation_uses_informative_features():
+    print("\n[2] Fitur dominan penjelasan = fitur yang menentukan label")
+    X, y = _synthetic_data()
+    explainer = PathExplainer.from_model(_calibrated_tree(X, y))
+
+    _, contrib = explainer.explain(X)
+    mean_abs = pd.Series(np.abs(contrib).mean(axis=0), index=Config.FEATURES)
+    top_two = set(mean_abs.nlargest(2).index)
+
+    assert top_two == {'glucose', 'bmi'}
+    print(f"   ✅ Dua fitur teratas: {sorted(top_two)}")
+
+
+def test_explain_one_format_and_plain_tree():
+    print("\n[3] Format explain_one & dukungan pohon tanpa kalibrasi")
+    X, y = _synthetic_data()
+    tree = DecisionTreeClassifier(max_depth=4, random_state=0).fit(X, y)
+    explainer = PathExplainer.from_model(tree)
+
+    result = explainer.explain_one(X.iloc[[0]], k=3)
+    assert set(result) == {'base_percent', 'probability_percent', 'contributions'}
+    assert len(result['contributions']) <= 3
+    assert abs(result['probability_percent'] - tree.predict_proba(X.iloc[[0]])[0, 1] * 100) < 0.01
+    for item in result['contributions']:
+        assert item['direction'] == ('naik' if item['value'] > 0 else 'turun')
+
+    # Model tanpa struktur pohon tidak didukung -> None (endpoint melewati penjelasan)
+    assert PathExplainer.from_model(object()) is None
+    print(f"   ✅ {result}")
+
+
+class _ConstantStage:
+    """Tahap-1 palsu yang selalu yakin (di luar band cascade -> tidak pernah eskalasi)."""
+
+    def predict_proba(self, frame):
+        return np.tile([0.01, 0.99], (len(frame), 1))
+
+
+def test_predict_cascade_matches_explanation():
+    print("\n[4] /api/predict + cascade: probabilitas = model penuh yang dijelaskan")
+    from flask import Flask
+    from Backend.models.inference import CascadeInference, DirectInference
+    from Backend.models.registry import active_paths
+    from Backend.routes import api_routes
+
+    if not os.path.exists(active_paths()[0]):
+        print("   ⚠️ Model belum ada, test dilewati (jalankan Scripts/train_model.py)")
+        return
+    if api_routes.model is None:
+        api_routes.load_model_resources()
+    if api_routes.explainer is None:
+        print("   ⚠️ Model aktif tidak bisa dijelaskan, test dilewati")
+        return
+    sample = {"age": 35, "gender": "Female", "pulse_rate": 60, "systolic_bp": 125, "diastolic_bp": 68,
+              "glucose": 5.71, "height": 1.47, "weight": 42.5, "bmi": 19.58, "family_diabetes": 0,
+              "hypertensive": 0, "family_hypertension": 0, "cardiovascular_disease": 0, "stroke": 0}
+    full = DirectInference(api_routes.model)
+    expected = round(float(full.predict_proba(api_routes.preprocessor.transform(sample))[0][1]) * 100, 2)
+    assert expected != 99.0
+
+    app = Flask(__name__)
+    app.register_blueprint(api_routes.api_bp)
+    client = app.test_client()
+    saved = (api_routes.inference, api_routes.explainer)
+    try:
+        api_routes.inference = CascadeInference(_ConstantStage(), full, band=0.15)
+        data = client.post('/api/predict', json=sample).get_json()
+        assert data['success']
+        assert data['probability_percent'] == data['explanation']['probability_percent'] == expected
+        assert data['label'] == ('Diabetic' if expected > 50 else 'Non-Diabetic')
+
+        # Tanpa penjelasan: hasil tahap-1 cascade dipakai apa adanya
+        api_routes.explainer = None
+        data = client.post('/api/predict', json=sample).get_json()
+        assert data['probability_percent'] == 99.0 and data['explanation'] is None
+    finally:
+        api_routes.inference, api_routes.explainer = saved
+    print(f"   ✅ Probabilitas {expected}% = penjelasan, bukan tahap-1 (99%)")
+
+
+if __name__ == "__main__":
+    test_explanation_sums_to_model_probability()
+    test_explanation_uses_informative_features()
+    test_explain_one_format_and_plain_tree()
+    test_predict_cascade_matches_explanation()
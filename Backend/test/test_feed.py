@@ -0,0 +1,235 @@
+"""
+Backend/test/test_feed.py
+Unit Test untuk feed live prediksi (ring buffer + SSE /api/logs/stream).
+Fokus: buffer terbatas tanpa entri ganda, lanjut dari Last-Event-ID, tailer membaca segmen worker lain,
+endpoint SSE mengirim event prediksi lalu menutup koneksi tepat waktu, dan fan-out tanpa CORS wildcard
+yang tetap melayani pelanggan walau lock feed sedang dipegang.
+"""
+
+import os
+import sys
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+
+from flask import Flask
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import feed as feed_module
+from Backend.models.feed import PredictionFeed
+from Backend.models.prediction_log import SegmentMerger, SegmentWriter
+from Backend.routes.feed_server import STREAM_PATH, FeedServer
+
+
+def _row(second: int, i: int):
+    row = {f: i for f in Config.FEATURES}
+    row.update({'timestamp': f"2026-01-01 10:{second // 60:02d}:{second % 60:02d}",
+                'prediction': 'Diabetic' if i % 2 else 'Non-Diabetic', 'probability': f"{i}.00%"})
+    return row
+
+
+def test_buffer_cursor_and_tailer():
+    print("\n📡 TEST: Ring buffer, Last-Event-ID & tailer segmen worker lain")
+    with tempfile.TemporaryDirectory() as tmp:
+        seg_dir, log_path = os.path.join(tmp, 'segments'), os.path.join(tmp, 'prediction_logs.csv')
+        merger = SegmentMerger(seg_dir, log_path, grace_seconds=0)
+
+        # Riwayat awal: sebagian sudah di log kanonik, sebagian masih di segmen
+        merged = SegmentWriter(seg_dir)
+        for i in range(6):
+            merged.write_row(_row(i, i))
+        merger.merge()
+        merged.close()
+        other = SegmentWriter(seg_dir)
+        other.pid = 999999  # "worker lain" (bukan prefix segmen proses ini), tidak digabung lagi di test ini
+        for i in range(6, 8):
+            other.write_row(_row(i, i))
+
+        feed = PredictionFeed(size=5, merger=merger)
+        recent = feed.recent(100)
+        assert [r['age'] for r in recent] == [7, 6, 5, 4, 3]  # terbaru dulu, dibatasi ukuran buffer
+        assert isinstance(recent[0]['glucose'], int)
+
+        # Entri lokal: id ganda diabaikan
+        cursor = feed.cursor()
+        feed.publish('seg-local:0', _row(10, 10))
+        feed.publish('seg-local:0', _row(10, 10))
+        events, cursor = feed.wait(cursor, timeout=0)
+        assert len(events) == 1 and events[0][0] == '2026-01-01 10:00:10@seg-local:0'
+
+        # Tailer: baris baru worker lain masuk tanpa membaca ulang log
+        other.write_row(_row(11, 11))
+        assert feed.poll() == 1 and feed.poll() == 0
+        events, cursor = feed.wait(cursor, timeout=0)
+        assert [row['age'] for _, row in events] == [11]
+
+        # Last-Event-ID dikenal -> lanjut setelahnya; tidak dikenal -> mulai dari timestamp-nya
+        assert feed.wait(feed.cursor(events[0][0]), timeout=0)[0] == []
+        replay, _ = feed.wait(feed.cursor('2026-01-01 10:00:10@seg-lain:5'), timeout=0)
+        assert [row['age'] for _, row in replay] == [10, 11]
+
+        # Pelanggan yang menunggu dibangunkan oleh publish dari thread lain
+        timer = threading.Timer(0.05, feed.publish, args=('seg-local:99', _row(12, 12)))
+        timer.start()
+        events, _ = feed.wait(cursor, timeout=5)
+        assert [row['age'] for _, row in events] == [12]
+        other.close()
+    print("   ✅ Buffer terbatas, tanpa ganda, reconnect melanjutkan dari id terakhir")
+
+
+def test_stream_endpoint():
+    print("\n📡 TEST: SSE /api/logs/stream")
+    from Backend.routes import api_routes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        merger = SegmentMerger(os.path.join(tmp, 'segments'), os.path.join(tmp, 'prediction_logs.csv'))
+        feed = PredictionFeed(size=10, merger=merger)
+        saved = (feed_module._feed.copy(), Config.FEED_STREAM_SECONDS, Config.FEED_HEARTBEAT_SECONDS)
+        feed_module._feed.update(pid=os.getpid(), feed=feed)
+        Config.FEED_STREAM_SECONDS, Config.FEED_HEARTBEAT_SECONDS = 0.5, 0.1
+        try:
+            app = Flask(__name__)
+            app.register_blueprint(api_routes.api_bp)
+            client = app.test_client()
+
+            feed.publish('seg-a:0', _row(1, 1))
+            first_id = feed.last_id()
+            feed.publish('seg-a:100', _row(2, 2))
+
+            logs = client.get('/api/logs').get_json()
+            assert [r['age'] for r in logs['logs']] == [2, 1] and logs['last_id'] == feed.last_id()
+
+            # Reconnect dengan Last-Event-ID: hanya entri setelahnya, lalu heartbeat, lalu ditutup
+            response = client.get('/api/logs/stream', headers={'Last-Event-ID': first_id})
+            assert response.mimetype == 'text/event-stream'
+            assert response.headers['Cache-Control'] == 'no-cache'
+            body = response.get_data(as_text=True)
+            assert body.startswith(f"retry: {Config.FEED_RETRY_MS}\n\n")
+            assert body.count('event: prediction') == 1 and '"age": 2' in body
+            assert f"id: {feed.last_id()}\n" in body and ': ping' in body
+        finally:
+            feed_module._feed.clear()
+            feed_module._feed.update(saved[0])
+            Config.FEED_STREAM_SECONDS, Config.FEED_HEARTBEAT_SECONDS = saved[1], saved[2]
+    print("   ✅ Event prediksi, heartbeat & batas umur koneksi")
+
+
+async def _open_stream(port: int, headers: str = '') -> tuple:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"GET {STREAM_PATH} HTTP/1.1\r\nHost: x\r\n{headers}\r\n".encode())
+    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 5)
+    return reader, writer, head.decode()
+
+
+async def _read_event(reader) -> str:
+    while True:
+        block = (await asyncio.wait_for(reader.readuntil(b'\n\n'), 5)).decode()
+        if 'event: prediction' in block:
+            return block
+
+
+def test_fanout_server_idle_subscribers():
+    print("\n📡 TEST: Fan-out SSE asyncio - banyak pelanggan diam tanpa thread per pelanggan")
+
+    async def scenario(seg_dir, merger):
+        other = SegmentWriter(seg_dir)
+        other.pid = 999999
+        server = FeedServer(PredictionFeed(size=50, merger=merger), max_clients=60,
+                            poll_seconds=0.02, heartbeat_seconds=0.2)
+        listener = await server.start('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        threads_before = threading.active_count()
+
+        clients = [await _open_stream(port) for _ in range(60)]
+        assert all(head.startswith('HTTP/1.1 200') and 'text/event-stream' in head for _, _, head in clients)
+        await asyncio.sleep(0.5)  # Semua diam (hanya heartbeat)
+        assert server.clients == 60
+        assert threading.active_count() - threads_before < 10  # Bukan satu thread per pelanggan
+
+        # Kapasitas penuh -> 503 cepat
+        _, extra, head = await _open_stream(port)
+        assert head.startswith('HTTP/1.1 503') and 'Retry-After' in head
+        extra.close()
+
+        # Satu prediksi di segmen worker -> semua pelanggan menerima event yang sama
+        other.write_row(_row(1, 1))
+        events = await asyncio.gather(*(_read_event(r) for r, _, _ in clients))
+        assert len(set(events)) == 1 and '"age": 1' in events[0]
+        first_id = events[0].split('id: ', 1)[1].split('\n', 1)[0]
+        for _, w, _ in clients:
+            w.close()
+        for _ in range(200):  # Koneksi ditutup klien -> slot bebas tanpa menunggu heartbeat
+            if server.clients == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert server.clients == 0
+
+        # Reconnect dengan Last-Event-ID: hanya entri setelahnya
+        other.write_row(_row(2, 2))
+        reader, writer, _ = await _open_stream(port, f"Last-Event-ID: {first_id}\r\n")
+        assert '"age": 2' in await _read_event(reader)
+        writer.close()
+
+        # Path lain -> 404
+        r, w = await asyncio.open_connection('127.0.0.1', port)
+        w.write(b"GET /api/predict HTTP/1.1\r\n\r\n")
+        assert (await asyncio.wait_for(r.readline(), 5)).startswith(b'HTTP/1.1 404')
+        w.close()
+
+        # CORS: tanpa wildcard; hanya origin yang dikonfigurasi yang di-echo
+        assert 'Access-Control-Allow-Origin' not in head
+        saved_origin = Config.FEED_SERVER_ALLOW_ORIGIN
+        Config.FEED_SERVER_ALLOW_ORIGIN = 'https://rs.example'
+        try:
+            for origin, allowed in (('https://rs.example', True), ('https://lain.example', False)):
+                _, w, head = await _open_stream(port, f"Origin: {origin}\r\n")
+                assert ('Access-Control-Allow-Origin: https://rs.example' in head) is allowed
+                assert '*' not in head
+                w.close()
+        finally:
+            Config.FEED_SERVER_ALLOW_ORIGIN = saved_origin
+
+        # Lock feed dipegang thread lain (tailer/poll lambat): event loop tetap melayani pelanggan
+        reader, writer, _ = await _open_stream(port)
+        held, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with server.feed._cond:
+                held.set()
+                release.wait(5)
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait(5)
+        try:
+            r, w = await asyncio.open_connection('127.0.0.1', port)
+            w.write(b"GET /health HTTP/1.1\r\n\r\n")
+            assert (await asyncio.wait_for(r.readline(), 1)).startswith(b'HTTP/1.1 200')
+            w.close()
+            assert (await asyncio.wait_for(reader.readuntil(b'\n\n'), 1)).startswith(b'retry:')
+            assert (await asyncio.wait_for(reader.readuntil(b'\n\n'), 1)).startswith(b': ping')
+        finally:
+            release.set()
+            holder.join()
+        writer.close()
+
+        listener.close()
+        server._poller.cancel()
+        other.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seg_dir = os.path.join(tmp, 'segments')
+        merger = SegmentMerger(seg_dir, os.path.join(tmp, 'prediction_logs.csv'))
+        asyncio.run(scenario(seg_dir, merger))
+    print("   ✅ 60 pelanggan diam di satu event loop, event tersebar ke semua, 503 saat penuh")
+
+
+if __name__ == "__main__":
+    test_buffer_cursor_and_tailer()
+    test_stream_endpoint()
+    test_fanout_server_idle_subscribers()
@@ -0,0 +1,154 @@
+"""
+Backend/test/test_gunicorn_conf.py
+Unit Test untuk profil produksi gunicorn.conf.py.
+Fokus: ukuran worker/thread (default & override environment), recycling max_requests + jitter,
+nilai lolos validasi setting gunicorn, dan hook post_fork (warmup + kompaktor log) per worker.
+"""
+
+import os
+import sys
+import importlib.util
+import multiprocessing
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import log_store
+from Backend.routes import api_routes
+
+CONF_PATH = project_root / 'gunicorn.conf.py'
+ENV_KEYS = ('GUNICORN_WORKERS', 'GUNICORN_THREADS', 'GUNICORN_MAX_REQUESTS', 'GUNICORN_MAX_REQUESTS_JITTER',
+            'GUNICORN_PRELOAD', 'GUNICORN_WARMUP_ROUNDS', 'FEED_SERVER_PORT')
+
+
+def _load_conf(**env):
+    """Muat gunicorn.conf.py sebagai modul baru dengan environment sementara."""
+    saved = {k: os.environ.get(k) for k in ENV_KEYS}
+    for key in ENV_KEYS:
+        os.environ.pop(key, None)
+    os.environ.update({k: str(v) for k, v in env.items()})
+    try:
+        spec = importlib.util.spec_from_file_location('gunicorn_conf_under_test', CONF_PATH)
+        conf = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(conf)
+        return conf
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class FakeLog:
+    def __init__(self):
+        self.lines = []
+
+    def info(self, msg):
+        self.lines.append(('info', msg))
+
+    def warning(self, msg):
+        self.lines.append(('warning', msg))
+
+
+class FakeServer:
+    def __init__(self):
+        self.log = FakeLog()
+
+
+class FakeWorker:
+    pid = 4242
+
+
+def test_sizing_and_recycling():
+    print("\n🦄 TEST: Ukuran worker/thread & recycling")
+    conf = _load_conf()
+    cpus = multiprocessing.cpu_count()
+    assert conf.worker_class == 'gthread' and conf.preload_app
+    assert conf.workers == max(2, min(cpus + 1, 8))
+    if Config.ADMISSION_ENABLED:
+        from Backend.routes.admission import build_controller
+        assert conf.threads == max(4, build_controller().capacity())
+    else:
+        assert conf.threads == 4
+    assert (conf.max_requests, conf.max_requests_jitter) == (2000, 200)
+    assert 0 < conf.max_requests_jitter < conf.max_requests
+    assert conf.FEED_SERVER_PORT == 0 and conf.WARMUP_ROUNDS is None
+
+    conf = _load_conf(GUNICORN_WORKERS=3, GUNICORN_THREADS=7, GUNICORN_MAX_REQUESTS=50,
+                      GUNICORN_MAX_REQUESTS_JITTER=5, GUNICORN_PRELOAD=0, GUNICORN_WARMUP_ROUNDS=2)
+    assert (conf.workers, conf.threads) == (3, 7)
+    assert (conf.max_requests, conf.max_requests_jitter) == (50, 5)
+    assert not conf.preload_app and conf.WARMUP_ROUNDS == 2
+    print(f"   ✅ Default {conf.workers} worker x {conf.threads} thread via env, recycle 50±5")
+
+
+def test_settings_accepted_by_gunicorn():
+    print("\n🦄 TEST: Nilai lolos validasi setting gunicorn")
+    try:
+        from gunicorn.config import Config as GunicornConfig
+    except ImportError:
+        print("   ⚠️ gunicorn belum terinstall, test dilewati")
+        return
+    conf = _load_conf()
+    cfg = GunicornConfig()
+    applied = []
+    for name in cfg.settings:
+        if hasattr(conf, name):
+            cfg.set(name, getattr(conf, name))  # validator gunicorn (tipe, arity hook)
+            applied.append(name)
+    for name in ('workers', 'threads', 'max_requests', 'max_requests_jitter', 'preload_app', 'post_fork'):
+        assert name in applied
+    assert cfg.workers == conf.workers and cfg.threads == conf.threads
+    assert cfg.post_fork is conf.post_fork
+    print(f"   ✅ {len(applied)} setting diterima gunicorn")
+
+
+def test_post_fork_warmup_wiring():
+    print("\n🦄 TEST: post_fork -> warmup model + kompaktor log")
+    conf = _load_conf(GUNICORN_WARMUP_ROUNDS=3)
+    saved = (api_routes.warmup_model, log_store.start_compactor)
+    calls = []
+
+    def start_compactor(interval=None):
+        calls.append('compactor')
+
+    def warmup(rounds=None):
+        calls.append(('warmup', rounds))
+        return [1.5, 1.2, 1.1]
+
+    try:
+        log_store.start_compactor = start_compactor
+        api_routes.warmup_model = warmup
+        server = FakeServer()
+        conf.post_fork(server, FakeWorker())
+        assert calls == [('warmup', 3), 'compactor']
+        assert server.log.lines[0][0] == 'info' and '4242' in server.log.lines[0][1]
+
+        # Model belum ada / warmup gagal: worker tetap jalan, kompaktor tetap dimulai
+        calls.clear()
+        api_routes.warmup_model = lambda rounds=None: []
+        server = FakeServer()
+        conf.post_fork(server, FakeWorker())
+        assert calls == ['compactor'] and server.log.lines[0][0] == 'warning'
+
+        def failing(rounds=None):
+            raise RuntimeError('bundle rusak')
+        calls.clear()
+        api_routes.warmup_model = failing
+        server = FakeServer()
+        conf.post_fork(server, FakeWorker())
+        assert calls == ['compactor'] and 'bundle rusak' in server.log.lines[0][1]
+    finally:
+        api_routes.warmup_model, log_store.start_compactor = saved
+    print("   ✅ Warmup per worker dengan GUNICORN_WARMUP_ROUNDS, kegagalan hanya dicatat")
+
+
+if __name__ == "__main__":
+    test_sizing_and_recycling()
+    test_settings_accepted_by_gunicorn()
+    test_post_fork_warmup_wiring()
@@ -0,0 +1,56 @@
+"""
+Backend/test/test_http_cache.py
+Unit Test untuk utilitas cache HTTP (Backend/routes/http_cache.py).
+Fokus: kompresi gzip ber-memo tidak pernah mengirim body lain walau ETag & panjangnya sama,
+ETag weak untuk varian gzip, dan 304 untuk If-None-Match yang cocok.
+"""
+
+import sys
+import gzip
+from pathlib import Path
+
+from flask import Flask, Response
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.routes import http_cache
+from Backend.routes.http_cache import etag_matches, init_compression, not_modified
+
+
+def test_gzip_memo_keyed_by_body():
+    print("\n🗜️ TEST: Memo gzip - ETag & panjang sama, body berbeda")
+    size = max(Config.GZIP_MIN_SIZE, 1024)
+    bodies = [b'a' * size, b'b' * size]
+    state = {'body': bodies[0]}
+
+    app = Flask(__name__)
+    init_compression(app)
+
+    @app.route('/data')
+    def data():
+        if etag_matches('v1'):
+            return not_modified('v1')
+        response = Response(state['body'], mimetype='text/plain')
+        response.set_etag('v1')  # ETag versi, bukan dari konten
+        return response
+
+    client = app.test_client()
+    http_cache._gzip_memo.clear()
+    for body in bodies + bodies:
+        state['body'] = body
+        response = client.get('/data', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['ETag'] == 'W/"v1"'
+        assert gzip.decompress(response.get_data()) == body
+    assert len(http_cache._gzip_memo) == 2  # Permintaan ulang memakai memo
+
+    assert client.get('/data', headers={'If-None-Match': 'W/"v1"'}).status_code == 304
+    print("   ✅ Tiap body mendapat hasil gzip-nya sendiri, memo dipakai ulang")
+
+
+if __name__ == "__main__":
+    test_gzip_memo_keyed_by_body()
@@ -0,0 +1,323 @@
+"""
+Backend/test/test_inference.py
+Unit Test untuk lapisan inference (Direct, Process Pool, Micro-Batching & Cascade).
+Fokus: setiap request menerima baris hasilnya sendiri walaupun digabung dalam satu batch,
+dan pool proses memberi hasil identik dengan model langsung (termasuk setelah fork & shutdown).
+"""
+
+import os
+import sys
+import threading
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import inference
+from Backend.models.inference import CascadeInference, DirectInference, MicroBatcher, ProcessPoolInference
+from Backend.models.registry import active_paths
+
+
+class EchoBackend:
+    """Backend palsu: probabilitas kelas 1 = nilai kolom pertama, mencatat ukuran tiap batch."""
+    name = 'echo'
+
+    def __init__(self):
+        self.calls = []
+
+    def predict_proba(self, X):
+        self.calls.append(X.shape[0])
+        p1 = X[:, 0].astype(float)
+        return np.column_stack([1 - p1, p1])
+
+    def close(self):
+        pass
+
+
+class ConstantModel:
+    """Model palsu: probabilitas kelas 1 tetap (membedakan model lama & baru saat reload)."""
+
+    def __init__(self, p1):
+        self.p1 = p1
+
+    def predict_proba(self, frame):
+        return np.tile([1 - self.p1, self.p1], (len(frame), 1))
+
+
+def _row(value):
+    row = np.zeros(len(Config.FEATURES), dtype=np.float32)
+    row[0] = value
+    return row
+
+
+def test_micro_batcher_routes_rows_back():
+    print("\n[1] Micro-batcher: hasil kembali ke request yang benar")
+    backend = EchoBackend()
+    batcher = MicroBatcher(backend, window_ms=20, max_batch=64)
+
+    values = [i / 100 for i in range(40)]
+    results = {}
+
+    def client(v):
+        results[v] = float(batcher.predict_proba(_row(v), timeout=5)[0][1])
+
+    threads = [threading.Thread(target=client, args=(v,)) for v in values]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.close()
+
+    for v in values:
+        assert abs(results[v] - v) < 1e-6
+    # 40 request paralel harus digabung -> jumlah panggilan model jauh lebih sedikit
+    assert len(backend.calls) < len(values)
+    assert batcher.stats()['requests'] == len(values)
+    print(f"   ✅ {len(values)} request dilayani dengan {len(backend.calls)} panggilan model")
+
+
+def test_micro_batcher_respects_max_batch():
+    print("\n[2] Micro-batcher: ukuran batch tidak melebihi max_batch")
+    backend = EchoBackend()
+    batcher = MicroBatcher(backend, window_ms=20, max_batch=4)
+    futures = [batcher.submit(_row(0.5)) for _ in range(10)]
+    for f in futures:
+        f.result(timeout=5)
+    batcher.close()
+
+    assert max(backend.calls) <= 4
+    assert sum(backend.calls) == 10
+    print(f"   ✅ Ukuran batch: {backend.calls}")
+
+
+def test_micro_batcher_propagates_errors():
+    print("\n[3] Micro-batcher: error model diteruskan ke pemanggil")
+
+    class BrokenBackend(EchoBackend):
+        def predict_proba(self, X):
+            raise ValueError("model rusak")
+
+    batcher = MicroBatcher(BrokenBackend(), window_ms=1, max_batch=8)
+    try:
+        batcher.predict_proba(_row(0.1), timeout=5)
+        raised = False
+    except ValueError:
+        raised = True
+    batcher.close()
+
+    assert raised
+    print("   ✅ Exception diteruskan")
+
+
+def test_cascade_escalates_only_uncertain_rows():
+    print("\n[4] Cascade: hanya baris dekat ambang yang dinaikkan ke model penuh")
+
+    class FirstStage:
+        """Model tahap-1 palsu (menerima DataFrame seperti model sklearn)."""
+        def predict_proba(self, X):
+            p1 = X.iloc[:, 0].to_numpy(dtype=float)
+            return np.column_stack([1 - p1, p1])
+
+    class FullBackend(EchoBackend):
+        def predict_proba(self, X):
+            self.calls.append(X.shape[0])
+            return np.tile([0.01, 0.99], (X.shape[0], 1))
+
+        def stats(self):
+            return {'backend': self.name}
+
+    full = FullBackend()
+    cascade = CascadeInference(FirstStage(), full, band=0.15, first_stage_name='palsu')
+    values = [0.05, 0.4, 0.5, 0.6, 0.9]
+    proba = cascade.predict_proba(np.vstack([_row(v) for v in values]))[:, 1]
+
+    # 0.4, 0.5, 0.6 di dalam (0.35, 0.65) -> hasil model penuh; sisanya hasil tahap-1
+    assert np.allclose(proba, [0.05, 0.99, 0.99, 0.99, 0.9])
+    assert full.calls == [3]
+    stats = cascade.stats()
+    assert stats['rows'] == 5 and stats['escalated'] == 3 and stats['escalation_rate'] == 0.6
+    print(f"   ✅ Eskalasi {stats['escalated']}/{stats['rows']} baris")
+
+
+def _real_model_and_rows(n=200):
+    """Model aktif + n baris dataset yang sudah ditransformasi (None jika model belum dilatih)."""
+    model_path = active_paths()[0]
+    if not os.path.exists(model_path):
+        print("   ⚠️ Model belum ada, test dilewati (jalankan Scripts/train_model.py)")
+        return None, None, None
+    from Backend.models.bundle import load_model_bundle
+    bundle = load_model_bundle(model_path)
+    raw = pd.read_csv(Config.RAW_DATA, nrows=n)
+    return bundle['model'], bundle['preprocessor'].transform(raw), model_path
+
+
+def _threshold_rows(model, X):
+    """
+    Baris float64 tepat di sekitar ambang split pohon pertama (di belakang StandardScaler):
+    nilai mentah = mean + ambang * scale, digeser sedikit di bawah resolusi float32.
+    """
+    from sklearn.pipeline import Pipeline
+    calibrated = getattr(model, 'calibrated_classifiers_', None)
+    estimator = calibrated[0].estimator if calibrated else model
+    if not isinstance(estimator, Pipeline) or not hasattr(estimator.steps[-1][1], 'tree_'):
+        return None
+    scaler, tree = estimator.steps[0][1], estimator.steps[-1][1].tree_
+    base = np.asarray(X, dtype=np.float64)[0]
+    rows = []
+    for f, t in zip(tree.feature, tree.threshold):
+        if f < 0 or not hasattr(scaler, 'mean_'):
+            continue
+        x0 = scaler.mean_[f] + t * scaler.scale_[f]
+        for k in range(-40, 41):
+            row = base.copy()
+            row[f] = x0 + k * abs(x0) * 1e-8
+            rows.append(row)
+    return np.array(rows) if rows else None
+
+
+def _predict_in_child(pool, X, queue):
+    """Dijalankan di proses hasil fork: pool induk tidak boleh dipakai / dimatikan dari sini."""
+    try:
+        pool.close()  # PID beda -> tidak menyentuh pool milik induk
+        proba = pool.predict_proba(X)
+        queue.put((pool._pid == os.getpid(), proba))
+        # Proses multiprocessing menjalankan finalizer antrian sebelum thread pool selesai:
+        # tunggu worker pool anak berhenti dulu (close() memakai wait=False)
+        pool._pool.shutdown(wait=True)
+    except Exception as e:
+        queue.put((False, repr(e)))
+
+
+def test_process_pool_matches_direct():
+    print("\n[5] Process pool: hasil = model langsung, shutdown & start ulang lazy")
+    model, X, model_path = _real_model_and_rows()
+    if model is None:
+        return
+    expected = DirectInference(model).predict_proba(X)
+
+    pool = ProcessPoolInference(model, workers=2, model_path=model_path)
+    try:
+        np.testing.assert_allclose(pool.predict_proba(X), expected, rtol=0, atol=1e-12)
+        # Beberapa submit bersamaan: tiap future menerima potongannya sendiri
+        futures = [pool.submit(X[i:i + 50]) for i in range(0, len(X), 50)]
+        np.testing.assert_allclose(np.vstack([f.result(timeout=30) for f in futures]), expected, atol=1e-12)
+        assert pool.stats() == {'backend': 'process', 'workers': 2, 'calls': 5}
+        first_pool = pool._pool
+
+        # Shutdown: pool dilepas, panggilan berikutnya membuat pool baru
+        pool.close()
+        assert pool._pool is None
+        np.testing.assert_allclose(pool.predict_proba(X[:3]), expected[:3], atol=1e-12)
+        assert pool._pool is not None and pool._pool is not first_pool
+    finally:
+        pool.close()
+    print(f"   ✅ {len(X)} baris identik dengan DirectInference, pool dibuat ulang setelah close()")
+
+
+def test_process_pool_after_fork():
+    print("\n[6] Process pool: proses hasil fork membuat pool sendiri (gunicorn --preload)")
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        print("   ⚠️ Start method 'fork' tidak tersedia, test dilewati")
+        return
+    model, X, model_path = _real_model_and_rows(50)
+    if model is None:
+        return
+    expected = DirectInference(model).predict_proba(X)
+
+    pool = ProcessPoolInference(model, workers=1, model_path=model_path)
+    try:
+        pool.predict_proba(X[:1])  # Pool induk sudah jalan sebelum fork
+        parent_pool = pool._pool
+        ctx = multiprocessing.get_context('fork')
+        queue = ctx.Queue()
+        child = ctx.Process(target=_predict_in_child, args=(pool, X, queue))
+        child.start()
+        own_pool, proba = queue.get(timeout=60)
+        child.join(timeout=30)
+        assert child.exitcode == 0 and own_pool, proba
+        np.testing.assert_allclose(proba, expected, atol=1e-12)
+
+        # Pool induk tetap hidup & dipakai setelah anak selesai
+        assert pool._pool is parent_pool and pool._pid == os.getpid()
+        np.testing.assert_allclose(pool.predict_proba(X), expected, atol=1e-12)
+    finally:
+        pool.close()
+
+    # Start method 'spawn': worker memuat model sendiri dari model_path lewat initializer
+    saved = inference._WORKER_MODEL
+    inference._WORKER_MODEL = None
+    try:
+        inference._init_worker(model_path)
+        np.testing.assert_allclose(DirectInference(inference._WORKER_MODEL).predict_proba(X), expected, atol=1e-12)
+    finally:
+        inference._WORKER_MODEL = saved
+    print("   ✅ Anak fork memakai pool baru, pool induk tidak terganggu, initializer memuat model")
+
+
+def test_process_pool_keeps_own_model():
+    print("\n[7] Process pool: pool lama & baru (hot reload) memakai modelnya sendiri")
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        print("   ⚠️ Start method 'fork' tidak tersedia, test dilewati")
+        return
+    X = np.stack([_row(0.5)] * 3)
+    old = ProcessPoolInference(ConstantModel(0.2), workers=2, model_path='tidak-dipakai')
+    new = ProcessPoolInference(ConstantModel(0.9), workers=1, model_path='tidak-dipakai')
+    try:
+        old._get_pool()
+        # Semua worker sudah di-fork saat pool dibuat, bukan saat submit berikutnya
+        assert len(old._pool._processes) == 2
+        new._get_pool()  # Reload: pool baru dibuat sebelum pool lama dipakai lagi
+        np.testing.assert_allclose(old.predict_proba(X)[:, 1], 0.2)
+        np.testing.assert_allclose(new.predict_proba(X)[:, 1], 0.9)
+        assert len(old._pool._processes) == 2
+    finally:
+        old.close()
+        new.close()
+    print("   ✅ Worker pool lama tidak mewarisi model baru")
+
+
+def test_backends_match_raw_model_float64():
+    print("\n[8] Backend = bundle['model'].predict_proba pada frame float64 (tanpa cast float32)")
+    model, X, model_path = _real_model_and_rows(20)
+    if model is None:
+        return
+    rows = _threshold_rows(model, X)
+    if rows is None:
+        print("   ⚠️ Model bukan scaler + pohon, hanya baris dataset yang dibandingkan")
+        rows = np.asarray(X, dtype=np.float64)
+    else:
+        # Pastikan baris benar-benar sensitif: dibulatkan ke float32 -> probabilitas berubah
+        rounded = model.predict_proba(pd.DataFrame(rows.astype(np.float32), columns=Config.FEATURES))
+        assert not np.allclose(rounded, model.predict_proba(pd.DataFrame(rows, columns=Config.FEATURES)))
+    expected = model.predict_proba(pd.DataFrame(rows, columns=Config.FEATURES))
+
+    np.testing.assert_allclose(DirectInference(model).predict_proba(rows), expected, rtol=0, atol=1e-12)
+    frame = pd.DataFrame(rows, columns=Config.FEATURES)
+    np.testing.assert_allclose(DirectInference(model).predict_proba(frame), expected, rtol=0, atol=1e-12)
+    batcher = MicroBatcher(DirectInference(model), window_ms=1, max_batch=64)
+    pool = ProcessPoolInference(model, workers=1, model_path=model_path)
+    try:
+        np.testing.assert_allclose(batcher.predict_proba(rows), expected, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(pool.predict_proba(rows), expected, rtol=0, atol=1e-12)
+    finally:
+        batcher.close()
+        pool.close()
+    print(f"   ✅ {len(rows)} baris di sekitar ambang split identik dengan model mentah")
+
+
+if __name__ == "__main__":
+    test_micro_batcher_routes_rows_back()
+    test_micro_batcher_respects_max_batch()
+    test_micro_batcher_propagates_errors()
+    test_cascade_escalates_only_uncertain_rows()
+    test_process_pool_matches_direct()
+    test_process_pool_after_fork()
+    test_process_pool_keeps_own_model()
+    test_backends_match_raw_model_float64()
@@ -0,0 +1,161 @@
+"""
+Backend/test/test_log_store.py
+Unit Test untuk store kolumnar log prediksi (/api/logs/search).
+Fokus: kompaksi inkremental per batch terbatas + penggabungan part, filter (waktu, label, rentang angka),
+paginasi & pencarian pertama yang tidak mengompaksi di thread request.
+"""
+
+import os
+import csv
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+from flask import Flask
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import log_store
+from Backend.models.log_store import LOG_COLUMNS, LogStore, parse_time_bound
+
+
+def _row(day, age, glucose, label, prob):
+    row = {c: '' for c in LOG_COLUMNS}
+    row.update({'timestamp': f'2026-09-{day:02d} 10:00:00', 'prediction': label,
+                'probability': f'{prob:.2f}%', 'age': age, 'glucose': glucose, 'gender': 'Male'})
+    return row
+
+
+def _append(path, rows):
+    new = not os.path.exists(path)
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=LOG_COLUMNS)
+        if new:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_compaction_and_search():
+    print("\n🔎 TEST: Kompaksi & filter pencarian log")
+    fanin = Config.LOG_STORE_MERGE_FANIN
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, 'log.csv')
+        store = LogStore(os.path.join(tmp, 'store'), log)
+
+        # Satu hari per kompaksi -> part kecil digabung bertingkat
+        for day in range(1, fanin + 2):
+            _append(log, [_row(day, 50 + day, 5.0 + day, 'Diabetic' if day % 2 else 'Non-Diabetic', 60.0),
+                          _row(day, 30, 90, 'Non-Diabetic', 10.0)])  # 90 mg/dL -> 5 mmol/L
+            assert store.compact() == 2
+        assert store.compact() == 0
+        manifest = store.manifest()
+        assert manifest['rows'] == 2 * (fanin + 1)
+        assert len(manifest['parts']) == 2  # fanin part level 0 -> 1 part level 1, + 1 part baru
+
+        result = store.search(label=1, ranges={'age': (55, None), 'glucose': (11, None)})
+        assert [r['timestamp'][:10] for r in result['rows']] == ['2026-09-09', '2026-09-07']
+        assert result['rows'][0]['gender'] == 'Male'
+
+        # Rentang waktu + zone map: part lama dilewati tanpa dibuka
+        last_day = parse_time_bound(f'2026-09-{fanin + 1:02d}')
+        result = store.search(ts_range=(last_day, None))
+        assert result['total'] == 2 and result['parts_skipped'] == 1
+
+        # Satuan dataset: glukosa 90 mg/dL tersimpan sebagai 5.0 mmol/L
+        assert store.search(ranges={'glucose': (None, 5.0)})['total'] == fanin + 1
+        print("   ✅ Filter label/angka/waktu benar, part digabung")
+
+
+def test_pagination_newest_first():
+    print("\n🔎 TEST: Paginasi terbaru dulu")
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, 'log.csv')
+        store = LogStore(os.path.join(tmp, 'store'), log)
+        for day in range(1, 6):
+            _append(log, [_row(day, 40 + day, 6.0, 'Diabetic', 70.0)])
+            store.compact()
+
+        pages = [store.search(page=p, page_size=2) for p in (1, 2, 3)]
+        ages = [r['age'] for page in pages for r in page['rows']]
+        assert ages == [45, 44, 43, 42, 41]
+        assert pages[0]['total'] == 5 and pages[0]['pages'] == 3
+        print("   ✅ 3 halaman, urutan terbaru dulu")
+
+
+def test_compaction_bounded_batches():
+    print("\n🔎 TEST: Kompaksi log besar per batch terbatas")
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, 'log.csv')
+        _append(log, [_row(1 + i % 28, 20 + i % 50, 6.0, 'Diabetic', 50.0) for i in range(25)])
+        with open(log, 'a', encoding='utf-8') as f:
+            f.write('2026-09-30 10:00:00,Diab')  # Baris terakhir sedang ditulis
+        store = LogStore(os.path.join(tmp, 'store'), log, part_rows=100, batch_rows=4)
+
+        batches = []
+        real_read = store._read_log_tail
+
+        def spy(offset, max_rows, end=None):
+            df, end = real_read(offset, max_rows, end)
+            batches.append(0 if df is None else len(df))
+            return df, end
+        store._read_log_tail = spy
+
+        assert store.compact() == 25
+        assert max(batches) <= 4  # Header + 25 baris dibaca per 4 baris, tidak sekaligus
+        assert store.search()['total'] == 25 and store.pending_bytes() > 0  # Baris setengah jadi menunggu
+        with open(log, 'a', encoding='utf-8') as f:
+            f.write('betic,70.00%' + ',' * (len(LOG_COLUMNS) - 3) + '\n')
+        assert store.compact() == 1 and store.pending_bytes() == 0
+        print(f"   ✅ {len(batches)} batch <= 4 baris, baris yang belum lengkap ditunda")
+
+
+def test_first_search_builds_in_background():
+    print("\n🔎 TEST: Pencarian pertama tidak mengompaksi di thread request")
+    from Backend.routes import api_routes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, 'log.csv')
+        _append(log, [_row(day, 40 + day, 6.0, 'Diabetic', 70.0) for day in range(1, 6)])
+        store = LogStore(os.path.join(tmp, 'store'), log)
+        saved = (log_store._default_store, log_store.start_compactor, log_store.trigger_compaction)
+        request_thread, compacted_in = threading.current_thread(), []
+        real_compact = store.compact
+
+        def compact():
+            compacted_in.append(threading.current_thread())
+            return real_compact()
+        store.compact = compact
+        log_store._default_store = store
+        log_store.start_compactor = lambda interval=None: None
+        log_store.trigger_compaction = lambda: threading.Thread(target=store.compact).start()
+        try:
+            app = Flask(__name__)
+            app.register_blueprint(api_routes.api_bp)
+            client = app.test_client()
+
+            response = client.get('/api/logs/search?label=Diabetic')
+            assert response.status_code == 202 and 'Retry-After' in response.headers
+            assert response.get_json()['status'] == 'building'
+            for _ in range(200):
+                if store.manifest()['parts']:
+                    break
+                threading.Event().wait(0.01)
+
+            data = client.get('/api/logs/search?label=Diabetic').get_json()
+            assert data['success'] and data['total'] == 5
+            assert compacted_in and request_thread not in compacted_in
+        finally:
+            log_store._default_store, log_store.start_compactor, log_store.trigger_compaction = saved
+    print("   ✅ 202 'building' + Retry-After, store dibangun di thread latar")
+
+
+if __name__ == "__main__":
+    test_compaction_and_search()
+    test_pagination_newest_first()
+    test_compaction_bounded_batches()
+    test_first_search_builds_in_background()
@@ -0,0 +1,191 @@
+"""
+Backend/test/test_prediction_log.py
+Unit Test untuk log prediksi multi-proses (segmen per worker + penggabung).
+Fokus: tidak ada baris tercampur/ganda dari banyak proses, log kanonik urut timestamp, crash saat gabung aman,
+dan pembaca tail (stats, log store) tidak pernah membaca byte gabung yang belum di-commit.
+"""
+
+import os
+import sys
+import json
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+import pandas as pd
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import prediction_log
+from Backend.models.prediction_log import LOG_COLUMNS, STATE_FILE, SegmentMerger, SegmentWriter
+
+
+def _row(second: int, worker: int, i: int):
+    row = {f: i for f in Config.FEATURES}
+    row.update({'timestamp': f"2026-01-01 10:{second // 60:02d}:{second % 60:02d}",
+                'prediction': 'Diabetic' if i % 2 else 'Non-Diabetic',
+                'probability': f"{worker}.{i:02d}%", 'gender': f"w{worker}"})
+    return row
+
+
+def _worker(directory, worker, n):
+    writer = SegmentWriter(directory, max_bytes=2048)  # rotasi beberapa kali
+    for i in range(n):
+        writer.write_row(_row(i * 3 + worker, worker, i))
+    writer.close()
+
+
+def test_many_processes_merge_in_order():
+    print("\n🧾 TEST: Segmen per proses digabung utuh & urut")
+    with tempfile.TemporaryDirectory() as tmp:
+        seg_dir, log_path = os.path.join(tmp, 'segments'), os.path.join(tmp, 'prediction_logs.csv')
+        ctx = multiprocessing.get_context('fork')
+        procs = [ctx.Process(target=_worker, args=(seg_dir, w, 60)) for w in range(3)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+
+        merger = SegmentMerger(seg_dir, log_path, grace_seconds=0)
+        # Sebelum digabung: pembaca sudah melihat semua baris, terurut
+        view = merger.read_log()
+        assert len(view) == 180 and view['timestamp'].is_monotonic_increasing
+
+        assert merger.merge() == 180
+        df = pd.read_csv(log_path)
+        assert list(df.columns) == LOG_COLUMNS
+        assert len(df) == 180 and df['timestamp'].is_monotonic_increasing
+        assert sorted(df['gender'].value_counts().tolist()) == [60, 60, 60]
+        # Pemilik segmen sudah selesai -> segmen yang habis digabung dihapus
+        assert not [n for n in os.listdir(seg_dir) if n.startswith('seg-')]
+
+        assert merger.merge() == 0
+        assert len(merger.read_log()) == 180
+        print("   ✅ 3 proses x 60 baris -> 180 baris kanonik, tanpa ganda")
+
+
+def test_grace_and_crash_recovery():
+    print("\n🧾 TEST: Watermark grace & pemulihan crash saat gabung")
+    with tempfile.TemporaryDirectory() as tmp:
+        seg_dir, log_path = os.path.join(tmp, 'segments'), os.path.join(tmp, 'prediction_logs.csv')
+        writer = SegmentWriter(seg_dir)
+        for i in range(5):
+            writer.write_row(_row(i, 0, i))
+
+        # Grace sangat besar: baris dianggap masih "baru" -> ditahan, tapi tetap terlihat pembaca
+        assert SegmentMerger(seg_dir, log_path, grace_seconds=10 ** 10).merge() == 0
+        assert len(SegmentMerger(seg_dir, log_path).read_log()) == 5
+
+        merger = SegmentMerger(seg_dir, log_path, grace_seconds=0)
+        assert merger.merge() == 5
+        size = os.path.getsize(log_path)
+
+        # Simulasi crash: niat gabung tercatat, sebagian baris sudah tertulis, offset belum maju
+        state_path = os.path.join(seg_dir, STATE_FILE)
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        state['pending'] = {'log_size': size}
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        with open(log_path, 'ab') as f:
+            f.write(b'2026-01-01 11:00:00,Diabe')
+
+        writer.write_row(_row(3600, 0, 9))
+        assert merger.merge() == 1
+        df = pd.read_csv(log_path)
+        assert len(df) == 6 and df['timestamp'].is_monotonic_increasing
+        # Segmen milik proses ini yang masih aktif tidak dihapus
+        assert os.path.exists(writer.path)
+        writer.close()
+        print("   ✅ Baris setengah jadi dipotong, tidak ada baris ganda")
+
+
+def test_crash_after_segment_removed():
+    print("\n🧾 TEST: Crash setelah segmen dihapus tidak menghilangkan baris")
+    with tempfile.TemporaryDirectory() as tmp:
+        seg_dir, log_path = os.path.join(tmp, 'segments'), os.path.join(tmp, 'prediction_logs.csv')
+        writer = SegmentWriter(seg_dir)
+        writer.pid = 999999  # Pemilik segmen sudah mati -> segmen tertutup & dihapus setelah digabung
+        for i in range(5):
+            writer.write_row(_row(i, 0, i))
+        writer.close()
+
+        # Simulasi crash tepat setelah os.remove segmen (sebelum langkah berikutnya)
+        real_remove = prediction_log.os.remove
+
+        def crash_after_remove(path):
+            real_remove(path)
+            raise KeyboardInterrupt("crash")
+
+        merger = SegmentMerger(seg_dir, log_path, grace_seconds=0)
+        prediction_log.os.remove = crash_after_remove
+        try:
+            merger.merge()
+            crashed = False
+        except KeyboardInterrupt:
+            crashed = True
+        finally:
+            prediction_log.os.remove = real_remove
+        assert crashed and not [n for n in os.listdir(seg_dir) if n.startswith('seg-')]
+
+        # Proses berikutnya: pemulihan tidak boleh memotong baris yang segmennya sudah hilang
+        merger = SegmentMerger(seg_dir, log_path, grace_seconds=0)
+        assert merger.merge() == 0
+        assert len(pd.read_csv(log_path)) == 5
+        assert len(merger.read_log()) == 5
+        print("   ✅ 5 baris tetap ada di log kanonik")
+
+
+def test_readers_stop_at_committed_size():
+    print("\n🧾 TEST: Pembaca berhenti di ukuran log yang sudah di-commit")
+    from Backend.models.log_store import LogStore
+    from Backend.models.stats import PredictionStats
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seg_dir, log_path = os.path.join(tmp, 'segments'), os.path.join(tmp, 'prediction_logs.csv')
+        writer = SegmentWriter(seg_dir)
+        for i in range(5):
+            writer.write_row(_row(i, 0, i))
+        merger = SegmentMerger(seg_dir, log_path, grace_seconds=0)
+        assert merger.merge() == 5
+        size = os.path.getsize(log_path)
+        assert merger.committed_log_size() == size
+
+        # Crash saat gabung: baris utuh sudah tertulis ke log, offset segmen belum maju
+        writer.write_row(_row(3600, 0, 9))
+        with open(writer.path, 'rb') as f:
+            line = f.read().splitlines(keepends=True)[-1]
+        state_path = os.path.join(seg_dir, STATE_FILE)
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        state['pending'] = {'log_size': size}
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        with open(log_path, 'ab') as f:
+            f.write(line)
+
+        stats = PredictionStats(log_path, os.path.join(tmp, 'stats.json'), merger=merger)
+        store = LogStore(os.path.join(tmp, 'store'), log_path, merger=merger)
+        stats.refresh()
+        assert store.compact() == 5 and stats.offset == size
+        assert stats.query()['total']['count'] == 6  # 5 kanonik + 1 dari segmen, bukan dari byte crash
+        assert len(merger.read_log()) == 6
+
+        # Pemulihan memotong & menulis ulang baris -> pembaca menyusul tanpa dobel
+        assert merger.merge() == 1
+        stats.refresh()
+        assert store.compact() == 1 and store.search()['total'] == 6
+        assert stats.query()['total']['count'] == 6 and not stats.pending
+        writer.close()
+        print("   ✅ Byte gabung yang crash tidak terbaca, 6 baris tanpa duplikasi")
+
+
+if __name__ == "__main__":
+    test_many_processes_merge_in_order()
+    test_grace_and_crash_recovery()
+    test_crash_after_segment_removed()
+    test_readers_stop_at_committed_size()
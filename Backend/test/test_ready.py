@@ -0,0 +1,71 @@
+"""
+Backend/test/test_ready.py
+Unit Test untuk readiness probe (/ready).
+Fokus: siap hanya setelah model termuat & warmup berjalan di proses ini, dan batas latensi warmup dihormati.
+"""
+
+import sys
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.routes import api_routes
+from run_app import app
+
+
+def test_ready_after_warmup():
+    print("\n🚦 TEST: /ready melaporkan model, waktu muat & latensi warmup")
+    if api_routes.model is None:
+        print("   ⏭️ Model belum dilatih, dilewati")
+        return
+    client = app.test_client()
+
+    # Warmup lama dianggap milik proses lain (misal master sebelum fork) -> diulang oleh probe
+    api_routes._readiness['warmup_pid'] = -1
+    response = client.get('/ready')
+    body = response.get_json()
+    assert response.status_code == 200, body
+    assert body['status'] == 'ready' and body['reasons'] == []
+    assert body['model_version'] and body['load_ms'] is not None
+    assert body['warmup']['rounds'] == Config.READY_WARMUP_ROUNDS
+    assert body['warmup']['p50_ms'] <= Config.READY_MAX_LATENCY_MS
+    # /health tetap liveness murni
+    assert client.get('/health').status_code == 200
+    print(f"   ✅ Siap: muat {body['load_ms']} ms, warmup p50 {body['warmup']['p50_ms']} ms")
+
+
+def test_not_ready_when_slow_or_unloaded():
+    print("\n🚦 TEST: /ready 503 jika warmup terlalu lambat / preprocessor hilang")
+    if api_routes.model is None:
+        print("   ⏭️ Model belum dilatih, dilewati")
+        return
+    client = app.test_client()
+
+    limit = Config.READY_MAX_LATENCY_MS
+    Config.READY_MAX_LATENCY_MS = 0.0
+    try:
+        response = client.get('/ready')
+        assert response.status_code == 503
+        assert 'Latensi warmup' in response.get_json()['reasons'][0]
+    finally:
+        Config.READY_MAX_LATENCY_MS = limit
+
+    preprocessor = api_routes.preprocessor
+    api_routes.preprocessor = None
+    try:
+        response = client.get('/ready')
+        assert response.status_code == 503
+        assert response.get_json()['status'] == 'not_ready'
+    finally:
+        api_routes.preprocessor = preprocessor
+    assert client.get('/ready').status_code == 200
+    print("   ✅ Worker lambat / belum lengkap tidak menerima traffic")
+
+
+if __name__ == "__main__":
+    test_ready_after_warmup()
+    test_not_ready_when_slow_or_unloaded()
@@ -0,0 +1,99 @@
+"""
+Backend/test/test_schema.py
+Unit Test untuk validator skema input (Backend/models/schema.py).
+Fokus: kode error per field, konversi satuan sebelum cek rentang, dan hasil batch == per baris.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.models.schema import EMPTY, NOT_NUMBER, OUT_OF_RANGE, UNKNOWN, CompiledSchema
+from Backend.models.utils import validate_input_data
+
+SAMPLE = {
+    'age': 45, 'gender': 'Male', 'pulse_rate': 72, 'systolic_bp': 130, 'diastolic_bp': 85,
+    'glucose': 150, 'height': 170, 'weight': 70, 'bmi': 0, 'family_diabetes': 'Yes',
+    'hypertensive': 'No', 'family_hypertension': 'No', 'cardiovascular_disease': 'No', 'stroke': 'No'
+}
+
+
+def test_single_record_codes():
+    print("\n[1] Validasi satu pasien: kode error per field")
+    schema = CompiledSchema()
+    assert schema.validate(SAMPLE) == {}
+
+    bad = dict(SAMPLE, age=0, glucose='abc', gender='alien', pulse_rate='  ', stroke=2)
+    bad.pop('weight')
+    codes = schema.validate(bad)
+    assert codes == {
+        'age': OUT_OF_RANGE, 'glucose': NOT_NUMBER, 'gender': UNKNOWN,
+        'pulse_rate': EMPTY, 'weight': EMPTY, 'stroke': UNKNOWN,
+    }
+    print(f"   ✅ {codes}")
+
+
+def test_unit_conversion_before_range():
+    print("\n[2] Konversi satuan (mg/dL, cm) sebelum cek rentang")
+    schema = CompiledSchema()
+    # 5.6 mmol/L & 100 mg/dL sama-sama wajar; 1.7 m & 170 cm sama-sama wajar
+    for glucose, height in [(5.6, 1.7), (100, 170)]:
+        assert schema.validate(dict(SAMPLE, glucose=glucose, height=height)) == {}
+    # 2.8 m tidak wajar (di atas 2.5 m tapi belum dianggap cm)
+    assert schema.validate(dict(SAMPLE, height=2.8)) == {'height': OUT_OF_RANGE}
+    # BMI 0 = dihitung otomatis, BMI 5 tidak wajar
+    assert schema.validate(dict(SAMPLE, bmi=5)) == {'bmi': OUT_OF_RANGE}
+    print("   ✅ Rentang dicek dalam satuan dataset")
+
+
+def test_batch_matches_single():
+    print("\n[3] Validasi batch (per kolom) == validasi per baris")
+    schema = CompiledSchema()
+    rows = [
+        SAMPLE,
+        dict(SAMPLE, age='le', gender='x'),
+        dict(SAMPLE, glucose=0, hypertensive='1.0'),
+        dict(SAMPLE, weight=None, stroke='ya'),
+        dict(SAMPLE, systolic_bp=400, family_diabetes='maybe'),
+    ]
+    df = pd.DataFrame(rows).astype(str).replace({'None': np.nan})
+    errors = schema.validate_frame(df)
+
+    for i, row in enumerate(df.to_dict(orient='records')):
+        row = {k: (None if isinstance(v, float) and np.isnan(v) else v) for k, v in row.items()}
+        expected = schema.validate(row)
+        got = {name: int(codes[i]) for name, codes in errors.items() if codes[i]}
+        assert got == expected, (i, got, expected)
+
+    messages = schema.row_messages(errors, len(df))
+    assert messages[0] == ''
+    assert messages[1] == 'age bukan angka; gender tidak dikenali'
+    print(f"   ✅ {list(messages)}")
+
+
+def test_validate_input_data_shape():
+    print("\n[4] validate_input_data: format lama + field_errors")
+    result = validate_input_data(SAMPLE)
+    assert result == {'is_valid': True, 'errors': [], 'field_errors': {}}
+
+    missing = dict(SAMPLE)
+    missing.pop('age')
+    result = validate_input_data(dict(missing, bmi=''))
+    assert not result['is_valid']
+    assert result['errors'][:2] == ['Data hilang: age', 'Data kosong: bmi']
+    assert set(result['field_errors']) == {'age', 'bmi'}
+    print(f"   ✅ {result['errors']}")
+
+
+if __name__ == "__main__":
+    test_single_record_codes()
+    test_unit_conversion_before_range()
+    test_batch_matches_single()
+    test_validate_input_data_shape()
@@ -0,0 +1,138 @@
+"""
+Backend/test/test_screening.py
+Unit Test untuk skrining massal CSV (/api/screening).
+Fokus: output CSV & NDJSON per baris sumber, baris tidak valid tetap dilaporkan,
+header/format salah ditolak 400, dan error di tengah stream ditulis sebagai baris CSV yang valid.
+"""
+
+import io
+import os
+import csv
+import sys
+import json
+from pathlib import Path
+
+from flask import Flask
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models.registry import active_paths
+from Backend.models.scoring import RESULT_COLUMNS
+
+HEADER = ("age,gender,pulse_rate,systolic_bp,diastolic_bp,glucose,height,weight,bmi,family_diabetes,"
+          "hypertensive,family_hypertension,cardiovascular_disease,stroke")
+ROWS = [
+    "42,Female,66,110,73,5.88,1.65,70.2,25.75,0,0,0,0,0",
+    "63,Male,90,160,95,14.2,1.70,92.0,31.8,1,1,1,0,0",
+    "abc,Male,90,160,95,14.2,1.70,92.0,31.8,1,1,1,0,0",  # Usia tidak valid
+    "35,Female,60,125,68,5.71,1.47,42.5,19.58,0,0,0,0,0",
+    "51,Male,75,135,85,8.3,1.72,80.0,27.0,1,0,0,0,0",
+]
+
+
+def _client():
+    from Backend.routes import api_routes
+    app = Flask(__name__)
+    app.register_blueprint(api_routes.api_bp)
+    return app.test_client(), api_routes
+
+
+def _post(client, body: str, fmt: str = 'csv'):
+    return client.post(f'/api/screening?format={fmt}', data=body.encode('utf-8'),
+                       headers={'Content-Type': 'text/csv'})
+
+
+def _model_missing() -> bool:
+    if not os.path.exists(active_paths()[0]):
+        print("   ⚠️ Model belum ada, test dilewati (jalankan Scripts/train_model.py)")
+        return True
+    return False
+
+
+def test_csv_and_ndjson_output():
+    print("\n🩺 TEST: Skrining massal - output CSV & NDJSON")
+    if _model_missing():
+        return
+    client, _ = _client()
+    body = HEADER + '\n' + '\n'.join(ROWS) + '\n'
+
+    response = _post(client, body)
+    assert response.status_code == 200 and response.mimetype == 'text/csv'
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert rows[0] == RESULT_COLUMNS
+    assert [r[0] for r in rows[1:]] == ['1', '2', '3', '4', '5']
+    assert all(len(r) == len(RESULT_COLUMNS) for r in rows)
+    invalid = rows[3]
+    assert invalid[1] == '' and 'age' in invalid[4]
+    for r in rows[1:3] + rows[4:]:
+        assert r[1] in ('Diabetic', 'Non-Diabetic') and 0 <= float(r[2]) <= 100 and r[4] == ''
+
+    response = _post(client, body, fmt='ndjson')
+    assert response.mimetype == 'application/x-ndjson'
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [rec['row'] for rec in records] == [1, 2, 3, 4, 5]
+    assert records[2]['error'] and not records[2]['label']
+    # Hasil sama dengan output CSV
+    assert [rec['label'] for rec in records] == [r[1] for r in rows[1:]]
+    print("   ✅ 5 baris (1 tidak valid) dengan nomor baris sumber, CSV = NDJSON")
+
+
+def test_rejects_bad_input():
+    print("\n🩺 TEST: Skrining massal - input ditolak sebelum stream")
+    if _model_missing():
+        return
+    client, _ = _client()
+    assert _post(client, '').status_code == 400
+    missing = _post(client, 'age,gender\n42,Female\n')
+    assert missing.status_code == 400 and 'glucose' in missing.get_json()['error']
+    assert _post(client, HEADER + '\n' + ROWS[0] + '\n', fmt='xml').status_code == 400
+    print("   ✅ CSV kosong, kolom hilang & format salah -> 400")
+
+
+def test_mid_stream_error_row():
+    print("\n🩺 TEST: Skrining massal - error di tengah stream")
+    if _model_missing():
+        return
+    client, api_routes = _client()
+    if api_routes.model is None:
+        api_routes.load_model_resources()
+
+    class FailingInference:
+        """Chunk pertama dinilai normal, chunk berikutnya gagal (pesan berisi kutip & koma)."""
+
+        def __init__(self, inner):
+            self.inner, self.calls = inner, 0
+
+        def predict_proba(self, X):
+            self.calls += 1
+            if self.calls > 1:
+                raise RuntimeError('model "v2", gagal dimuat')
+            return self.inner.predict_proba(X)
+
+    saved = (api_routes.inference, Config.SCREENING_CHUNK_SIZE)
+    Config.SCREENING_CHUNK_SIZE = 2
+    body = HEADER + '\n' + '\n'.join(ROWS) + '\n'
+    try:
+        api_routes.inference = FailingInference(saved[0])
+        rows = list(csv.reader(io.StringIO(_post(client, body).get_data(as_text=True))))
+        assert rows[0] == RESULT_COLUMNS and [r[0] for r in rows[1:3]] == ['1', '2']
+        assert len(rows) == 4 and len(rows[-1]) == len(RESULT_COLUMNS)
+        assert rows[-1][RESULT_COLUMNS.index('error')] == 'Proses dihentikan: model "v2", gagal dimuat'
+
+        api_routes.inference = FailingInference(saved[0])
+        lines = _post(client, body, fmt='ndjson').get_data(as_text=True).splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[-1]) == {'error': 'Proses dihentikan: model "v2", gagal dimuat'}
+    finally:
+        api_routes.inference, Config.SCREENING_CHUNK_SIZE = saved
+    print("   ✅ Baris error CSV selebar header, kutip & koma di-escape")
+
+
+if __name__ == "__main__":
+    test_csv_and_ndjson_output()
+    test_rejects_bad_input()
+    test_mid_stream_error_row()
@@ -0,0 +1,107 @@
+"""
+Backend/test/test_training_job.py
+Unit Test untuk job training latar (/api/admin/train).
+Fokus: progres tahap/fold tertulis ke file status, dan job yang prosesnya hilang tidak dianggap berjalan.
+"""
+
+import os
+import sys
+import tempfile
+import subprocess
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from flask import Flask
+
+from Backend.config import Config
+from Backend.models import training_job
+
+
+def _fake_train(activate=False, shadow=False, progress=None, backend=None):
+    """Pengganti train_model(): hanya melaporkan tahap seperti aslinya."""
+    progress('load_data')
+    scores = []
+    for fold in range(1, 4):
+        progress('cross_validation', fold=fold, n_folds=3, fold_scores=list(scores))
+        scores.append(0.9)
+    progress('final_fit', fold_scores=scores)
+    progress('register')
+    return 'v0007' if activate else False
+
+
+def test_progress_status():
+    print("\n🧵 TEST: Progres job training")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'training_job.json')
+
+        assert training_job.run_job('job-1', activate=True, status_path=path, train=_fake_train) == 'v0007'
+        status = training_job.job_status(path)
+        assert status['state'] == 'succeeded' and status['version'] == 'v0007'
+        assert status['fold'] == 3 and status['n_folds'] == 3 and status['fold_scores'] == [0.9] * 3
+        assert [s['stage'] for s in status['stages']] == [
+            'running', 'load_data', 'cross_validation', 'final_fit', 'register']
+
+        # train_model() return False -> job gagal dengan pesan error
+        assert training_job.run_job('job-2', status_path=path, train=_fake_train) is None
+        status = training_job.job_status(path)
+        assert status['state'] == 'failed' and status['error']
+        print("   ✅ Tahap, fold & versi hasil tercatat")
+
+
+def test_dead_and_busy_jobs():
+    print("\n🧵 TEST: Job mati & job ganda")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'training_job.json')
+
+        # Status 'running' dengan pid yang sudah tidak ada -> dilaporkan gagal
+        proc = subprocess.Popen([sys.executable, '-c', 'pass'])
+        proc.wait()
+        training_job._write_status(training_job._new_status('job-x', 'running', proc.pid, {}), path)
+        assert training_job.job_status(path)['state'] == 'failed'
+
+        # Status 'running' dengan proses hidup -> job baru ditolak
+        training_job._write_status(training_job._new_status('job-y', 'running', os.getpid(), {}), path)
+        try:
+            training_job.start_job(status_path=path)
+            raised = False
+        except training_job.JobBusyError:
+            raised = True
+        assert raised
+        assert training_job.job_status(path)['elapsed_seconds'] >= 0
+        print("   ✅ Proses hilang -> failed, job ganda -> ditolak")
+
+
+def test_admin_endpoints_fail_closed():
+    print("\n🧵 TEST: Endpoint admin tanpa ADMIN_TOKEN ditolak")
+    from Backend.routes import api_routes
+
+    app = Flask(__name__)
+    app.register_blueprint(api_routes.api_bp)
+    client = app.test_client()
+    saved = Config.ADMIN_TOKEN
+    try:
+        # Token belum dikonfigurasi -> semua endpoint admin 403 (termasuk dengan header kosong)
+        Config.ADMIN_TOKEN = ''
+        for method, url in (('post', '/api/admin/train'), ('get', '/api/admin/train'),
+                            ('post', '/api/admin/reload'), ('post', '/api/stats/rebuild')):
+            assert getattr(client, method)(url).status_code == 403
+            assert getattr(client, method)(url, headers={'X-Admin-Token': ''}).status_code == 403
+
+        # Token di-set -> token salah ditolak, token benar diteruskan ke endpoint
+        Config.ADMIN_TOKEN = 'rahasia'
+        assert client.get('/api/admin/train', headers={'X-Admin-Token': 'salah'}).status_code == 403
+        assert client.post('/api/stats/rebuild', headers={'X-Admin-Token': 'salah'}).status_code == 403
+        assert client.get('/api/admin/train', headers={'X-Admin-Token': 'rahasia'}).status_code in (200, 404)
+    finally:
+        Config.ADMIN_TOKEN = saved
+    print("   ✅ Tanpa token admin -> 403")
+
+
+if __name__ == "__main__":
+    test_progress_status()
+    test_dead_and_busy_jobs()
+    test_admin_endpoints_fail_closed()
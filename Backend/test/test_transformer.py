@@ -0,0 +1,112 @@
+"""
+Backend/test/test_transformer.py
+Unit Test untuk DiabetesFeatureTransformer & loader bundle.
+Fokus: hasil identik dengan clean_and_encode (record & batch) dan deteksi versi preprocessing.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.tree import DecisionTreeClassifier
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models.bundle import PreprocessVersionError, load_model_bundle
+from Backend.models.preprocess import PREPROCESS_VERSION, DiabetesFeatureTransformer, DiabetesPreprocessor
+
+RECORDS = [
+    {'age': 45, 'gender': 'Male', 'pulse_rate': 72, 'systolic_bp': 130, 'diastolic_bp': 85,
+     'glucose': 150, 'height': 170, 'weight': 70, 'bmi': 0, 'family_diabetes': 'Yes',
+     'hypertensive': 'No', 'family_hypertension': 'No', 'cardiovascular_disease': 'No', 'stroke': 'No'},
+    {'age': '60', 'gender': 'perempuan', 'pulse_rate': '88', 'systolic_bp': 150, 'diastolic_bp': 95,
+     'glucose': 6.1, 'height': 1.55, 'weight': 68, 'bmi': 28.3, 'family_diabetes': 1,
+     'hypertensive': 'ya', 'family_hypertension': '0', 'cardiovascular_disease': 'tidak', 'stroke': 'y'},
+    {'age': 'le', 'gender': None, 'pulse_rate': None, 'systolic_bp': '', 'diastolic_bp': 80,
+     'glucose': None, 'height': 0, 'weight': 50, 'bmi': None, 'family_diabetes': 'maybe',
+     'hypertensive': '2', 'family_hypertension': None, 'cardiovascular_disease': 'none', 'stroke': 'x'},
+]
+
+
+def _reference(records):
+    pp = DiabetesPreprocessor()
+    return pp.get_features(pp.clean_and_encode(pd.DataFrame(records))).to_numpy()
+
+
+def test_record_and_batch_match_clean_and_encode():
+    print("\n[1] Transformer == clean_and_encode (record & batch)")
+    transformer = DiabetesFeatureTransformer().fit()
+    expected = _reference(RECORDS)
+
+    batch = transformer.transform(pd.DataFrame(RECORDS))
+    assert list(batch.columns) == Config.FEATURES
+    assert batch.dtypes.eq(np.float32).all()
+    assert np.array_equal(batch.to_numpy(), expected)
+
+    singles = np.vstack([transformer.transform(r).to_numpy() for r in RECORDS])
+    assert np.array_equal(singles, expected)
+    print(f"   ✅ {len(RECORDS)} record identik (BMI otomatis: {batch['bmi'].iloc[0]})")
+
+
+def test_randomized_half_values_match():
+    print("\n[2] Fuzz: tinggi setengah cm & glukosa setengah mg/dL (pembulatan setengah)")
+    rng = np.random.default_rng(37)
+    n = 5000
+    records = pd.DataFrame({
+        'age': rng.integers(18, 90, n), 'gender': rng.choice(['Male', 'Female'], n),
+        'pulse_rate': rng.integers(50, 120, n), 'systolic_bp': rng.integers(90, 200, n),
+        'diastolic_bp': rng.integers(50, 120, n),
+        'glucose': rng.integers(60, 400, n) + rng.choice([0.0, 0.5], n),
+        'height': rng.integers(130, 200, n) + rng.choice([0.0, 0.5], n),
+        'weight': rng.integers(35, 150, n) + rng.choice([0.0, 0.5], n),
+        'bmi': np.where(rng.random(n) < 0.8, 0, np.round(rng.uniform(15, 45, n), 1)),
+        'family_diabetes': rng.choice(['Yes', 'No'], n), 'hypertensive': rng.choice(['Yes', 'No'], n),
+        'family_hypertension': rng.choice(['Yes', 'No'], n),
+        'cardiovascular_disease': rng.choice(['Yes', 'No'], n), 'stroke': rng.choice(['Yes', 'No'], n),
+    }).to_dict(orient='records')
+    records.append({**RECORDS[0], 'height': 140.5, 'glucose': 150.5})
+
+    transformer = DiabetesFeatureTransformer().fit()
+    expected = _reference(records)
+    batch = transformer.transform(pd.DataFrame(records)).to_numpy()
+    singles = np.vstack([transformer.transform(r).to_numpy() for r in records])
+    assert np.array_equal(singles, expected)
+    mismatched = int((batch != singles).any(axis=1).sum())
+    assert mismatched == 0, f"{mismatched} baris batch berbeda dari jalur satu record"
+    print(f"   ✅ {len(records)} record acak identik di jalur batch & satu record")
+
+
+def test_bundle_version_check():
+    print("\n[3] Loader bundle: format lama & deteksi versi")
+    features = pd.DataFrame(_reference(RECORDS), columns=Config.FEATURES)
+    model = DecisionTreeClassifier(max_depth=2).fit(features, [0, 1, 0])
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, 'legacy.pkl')
+        joblib.dump({'model': model}, legacy)
+        bundle = load_model_bundle(legacy)
+        assert bundle['preprocess_version'] == PREPROCESS_VERSION
+        assert bundle['pipeline'].predict_proba(pd.DataFrame(RECORDS)).shape == (3, 2)
+
+        stale = os.path.join(tmp, 'stale.pkl')
+        joblib.dump({'model': model, 'preprocess_version': PREPROCESS_VERSION + '-lama'}, stale)
+        try:
+            load_model_bundle(stale)
+            raised = False
+        except PreprocessVersionError:
+            raised = True
+        assert raised
+    print("   ✅ Bundle lama dibungkus, versi berbeda ditolak")
+
+
+if __name__ == "__main__":
+    test_record_and_batch_match_clean_and_encode()
+    test_randomized_half_values_match()
+    test_bundle_version_check()
@@ -0,0 +1,100 @@
+"""
+Backend/test/test_web_routes.py
+Unit Test untuk cache halaman ter-render (Backend/routes/web_routes.py).
+Fokus: ETag/304, folder template tidak di-walk per request di produksi,
+dan perubahan template terdeteksi (dengan batas interval) saat auto-reload aktif.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+from flask import Flask
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.routes import web_routes
+from Backend.routes.assets import init_assets
+
+
+def _app():
+    app = Flask(__name__, template_folder=Config.TEMPLATES_DIR)
+    init_assets(app)
+    app.register_blueprint(web_routes.web_bp)
+    return app
+
+
+def _count_scans():
+    calls = []
+    real_scan = web_routes._scan_templates
+
+    def scan():
+        calls.append(time.monotonic())
+        return real_scan()
+    web_routes._scan_templates = scan
+    return calls, real_scan
+
+
+def test_production_scans_templates_once():
+    print("\n🌐 TEST: Produksi - sidik jari template dihitung sekali")
+    saved = (Config.TEMPLATES_AUTO_RELOAD, dict(web_routes._templates_tree))
+    calls, real_scan = _count_scans()
+    Config.TEMPLATES_AUTO_RELOAD = False
+    web_routes._templates_tree.update(version=None, checked=0.0)
+    try:
+        client = _app().test_client()
+        first = client.get('/about')
+        assert first.status_code == 200 and first.headers['ETag']
+        for _ in range(20):
+            client.get('/about')
+        assert len(calls) == 1
+
+        cached = client.get('/about', headers={'If-None-Match': first.headers['ETag']})
+        assert cached.status_code == 304
+    finally:
+        web_routes._scan_templates = real_scan
+        Config.TEMPLATES_AUTO_RELOAD = saved[0]
+        web_routes._templates_tree.update(saved[1])
+    print("   ✅ 21 request, 1 kali walk folder template, 304 dengan ETag")
+
+
+def test_auto_reload_throttled():
+    print("\n🌐 TEST: Auto-reload - perubahan template terdeteksi dengan interval")
+    saved = (Config.TEMPLATES_AUTO_RELOAD, Config.TEMPLATES_CHECK_SECONDS, dict(web_routes._templates_tree))
+    calls, real_scan = _count_scans()
+    Config.TEMPLATES_AUTO_RELOAD, Config.TEMPLATES_CHECK_SECONDS = True, 0.2
+    web_routes._templates_tree.update(version=None, checked=0.0)
+    try:
+        client = _app().test_client()
+        client.get('/about')
+        before = web_routes._templates_version
+        for _ in range(20):
+            client.get('/about')
+        assert len(calls) == 1  # Masih dalam interval
+
+        # Template "diedit" (mtime berubah) -> terdeteksi setelah interval lewat
+        path = os.path.join(Config.TEMPLATES_DIR, 'pages', 'about.html')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        try:
+            time.sleep(0.25)
+            client.get('/about')
+            assert len(calls) == 2
+            assert web_routes._templates_version != before  # Cache render dibuang
+        finally:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    finally:
+        web_routes._scan_templates = real_scan
+        Config.TEMPLATES_AUTO_RELOAD, Config.TEMPLATES_CHECK_SECONDS = saved[0], saved[1]
+        web_routes._templates_tree.update(saved[2])
+    print("   ✅ Walk folder template paling sering sekali per interval")
+
+
+if __name__ == "__main__":
+    test_production_scans_templates_once()
+    test_auto_reload_throttled()
@@ -20,10 +20,12 @@ sys.path.insert(0, str(project_root))
 try:
     from Backend.config import Config
     from Backend.models.preprocess import DiabetesPreprocessor
+    from Backend.models.dataset import load_dataset, memory_report
 except ModuleNotFoundError:
     try:
         from backend.config import Config
         from backend.models.preprocess import DiabetesPreprocessor
+        from backend.models.dataset import load_dataset, memory_report
     except ModuleNotFoundError:
         print("❌ CRITICAL ERROR: Module 'Backend' tidak ditemukan.")
         sys.exit(1)
@@ -40,7 +42,8 @@ def analyze_dataset():
             return False
 
         print(f"📂 Membaca RAW Data: {Config.RAW_DATA}")
-        df_raw = pd.read_csv(Config.RAW_DATA)
+        df_raw = load_dataset(Config.RAW_DATA, kind='raw')
+        print(memory_report(df_raw, 'RAW Data'))
         
         # Gunakan Preprocessor untuk membersihkan data
         pp = DiabetesPreprocessor()
@@ -83,7 +86,7 @@ def analyze_dataset():
         # 4. Cek Dataset Balanced
         print(f"\n3️⃣  STATISTIK BALANCED DATA")
         if os.path.exists(Config.BALANCED_DATA):
-            df_bal = pd.read_csv(Config.BALANCED_DATA)
+            df_bal = load_dataset(Config.BALANCED_DATA, kind='balanced')
             b_counts = df_bal[target_col].value_counts()
             b_neg, b_pos = b_counts.get(0, 0), b_counts.get(1, 0)
             
@@ -12,6 +12,7 @@ sys.path.append(project_root)
 
 from Backend.config import Config
 from Backend.models.preprocess import DiabetesPreprocessor
+from Backend.models.dataset import load_dataset, memory_report
 
 def balance_data():
     print("="*60)
@@ -26,7 +27,8 @@ def balance_data():
     try:
         # --- 2. LOAD DATA ---
         print(f"📂 Membaca data dari: {Config.RAW_DATA}")
-        df = pd.read_csv(Config.RAW_DATA)
+        df = load_dataset(Config.RAW_DATA, kind='raw')
+        print(memory_report(df, 'Dataset mentah'))
 
         # --- 3. PREPROCESSING (ENCODING & CLEANING) ---
         preprocessor = DiabetesPreprocessor()
@@ -52,6 +54,7 @@ def balance_data():
         X_resampled, y_resampled = smote.fit_resample(X, y)
 
         print(f"✅ Distribusi Setelah SMOTE: {Counter(y_resampled)}")
+        print(memory_report(X_resampled, 'Hasil SMOTE'))
 
         # --- 5. GABUNGKAN KEMBALI & SIMPAN ---
         # Gabungkan X dan y hasil resampling menjadi DataFrame utuh
@@ -0,0 +1,142 @@
+"""
+Scripts/benchmark_admission.py
+Membuktikan efek admission control (Backend/routes/admission.py) secara end-to-end:
+server Gunicorn (gunicorn.conf.py) dijalankan dengan ADMISSION_ENABLED=0 lalu =1, masing-masing
+diberi beban normal dan beban berlebih (banyak klien + porsi PDF besar) lewat Scripts/load_test.py.
+
+Yang dibandingkan: p99 prediksi SUKSES, throughput 2xx, jumlah 503 (ditolak cepat + Retry-After)
+dan waktu tunggu admission dari /api/metrics. Klien load test patuh Retry-After
+(--retry-storm: klien langsung mengirim ulang, kasus terburuk).
+--micro-batch menambah profil admission ON + MICRO_BATCH_ENABLED=1 (interaksi batas predict
+dengan ukuran batch: rata-rata batch & waktu antri batcher ikut dicetak).
+
+Contoh:
+    python Scripts/benchmark_admission.py --duration 15
+    python Scripts/benchmark_admission.py --overload-concurrency 128 --pdf-ratio 0.4
+    python Scripts/benchmark_admission.py --micro-batch --pdf-ratio 0
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import subprocess
+import http.client
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Scripts.load_test import run_load, summarize, print_summary, _request
+
+
+def wait_until_ready(port, timeout=120):
+    """Polling /ready (model termuat & warmup) sampai 200. Return: True jika siap."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            if _request(conn, 'GET', '/ready') == 200:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def runtime_metrics(port):
+    """/api/metrics satu worker (yang kebetulan menjawab): admission & inference."""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('GET', '/api/metrics')
+    return json.loads(conn.getresponse().read())
+
+
+def run_profile(args, admission: bool, micro_batch: bool = False):
+    env = dict(os.environ, ADMISSION_ENABLED='1' if admission else '0', PORT=str(args.port),
+               MICRO_BATCH_ENABLED='1' if micro_batch else '0',
+               GUNICORN_WORKERS=str(args.workers), GUNICORN_ACCESS_LOG='/dev/null')
+    proc = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'run_app:app'],
+                            cwd=str(project_root), env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    results = {}
+    try:
+        if not wait_until_ready(args.port):
+            print("   ❌ Server tidak siap.")
+            return results
+        url = f"http://127.0.0.1:{args.port}"
+        for scenario, concurrency in (('normal', args.concurrency), ('overload', args.overload_concurrency)):
+            print(f"\n   ▶️  Beban {scenario}: {concurrency} klien, PDF {args.pdf_ratio:.0%}")
+            summary = summarize(run_load(url, concurrency, args.duration, args.pdf_ratio, timeout=args.timeout,
+                                         honor_retry_after=not args.retry_storm), args.duration)
+            print_summary(summary)
+            results[scenario] = summary
+        metrics = runtime_metrics(args.port)
+        if admission:
+            for name, s in (metrics.get('admission') or {}).items():
+                print(f"   🚦 {name:<9}: batas {s['limit']}, diterima {s['admitted']}, ditolak {s['rejected']}, "
+                      f"tunggu p50 {s['wait_ms_p50']} ms / p99 {s['wait_ms_p99']} ms (1 worker)")
+        batcher = metrics.get('inference') or {}
+        if 'avg_batch_size' in batcher:
+            print(f"   📦 micro-batch: rata-rata {batcher['avg_batch_size']} baris/batch (maks {batcher['max_batch']}), "
+                  f"antri p50 {batcher['queue_ms_p50']} ms / p99 {batcher['queue_ms_p99']} ms (1 worker)")
+            for summary in results.values():
+                summary['avg_batch_size'] = batcher['avg_batch_size']
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=60)
+    return results
+
+
+def main(args):
+    print("=" * 96)
+    print("🚦 BENCHMARK ADMISSION CONTROL (LOAD SHEDDING) - PREDIKSI vs PDF")
+    print("=" * 96)
+    print(f"   CPU: {os.cpu_count()} | worker: {args.workers} | durasi: {args.duration:.0f} detik per beban")
+
+    variants = [('admission OFF', False, False), ('admission ON', True, False)]
+    if args.micro_batch:
+        variants.append(('adm ON+batch', True, True))
+    profiles = {}
+    for label, admission, micro_batch in variants:
+        print("\n" + "-" * 96)
+        print(f"🔧 {label}")
+        profiles[label] = run_profile(args, admission, micro_batch)
+
+    print("\n" + "=" * 96)
+    print(f"   {'Profil':<14} {'Beban':<9} {'predict 2xx/s':>13} {'p99 2xx ms':>11} {'503':>7} "
+          f"{'report 2xx/s':>13} {'p99 2xx ms':>11} {'batch':>6}")
+    for label, scenarios in profiles.items():
+        for scenario, summary in scenarios.items():
+            p = summary.get('predict', {})
+            r = summary.get('report', {})
+            batch = summary.get('avg_batch_size', '-')
+            print(f"   {label:<14} {scenario:<9} {p.get('ok_rps', 0):>13.1f} {p.get('ok_p99', 0):>11.1f} "
+                  f"{p.get('status', {}).get(503, 0):>7} {r.get('ok_rps', 0):>13.1f} {r.get('ok_p99', 0):>11.1f} "
+                  f"{batch:>6}")
+    print("=" * 96)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(profiles, f, indent=2, default=str)
+        print(f"💾 Hasil tersimpan: {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark admission control di bawah beban berlebih")
+    parser.add_argument('--port', type=int, default=18766)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=4, help="Klien untuk beban normal")
+    parser.add_argument('--overload-concurrency', type=int, default=64, help="Klien untuk beban berlebih")
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--pdf-ratio', type=float, default=0.2)
+    parser.add_argument('--timeout', type=float, default=30.0, help="Timeout klien (detik)")
+    parser.add_argument('--retry-storm', action='store_true',
+                        help="Klien mengabaikan Retry-After dan langsung mengirim ulang setelah 503")
+    parser.add_argument('--micro-batch', action='store_true',
+                        help="Tambah profil admission ON + micro-batching (MICRO_BATCH_ENABLED=1)")
+    parser.add_argument('--output', default=None, help="Simpan hasil sebagai JSON")
+    main(parser.parse_args())
@@ -0,0 +1,151 @@
+"""
+Scripts/benchmark_backends.py
+Matriks biaya vs akurasi backend model (Backend/models/backends.py), berdampingan:
+- metrik CV (akurasi, ROC AUC, F1, Brier) dengan fold yang sama untuk semua backend
+- waktu training model final (seluruh data)
+- latensi inference 1 baris (seperti /api/predict: DataFrame 1 baris) p50/p99
+- latensi batch (seperti /api/screening) per batch & per baris
+- ukuran model terserialisasi (joblib, seperti di bundle)
+
+Contoh:
+    python Scripts/benchmark_backends.py
+    python Scripts/benchmark_backends.py --source raw --backends tree hist_gb --output hasil.json
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+import joblib
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score, brier_score_loss, f1_score, roc_auc_score
+from sklearn.model_selection import StratifiedKFold
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models.backends import get_backend, list_backends
+from Backend.models.dataset import load_dataset
+from Backend.models.preprocess import DiabetesPreprocessor
+
+
+def load_data(source):
+    path = Config.BALANCED_DATA if source == 'balanced' else Config.RAW_DATA
+    if not Path(path).exists():
+        print(f"❌ Dataset tidak ditemukan: {path}")
+        if source == 'balanced':
+            print("   Jalankan Scripts/balance_dataset.py atau pakai --source raw.")
+        return None, None
+    df = load_dataset(path, kind=source)
+    if source == 'raw':
+        df = DiabetesPreprocessor().clean_and_encode(df, is_training=True)
+    df = df[Config.FEATURES + ['diabetic']].dropna()
+    return df[Config.FEATURES], df['diabetic'].astype(int)
+
+
+def cross_validate(estimator, X, y, folds):
+    """Metrik out-of-fold (probabilitas semua baris dari fold tempat baris itu jadi data uji)."""
+    cv = StratifiedKFold(n_splits=folds, shuffle=True, random_state=42)
+    proba = np.zeros(len(y))
+    for train_idx, test_idx in cv.split(X, y):
+        fold_model = clone(estimator).fit(X.iloc[train_idx], y.iloc[train_idx])
+        proba[test_idx] = fold_model.predict_proba(X.iloc[test_idx])[:, 1]
+    pred = (proba > 0.5).astype(int)
+    return {
+        'accuracy': accuracy_score(y, pred),
+        'roc_auc': roc_auc_score(y, proba),
+        'f1': f1_score(y, pred),
+        'brier': brier_score_loss(y, proba),
+    }
+
+
+def time_calls(fn, repeats):
+    fn()  # warmup
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return np.percentile(samples, 50), np.percentile(samples, 99)
+
+
+def benchmark_backend(name, X, y, args):
+    backend = get_backend(name)
+    result = {'backend': name, 'algorithm': backend.algorithm}
+
+    t0 = time.perf_counter()
+    result['cv'] = {k: round(float(v), 4) for k, v in cross_validate(backend.build(), X, y, args.folds).items()}
+    result['cv_seconds'] = round(time.perf_counter() - t0, 2)
+
+    model = backend.build()
+    t0 = time.perf_counter()
+    model.fit(X, y)
+    result['fit_seconds'] = round(time.perf_counter() - t0, 3)
+
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    result['size_kb'] = round(buffer.tell() / 1024, 1)
+
+    # 1 baris: DataFrame seperti keluaran transformer di /api/predict
+    row = X.iloc[:1]
+    p50, p99 = time_calls(lambda: model.predict_proba(row), args.single)
+    result['single_ms'] = {'p50': round(p50, 3), 'p99': round(p99, 3)}
+
+    batch = X.iloc[:args.batch_size]
+    p50, p99 = time_calls(lambda: model.predict_proba(batch), args.batch_repeats)
+    result['batch_ms'] = {'p50': round(p50, 3), 'p99': round(p99, 3),
+                          'per_row_us': round(p50 * 1000 / len(batch), 2)}
+    return result
+
+
+def main(args):
+    print("=" * 100)
+    print("🏁 BENCHMARK BACKEND MODEL: BIAYA vs AKURASI")
+    print("=" * 100)
+
+    X, y = load_data(args.source)
+    if X is None:
+        return False
+    print(f"   Dataset       : {args.source} ({len(X):,} baris, {args.folds}-fold CV)")
+    print(f"   Latensi       : 1 baris x {args.single}, batch {args.batch_size} x {args.batch_repeats}")
+    print("-" * 100)
+    print(f"   {'Backend':<16} {'Akurasi':>8} {'AUC':>7} {'F1':>7} {'Brier':>7} {'Fit s':>7} "
+          f"{'1 baris p50/p99 ms':>19} {'Batch ms':>9} {'µs/baris':>9} {'KB':>8}")
+
+    results = []
+    for name in args.backends:
+        res = benchmark_backend(name, X, y, args)
+        results.append(res)
+        cv, single, batch = res['cv'], res['single_ms'], res['batch_ms']
+        print(f"   {name:<16} {cv['accuracy']:>8.4f} {cv['roc_auc']:>7.4f} {cv['f1']:>7.4f} "
+              f"{cv['brier']:>7.4f} {res['fit_seconds']:>7.2f} "
+              f"{single['p50']:>10.3f}/{single['p99']:<8.3f} {batch['p50']:>9.2f} "
+              f"{batch['per_row_us']:>9.2f} {res['size_kb']:>8.1f}")
+    print("=" * 100)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'source': args.source, 'rows': int(len(X)), 'folds': args.folds,
+                       'results': results}, f, indent=2)
+        print(f"💾 Hasil tersimpan: {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bandingkan biaya & akurasi backend model")
+    parser.add_argument('--source', choices=['balanced', 'raw'], default='balanced')
+    parser.add_argument('--backends', nargs='+', choices=list_backends(), default=list_backends())
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--single', type=int, default=300, help="Jumlah prediksi 1 baris per backend")
+    parser.add_argument('--batch-size', type=int, default=Config.SCREENING_CHUNK_SIZE)
+    parser.add_argument('--batch-repeats', type=int, default=20)
+    parser.add_argument('--output', default=None, help="Simpan hasil lengkap sebagai JSON")
+    if not main(parser.parse_args()):
+        sys.exit(1)
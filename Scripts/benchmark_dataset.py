@@ -0,0 +1,108 @@
+"""
+Scripts/benchmark_dataset.py
+Membandingkan cara load dataset (sebelum vs sesudah loader terpusat):
+1. baseline -> pd.read_csv polos (dtype ditebak pandas: object / int64 / float64)
+2. loader   -> Backend/models/dataset.load_dataset (dtype ringkas dari Config, PyArrow jika ada)
+3. chunked  -> iter_dataset per chunk (memori dibatasi ukuran chunk)
+
+Setiap mode dijalankan di proses terpisah (spawn) agar peak RSS tidak saling memengaruhi.
+Dilaporkan: waktu load + clean_and_encode, ukuran DataFrame, dan peak RSS proses.
+
+Contoh:
+    python Scripts/benchmark_dataset.py --repeat 50
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+
+MODES = ('baseline', 'loader', 'chunked')
+
+
+def _run_mode(mode, path, queue):
+    """Dijalankan di proses anak."""
+    import pandas as pd
+    from Backend.models import dataset
+    from Backend.models.preprocess import DiabetesPreprocessor
+
+    pp = DiabetesPreprocessor()
+    start = time.perf_counter()
+    if mode == 'baseline':
+        df = pd.read_csv(path)
+        frame_mb = dataset.frame_memory_mb(df)
+        rows = len(pp.clean_and_encode(df, is_training=True))
+    elif mode == 'loader':
+        df = dataset.load_dataset(path, kind='raw')
+        frame_mb = dataset.frame_memory_mb(df)
+        rows = len(pp.clean_and_encode(df, is_training=True))
+    else:
+        frame_mb, rows = 0.0, 0
+        for chunk in dataset.iter_dataset(path, kind='raw'):
+            frame_mb = max(frame_mb, dataset.frame_memory_mb(chunk))
+            rows += len(pp.clean_and_encode(chunk, is_training=True))
+    elapsed = time.perf_counter() - start
+
+    queue.put({'mode': mode, 'rows': rows, 'seconds': elapsed,
+               'frame_mb': frame_mb, 'peak_mb': dataset.peak_rss_mb()})
+
+
+def build_input(repeat):
+    """Dataset RAW diulang N kali ke file sementara (simulasi file besar)."""
+    if repeat <= 1:
+        return Config.RAW_DATA, None
+    with open(Config.RAW_DATA, 'r', encoding='utf-8') as f:
+        header, *lines = f.read().splitlines()
+    tmp = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8')
+    with tmp:
+        tmp.write(header + '\n')
+        body = '\n'.join(lines) + '\n'
+        for _ in range(repeat):
+            tmp.write(body)
+    return tmp.name, tmp.name
+
+
+def benchmark(args):
+    print("=" * 72)
+    print("📦 BENCHMARK LOAD DATASET (SEBELUM vs SESUDAH LOADER)")
+    print("=" * 72)
+
+    path, cleanup = build_input(args.repeat)
+    size_mb = os.path.getsize(path) / (1024 ** 2)
+    print(f"   File: {path} ({size_mb:.1f} MB, dataset RAW x{args.repeat})")
+    print(f"   Engine loader: {Config.DATASET_ENGINE} | chunk: {Config.DATASET_CHUNK_SIZE:,} baris")
+    print("-" * 72)
+    print(f"{'Mode':<10} {'Baris':>10} {'Waktu (s)':>10} {'DataFrame (MB)':>15} {'Peak RSS (MB)':>15}")
+
+    ctx = multiprocessing.get_context('spawn')
+    try:
+        for mode in MODES:
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run_mode, args=(mode, path, queue))
+            proc.start()
+            res = queue.get()
+            proc.join()
+            label = 'maks chunk' if mode == 'chunked' else ''
+            print(f"{mode:<10} {res['rows']:>10,} {res['seconds']:>10.2f} "
+                  f"{res['frame_mb']:>15.2f} {res['peak_mb']:>15.1f} {label}")
+    finally:
+        if cleanup:
+            os.remove(cleanup)
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark loader dataset")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="Berapa kali dataset RAW diulang untuk membuat file uji")
+    benchmark(parser.parse_args())
@@ -0,0 +1,132 @@
+"""
+Scripts/benchmark_inference.py
+Benchmark backend inference (tanpa Flask):
+membandingkan throughput & tail latency antara panggilan model langsung (in-thread),
+pool proses, dan micro-batching dengan berbagai ukuran jendela / batch.
+
+Contoh:
+    python Scripts/benchmark_inference.py --threads 16 --requests 200
+    python Scripts/benchmark_inference.py --windows 0.5 2 5 --max-batch 64
+    python Scripts/benchmark_inference.py --process --workers 4
+"""
+
+import sys
+import os
+import time
+import argparse
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models.bundle import load_model_bundle
+from Backend.models.preprocess import DiabetesPreprocessor
+from Backend.models.dataset import iter_dataset
+from Backend.models.registry import active_paths
+from Backend.models.inference import DirectInference, MicroBatcher, ProcessPoolInference
+
+
+def load_rows(n_rows=512):
+    """Mengambil sampel baris fitur asli dari dataset RAW (sudah dibersihkan)."""
+    pp = DiabetesPreprocessor()
+    df = pp.clean_and_encode(next(iter_dataset(Config.RAW_DATA, chunksize=n_rows)))
+    return pp.get_features(df).to_numpy(dtype=np.float32)
+
+
+def run_scenario(engine, rows, n_threads, n_requests):
+    """Menjalankan n_threads klien paralel, masing-masing n_requests prediksi 1 baris."""
+    latencies = [[] for _ in range(n_threads)]
+    barrier = threading.Barrier(n_threads + 1)
+
+    def client(idx):
+        rng = np.random.default_rng(idx)
+        barrier.wait()
+        for _ in range(n_requests):
+            row = rows[rng.integers(len(rows))]
+            t0 = time.perf_counter()
+            engine.predict_proba(row)
+            latencies[idx].append((time.perf_counter() - t0) * 1000)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(n_threads)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    lat = np.concatenate([np.asarray(l) for l in latencies])
+    return {
+        'throughput': len(lat) / elapsed,
+        'p50': np.percentile(lat, 50),
+        'p95': np.percentile(lat, 95),
+        'p99': np.percentile(lat, 99),
+    }
+
+
+def print_row(name, res, extra=""):
+    print(f"   {name:<28} {res['throughput']:>9.1f} {res['p50']:>8.2f} "
+          f"{res['p95']:>8.2f} {res['p99']:>8.2f}  {extra}")
+
+
+def benchmark(args):
+    print("=" * 78)
+    print("⚡ BENCHMARK INFERENCE: DIRECT vs PROCESS POOL vs MICRO-BATCHING")
+    print("=" * 78)
+
+    model = load_model_bundle(active_paths()[0])['model']
+    rows = load_rows()
+
+    print(f"   CPU tersedia  : {os.cpu_count()}")
+    print(f"   Threads klien : {args.threads}")
+    print(f"   Request/klien : {args.requests}")
+    print("-" * 78)
+    print(f"   {'Skenario':<28} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+
+    direct = DirectInference(model)
+    direct.predict_proba(rows[:1])  # warmup
+    print_row("direct (in-thread)", run_scenario(direct, rows, args.threads, args.requests))
+
+    for window in args.windows:
+        batcher = MicroBatcher(DirectInference(model), window_ms=window, max_batch=args.max_batch)
+        batcher.predict_proba(rows[:1])
+        res = run_scenario(batcher, rows, args.threads, args.requests)
+        stats = batcher.stats()
+        batcher.close()
+        print_row(f"batch window={window}ms", res,
+                  f"avg batch {stats['avg_batch_size']}, antri p99 {stats['queue_ms_p99']} ms")
+
+    if args.process:
+        pool = ProcessPoolInference(model, workers=args.workers)
+        pool.predict_proba(rows[:1])
+        print_row(f"process pool ({pool.workers} worker)",
+                  run_scenario(pool, rows, args.threads, args.requests))
+
+        for window in args.windows:
+            batcher = MicroBatcher(pool, window_ms=window, max_batch=args.max_batch)
+            res = run_scenario(batcher, rows, args.threads, args.requests)
+            print_row(f"batch+process window={window}ms", res,
+                      f"avg batch {batcher.stats()['avg_batch_size']}")
+        pool.close()
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark backend inference")
+    parser.add_argument('--threads', type=int, default=16, help="Jumlah klien paralel")
+    parser.add_argument('--requests', type=int, default=100, help="Request per klien")
+    parser.add_argument('--windows', type=float, nargs='+', default=[0.5, 2.0, 5.0],
+                        help="Daftar jendela micro-batch (ms)")
+    parser.add_argument('--max-batch', type=int, default=Config.MICRO_BATCH_MAX_SIZE)
+    parser.add_argument('--process', action='store_true', help="Sertakan backend pool proses")
+    parser.add_argument('--workers', type=int, default=Config.INFERENCE_WORKERS,
+                        help="Jumlah proses worker untuk backend 'process'")
+    benchmark(parser.parse_args())
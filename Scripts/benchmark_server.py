@@ -0,0 +1,108 @@
+"""
+Scripts/benchmark_server.py
+Membandingkan beberapa profil Gunicorn secara end-to-end:
+1. default  -> 1 worker sync, tanpa preload, tanpa warmup (CMD Dockerfile lama)
+2. gthread  -> beberapa worker gthread, tanpa preload/warmup
+3. preload  -> profil produksi gunicorn.conf.py (preload + warmup post_fork + recycling)
+
+Untuk setiap profil dilaporkan: waktu boot, latensi prediksi pertama,
+serta throughput & latensi p50/p95/p99 di bawah beban campuran predict + PDF.
+
+Contoh:
+    python Scripts/benchmark_server.py --duration 15 --concurrency 16 --pdf-ratio 0.1
+"""
+
+import os
+import sys
+import time
+import signal
+import argparse
+import subprocess
+import http.client
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Scripts.load_test import run_load, summarize, print_summary, _request, SAMPLE_PATIENT
+
+
+def variants(port, workers, threads):
+    bind = f"0.0.0.0:{port}"
+    return {
+        'default': ['-c', os.devnull, '-b', bind],
+        'gthread': ['-c', os.devnull, '-b', bind, '-k', 'gthread',
+                    '-w', str(workers), '--threads', str(threads)],
+        'preload': ['-c', str(project_root / 'gunicorn.conf.py'), '-b', bind,
+                    '-w', str(workers), '--threads', str(threads)],
+    }
+
+
+def wait_until_up(port, timeout=120):
+    """Polling /health sampai server menjawab. Return: detik sejak start atau None."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            if _request(conn, 'GET', '/health') == 200:
+                return time.perf_counter() - start
+        except OSError:
+            time.sleep(0.1)
+    return None
+
+
+def first_prediction_ms(port):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    start = time.perf_counter()
+    _request(conn, 'POST', '/api/predict', SAMPLE_PATIENT)
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark(args):
+    print("=" * 78)
+    print("🦄 BENCHMARK PROFIL GUNICORN")
+    print("=" * 78)
+    print(f"   CPU: {os.cpu_count()} | worker: {args.workers} | thread: {args.threads} | "
+          f"klien: {args.concurrency} | PDF: {args.pdf_ratio:.0%}")
+
+    for name, cli in variants(args.port, args.workers, args.threads).items():
+        if args.only and name not in args.only:
+            continue
+        print("\n" + "-" * 78)
+        print(f"▶️  Profil: {name}")
+
+        proc = subprocess.Popen([sys.executable, '-m', 'gunicorn', *cli, 'run_app:app'],
+                                cwd=str(project_root),
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            boot = wait_until_up(args.port)
+            if boot is None:
+                print("   ❌ Server tidak merespons.")
+                continue
+
+            first_ms = first_prediction_ms(args.port)
+            print(f"   Boot          : {boot:.2f} detik")
+            print(f"   Prediksi #1   : {first_ms:.1f} ms")
+
+            res = run_load(f"http://127.0.0.1:{args.port}", args.concurrency,
+                           args.duration, args.pdf_ratio)
+            print_summary(summarize(res, args.duration))
+        finally:
+            proc.send_signal(signal.SIGTERM)
+            proc.wait(timeout=60)
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark profil Gunicorn")
+    parser.add_argument('--port', type=int, default=18765)
+    parser.add_argument('--workers', type=int, default=max(2, min((os.cpu_count() or 1) + 1, 8)))
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--pdf-ratio', type=float, default=0.1)
+    parser.add_argument('--only', nargs='+', choices=['default', 'gthread', 'preload'])
+    benchmark(parser.parse_args())
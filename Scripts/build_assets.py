@@ -0,0 +1,127 @@
+"""
+Scripts/build_assets.py
+Build step aset statis (jalankan saat deploy / di Dockerfile):
+1. Fingerprint: setiap file di Backend/static disalin ke static/dist/ dengan hash konten
+   di namanya (styles.css -> styles.3f2a9c1b0d.css) sehingga bisa di-cache selamanya
+2. Pre-kompresi: varian .gz (dan .br jika modul 'brotli' tersedia) untuk file teks
+3. Manifest: static/dist/manifest.json (path asli -> path ber-hash) dibaca helper asset_url()
+
+Contoh:
+    python Scripts/build_assets.py
+"""
+
+import os
+import sys
+import gzip
+import json
+import shutil
+import hashlib
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# Folder di dalam static yang BUKAN aset build (hasil runtime / output build itu sendiri)
+SKIP_DIRS = {'dist', 'reports'}
+# Format yang sudah terkompresi (jpg/png/pdf) tidak perlu di-gzip lagi
+COMPRESSIBLE = {'.css', '.js', '.svg', '.json', '.txt', '.html', '.ico', '.map'}
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def fingerprinted_name(rel_path: str, digest: str) -> str:
+    stem, ext = os.path.splitext(rel_path)
+    return f"{stem}.{digest}{ext}"
+
+
+def iter_assets(static_dir):
+    for root, dirs, files in os.walk(static_dir):
+        rel_root = os.path.relpath(root, static_dir)
+        if rel_root == '.':
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in sorted(files):
+            yield os.path.relpath(os.path.join(root, name), static_dir).replace(os.sep, '/')
+
+
+def write_compressed(path: str, data: bytes):
+    """Menulis varian .gz / .br hanya jika hasilnya lebih kecil dari aslinya."""
+    variants = []
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        with open(path + '.gz', 'wb') as f:
+            f.write(gz)
+        variants.append(('gzip', len(gz)))
+    if HAS_BROTLI:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data):
+            with open(path + '.br', 'wb') as f:
+                f.write(br)
+            variants.append(('br', len(br)))
+    return variants
+
+
+def build_assets():
+    print("=" * 60)
+    print("🏗️  BUILD ASET STATIS (FINGERPRINT + PRE-KOMPRESI)")
+    print("=" * 60)
+
+    static_dir = Config.STATIC_DIR
+    dist_dir = Config.ASSET_DIST_DIR
+
+    # Build ulang dari nol agar file hash lama tidak menumpuk
+    if os.path.exists(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir, exist_ok=True)
+
+    if not HAS_BROTLI:
+        print("ℹ️  Modul 'brotli' tidak ada, hanya membuat varian gzip (pip install brotli).")
+
+    manifest = {}
+    total_raw = total_best = 0
+    for rel_path in iter_assets(static_dir):
+        with open(os.path.join(static_dir, rel_path), 'rb') as f:
+            data = f.read()
+
+        hashed = fingerprinted_name(rel_path, content_hash(data))
+        out_path = os.path.join(dist_dir, hashed)
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        with open(out_path, 'wb') as f:
+            f.write(data)
+        manifest[rel_path] = hashed
+
+        variants = []
+        if os.path.splitext(rel_path)[1].lower() in COMPRESSIBLE:
+            variants = write_compressed(out_path, data)
+
+        best = min([len(data)] + [size for _, size in variants])
+        total_raw += len(data)
+        total_best += best
+        info = ', '.join(f"{enc} {size:,}B" for enc, size in variants) or 'tanpa kompresi'
+        print(f"   ✅ {rel_path:<28} -> {hashed:<36} ({len(data):,}B | {info})")
+
+    with open(Config.ASSET_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print("-" * 60)
+    print(f"📦 {len(manifest)} aset | {total_raw:,}B -> {total_best:,}B setelah kompresi terbaik")
+    print(f"📄 Manifest: {Config.ASSET_MANIFEST}")
+    return True
+
+
+if __name__ == "__main__":
+    if build_assets():
+        print("\n✅ Build aset selesai.")
+    else:
+        sys.exit(1)
@@ -0,0 +1,65 @@
+"""
+Scripts/build_drift_reference.py
+Membuat ulang distribusi referensi monitor drift (Backend/models/drift_reference.json)
+tanpa melatih ulang model. Scripts/train_model.py sudah membuat file ini otomatis.
+
+Sumber default (--source auto): dataset training (diabetes_balanced.csv) jika ada, selain itu
+dataset mentah Config.RAW_DATA (diabetes.csv di-encode dengan aturan preprocessing yang sama).
+
+Contoh:
+    python Scripts/build_drift_reference.py
+    python Scripts/build_drift_reference.py --source raw --bins 20
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models.dataset import load_dataset
+from Backend.models.drift import build_reference, save_reference
+from Backend.models.preprocess import DiabetesPreprocessor
+
+
+def main(args):
+    print("=" * 60)
+    print("📐 MEMBUAT REFERENSI DRIFT FITUR")
+    print("=" * 60)
+
+    source = args.source
+    if source == 'auto':
+        source = 'balanced' if Path(Config.BALANCED_DATA).exists() else 'raw'
+        if source == 'raw':
+            print(f"ℹ️  {Config.BALANCED_DATA} belum ada, referensi dibuat dari dataset mentah.")
+    path = Config.BALANCED_DATA if source == 'balanced' else Config.RAW_DATA
+    if not Path(path).exists():
+        print(f"❌ Dataset tidak ditemukan: {path}")
+        if source == 'balanced':
+            print("   Jalankan Scripts/balance_dataset.py atau pakai --source raw.")
+        return False
+
+    df = load_dataset(path, kind=source)
+    if source == 'raw':
+        df = DiabetesPreprocessor().clean_and_encode(df, is_training=True)
+    X = df[Config.FEATURES].dropna()
+
+    reference = build_reference(X, bins=args.bins, source=Path(path).name)
+    out = save_reference(reference, args.output)
+    print(f"📊 {len(X):,} baris, {args.bins or Config.DRIFT_BINS} bin per fitur")
+    print(f"💾 Referensi tersimpan: {out}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bangun referensi distribusi fitur untuk monitor drift")
+    parser.add_argument('--source', choices=['auto', 'balanced', 'raw'], default='auto',
+                        help="auto = balanced jika ada, selain itu raw")
+    parser.add_argument('--bins', type=int, default=None)
+    parser.add_argument('--output', default=None, help="Default: Config.DRIFT_REFERENCE_PATH")
+    if not main(parser.parse_args()):
+        sys.exit(1)
@@ -0,0 +1,122 @@
+"""
+Scripts/cascade_report.py
+Laporan mode cascade (Config.CASCADE_*) atas diabetes.csv untuk beberapa lebar band ketidakpastian:
+- escalation rate   : porsi baris yang dinaikkan ke ensemble penuh (|p_tahap1 - 0.5| < band)
+- kesepakatan       : label & |selisih probabilitas| hasil cascade vs ensemble penuh (semua baris)
+- latensi           : per request 1 baris (seperti /api/predict) ensemble penuh vs cascade,
+                      diukur langsung dengan CascadeInference pada sampel baris
+
+Contoh:
+    python Scripts/cascade_report.py
+    python Scripts/cascade_report.py --first-stage fold --bands 0.05 0.1 0.2 --output cascade.json
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import registry
+from Backend.models.bundle import load_model_bundle
+from Backend.models.dataset import load_dataset
+from Backend.models.inference import (
+    CASCADE_THRESHOLD, CascadeInference, DirectInference, cascade_first_stage
+)
+from Backend.models.preprocess import DiabetesPreprocessor
+
+
+def per_request_ms(engine, rows):
+    """Rata-rata & p99 latensi predict_proba satu baris per panggilan (ms)."""
+    engine.predict_proba(rows[:1])  # warmup
+    samples = []
+    for row in rows:
+        t0 = time.perf_counter()
+        engine.predict_proba(row)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return float(np.mean(samples)), float(np.percentile(samples, 99))
+
+
+def main(args):
+    print("=" * 92)
+    print("🪜 LAPORAN CASCADE INFERENCE (TAHAP-1 MURAH -> ENSEMBLE PENUH DI SEKITAR AMBANG)")
+    print("=" * 92)
+
+    model_path = registry.active_paths()[0]
+    model = load_model_bundle(model_path)['model']
+    first_stage, stage_name = cascade_first_stage(model, registry.get_active(), args.first_stage)
+    if first_stage is None:
+        print(f"❌ Cascade tidak bisa dipakai: {stage_name}")
+        return False
+
+    df = DiabetesPreprocessor().clean_and_encode(load_dataset(Config.RAW_DATA, kind='raw'), is_training=True)
+    X = df[Config.FEATURES].dropna().to_numpy(dtype=np.float32)
+
+    full = DirectInference(model)
+    first = DirectInference(first_stage)
+    p_full = full.predict_proba(X)[:, 1]
+    p_first = first.predict_proba(X)[:, 1]
+
+    rng = np.random.default_rng(42)
+    sample = X[rng.choice(len(X), size=min(args.latency_rows, len(X)), replace=False)]
+    full_mean, full_p99 = per_request_ms(full, sample)
+
+    print(f"   Model penuh   : {model_path}")
+    print(f"   Tahap-1       : {stage_name}")
+    print(f"   Dataset       : {Path(Config.RAW_DATA).name} ({len(X):,} baris), latensi dari {len(sample)} request")
+    print(f"   Ensemble penuh: {full_mean:.3f} ms/request (p99 {full_p99:.3f})")
+    print("-" * 92)
+    print(f"   {'Band':>6} {'Eskalasi':>9} {'Label sama':>11} {'|Δp| rata2':>11} {'|Δp| maks':>10} "
+          f"{'ms/request':>11} {'p99 ms':>8} {'Hemat':>7}")
+
+    results = []
+    for band in args.bands:
+        uncertain = np.abs(p_first - CASCADE_THRESHOLD) < band
+        p_cascade = np.where(uncertain, p_full, p_first)
+        delta = np.abs(p_cascade - p_full) * 100
+        agreement = float(((p_cascade > CASCADE_THRESHOLD) == (p_full > CASCADE_THRESHOLD)).mean())
+
+        cascade = CascadeInference(first_stage, DirectInference(model), band, stage_name)
+        mean_ms, p99_ms = per_request_ms(cascade, sample)
+        saved = 1 - mean_ms / full_mean
+
+        res = {
+            'band': band,
+            'escalation_rate': round(float(uncertain.mean()), 4),
+            'label_agreement': round(agreement, 4),
+            'delta_pp_mean': round(float(delta.mean()), 3),
+            'delta_pp_max': round(float(delta.max()), 3),
+            'ms_per_request': round(mean_ms, 3),
+            'p99_ms': round(p99_ms, 3),
+            'latency_saved': round(saved, 4),
+        }
+        results.append(res)
+        print(f"   {band:>6.2f} {res['escalation_rate']:>9.2%} {agreement:>11.2%} {res['delta_pp_mean']:>11.3f} "
+              f"{res['delta_pp_max']:>10.3f} {mean_ms:>11.3f} {p99_ms:>8.3f} {saved:>7.1%}")
+    print("=" * 92)
+    print(f"ℹ️  Band aktif: CASCADE_BAND={Config.CASCADE_BAND} (aktifkan dengan CASCADE_ENABLED=1)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'first_stage': stage_name, 'rows': int(len(X)),
+                       'full_ms_per_request': round(full_mean, 3), 'results': results}, f, indent=2)
+        print(f"💾 Hasil tersimpan: {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Escalation rate, latensi & kesepakatan mode cascade")
+    parser.add_argument('--first-stage', choices=['auto', 'distilled', 'fold'], default=Config.CASCADE_FIRST_STAGE)
+    parser.add_argument('--bands', type=float, nargs='+', default=[0.05, 0.1, 0.15, 0.2, 0.3])
+    parser.add_argument('--latency-rows', type=int, default=300, help="Jumlah request untuk ukur latensi")
+    parser.add_argument('--output', default=None, help="Simpan hasil sebagai JSON")
+    if not main(parser.parse_args()):
+        sys.exit(1)
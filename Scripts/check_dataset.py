@@ -20,6 +20,7 @@ if str(project_root) not in sys.path:
 try:
     from Backend.config import Config
     from Backend.models.preprocess import DiabetesPreprocessor
+    from Backend.models.dataset import load_dataset, memory_report
 except ImportError as e:
     print(f"❌ Gagal mengimpor modul: {e}")
     print("Pastikan Anda menjalankan script dari root folder proyek.")
@@ -44,9 +45,10 @@ def check_dataset():
         return
         
     try:
-        df = pd.read_csv(raw_path)
+        df = load_dataset(raw_path, kind='raw')
         print(f"✅ File Raw Ditemukan")
         print(f"   • Total Sampel: {len(df)} baris")
+        print(f"   • {memory_report(df, 'Memori')}")
     except Exception as e:
         print(f"❌ Gagal membaca CSV: {e}")
         return
@@ -97,9 +99,10 @@ def check_dataset():
     print("-" * 60)
     if balanced_path.exists():
         try:
-            df_b = pd.read_csv(balanced_path)
+            df_b = load_dataset(balanced_path, kind='balanced')
             print(f"✅ Dataset Balanced Ditemukan")
             print(f"   • Total Sampel: {len(df_b)} baris")
+            print(f"   • {memory_report(df_b, 'Memori')}")
             
             b_counts = df_b['diabetic'].value_counts()
             if b_counts[0] == b_counts[1]:
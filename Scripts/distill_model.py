@@ -0,0 +1,81 @@
+"""
+Scripts/distill_model.py
+Distilasi model yang SUDAH ada (versi aktif registry / file model lama, atau --version)
+menjadi satu pohon + tabel probabilitas daun, lalu simpan sebagai versi registry baru.
+Scripts/train_model.py sudah melakukan ini otomatis untuk model baru.
+
+Contoh:
+    python Scripts/distill_model.py
+    python Scripts/distill_model.py --version v0003 --source raw
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import registry
+from Backend.models.bundle import load_model_bundle
+from Backend.models.dataset import load_dataset
+from Backend.models.distill import register_distilled, summary_lines
+from Backend.models.drift import build_reference
+from Backend.models.preprocess import DiabetesPreprocessor
+
+
+def main(args):
+    print("=" * 70)
+    print("🧪 DISTILASI MODEL: ENSEMBLE -> SATU POHON")
+    print("=" * 70)
+
+    teacher_version = args.version or registry.get_active()
+    model_path, meta_path = registry.version_paths(teacher_version) if teacher_version else registry.active_paths()
+    bundle = load_model_bundle(model_path)
+    if bundle.get('distilled_from'):
+        print(f"❌ Model {teacher_version} sudah hasil distilasi.")
+        return False
+
+    path = Config.BALANCED_DATA if args.source == 'balanced' else Config.RAW_DATA
+    if not Path(path).exists():
+        print(f"❌ Dataset tidak ditemukan: {path}")
+        if args.source == 'balanced':
+            print("   Jalankan Scripts/balance_dataset.py atau pakai --source raw.")
+        return False
+
+    df = load_dataset(path, kind=args.source)
+    if args.source == 'raw':
+        df = DiabetesPreprocessor().clean_and_encode(df, is_training=True)
+    df = df[Config.FEATURES + ['diabetic']].dropna()
+    X, y = df[Config.FEATURES], df['diabetic'].astype(int)
+
+    metadata = {}
+    if Path(meta_path).exists():
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+
+    print(f"📂 Guru    : {teacher_version or 'model lama'} ({model_path})")
+    print(f"📊 Dataset : {Path(path).name}, {len(X):,} baris")
+    reference = build_reference(X, source=Path(path).name)
+    version, report = register_distilled(bundle, teacher_version, X, y, metadata,
+                                         extras={'drift_reference.json': reference})
+    print("-" * 70)
+    for line in summary_lines(report):
+        print(f"   {line}")
+    print("-" * 70)
+    print(f"💾 Versi distilasi: {version}")
+    print(f"   python Scripts/model_registry.py shadow {version}    (uji pada traffic live)")
+    print(f"   python Scripts/model_registry.py activate {version}  (jadikan aktif)")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Distilasi model ensemble menjadi satu pohon")
+    parser.add_argument('--version', default=None, help="Versi guru (default: versi aktif / model lama)")
+    parser.add_argument('--source', choices=['balanced', 'raw'], default='balanced')
+    if not main(parser.parse_args()):
+        sys.exit(1)
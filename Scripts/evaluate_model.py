@@ -1,7 +1,6 @@
 import sys
 import os
 import json
-import joblib
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -16,41 +15,65 @@ sys.path.append(str(project_root))
 
 from Backend.config import Config
 from Backend.models.preprocess import DiabetesPreprocessor
+from Backend.models.bundle import load_model_bundle
+from Backend.models import registry
+from Backend.models.registry import active_paths
+from Backend.models.distill import compare, find_distilled, summary_lines
+from Backend.models.dataset import load_dataset, memory_report
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score,
     roc_auc_score, confusion_matrix
 )
 
-def evaluate():
+def _distillation_pair(bundle, distilled=None):
+    """
+    (guru, murid, versi guru, versi murid) untuk perbandingan distilasi, atau None.
+    Model aktif = ensemble -> bandingkan dengan versi distilasinya; model aktif = distilasi -> dengan gurunya.
+    """
+    active = registry.get_active()
+    if bundle.get('distilled_from'):
+        teacher_version = bundle['distilled_from']
+        teacher_path = Config.MODEL_PATH if teacher_version == 'legacy' else registry.version_paths(teacher_version)[0]
+        return load_model_bundle(teacher_path)['model'], bundle['model'], teacher_version, active
+
+    distilled = distilled or find_distilled(active)
+    if not distilled:
+        return None
+    student = load_model_bundle(registry.version_paths(distilled)[0])['model']
+    return bundle['model'], student, active or 'legacy', distilled
+
+
+def evaluate(source='balanced', distilled=None):
     print("=" * 70)
     print("📊 MODEL EVALUATION - DIABETES DSS")
     print("=" * 70)
 
     # --- 1. Validasi File ---
-    if not os.path.exists(Config.MODEL_PATH):
-        print(f"❌ Model tidak ditemukan di: {Config.MODEL_PATH}")
+    model_path = active_paths()[0]  # Versi aktif registry / file model lama
+    if not os.path.exists(model_path):
+        print(f"❌ Model tidak ditemukan di: {model_path}")
         print("   👉 Jalankan: python Scripts/train_model.py")
         return False
 
-    if not os.path.exists(Config.BALANCED_DATA):
-        print(f"❌ Dataset balanced tidak ditemukan di: {Config.BALANCED_DATA}")
-        print("   👉 Jalankan: python Scripts/balance_dataset.py")
+    data_path = Config.BALANCED_DATA if source == 'balanced' else Config.RAW_DATA
+    if not os.path.exists(data_path):
+        print(f"❌ Dataset {source} tidak ditemukan di: {data_path}")
+        if source == 'balanced':
+            print("   👉 Jalankan: python Scripts/balance_dataset.py (atau pakai --source raw)")
         return False
 
     try:
         # --- 2. Load Model Bundle ---
-        print(f"📂 Loading model dari: {Config.MODEL_PATH}")
-        bundle = joblib.load(Config.MODEL_PATH)
-        
-        # Handle format baru (dict) vs format lama (objek langsung)
-        if isinstance(bundle, dict) and 'model' in bundle:
-            model = bundle['model']
-        else:
-            model = bundle
+        print(f"📂 Loading model dari: {model_path}")
+        # Format baru (dict) / lama (objek langsung) dinormalisasi + cek versi preprocessing
+        bundle = load_model_bundle(model_path)
+        model = bundle['model']
+        print(f"   Preprocessing versi: {bundle['preprocess_version']}")
         
         # --- 3. Load & Preprocess Data ---
-        print(f"📂 Loading dataset dari: {Config.BALANCED_DATA}")
-        df = pd.read_csv(Config.BALANCED_DATA)
+        print(f"📂 Loading dataset dari: {data_path}")
+        df = load_dataset(data_path, kind=source)
+        print(memory_report(df, f'Dataset {source}'))
         
         # Gunakan preprocessor yang SAMA dengan training/API
         pp = DiabetesPreprocessor()
@@ -122,7 +145,20 @@ def evaluate():
         else:
             print(f"   ✅  Model Seimbang (Bias < 15%)")
 
-        # --- 8. Simpan Laporan JSON ---
+        # --- 8. Divergensi Model Distilasi vs Ensemble ---
+        distillation = None
+        pair = _distillation_pair(bundle, distilled)
+        if pair is not None:
+            teacher, student, teacher_version, student_version = pair
+            print(f"\n🧪 DISTILASI: {student_version} (murid) vs {teacher_version} (guru/ensemble)")
+            distillation = compare(teacher, student, X, y)
+            distillation.update({'teacher_version': teacher_version, 'student_version': student_version})
+            for line in summary_lines(distillation):
+                print(f"   {line}")
+        else:
+            print("\nℹ️  Belum ada versi distilasi untuk model aktif (dibuat otomatis oleh train_model.py).")
+
+        # --- 9. Simpan Laporan JSON ---
         report_data = {
             "timestamp": datetime.now().isoformat(),
             "metrics": {
@@ -140,7 +176,8 @@ def evaluate():
                 "recall_class_0": round(recall_0, 4),
                 "recall_class_1": round(recall_1, 4),
                 "is_balanced": bool(diff <= 0.15)
-            }
+            },
+            "distillation": distillation
         }
         
         # PERBAIKAN: Menggunakan os.path.join agar kompatibel dengan path string
@@ -157,7 +194,14 @@ def evaluate():
         return False
 
 if __name__ == "__main__":
-    if evaluate():
+    import argparse
+    parser = argparse.ArgumentParser(description="Evaluasi model aktif (+ divergensi versi distilasi)")
+    parser.add_argument('--source', choices=['balanced', 'raw'], default='balanced')
+    parser.add_argument('--distilled', default=None,
+                        help="Versi distilasi yang dibandingkan (default: terbaru untuk model aktif)")
+    args = parser.parse_args()
+
+    if evaluate(args.source, args.distilled):
         print("\n✅ Evaluasi Selesai.")
     else:
         sys.exit(1)
\ No newline at end of file
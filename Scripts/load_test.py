@@ -0,0 +1,141 @@
+"""
+Scripts/load_test.py
+Load harness HTTP sederhana (tanpa dependency tambahan) untuk server yang sedang berjalan.
+Mengirim campuran request /api/predict dan /api/download-report secara paralel,
+lalu melaporkan throughput, status code, dan latensi p50/p95/p99 per endpoint
+(semua request, serta p99 khusus request sukses 2xx -> penolakan 503 cepat tidak mempercantik angka).
+
+Contoh:
+    python Scripts/load_test.py --url http://localhost:7860 --concurrency 32 --duration 20
+    python Scripts/load_test.py --pdf-ratio 0.2
+    python Scripts/load_test.py --concurrency 64 --honor-retry-after   (klien patuh 503 + Retry-After)
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import http.client
+from collections import defaultdict
+from urllib.parse import urlparse
+
+import numpy as np
+
+SAMPLE_PATIENT = {
+    'age': 55, 'gender': 'Male', 'pulse_rate': 80, 'systolic_bp': 140, 'diastolic_bp': 90,
+    'glucose': 180, 'height': 168, 'weight': 82, 'bmi': 0, 'family_diabetes': 'Yes',
+    'hypertensive': 'Yes', 'family_hypertension': 'No', 'cardiovascular_disease': 'No', 'stroke': 'No'
+}
+
+
+def _request(conn, method, path, payload=None, with_headers=False):
+    body = json.dumps(payload) if payload is not None else None
+    headers = {'Content-Type': 'application/json'} if body else {}
+    conn.request(method, path, body=body, headers=headers)
+    resp = conn.getresponse()
+    resp.read()
+    if with_headers:
+        return resp.status, resp.headers
+    return resp.status
+
+
+def run_load(base_url, concurrency=16, duration=10.0, pdf_ratio=0.0, timeout=30.0, honor_retry_after=False):
+    """
+    Menjalankan beban selama `duration` detik dengan `concurrency` klien keep-alive.
+    honor_retry_after: klien yang ditolak 503 menunggu sesuai header Retry-After sebelum mengirim lagi.
+    Return: dict per endpoint -> {'latencies': [...ms], 'ok_latencies': [...ms], 'status': {code: count}}
+    """
+    target = urlparse(base_url)
+    results = defaultdict(lambda: {'latencies': [], 'ok_latencies': [], 'status': defaultdict(int)})
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(seed):
+        rng = random.Random(seed)
+        conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=timeout)
+        while time.perf_counter() < stop_at:
+            patient = dict(SAMPLE_PATIENT, age=rng.randint(20, 80), glucose=rng.randint(70, 250))
+            if rng.random() < pdf_ratio:
+                name, method, path = 'report', 'POST', '/api/download-report'
+                payload = {'input_data': patient, 'label': 'Diabetic', 'probability': 75.0}
+            else:
+                name, method, path, payload = 'predict', 'POST', '/api/predict', patient
+
+            start = time.perf_counter()
+            retry_after = 0.0
+            try:
+                status, headers = _request(conn, method, path, payload, with_headers=True)
+                if status == 503 and honor_retry_after:
+                    retry_after = float(headers.get('Retry-After') or 0)
+            except Exception:
+                status = 'error'
+                conn.close()
+                conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=timeout)
+            elapsed = (time.perf_counter() - start) * 1000
+
+            with lock:
+                results[name]['latencies'].append(elapsed)
+                if status in (200, 201, 202):
+                    results[name]['ok_latencies'].append(elapsed)
+                results[name]['status'][status] += 1
+            if retry_after:
+                time.sleep(min(retry_after, max(stop_at - time.perf_counter(), 0)))
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def summarize(results, duration):
+    """Ringkasan per endpoint: req/s, p50/p95/p99 (ms), distribusi status code."""
+    summary = {}
+    for name, data in results.items():
+        lat = np.asarray(data['latencies'])
+        ok = np.asarray(data.get('ok_latencies', []))
+        summary[name] = {
+            'requests': len(lat),
+            'rps': len(lat) / duration,
+            'p50': float(np.percentile(lat, 50)) if len(lat) else 0.0,
+            'p95': float(np.percentile(lat, 95)) if len(lat) else 0.0,
+            'p99': float(np.percentile(lat, 99)) if len(lat) else 0.0,
+            'ok_rps': len(ok) / duration,
+            'ok_p99': float(np.percentile(ok, 99)) if len(ok) else 0.0,
+            'status': dict(data['status']),
+        }
+    return summary
+
+
+def print_summary(summary):
+    print(f"   {'Endpoint':<10} {'req':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'2xx/s':>7} {'p99 2xx':>8}  status")
+    for name, s in sorted(summary.items()):
+        print(f"   {name:<10} {s['requests']:>7} {s['rps']:>8.1f} {s['p50']:>9.1f} "
+              f"{s['p95']:>9.1f} {s['p99']:>9.1f} {s.get('ok_rps', 0):>7.1f} {s.get('ok_p99', 0):>8.1f}  {s['status']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test API Diabetes Detector")
+    parser.add_argument('--url', default='http://localhost:7860')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--pdf-ratio', type=float, default=0.0,
+                        help="Proporsi request /api/download-report (0-1)")
+    parser.add_argument('--honor-retry-after', action='store_true',
+                        help="Klien menunggu Retry-After setelah 503 (seperti klien yang patuh)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"🔥 LOAD TEST {args.url} | {args.concurrency} klien | {args.duration:.0f} detik")
+    print("=" * 70)
+    res = run_load(args.url, args.concurrency, args.duration, args.pdf_ratio,
+                   honor_retry_after=args.honor_retry_after)
+    if not res:
+        print("❌ Tidak ada request yang terkirim.")
+        sys.exit(1)
+    print_summary(summarize(res, args.duration))
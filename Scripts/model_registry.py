@@ -0,0 +1,92 @@
+"""
+Scripts/model_registry.py
+Kelola registry model berversi (Backend/models/registry/).
+
+Contoh:
+    python Scripts/model_registry.py list
+    python Scripts/model_registry.py import-legacy       # daftarkan decision_tree_bundle.pkl sebagai versi
+    python Scripts/model_registry.py shadow v0002         # kandidat dinilai pada traffic live
+    python Scripts/model_registry.py shadow off
+    python Scripts/model_registry.py activate v0002
+
+Perubahan pointer dibaca API saat model dimuat (restart server / worker).
+Laporan shadow live: GET /api/shadow
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models import registry
+
+
+def cmd_list(args):
+    info = registry.describe()
+    print("=" * 78)
+    print(f"📚 REGISTRY MODEL: {Config.REGISTRY_DIR}")
+    print("=" * 78)
+    if not info['versions']:
+        print("   (kosong) -> API memakai file model lama. Jalankan 'import-legacy' atau train_model.py.")
+        return True
+    print(f"   {'Versi':<8} {'Terdaftar':<20} {'Training':<20} {'Akurasi CV':>10}  Status")
+    for v in info['versions']:
+        status = 'AKTIF' if v['active'] else ('SHADOW' if v['shadow'] else '')
+        acc = f"{v['accuracy_cv']:.4f}" if v['accuracy_cv'] is not None else '-'
+        print(f"   {v['version']:<8} {v['registered_at'] or '-':<20} {v['training_date'] or '-':<20} {acc:>10}  {status}")
+    return True
+
+
+def cmd_import_legacy(args):
+    version = registry.register_files(Config.MODEL_PATH, Config.META_PATH)
+    print(f"✅ {Config.MODEL_PATH} terdaftar sebagai {version}")
+    if registry.get_active() is None:
+        registry.set_active(version)
+        print(f"🚀 {version} dijadikan versi aktif (belum ada versi aktif sebelumnya).")
+    return True
+
+
+def cmd_activate(args):
+    registry.set_active(args.version)
+    print(f"🚀 Versi aktif: {args.version}")
+    return True
+
+
+def cmd_shadow(args):
+    if args.version.lower() == 'off':
+        registry.set_shadow(None)
+        print("🕶️  Shadow scoring dimatikan.")
+        return True
+    if args.version == registry.get_active():
+        print(f"⚠️  {args.version} sudah aktif, tidak perlu dijadikan shadow.")
+        return False
+    registry.set_shadow(args.version)
+    print(f"🕶️  Versi shadow: {args.version} (laporan: GET /api/shadow)")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kelola registry model berversi")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list').set_defaults(func=cmd_list)
+    sub.add_parser('import-legacy').set_defaults(func=cmd_import_legacy)
+    p = sub.add_parser('activate')
+    p.add_argument('version')
+    p.set_defaults(func=cmd_activate)
+    p = sub.add_parser('shadow')
+    p.add_argument('version', help="Versi kandidat atau 'off'")
+    p.set_defaults(func=cmd_shadow)
+
+    args = parser.parse_args()
+    try:
+        ok = args.func(args)
+    except registry.RegistryError as e:
+        print(f"❌ {e}")
+        ok = False
+    if not ok:
+        sys.exit(1)
@@ -0,0 +1,280 @@
+"""
+Scripts/score_file.py
+Skoring offline (batch malam hari) untuk ekstrak data pasien berukuran sangat besar.
+
+Alur:
+1. Input dibaca per chunk dengan dtype eksplisit (tidak ada inferensi tipe)
+2. Chunk dibagikan ke pool proses; setiap worker memuat bundle model SEKALI
+3. Output ditulis BERURUTAN ke CSV atau Parquet (folder part-*.parquet)
+4. Checkpoint (offset byte input & output) disimpan setiap chunk selesai -> bisa dilanjutkan
+   setelah terputus; resume langsung seek ke offset input, tanpa membaca ulang baris yang selesai
+
+Contoh:
+    python Scripts/score_file.py pasien.csv hasil.csv
+    python Scripts/score_file.py pasien.csv hasil_parquet --format parquet --workers 8
+    python Scripts/score_file.py pasien.csv hasil.csv --resume
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# 1. Setup Path Project
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Backend.config import Config
+from Backend.models.bundle import load_model_bundle
+from Backend.models.registry import active_paths
+from Backend.models.preprocess import NUMERIC_COLUMNS
+from Backend.models.inference import DirectInference
+from Backend.models.scoring import score_frame, missing_columns
+from Backend.models import dataset
+
+# Dtype eksplisit per kolom input (tidak ada inferensi tipe oleh pandas).
+# Kolom numerik default dibaca sebagai string lalu divalidasi per baris di worker,
+# karena satu nilai rusak (misal 'le' di kolom usia) akan menggagalkan parsing float
+# seluruh chunk. Gunakan --strict-numeric untuk ekstrak yang dijamin bersih (lebih cepat).
+CATEGORY_DTYPES = {col: 'category' for col in
+                   ['gender', 'family_diabetes', 'hypertensive', 'family_hypertension',
+                    'cardiovascular_disease', 'stroke']}
+
+
+def input_dtypes(header, strict_numeric=False):
+    numeric_type = 'float32' if strict_numeric else str
+    dtypes = {col: numeric_type for col in NUMERIC_COLUMNS}
+    dtypes.update(CATEGORY_DTYPES)
+    return {c: t for c, t in dtypes.items() if c in header}
+
+
+# --- 2. WORKER (PROSES TERPISAH) ---
+_worker_engine = None
+_worker_preprocessor = None
+
+
+def _init_worker(model_path):
+    """Dipanggil sekali per proses worker: muat bundle model."""
+    global _worker_engine
+    global _worker_preprocessor
+    bundle = load_model_bundle(model_path)
+    _worker_engine = DirectInference(bundle['model'])
+    _worker_preprocessor = bundle['preprocessor']
+
+
+def _score_chunk(chunk, start_row):
+    return score_frame(chunk, _worker_engine.predict_proba, start_row=start_row,
+                       preprocessor=_worker_preprocessor)
+
+
+# --- 3. CHECKPOINT ---
+def checkpoint_path(output):
+    return str(output).rstrip('/\\') + '.checkpoint.json'
+
+
+def load_checkpoint(output, input_path, chunksize):
+    path = checkpoint_path(output)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    if (state.get('input') != os.path.abspath(input_path) or state.get('chunksize') != chunksize
+            or 'input_offset' not in state):
+        print("⚠️  Checkpoint tidak cocok dengan input/chunksize saat ini. Mulai dari awal.")
+        return None
+    return state
+
+
+def output_intact(output, state):
+    """Output hasil chunk yang tercatat di checkpoint masih ada (file CSV / part Parquet)."""
+    if state['format'] == 'parquet':
+        return all(os.path.exists(os.path.join(output, f"part-{i:05d}.parquet"))
+                   for i in range(state['chunks_done']))
+    try:
+        return os.path.getsize(output) >= state['output_bytes']
+    except OSError:
+        return False
+
+
+def save_checkpoint(output, state):
+    # Tulis ke file sementara lalu rename (atomic) agar checkpoint tidak pernah setengah jadi
+    path = checkpoint_path(output)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+# --- 4. WRITER (CSV / PARQUET) ---
+class CsvWriter:
+    def __init__(self, path, offset=0):
+        self.path = path
+        if offset:
+            # Buang sisa tulisan chunk yang belum selesai sebelum interupsi
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+            self.handle = open(path, 'ab')
+        else:
+            self.handle = open(path, 'wb')
+
+    def write(self, index, df):
+        header = self.handle.tell() == 0
+        self.handle.write(df.to_csv(index=False, header=header).encode('utf-8'))
+        self.handle.flush()
+        os.fsync(self.handle.fileno())
+        return self.handle.tell()
+
+    def close(self):
+        self.handle.close()
+
+
+class ParquetWriter:
+    def __init__(self, path, offset=0):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("❌ Output Parquet butuh 'pyarrow'. Install dengan: pip install pyarrow")
+            sys.exit(1)
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, index, df):
+        df.to_parquet(os.path.join(self.path, f"part-{index:05d}.parquet"), index=False)
+        return 0
+
+    def close(self):
+        pass
+
+
+def peak_memory_mb():
+    """Puncak RSS proses utama & worker (MB). None jika tidak didukung OS."""
+    if dataset.resource is None:
+        return None, None
+    return dataset.peak_rss_mb('self'), dataset.peak_rss_mb('children')
+
+
+# --- 5. MAIN ---
+def score_file(args):
+    print("=" * 60)
+    print("📦 BULK SCORING PASIEN")
+    print("=" * 60)
+
+    if not os.path.exists(args.input):
+        print(f"❌ File input tidak ditemukan: {args.input}")
+        return False
+    model_path = active_paths()[0]  # Versi aktif registry / file model lama
+    if not os.path.exists(model_path):
+        print(f"❌ Model tidak ditemukan di: {model_path}")
+        return False
+
+    fmt = args.format or ('parquet' if args.output.endswith('.parquet') else 'csv')
+
+    # A. Validasi header
+    header = pd.read_csv(args.input, nrows=0).columns
+    missing = missing_columns(header)
+    if missing:
+        print(f"❌ Kolom hilang: {missing}")
+        return False
+
+    # B. Resume dari checkpoint
+    state = load_checkpoint(args.output, args.input, args.chunksize) if args.resume else None
+    if state is not None and (state.get('format') != fmt or not output_intact(args.output, state)):
+        print("⚠️  Output dari checkpoint hilang/terpotong atau format berbeda. Mulai dari awal.")
+        state = None
+    if state is None:
+        state = {'input': os.path.abspath(args.input), 'chunksize': args.chunksize, 'format': fmt,
+                 'chunks_done': 0, 'rows_done': 0, 'input_offset': 0, 'output_bytes': 0}
+    else:
+        print(f"🔁 Melanjutkan dari chunk {state['chunks_done']} ({state['rows_done']} baris selesai)")
+
+    # Resume: seek ke offset byte input (memori & waktu tidak bergantung jumlah baris yang sudah selesai)
+    reader = dataset.iter_dataset_offsets(
+        args.input,
+        chunksize=args.chunksize,
+        dtypes=input_dtypes(header, args.strict_numeric),
+        strict=args.strict_numeric,
+        offset=state['input_offset'],
+    )
+
+    writer_cls = ParquetWriter if fmt == 'parquet' else CsvWriter
+    writer = writer_cls(args.output, offset=state['output_bytes'])
+
+    print(f"📂 Input    : {args.input}")
+    print(f"💾 Output   : {args.output} ({fmt})")
+    print(f"⚙️  Worker   : {args.workers} proses, {args.chunksize} baris/chunk")
+
+    start = time.perf_counter()
+    rows_this_run = 0
+    in_flight = []
+    max_in_flight = args.workers * 2  # batasi chunk di memori
+
+    def _flush_one():
+        nonlocal rows_this_run
+        index, n_rows, input_offset, future = in_flight.pop(0)
+        offset = writer.write(index, future.result())
+        state['chunks_done'] = index + 1
+        state['rows_done'] += n_rows
+        state['input_offset'] = input_offset
+        state['output_bytes'] = offset
+        save_checkpoint(args.output, state)
+        rows_this_run += n_rows
+
+        elapsed = time.perf_counter() - start
+        print(f"   ✅ Chunk {index:>5} selesai | total {state['rows_done']} baris | "
+              f"{rows_this_run / elapsed:,.0f} baris/detik")
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                                 initargs=(model_path,)) as pool:
+            index = state['chunks_done']
+            next_row = state['rows_done'] + 1
+            for chunk, input_offset in reader:
+                in_flight.append((index, len(chunk), input_offset, pool.submit(_score_chunk, chunk, next_row)))
+                index += 1
+                next_row += len(chunk)
+                if len(in_flight) >= max_in_flight:
+                    _flush_one()
+            while in_flight:
+                _flush_one()
+    except KeyboardInterrupt:
+        print("\n⏸️  Dihentikan. Jalankan ulang dengan --resume untuk melanjutkan.")
+        return False
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    main_mb, worker_mb = peak_memory_mb()
+
+    print("-" * 60)
+    print(f"📊 Baris diproses   : {rows_this_run:,} (total {state['rows_done']:,})")
+    print(f"⏱️  Waktu            : {elapsed:.2f} detik")
+    print(f"🚀 Throughput       : {rows_this_run / elapsed if elapsed else 0:,.0f} baris/detik")
+    if main_mb is not None:
+        print(f"🧠 Peak memori      : utama {main_mb:.1f} MB | worker (maks) {worker_mb:.1f} MB")
+
+    # Selesai penuh -> checkpoint tidak diperlukan lagi
+    os.remove(checkpoint_path(args.output))
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk scoring file pasien (CSV -> CSV/Parquet)")
+    parser.add_argument('input', help="File CSV input (kolom sama dengan diabetes.csv)")
+    parser.add_argument('output', help="File CSV output atau folder Parquet")
+    parser.add_argument('--format', choices=['csv', 'parquet'], help="Default: dari ekstensi output")
+    parser.add_argument('--chunksize', type=int, default=50000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--resume', action='store_true', help="Lanjutkan dari checkpoint terakhir")
+    parser.add_argument('--strict-numeric', action='store_true',
+                        help="Parse kolom numerik langsung ke float32 (lebih cepat, gagal jika ada nilai rusak)")
+
+    if score_file(parser.parse_args()):
+        print("\n✅ Scoring Selesai.")
+    else:
+        sys.exit(1)
@@ -25,6 +25,13 @@ try:
     from Backend.config import Config
     # Mengimport Preprocessor dari package models
     from Backend.models import DiabetesPreprocessor
+    from Backend.models.preprocess import PREPROCESS_VERSION, DiabetesFeatureTransformer
+    from Backend.models.bundle import build_pipeline
+    from Backend.models.dataset import load_dataset, memory_report
+    from Backend.models.drift import build_reference
+    from Backend.models.backends import feature_importances, get_backend, list_backends
+    from Backend.models.distill import DISTILL_TEACHERS, register_distilled, summary_lines
+    from Backend.models import registry
 except ModuleNotFoundError as e:
     print("\n❌ CRITICAL ERROR: Gagal mengimport modul 'Backend'.")
     print(f"   Detail: {e}")
@@ -33,17 +40,27 @@ except ModuleNotFoundError as e:
     sys.exit(1)
 
 # Import Library Machine Learning
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.model_selection import StratifiedKFold, cross_val_score
-from sklearn.calibration import CalibratedClassifierCV
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
+from sklearn.base import clone
+from sklearn.model_selection import StratifiedKFold
 from sklearn.metrics import (
     accuracy_score, roc_auc_score, confusion_matrix,
     precision_score, recall_score, f1_score
 )
 
-def train_model():
+def _no_progress(stage, **info):
+    pass
+
+
+def train_model(activate: bool = False, shadow: bool = False, progress=None, backend: str = None,
+                distill: bool = None):
+    """
+    Latih model & daftarkan ke registry. Return: versi baru (misal 'v0002') atau False.
+    progress(stage, **info): callback tahap/fold (dipakai job training latar, models/training_job.py).
+    backend: nama estimator di Backend/models/backends.py (default Config.MODEL_BACKEND).
+    distill: ikut simpan versi distilasi (default Config.DISTILL_ENABLED, lihat models/distill.py).
+    """
+    progress = progress or _no_progress
+    distill = Config.DISTILL_ENABLED if distill is None else distill
     print("=" * 60)
     print("🧠 TRAINING MODEL DIABETES (DECISION TREE)")
     print("=" * 60)
@@ -55,14 +72,18 @@ def train_model():
         if not os.path.exists(Config.BALANCED_DATA):
             print(f"❌ Dataset tidak ditemukan di: {Config.BALANCED_DATA}")
             print("   Mohon pastikan file 'diabetes_balanced.csv' ada di folder 'Backend/data'.")
+            progress('error', error=f"Dataset tidak ditemukan: {Config.BALANCED_DATA}")
             return False
 
+        progress('load_data')
         print(f"📂 Membaca dataset: {Config.BALANCED_DATA}")
-        df = pd.read_csv(Config.BALANCED_DATA)
+        df = load_dataset(Config.BALANCED_DATA, kind='balanced')
+        print(memory_report(df, 'Dataset balanced'))
 
         # ---------------------------------------------------------
         # 4. Preprocessing
         # ---------------------------------------------------------
+        progress('preprocess', rows=int(len(df)))
         preprocessor = DiabetesPreprocessor()
         
         # Cek apakah data sudah bersih/numerik
@@ -76,6 +97,7 @@ def train_model():
         
         if len(df_clean) == 0:
             print("❌ ERROR: Dataset kosong setelah preprocessing!")
+            progress('error', error="Dataset kosong setelah preprocessing")
             return False
 
         # Pisahkan Fitur (X) dan Target (y)
@@ -84,35 +106,17 @@ def train_model():
         y = df_clean['diabetic'] # Pastikan nama kolom target sesuai CSV Anda
         
         print(f"📊 Dataset Shape: {X.shape}")
+        print(memory_report(X, 'Fitur siap training'))
         print(f"📊 Distribusi Kelas: {Counter(y)}")
 
         # ---------------------------------------------------------
-        # 5. Membangun Pipeline Model
+        # 5-6. Membangun Estimator dari Backend Terpilih
         # ---------------------------------------------------------
-        # Base Model: Decision Tree
-        dt_classifier = DecisionTreeClassifier(
-            criterion="entropy",
-            max_depth=6,
-            min_samples_leaf=10,
-            min_samples_split=20,
-            class_weight="balanced",
-            random_state=42
-        )
-
-        # Pipeline: Scaling -> Modeling
-        pipeline = Pipeline([
-            ('scaler', StandardScaler()),
-            ('dt', dt_classifier)
-        ])
-
-        # ---------------------------------------------------------
-        # 6. Kalibrasi Probabilitas (Agar output % lebih akurat)
-        # ---------------------------------------------------------
-        calibrated_model = CalibratedClassifierCV(
-            estimator=pipeline,
-            method='sigmoid',
-            cv=5
-        )
+        # Default 'calibrated_tree': Scaling -> Decision Tree, dikalibrasi sigmoid 5 fold
+        # (backend lain lihat Backend/models/backends.py)
+        model_backend = get_backend(backend)
+        model = model_backend.build()
+        print(f"🧩 Backend model: {model_backend.name} ({model_backend.algorithm})")
 
         # ---------------------------------------------------------
         # 7. Evaluasi Cross Validation
@@ -120,7 +124,14 @@ def train_model():
         cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
         
         print("\n🔄 Menjalankan 5-Fold Cross Validation...")
-        scores = cross_val_score(calibrated_model, X, y, cv=cv, scoring='accuracy')
+        # Loop fold manual (setara cross_val_score scoring='accuracy') agar progres per fold terlihat
+        scores = []
+        for fold, (train_idx, test_idx) in enumerate(cv.split(X, y), start=1):
+            progress('cross_validation', fold=fold, n_folds=cv.get_n_splits(), fold_scores=list(scores))
+            fold_model = clone(model).fit(X.iloc[train_idx], y.iloc[train_idx])
+            scores.append(round(float(accuracy_score(y.iloc[test_idx], fold_model.predict(X.iloc[test_idx]))), 4))
+            print(f"   Fold {fold}/{cv.get_n_splits()}: {scores[-1]:.4f}")
+        scores = np.array(scores)
         mean_acc = scores.mean()
         
         print(f"📈 Rata-rata Akurasi Validasi: {mean_acc:.4f} (±{scores.std():.4f})")
@@ -128,12 +139,14 @@ def train_model():
         # ---------------------------------------------------------
         # 8. Final Training (Full Data)
         # ---------------------------------------------------------
+        progress('final_fit', fold_scores=scores.tolist())
         print("💪 Melatih model final dengan seluruh data...")
-        calibrated_model.fit(X, y)
+        model.fit(X, y)
 
         # Prediksi untuk metrik evaluasi
-        y_pred = calibrated_model.predict(X)
-        y_proba = calibrated_model.predict_proba(X)[:, 1]
+        progress('evaluate')
+        y_pred = model.predict(X)
+        y_proba = model.predict_proba(X)[:, 1]
 
         # Hitung Metrik Lengkap
         metrics = {
@@ -147,10 +160,10 @@ def train_model():
         cm = confusion_matrix(y, y_pred)
         tn, fp, fn, tp = cm.ravel()
 
-        # Ekstrak Feature Importance (Dari fold pertama sebagai representasi)
-        base_pipeline = calibrated_model.calibrated_classifiers_[0].estimator
-        importance_vals = base_pipeline.named_steps['dt'].feature_importances_
-        feature_importance = sorted(zip(Config.FEATURES, importance_vals), key=lambda x: x[1], reverse=True)
+        # Ekstrak Feature Importance (model terkalibrasi: fold pertama sebagai representasi)
+        importance_vals = feature_importances(model)
+        feature_importance = sorted(zip(Config.FEATURES, importance_vals), key=lambda x: x[1], reverse=True) \
+            if importance_vals is not None else []
 
         # ---------------------------------------------------------
         # 9. Simpan Model & Metadata
@@ -158,21 +171,29 @@ def train_model():
         # Pastikan folder models ada (dibuat via Config, tapi kita cek lagi)
         os.makedirs(Config.MODELS_DIR, exist_ok=True)
         
+        # Transformer preprocessing ikut disimpan -> inference cukup satu
+        # bundle['pipeline'].predict_proba(record_mentah)
+        feature_transformer = DiabetesFeatureTransformer().fit(X, y)
+
         # Bundle objek untuk disimpan (.pkl)
         bundle = {
-            'model': calibrated_model,
+            'model': model,
+            'backend': model_backend.name,
+            'algorithm': model_backend.algorithm,
+            'preprocessor': feature_transformer,
+            'pipeline': build_pipeline(feature_transformer, model),
+            'preprocess_version': PREPROCESS_VERSION,
             'features': Config.FEATURES,
             'target_names': ['Non-Diabetic', 'Diabetic'],
             'timestamp': datetime.now().isoformat()
         }
         
-        joblib.dump(bundle, Config.MODEL_PATH)
-        print(f"\n💾 Model tersimpan: {Config.MODEL_PATH}")
-
         # Metadata JSON untuk keperluan Log/UI
         metadata = {
-            'algorithm': 'Calibrated Decision Tree (Entropy)',
+            'algorithm': model_backend.algorithm,
+            'backend': model_backend.name,
             'training_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'preprocess_version': PREPROCESS_VERSION,
             'accuracy_cv': round(mean_acc, 4),
             'accuracy_train': round(metrics['accuracy'], 4),
             'metrics': {k: round(v, 4) for k, v in metrics.items()},
@@ -180,21 +201,61 @@ def train_model():
             'top_features': {k: round(v, 4) for k, v in feature_importance[:5]}
         }
 
-        with open(Config.META_PATH, 'w') as f:
-            json.dump(metadata, f, indent=4)
-            
-        print(f"📄 Metadata tersimpan: {Config.META_PATH}")
-        return True
+        # Distribusi fitur training -> pembanding untuk monitor drift di API
+        drift_reference = build_reference(X, source=os.path.basename(Config.BALANCED_DATA))
+
+        # Simpan sebagai versi BARU di registry (model aktif tidak pernah ditimpa)
+        progress('register')
+        version = registry.register(bundle, metadata, extras={'drift_reference.json': drift_reference})
+        model_path, meta_path = registry.version_paths(version)
+        print(f"\n💾 Model tersimpan sebagai versi {version}: {model_path}")
+        print(f"📄 Metadata tersimpan: {meta_path}")
+
+        # ---------------------------------------------------------
+        # 10. Distilasi: satu pohon + tabel probabilitas daun (versi alternatif, lebih murah)
+        # ---------------------------------------------------------
+        if distill and model_backend.name in DISTILL_TEACHERS:
+            progress('distill')
+            print("\n🧪 Distilasi ensemble -> satu pohon...")
+            distilled_version, report = register_distilled(
+                bundle, version, X, y, metadata, extras={'drift_reference.json': drift_reference})
+            for line in summary_lines(report):
+                print(f"   {line}")
+            print(f"💾 Model distilasi tersimpan sebagai versi {distilled_version} "
+                  f"(bandingkan: python Scripts/evaluate_model.py)")
+
+        if activate:
+            registry.set_active(version)
+            print(f"🚀 Versi {version} sekarang AKTIF.")
+        elif shadow:
+            registry.set_shadow(version)
+            print(f"🕶️  Versi {version} dijadikan SHADOW (dinilai pada traffic live tanpa dipakai pasien).")
+        else:
+            print(f"ℹ️  Versi aktif tetap: {registry.get_active() or 'model lama'}. Untuk memakai versi ini:")
+            print(f"   python Scripts/model_registry.py shadow {version}    (uji pada traffic live)")
+            print(f"   python Scripts/model_registry.py activate {version}  (jadikan aktif)")
+        return version
 
     except Exception as e:
         print(f"\n❌ TRAINING ERROR: {str(e)}")
+        progress('error', error=str(e))
         import traceback
         traceback.print_exc()
         return False
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Latih model & simpan sebagai versi baru di registry")
+    parser.add_argument('--activate', action='store_true', help="Langsung jadikan versi aktif")
+    parser.add_argument('--shadow', action='store_true', help="Jadikan kandidat shadow scoring")
+    parser.add_argument('--backend', choices=list_backends(), default=Config.MODEL_BACKEND,
+                        help="Estimator yang dilatih (bandingkan dulu dengan Scripts/benchmark_backends.py)")
+    parser.add_argument('--no-distill', action='store_true', help="Lewati pembuatan versi distilasi")
+    args = parser.parse_args()
+
     # Eksekusi fungsi utama
-    if train_model():
+    if train_model(activate=args.activate, shadow=args.shadow, backend=args.backend,
+                   distill=False if args.no_distill else None):
         print("\n✅ PROSES SELESAI. Model siap digunakan di Web App.")
     else:
         print("\n❌ PROSES GAGAL.")
@@ -0,0 +1,100 @@
+"""
+gunicorn.conf.py
+Profil produksi Gunicorn (dibaca otomatis oleh `gunicorn run_app:app` dari folder root).
+
+- Worker & thread dihitung dari jumlah CPU & kapasitas admission control (bisa di-override via environment)
+- preload_app: model dimuat SEKALI di master, worker mewarisinya via fork (copy-on-write)
+- post_fork: setiap worker menjalankan prediksi sintetis sebelum menerima traffic
+- max_requests + jitter: worker di-recycle berkala agar kebocoran memori tidak menumpuk,
+  jitter mencegah semua worker restart bersamaan
+- Feed live SSE (/api/logs/stream): opsional dilayani proses fan-out asyncio terpisah
+  (Backend/routes/feed_server.py, FEED_SERVER_PORT=<port>) sehingga pelanggan yang diam tidak
+  memegang thread gthread. Default nonaktif: port tambahan harus bisa dijangkau browser
+  (tidak berlaku di Hugging Face Spaces yang hanya membuka PORT lewat HTTPS)
+"""
+
+import os
+import multiprocessing
+
+_cpus = multiprocessing.cpu_count()
+_port = int(os.environ.get('PORT', 7860))
+
+FEED_SERVER_PORT = int(os.environ.get("FEED_SERVER_PORT", 0))  # 0 = fan-out nonaktif (opt-in)
+_feed_server = {'proc': None}
+
+
+def _admission_threads():
+    from Backend.config import Config
+    if not Config.ADMISSION_ENABLED:
+        return 4
+    from Backend.routes.admission import build_controller
+    return max(4, build_controller().capacity())
+
+
+# --- 1. SERVER SOCKET ---
+bind = f"0.0.0.0:{_port}"
+backlog = int(os.environ.get("GUNICORN_BACKLOG", 2048))
+
+# --- 2. WORKER ---
+# gthread: satu request PDF yang lambat tidak memblokir request lain di worker yang sama
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.environ.get("GUNICORN_WORKERS", 0)) or max(2, min(_cpus + 1, 8))
+# Dengan admission control, thread = kapasitas admission (berjalan + antrian) agar request
+# berlebih ditolak cepat oleh aplikasi (503 + Retry-After) alih-alih antri tak terlihat di gunicorn
+threads = int(os.environ.get("GUNICORN_THREADS", 0)) or _admission_threads()
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 60))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+# --- 3. PRELOAD & RECYCLING ---
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") == "1"
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 200))
+
+# --- 4. LOGGING ---
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+# Jumlah prediksi sintetis per worker saat start (0 = Config.READY_WARMUP_ROUNDS)
+WARMUP_ROUNDS = int(os.environ.get("GUNICORN_WARMUP_ROUNDS", 0)) or None
+
+
+# --- 5. HOOKS ---
+def when_ready(server):
+    server.log.info(
+        f"Gunicorn siap: {workers} worker x {threads} thread ({worker_class}), "
+        f"preload={preload_app}, recycle setiap {max_requests}±{max_requests_jitter} request"
+    )
+    if FEED_SERVER_PORT:
+        from Backend.routes.feed_server import spawn
+        _feed_server['proc'] = spawn(FEED_SERVER_PORT)
+        server.log.info(f"Fan-out feed live (SSE) pid {_feed_server['proc'].pid} di port {FEED_SERVER_PORT}")
+
+
+def on_exit(server):
+    """Hentikan proses fan-out feed live bersama master."""
+    proc = _feed_server['proc']
+    if proc is not None and proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except Exception:
+            proc.kill()
+
+
+def post_fork(server, worker):
+    """Pemanasan per worker: bayar biaya inisialisasi lazy sebelum request pasien pertama (/ready)."""
+    try:
+        from Backend.routes import api_routes
+        latencies = api_routes.warmup_model(WARMUP_ROUNDS)
+        if latencies:
+            server.log.info(f"Worker {worker.pid} warmup selesai: {latencies} ms")
+        else:
+            server.log.warning(f"Worker {worker.pid} warmup dilewati: model belum tersedia")
+    except Exception as e:
+        server.log.warning(f"Worker {worker.pid} warmup gagal: {e}")
+
+    # Kompaksi log -> store kolumnar /api/logs/search (file lock: satu worker per putaran)
+    from Backend.models.log_store import start_compactor
+    start_compactor()
@@ -10,7 +10,27 @@ app = Flask(__name__,
             static_folder='Backend/static')
 
 # Izinkan akses dari luar (agar API tidak diblokir browser)
-CORS(app)
+# Header Server-Timing di-expose agar bisa dibaca fetch() dari origin lain
+CORS(app, expose_headers=['Server-Timing'])
+
+# Encoder JSON cepat (opt-in) & kompresi gzip response besar.
+# Kompresi didaftarkan lebih dulu agar dijalankan PALING AKHIR (after_request urutan terbalik)
+from Backend.routes.json_provider import init_json
+from Backend.routes.http_cache import init_compression
+init_json(app)
+init_compression(app)
+
+# Instrumentasi waktu per-request (header Server-Timing + blok 'timings' mode debug)
+from Backend.routes.timing import init_timing
+init_timing(app)
+
+# Admission control: batas konkurensi per kelas endpoint, kelebihan dijawab 503 + Retry-After
+from Backend.routes.admission import init_admission
+init_admission(app)
+
+# Aset statis ber-fingerprint + varian gzip/brotli (hasil Scripts/build_assets.py)
+from Backend.routes.assets import init_assets
+init_assets(app)
 
 # --- 2. REGISTRASI BLUEPRINT (MENGHUBUNGKAN MENU) ---
 with app.app_context():
@@ -36,11 +56,28 @@ with app.app_context():
         print(f"❌ ERROR FATAL saat load routes: {e}")
 
 # --- 3. ROUTES DARURAT (Cek apakah server hidup) ---
+# /health = liveness (proses Flask hidup); /ready = readiness (model termuat & sudah warmup)
 @app.route('/health')
 def health_check():
     return jsonify({"status": "online", "message": "Server Diabetes Detector Berjalan!"})
 
+@app.route('/ready')
+def ready_check():
+    try:
+        from Backend.routes.api_routes import readiness
+    except Exception as e:
+        return jsonify({"status": "not_ready", "reasons": [f"API routes gagal dimuat: {e}"]}), 503
+    is_ready, detail = readiness()
+    return jsonify(detail), 200 if is_ready else 503
+
 # --- 4. JALANKAN SERVER ---
 if __name__ == "__main__":
+    from Backend.models.log_store import start_compactor
+    start_compactor()
+    try:
+        from Backend.routes.api_routes import warmup_model
+        print(f"🔥 Warmup: {warmup_model()} ms")
+    except Exception as e:
+        print(f"⚠️ Warmup gagal: {e}")
     port = int(os.environ.get("PORT", 7860))
     app.run(host="0.0.0.0", port=port)
\ No newline at end of file